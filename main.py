@@ -12,6 +12,31 @@ Examples:
 
     To generate Overview Snapshot:
         python main.py overview
+        python main.py overview -w 1
+        python main.py overview --force
+        python main.py overview --format html json parquet
+
+    To write per-statement SQL timings and query plans to logs/sql_profile.txt at exit (any execution type):
+        python main.py overview --sql_profile
+        python main.py equity -m update --sql_profile logs/sql_profile_update.txt
+
+    To append timing spans of every stage to logs/trace.jsonl and print their summary tree (any execution type):
+        python main.py overview --trace
+        python main.py equity -m update --trace logs/trace_update.jsonl
+
+    To write run metrics in Prometheus text format, default to logs/metrics_<type>[_<mode>].prom (any execution type):
+        python main.py overview --metrics
+        python main.py equity -m update --metrics /var/lib/node_exporter/textfile/portfolio_equity_update.prom
+
+    To profile a run with cProfile (pstats, listing and collapsed stacks for flamegraphs) and/or tracemalloc (net
+    memory and top allocation sites per stage), files go to logs/profiles/<type>[_<mode>]_<timestamp>*:
+        python main.py overview --profile cpu
+        python main.py equity -m update --profile both
+        python main.py overview --profile mem -w 1
+
+    To set the logging level, for all modules and/or per module (any execution type):
+        python main.py overview --log_level WARNING
+        python main.py equity -m update --log_level WARNING src.equity=INFO src.eq_SQLite_utility=ERROR
 
     To manage equity investment Database:
         python main.py equity -m update
@@ -22,14 +47,22 @@ Examples:
     To manage fixed income investment Database:
         python main.py fixed -m backup
         python main.py fixed -m restore
+        python main.py fixed -m upgrade
         python main.py fixed -m add -fe 'US Treasury Notes,XXXXXXXX1,TREASURY,10,100.0,2018-12-31,2019-12-31,1000.0,
             Trading Center,YTM=0.025'
 
+    To benchmark every stage on a synthetic portfolio in a scratch directory, results go to
+    logs/benchmark_<scale>_<timestamp>.json, scales are tiny/small/medium/large with optional overrides:
+        python main.py benchmark --scale small
+        python main.py benchmark --scale large,transactions=1000000 --log_level WARNING --no_tracemalloc
+        python main.py benchmark --scale small --baseline logs/benchmark_small_20261001_120000.json
+
     To pull fund data for Investment Fund excel spreadsheet:
         python main.py get-fund-data
 
 """
 
+import time
 import argparse
 from datetime import datetime
 
@@ -87,10 +120,10 @@ def master_equity(v_mode, row=None):
 
 
 def master_fixed(v_mode, row=None):
-    """ Master script for Fixed Income Management, include: BACKUP, RESTORE, ADD.
+    """ Master script for Fixed Income Management, include: BACKUP, RESTORE, UPGRADE, ADD.
 
     Args:
-        v_mode (str): BACKUP/RESTORE/ADD
+        v_mode (str): BACKUP/RESTORE/UPGRADE/ADD
         row (list): new transaction entry, default to None [
             :str: Product NAME,
             :str: SYMBOL,
@@ -119,6 +152,8 @@ def master_fixed(v_mode, row=None):
             this_instance.backup()
         elif v_mode.upper() == 'RESTORE':
             this_instance.restore()
+        elif v_mode.upper() == 'UPGRADE':
+            this_instance.upgrade()
         elif v_mode.upper() == 'ADD':
             if isinstance(row, list) and len(row) == 10:
                 if row[9].split('=')[0].upper() == 'YTM':
@@ -140,94 +175,109 @@ def master_fixed(v_mode, row=None):
                                                                                                str(len(row)),
                                                                                                ','.join(row)))
         else:
-            raise IOError('Error: input :v_mode: is not valid ! -> expect backup/restore/add, got {}: {}'.format(
-                str(type(v_mode)), str(v_mode)))
+            raise IOError('Error: input :v_mode: is not valid ! -> expect backup/restore/upgrade/add, '
+                          'got {}: {}'.format(str(type(v_mode)), str(v_mode)))
         return True
     except Exception as e:
         raise RuntimeError('Error: Failed to run master_fixed() -> '+str(e))
 
 
-def master_overview():
+def master_overview(v_workers=4, v_force=False, v_formats=('html',), v_replica=True):
     """ Master script for Overview Generator, include: ALLOCATION_TYPE, ALLOCATION_ACCOUNT, MATURE_CALENDER
 
+    The snapshot is only regenerated when the fingerprint of its inputs changed since the last run.
+
+    Args:
+        v_workers (int): number of reports computed concurrently, default to 4.
+        v_force (bool): regenerate the snapshot even if its inputs are unchanged, default to False.
+        v_formats (list): output formats, any of html/json/csv/parquet, default to html only.
+        v_replica (bool): read both databases from a read-only in-memory copy taken at run start, default to True.
+
     Returns:
         True is job completed successfully, False otherwise.
 
     """
-    from src.overview_generator import SummaryTool as SummaryTool
+    from src.snapshot_cache import SnapshotCache as SnapshotCache
     print('[..] Calling master_overview() ...')
     try:
-        out_filename = 'snapshots/snapshot_' + datetime.now().strftime('%Y%m%d') + '.html'
-        this_instance = SummaryTool()
-        # call function to generate master investment allocation report
-        this_allocation_report_type = this_instance.generate_allocation_report_type()
-        this_allocation_report_type.iloc[-1] = this_allocation_report_type.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        # call function to generate account allocation report
-        this_allocation_report_account = this_instance.generate_allocation_report_account()
-        '''
-        # call function to generate equity ETF allocation report
-        this_allocation_report_equity_etf = this_instance.generate_allocation_report_equity_etf()
-        this_allocation_report_equity_etf.iloc[-1] = this_allocation_report_equity_etf.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        '''
-        # call function to generate ETF allocation report in :broker: Charles Schwab
-        this_allocation_report_etf_at_schwab = this_instance.generate_allocation_report_etf_w_account(
-            'Schwab')
-        this_allocation_report_etf_at_schwab.iloc[-1] = this_allocation_report_etf_at_schwab.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        # call function to generate ETF allocation report in :broker: Fidelity
-        this_allocation_report_etf_at_fidelity = this_instance.generate_allocation_report_etf_w_account(
-            'Fidelity')
-        this_allocation_report_etf_at_fidelity.iloc[-1] = this_allocation_report_etf_at_fidelity.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        # call function to generate ETF allocation report in :broker: Vanguard
-        this_allocation_report_etf_at_vanguard = this_instance.generate_allocation_report_etf_w_account(
-            'Vanguard')
-        this_allocation_report_etf_at_vanguard.iloc[-1] = this_allocation_report_etf_at_vanguard.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        '''
-        # call function to generate Fixed Income ETF allocation report
-        this_allocation_report_fixed_etf = this_instance.generate_allocation_report_fixed_etf()
-        this_allocation_report_fixed_etf.iloc[-1] = this_allocation_report_fixed_etf.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        '''
-        # call function to generate individual Stock holding list
-        this_allocation_report_equity_stock = this_instance.generate_allocation_report_equity_stock()
-        this_allocation_report_equity_stock.iloc[-1] = this_allocation_report_equity_stock.iloc[-1].apply(
-            lambda x: '//strong/' + str(x) + '/strong//')
-        # call function to generate Fixed Income mature calender
-        this_mature_calender = this_instance.generate_mature_calender()
-        with open(out_filename, 'w+') as wf:
-            tmp_html_data = '<h1>Investment Portfolio Overview - ' + datetime.now().strftime('%b %d, %Y') + '</h1>' + \
-                            '\n<h3>Allocation Report - Investment Type </h3>' + \
-                            this_allocation_report_type.to_html(index=False) + \
-                            '\n<br>\n<h3>Allocation Report - Broker </h3>' + \
-                            this_allocation_report_account.to_html(index=False) + \
-                            '\n<br>\n<h3>Allocation Report - Charles Schwab </h3>' + \
-                            this_allocation_report_etf_at_schwab.to_html(index=False) + \
-                            '\n<br>\n<h3>Allocation Report - Fidelity </h3>' + \
-                            this_allocation_report_etf_at_fidelity.to_html(index=False) + \
-                            '\n<br>\n<h3>Allocation Report - Vanguard </h3>' + \
-                            this_allocation_report_etf_at_vanguard.to_html(index=False) + \
-                            '\n<br>\n<h3>Allocation Report - Individual Stock </h3>' + \
-                            this_allocation_report_equity_stock.to_html(index=False) + \
-                            '\n<br>\n<h3>Fixed Income Mature Calender</h3>' + \
-                            this_mature_calender.to_html(index=False) + '\n<br>\n'
-            out_data = tmp_html_data.replace('<th>', '<th align="center"; bgcolor="E0FFFF">').\
-                replace('//strong/', '<strong>').\
-                replace('/strong//', '</strong>')
-            wf.write(out_data)
+        out_stem = 'snapshots/snapshot_' + datetime.now().strftime('%Y%m%d')
+        out_filename = out_stem + '.html'
+        this_formats = sorted(set(x.lower() for x in v_formats))
+        this_cache = SnapshotCache()
+        this_fingerprint = this_cache.compute_fingerprint(datetime.now().strftime('%Y%m%d'),
+                                                          {'FORMATS': this_formats})
+        if not v_force and this_cache.is_fresh(this_fingerprint):
+            print('[..] Inputs are unchanged, reusing snapshot files of ' + out_stem + ' ...')
+            return True
+        from src.overview_pipeline import OverviewPipeline as OverviewPipeline
+        from src.report_renderer import ReportRenderer as ReportRenderer
+        from src.report_exporter import ReportExporter as ReportExporter
+        from src.snapshot_history import SnapshotHistory as SnapshotHistory
+        this_pipeline = OverviewPipeline(v_workers, v_replica=v_replica)
+        if 'html' in this_formats:
+            # call function to load shared inputs once, compute every report on the worker pool and stream each
+            # section into the snapshot as soon as it is ready
+            ReportRenderer().write_snapshot(out_filename, datetime.now().strftime('%b %d, %Y'),
+                                            this_pipeline.iter_sections())
+        else:
+            this_pipeline.run()
+        # call function to write the numeric report frames for downstream consumers
+        out_files = ([out_filename] if 'html' in this_formats else []) + \
+            ReportExporter().export(out_stem, this_pipeline.reports, [x for x in this_formats if x != 'html'])
+        # call function to append the numeric results of this run to the snapshot history
+        SnapshotHistory().record(datetime.now().strftime('%Y-%m-%d'), this_pipeline.reports,
+                                 this_pipeline.summary_tool.generate_position_values())
+        this_cache.save(this_fingerprint, out_files)
         return True
     except Exception as e:
         raise RuntimeError('Error: Failed to run master_overview() -> '+str(e))
 
 
+def master_benchmark(v_scale='small', v_seed=0, v_workers=4, v_memory=True, v_output=None, v_baseline=None):
+    """ Master script for Scale Benchmark, include: GENERATE, SYNC, UPDATE, BACKUP, RESTORE, OVERVIEW REPORTS
+
+    Args:
+        v_scale (str): scale preset tiny/small/medium/large with optional overrides, e.g. 'large,transactions=1000'.
+        v_seed (int): seed of the synthetic portfolio, default to 0.
+        v_workers (int): number of reports computed concurrently for the snapshot stage, default to 4.
+        v_memory (bool): trace the memory of every stage with tracemalloc, default to True.
+        v_output (str): results file, default to logs/benchmark_<scale>_<timestamp>.json.
+        v_baseline (str): results file of an earlier run to compare with, default to None.
+
+    Returns:
+        True is job completed successfully, False otherwise.
+
+    """
+    from src.benchmark import ScaleBenchmark as ScaleBenchmark, compare_results as compare_results
+    print('[..] Calling master_benchmark() ...')
+    try:
+        this_benchmark = ScaleBenchmark(v_scale, v_seed, v_workers, v_memory)
+        this_results = this_benchmark.run()
+        this_output = v_output or 'logs/benchmark_{}_{}.json'.format(v_scale.split(',')[0].replace('=', '_'),
+                                                                     datetime.now().strftime('%Y%m%d_%H%M%S'))
+        this_benchmark.write(this_output)
+        for this_stage in this_results['STAGES']:
+            print('[..] {:<45} {:>10.3f}s {:>12} {}'.format(
+                this_stage['NAME'], this_stage['SECONDS'],
+                '' if this_stage['PEAK_BYTES'] is None else '{:.1f} MiB'.format(this_stage['PEAK_BYTES'] / 2 ** 20),
+                this_stage['ERROR'] or ''))
+        if v_baseline:
+            for this_row in compare_results(v_baseline, this_results):
+                print('[..] {:<45} {:>10} -> {:>10} x{}'.format(this_row['NAME'], str(this_row['BASELINE_SECONDS']),
+                                                              str(this_row['SECONDS']), str(this_row['RATIO'])))
+        print('[..] Benchmark results written to ' + this_output)
+        if this_benchmark.failed:
+            raise RuntimeError('stage(s) failed: ' + ', '.join(this_benchmark.failed))
+        return True
+    except Exception as e:
+        raise RuntimeError('Error: Failed to run master_benchmark() -> '+str(e))
+
+
 # Executable arguments handler
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument('type', type=str, help='Execution Type: equity/fixed/overview')
-    parser.add_argument('-m', '--mode', type=str, help='Execution Mode: update/backup/restore/add')
+    parser.add_argument('type', type=str, help='Execution Type: equity/fixed/overview/benchmark')
+    parser.add_argument('-m', '--mode', type=str, help='Execution Mode: update/backup/restore/upgrade/add')
     parser.add_argument('-ee', '--eq_entry', type=str,
                         help='Transaction Entry to add, len=19):\n e.g. "SYMBOL,ACTION(BUY/SELL),'
                              'TRANSACTION_DATE(YYYY-MM-DD),PRICE,UNITS,INVESTMENT_TYPE(stock/ETF),'
@@ -238,20 +288,93 @@ if __name__ == "__main__":
                              'INVESTMENT_TYPE(TREASURY/CD/COPR BOND/HIGHYIELD),UNITS,FACE_VALUE,'
                              'ADDED_DATE(YYYY-MM-DD),MATURE_DATE(YYYY-MM-DD),TOTAL_COST,BROKER_NAME,YTM/APR=n"'
                         )
+    parser.add_argument('-w', '--workers', type=int, default=4,
+                        help='Number of reports computed concurrently for overview, default to 4')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='Regenerate overview snapshot even if its inputs are unchanged')
+    parser.add_argument('--format', type=str, nargs='+', default=['html'],
+                        choices=['html', 'json', 'csv', 'parquet'],
+                        help='Output formats for overview, multiple allowed, default to html')
+    parser.add_argument('--no_replica', action='store_true',
+                        help='Read overview inputs from the database files instead of an in-memory copy')
+    parser.add_argument('--sql_profile', type=str, nargs='?', const='logs/sql_profile.txt', default=None,
+                        help='Profile every SQL statement and write the report to this file at exit, '
+                             'default to logs/sql_profile.txt')
+    parser.add_argument('--trace', type=str, nargs='?', const='logs/trace.jsonl', default=None,
+                        help='Append timing spans of every stage to this JSON-lines file and print their summary '
+                             'tree at the end of the run, default to logs/trace.jsonl')
+    parser.add_argument('--metrics', type=str, nargs='?', const='', default=None,
+                        help='Write run metrics in Prometheus text format to this file at the end of the run, '
+                             'default to logs/metrics_<type>[_<mode>].prom')
+    parser.add_argument('--profile', type=str, choices=['cpu', 'mem', 'both'], default=None,
+                        help='Profile the run with cProfile (cpu), tracemalloc (mem) or both, output files go to '
+                             'logs/profiles/')
+    parser.add_argument('--scale', type=str, default='small',
+                        help='Scale of the synthetic portfolio for benchmark, tiny/small/medium/large with optional '
+                             'overrides, e.g. large,transactions=1000000, default to small')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Seed of the synthetic portfolio for benchmark, default to 0')
+    parser.add_argument('--benchmark_file', type=str, default=None,
+                        help='Results file for benchmark, default to logs/benchmark_<scale>_<timestamp>.json')
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='Results file of an earlier benchmark run to compare stage timings with')
+    parser.add_argument('--no_tracemalloc', action='store_true',
+                        help='Time benchmark stages without tracing their memory')
+    parser.add_argument('--log_level', type=str, nargs='+', default=None,
+                        help='Logging level of all modules and/or MODULE=LEVEL per module, e.g. WARNING '
+                             'src.eq_SQLite_utility=DEBUG, default to INFO')
     args = parser.parse_args()
-    if args.type.lower() == 'equity':
-        if args.mode.lower() == 'add':
-            master_equity(args.mode, args.eq_entry.split(','))
-        else:
-            master_equity(args.mode)
-    elif args.type.lower() == 'fixed':
-        if args.mode.lower() == 'add':
-            master_fixed(args.mode, args.fixed_entry.split(','))
-        else:
-            master_fixed(args.mode)
-    elif args.type.lower() == 'overview':
-        master_overview()
-    else:
-        raise IOError('Error in Executable arguments handler: Execution type is not valid -> '
-                      'expect equity/fixed/overview/get-fund-data, got {}: {}'.format(str(type(args.type)),
-                                                                                      str(args.type)))
+    if args.log_level:
+        from src.logger import set_logging_levels
+        set_logging_levels(dict(x.split('=', 1) if '=' in x else ('', x) for x in args.log_level))
+    if args.sql_profile:
+        from src.sql_profiler import SQL_PROFILER
+        SQL_PROFILER.enable(args.sql_profile)
+    from src.tracing import TRACER
+    if args.trace:
+        TRACER.enable(args.trace)
+    from src.metrics import METRICS, peak_rss_bytes
+    this_job = args.type.lower() + ('_' + args.mode.lower() if args.mode else '')
+    if args.metrics is not None:
+        METRICS.enable(args.metrics or f'logs/metrics_{this_job}.prom')
+    from src.run_profiler import RUN_PROFILER
+    if args.profile:
+        RUN_PROFILER.start(args.profile, v_run_name=this_job)
+    this_start = time.perf_counter()
+    this_success = False
+    try:
+        with TRACER.span('main.' + args.type.lower()), RUN_PROFILER.stage('main.' + this_job):
+            if args.type.lower() == 'equity':
+                if args.mode.lower() == 'add':
+                    master_equity(args.mode, args.eq_entry.split(','))
+                else:
+                    master_equity(args.mode)
+            elif args.type.lower() == 'fixed':
+                if args.mode.lower() == 'add':
+                    master_fixed(args.mode, args.fixed_entry.split(','))
+                else:
+                    master_fixed(args.mode)
+            elif args.type.lower() == 'overview':
+                master_overview(args.workers, args.force, args.format, not args.no_replica)
+            elif args.type.lower() == 'benchmark':
+                master_benchmark(args.scale, args.seed, args.workers, not args.no_tracemalloc, args.benchmark_file,
+                                 args.baseline)
+            else:
+                raise IOError('Error in Executable arguments handler: Execution type is not valid -> '
+                              'expect equity/fixed/overview/benchmark/get-fund-data, got {}: {}'.format(
+                                  str(type(args.type)), str(args.type)))
+        this_success = True
+    finally:
+        if RUN_PROFILER.running:
+            for this_file in RUN_PROFILER.stop():
+                print('[..] Profile written to ' + this_file)
+        if METRICS.enabled:
+            METRICS.set('portfolio_run_success', int(this_success), job=this_job)
+            METRICS.set('portfolio_run_duration_seconds', time.perf_counter() - this_start, job=this_job)
+            METRICS.set('portfolio_run_last_timestamp_seconds', time.time(), job=this_job)
+            if peak_rss_bytes() is not None:
+                METRICS.set('portfolio_peak_rss_bytes', peak_rss_bytes(), job=this_job)
+            METRICS.write()
+        if TRACER.enabled:
+            TRACER.dump()
+            print(TRACER.summary_tree())
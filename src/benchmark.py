@@ -0,0 +1,385 @@
+"""
+This module is used to benchmark every job of this package end to end on a synthetic portfolio.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+
+    A run generates a synthetic portfolio (src/synthetic_portfolio) in a scratch directory with the layout main.py
+    expects (databases/, backup/, logs/, snapshots/ and a copy of templates/), works from that directory, and times
+    each stage in sequence: the holdings and watch list syncs, the equity update, the backup and restore of both
+    databases, the shared overview inputs, every report of the Overview Snapshot, and the whole snapshot with the
+    worker pool. Quotes of the update come from FakeQuote instead of Yahoo Finance, so a run is offline and repeatable.
+    Restores write into a separate file next to the database they restore, so later stages read the generated data.
+    Memory of every stage is measured with tracemalloc, started at the stage start and stopped at its end: PEAK_BYTES
+    is the highest traced memory during the stage and NET_BYTES what the stage left allocated. Tracing slows Python
+    code down, so release comparisons should only compare runs with the same TRACEMALLOC setting.
+    A failing stage records its ERROR and the run goes on, later stages may then fail too.
+    Results are one JSON file per run, with the scale, seed, git revision and platform, so runs of two releases can
+    be compared stage by stage with :function: compare_results.
+
+Examples:
+    -- Run the 'small' benchmark and write its results:
+        from src.benchmark import ScaleBenchmark
+        this_benchmark = ScaleBenchmark('small')
+        this_benchmark.run()
+        this_benchmark.write('logs/benchmark_small.json')
+
+    -- Compare two runs:
+        from src.benchmark import compare_results
+        compare_results('logs/benchmark_v1.json', 'logs/benchmark_v2.json')
+
+    -- From the command line:
+        python main.py benchmark --scale large --log_level WARNING
+        python main.py benchmark --scale small,transactions=100000 --baseline logs/benchmark_small_v1.json
+
+"""
+
+import os
+import json
+import time
+import shutil
+import sqlite3
+import zlib
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import datetime
+from collections import OrderedDict
+from unittest.mock import patch
+
+from .logger import UseLogging
+from .synthetic_portfolio import SyntheticPortfolio, ETF_CATEGORIES
+from .overview_generator import SummaryTool
+from .overview_pipeline import OverviewPipeline, REPORTS
+from .report_renderer import ReportRenderer
+from .tracing import TRACER
+from .metrics import peak_rss_bytes
+
+
+RESULTS_VERSION = 1
+
+
+class FakeQuote(object):
+    """
+    The :class: FakeQuote can be used in place of :class: Stock and :class: ETF, every value is derived from the
+    ticker so the same ticker always gets the same quote.
+    """
+    def __init__(self, v_ticker):
+        self.ticker = v_ticker
+        self._hash = zlib.crc32(v_ticker.encode('utf-8'))
+
+    def get_previous_close(self):
+        return round(5.0 + self._hash % 49500 / 100.0, 2)
+
+    def get_low_52wks(self):
+        return round(self.get_previous_close() * 0.8, 2)
+
+    def get_high_52wks(self):
+        return round(self.get_previous_close() * 1.2, 2)
+
+    def get_market_cap(self):
+        return (self._hash % 200000 + 1) * 10000000
+
+    def get_pe(self):
+        return round(5.0 + self._hash % 4000 / 100.0, 2)
+
+    def get_forward_pe(self):
+        return round(self.get_pe() * 0.9, 2)
+
+    def get_sector(self):
+        return 'Technology'
+
+    def get_dividend(self):
+        return round(self._hash % 500 / 100.0, 2)
+
+    def get_eps(self):
+        return round(self.get_previous_close() / self.get_pe(), 2)
+
+    def get_forward_eps(self):
+        return round(self.get_eps() * 1.1, 2)
+
+    def get_short_float(self):
+        return round(self._hash % 1000 / 10000.0, 4)
+
+    def get_beta(self):
+        return round(0.5 + self._hash % 150 / 100.0, 2)
+
+    def get_name(self):
+        return 'Synthetic ' + self.ticker
+
+    def get_total_assets(self):
+        return (self._hash % 50000 + 1) * 10000000
+
+    def get_yield(self):
+        return round(self._hash % 600 / 10000.0, 4)
+
+    def get_category(self):
+        return ETF_CATEGORIES[self._hash % len(ETF_CATEGORIES)]
+
+
+def _git_revision(v_directory):
+    """Commit of the working tree in v_directory, None outside of a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=v_directory, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, check=True, universal_newlines=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def _count_rows(v_db_file, v_table):
+    """Number of rows of v_table in v_db_file."""
+    this_conn = sqlite3.connect(v_db_file)
+    try:
+        return this_conn.execute('SELECT COUNT(*) FROM {};'.format(v_table)).fetchone()[0]
+    finally:
+        this_conn.close()
+
+
+def _count_lines(v_file):
+    """Number of data lines of a CSV file with a header."""
+    with open(v_file, 'r') as rf:
+        return sum(1 for _ in rf) - 1
+
+
+class ScaleBenchmark(object):
+    """
+    The :class: ScaleBenchmark can be used to time and memory-profile every stage on a synthetic portfolio.
+    """
+    def __init__(self, v_scale='small', v_seed=0, v_workers=4, v_memory=True, v_work_dir=None, v_keep=False):
+        """
+        constructor for :class: ScaleBenchmark.
+
+        Args:
+            v_scale (str/dict): scale preset with optional overrides, see :function: parse_scale.
+            v_seed (int): seed of the synthetic portfolio, default to 0.
+            v_workers (int): worker count of the whole snapshot stage, default to 4.
+            v_memory (bool): trace the memory of every stage with tracemalloc, default to True.
+            v_work_dir (str): scratch directory, a new temporary directory when None.
+            v_keep (bool): keep the scratch directory after the run, default to False.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        if not isinstance(v_workers, int) or isinstance(v_workers, bool) or v_workers < 1:
+            raise IOError('Error in ScaleBenchmark(): input :v_workers: is not valid -> expect positive int, '
+                          'got {}: {}'.format(str(type(v_workers)), str(v_workers)))
+        self.portfolio = SyntheticPortfolio(v_scale, v_seed)
+        self.workers = v_workers
+        self.memory = bool(v_memory)
+        self.work_dir = v_work_dir
+        self.keep = bool(v_keep) or v_work_dir is not None
+        self.results = None
+        self._stages = []
+
+    def _run_stage(self, v_name, v_function):
+        """Run one stage, record its seconds, memory and rows, and its error instead of raising it."""
+        this_record = OrderedDict([('NAME', v_name), ('SECONDS', None), ('PEAK_BYTES', None), ('NET_BYTES', None),
+                                   ('ROWS', None), ('PEAK_RSS_BYTES', None), ('ERROR', None)])
+        self.logger.info('Benchmark stage {} ...'.format(v_name))
+        if self.memory:
+            tracemalloc.start()
+        this_start = time.perf_counter()
+        try:
+            with TRACER.span('ScaleBenchmark.' + v_name):
+                this_record['ROWS'] = v_function()
+        except Exception as e:
+            self.logger.error('Benchmark stage {} failed -> {}'.format(v_name, str(e)))
+            this_record['ERROR'] = '{}: {}'.format(type(e).__name__, str(e))
+        finally:
+            this_record['SECONDS'] = round(time.perf_counter() - this_start, 6)
+            if self.memory:
+                this_record['NET_BYTES'], this_record['PEAK_BYTES'] = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            this_record['PEAK_RSS_BYTES'] = peak_rss_bytes()
+        self.logger.info('Benchmark stage {} completed in {:.3f}s'.format(v_name, this_record['SECONDS']))
+        self._stages.append(this_record)
+        return this_record
+
+    def _generate(self):
+        this_rows = self.portfolio.write('databases')
+        return sum(this_rows.values())
+
+    def _sync_table_watch_list(self):
+        from .eq_SQLite_utility import SQLiteRequest
+        SQLiteRequest('databases/equity.db').sync_table_watch_list()
+        return _count_rows('databases/equity.db', 'watch_list')
+
+    def _sync_table_holdings(self):
+        from .eq_SQLite_utility import SQLiteRequest
+        SQLiteRequest('databases/equity.db').sync_table_holdings()
+        return _count_rows('databases/equity.db', 'tmp_holdings')
+
+    def _equity_update(self):
+        # imported here, the quote API of src/equity is only replaced for the duration of the update
+        from . import equity
+        with patch.object(equity, 'Stock', FakeQuote), patch.object(equity, 'ETF', FakeQuote):
+            equity.DbCommands().update()
+        return _count_rows('databases/equity.db', 'price_history')
+
+    def _equity_backup(self):
+        from .equity import DbCommands
+        this_instance = DbCommands()
+        this_instance.backup()
+        return _count_lines('backup/' + this_instance.backup_db_file)
+
+    def _equity_restore(self):
+        from .equity import DbCommands
+        this_instance = DbCommands()
+        this_instance.production_db_file = 'databases/restored_equity.db'
+        this_instance.restore()
+        return _count_rows(this_instance.production_db_file, 'transactions')
+
+    def _fixed_backup(self):
+        from .fixed_income import DbCommands
+        this_instance = DbCommands()
+        this_instance.backup()
+        return _count_lines('backup/' + this_instance.backup_db_file)
+
+    def _fixed_restore(self):
+        from .fixed_income import DbCommands
+        this_instance = DbCommands()
+        this_instance.production_db_file = 'databases/restored_fixed_income.db'
+        this_instance.restore()
+        return _count_rows(this_instance.production_db_file, 'transactions')
+
+    @staticmethod
+    def _report(v_summary_tool, v_name):
+        this_output = getattr(v_summary_tool, REPORTS[v_name][0])()
+        if isinstance(this_output, dict):
+            return sum(len(x) for x in this_output.values())
+        return len(this_output)
+
+    def _snapshot(self):
+        this_pipeline = OverviewPipeline(self.workers)
+        ReportRenderer().write_snapshot('snapshots/snapshot_benchmark.html', datetime.now().strftime('%b %d, %Y'),
+                                        this_pipeline.iter_sections())
+        return len(this_pipeline.reports)
+
+    def _prepare(self, v_templates_dir):
+        """Create the directory layout main.py expects in the scratch directory."""
+        for this_directory in ['databases', 'backup', 'logs', 'snapshots']:
+            os.makedirs(os.path.join(self.work_dir, this_directory), exist_ok=True)
+        if not os.path.exists(os.path.join(self.work_dir, 'templates')):
+            shutil.copytree(v_templates_dir, os.path.join(self.work_dir, 'templates'))
+
+    def run(self):
+        """The :function: run is used to generate the synthetic portfolio and run every stage on it.
+
+        Returns: :object: OrderedDict of run information and STAGES, the list of stage records.
+
+        """
+        if self.memory and tracemalloc.is_tracing():
+            self.logger.warning('tracemalloc is already tracing (--profile mem ?), stage memory is not measured')
+            self.memory = False
+        this_cwd = os.getcwd()
+        this_templates_dir = os.path.abspath('templates')
+        if self.work_dir is None:
+            self.work_dir = tempfile.mkdtemp(prefix='portfolio_benchmark_')
+        self.work_dir = os.path.abspath(self.work_dir)
+        self._stages = []
+        self.results = OrderedDict([
+            ('VERSION', RESULTS_VERSION),
+            ('CREATED', datetime.now().strftime('%Y-%m-%dT%H:%M:%S')),
+            ('GIT_REVISION', _git_revision(this_cwd)),
+            ('PYTHON', platform.python_version()),
+            ('PLATFORM', platform.platform()),
+            ('SCALE', self.portfolio.scale),
+            ('SEED', self.portfolio.seed),
+            ('WORKERS', self.workers),
+            ('TRACEMALLOC', self.memory),
+            ('TOTAL_SECONDS', None),
+            ('STAGES', self._stages)
+        ])
+        self.logger.info('Running benchmark in {} ...'.format(self.work_dir))
+        this_start = time.perf_counter()
+        try:
+            self._prepare(this_templates_dir)
+            os.chdir(self.work_dir)
+            if self._run_stage('generate', self._generate)['ERROR'] is not None:
+                return self.results
+            self._run_stage('equity.sync_table_watch_list', self._sync_table_watch_list)
+            self._run_stage('equity.sync_table_holdings', self._sync_table_holdings)
+            self._run_stage('equity.update', self._equity_update)
+            self._run_stage('equity.backup', self._equity_backup)
+            self._run_stage('equity.restore', self._equity_restore)
+            self._run_stage('fixed.backup', self._fixed_backup)
+            self._run_stage('fixed.restore', self._fixed_restore)
+            this_summary_tool = SummaryTool()
+            self._run_stage('overview.preload', this_summary_tool.data_context.preload)
+            for this_name in REPORTS:
+                self._run_stage('overview.report.' + this_name,
+                                lambda v_name=this_name: self._report(this_summary_tool, v_name))
+            self._run_stage('overview.snapshot', self._snapshot)
+        finally:
+            os.chdir(this_cwd)
+            self.results['TOTAL_SECONDS'] = round(time.perf_counter() - this_start, 6)
+            if not self.keep:
+                shutil.rmtree(self.work_dir, ignore_errors=True)
+        return self.results
+
+    @property
+    def failed(self):
+        """Names of the stages with an error."""
+        return [x['NAME'] for x in self._stages if x['ERROR'] is not None]
+
+    def write(self, v_output_file):
+        """The :function: write is used to write the results of the last run as JSON.
+
+        Args:
+            v_output_file (str): output file, its directory is created when missing.
+
+        Returns: :str: output file.
+
+        """
+        if self.results is None:
+            raise IOError('Error in ScaleBenchmark.write(): no results, call run() first')
+        if os.path.dirname(v_output_file):
+            os.makedirs(os.path.dirname(v_output_file), exist_ok=True)
+        with open(v_output_file, 'w') as wf:
+            json.dump(self.results, wf, indent=2)
+        self.logger.info('Benchmark results written to ' + v_output_file)
+        return v_output_file
+
+
+def compare_results(v_baseline, v_current):
+    """The :function: compare_results is used to compare the stage timings of two benchmark runs.
+
+    Args:
+        v_baseline (str/dict): results file or results of the reference run.
+        v_current (str/dict): results file or results of the new run.
+
+    Returns: :list: of OrderedDict NAME, BASELINE_SECONDS, SECONDS and RATIO (current / baseline), for the stages of
+        the current run, RATIO is None when either run has no timing for the stage or failed it.
+
+    """
+    this_runs = []
+    for this_run in [v_baseline, v_current]:
+        if isinstance(this_run, str):
+            with open(this_run, 'r') as rf:
+                this_run = json.load(rf)
+        if not isinstance(this_run, dict) or 'STAGES' not in this_run:
+            raise IOError('Error in compare_results(): input is not valid benchmark results -> got {}'.format(
+                str(type(this_run))))
+        this_runs.append(this_run)
+    if this_runs[0].get('SCALE') != this_runs[1].get('SCALE') or \
+            this_runs[0].get('TRACEMALLOC') != this_runs[1].get('TRACEMALLOC'):
+        UseLogging(__name__).use_loggers('portfolio_management').warning(
+            'Comparing benchmark runs of different SCALE or TRACEMALLOC settings')
+    this_baseline = {x['NAME']: x for x in this_runs[0]['STAGES']}
+    that_output = []
+    for this_stage in this_runs[1]['STAGES']:
+        this_reference = this_baseline.get(this_stage['NAME'], {})
+        this_ratio = None
+        if this_stage['ERROR'] is None and this_reference.get('ERROR') is None and this_reference.get('SECONDS'):
+            this_ratio = round(this_stage['SECONDS'] / this_reference['SECONDS'], 3)
+        that_output.append(OrderedDict([('NAME', this_stage['NAME']),
+                                        ('BASELINE_SECONDS', this_reference.get('SECONDS')),
+                                        ('SECONDS', this_stage['SECONDS']), ('RATIO', this_ratio)]))
+    return that_output
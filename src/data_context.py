@@ -0,0 +1,100 @@
+"""
+This module is used to share lazily loaded DataFrames across all reports generated in one run.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+
+    Every frame is loaded on first use only, then memoized until invalidate() is called. Callers always receive a
+    copy, so a report that renames or filters its input can not leak changes into the next report.
+
+Examples:
+    -- Initialize class:
+        from src.data_context import PortfolioDataContext
+        this_context = PortfolioDataContext({'eq_positions': this_summary_tool._get_eq_positions_data})
+
+    -- Get a memoized frame:
+        this_context.get('eq_positions')
+
+    -- Drop memoized frames, e.g. after the databases were updated:
+        this_context.invalidate()
+
+"""
+
+import threading
+
+from .logger import UseLogging
+from .tracing import TRACER
+
+
+class PortfolioDataContext(object):
+    """
+    The :class: PortfolioDataContext can be used to load each input DataFrame at most once per run.
+    """
+    def __init__(self, v_loaders):
+        """
+        constructor for :class: PortfolioDataContext.
+
+        Args:
+            v_loaders (dict): frame name -> callable without arguments returning a Pandas DataFrame.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.loaders = dict(v_loaders)
+        self._frames = {}
+        # one lock per frame, so different frames can be loaded by concurrent threads
+        self._locks = {k: threading.Lock() for k in self.loaders}
+
+    def get(self, v_name):
+        """The :function: get is used to return a copy of the memoized frame, loading it on first use.
+
+        Args:
+            v_name (str): frame name, one of the keys given to the constructor.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        if v_name not in self.loaders:
+            raise IOError('Error in PortfolioDataContext.get(): frame name is not valid -> expect one of {}, '
+                          'got {}'.format(', '.join(sorted(self.loaders.keys())), str(v_name)))
+        with self._locks[v_name]:
+            if v_name not in self._frames:
+                self.logger.info(f'Loading frame {v_name} into data context ...')
+                self._frames[v_name] = self.loaders[v_name]()
+            return self._frames[v_name].copy()
+
+    def invalidate(self, v_name=None):
+        """The :function: invalidate is used to drop one memoized frame, or all of them when v_name is None.
+
+        Args:
+            v_name (str): frame name, default to None.
+
+        """
+        for this_name in (list(self.loaders) if v_name is None else [v_name]):
+            with self._locks.get(this_name, threading.Lock()):
+                self._frames.pop(this_name, None)
+
+    def preload(self, v_executor=None):
+        """The :function: preload is used to load every frame that is not memoized yet.
+
+        Args:
+            v_executor (concurrent.futures.Executor): loads frames concurrently when given, default to None.
+
+        """
+        this_names = [x for x in self.loaders if x not in self._frames]
+        if v_executor is None:
+            for this_name in this_names:
+                self.get(this_name)
+        else:
+            for this_future in [v_executor.submit(TRACER.propagate(self.get), x) for x in this_names]:
+                this_future.result()
+
+    def is_loaded(self, v_name):
+        """The :function: is_loaded is used to check whether a frame is already memoized."""
+        return v_name in self._frames
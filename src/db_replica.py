@@ -0,0 +1,117 @@
+"""
+This module is used to take a frozen in-memory copy of a SQLite database without write locks.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    The source file is opened through a 'mode=ro' URI and copied with the sqlite3 backup API, which reads one
+    consistent version of the database and never takes a write lock, so an update job writing at the same time is
+    not blocked. The copy lives in a named shared-cache in-memory database, every connection opened on :attr: uri
+    sees the same point-in-time data at RAM speed, until close() drops it. A memory URI cannot be opened with
+    mode=ro, so the consumers, SQLiteRequest and PortfolioQuery, switch their connections to PRAGMA query_only.
+
+Examples:
+    -- Initialize class:
+        from src.db_replica import DatabaseReplica
+        this_replica = DatabaseReplica('databases/equity.db')
+
+    -- Read from the replica with the existing SQLite utilities:
+        with this_replica:
+            SQLiteRequest(this_replica.uri).get_view_positions()
+
+"""
+
+import os
+import sqlite3
+import pathlib
+import itertools
+
+from .logger import UseLogging
+
+
+_REPLICA_COUNTER = itertools.count(1)
+
+
+def read_only_uri(v_db_file):
+    """The :function: read_only_uri is used to get a 'mode=ro' URI of a database path.
+
+    The path is percent-encoded, a '#', '?' or '%' in it would otherwise end the path of the URI.
+
+    Args:
+        v_db_file (str): path to the SQLite database.
+
+    Returns: :str: URI to be opened with sqlite3.connect(uri, uri=True).
+
+    """
+    return pathlib.Path(os.path.abspath(v_db_file)).as_uri() + '?mode=ro'
+
+
+class DatabaseReplica(object):
+    """
+    The :class: DatabaseReplica can be used to read a SQLite database from a frozen in-memory copy.
+    """
+    def __init__(self, v_db_file):
+        """
+        constructor for :class: DatabaseReplica.
+
+        Args:
+            v_db_file (str): path to the SQLite database to copy.
+
+        """
+        if not isinstance(v_db_file, str):
+            raise IOError('Error in DatabaseReplica(): input :v_db_file: is not valid -> expect str, got {}: {}'.
+                          format(str(type(v_db_file)), str(v_db_file)))
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.db_file = v_db_file
+        self.uri = None
+        self._conn = None
+
+    def open(self):
+        """The :function: open is used to copy the database into memory.
+
+        Returns: :str: URI of the in-memory copy, to be opened with sqlite3.connect(uri, uri=True).
+
+        """
+        if self._conn is not None:
+            return self.uri
+        if not os.path.exists(self.db_file):
+            raise IOError(f'Error in DatabaseReplica.open(): database {self.db_file} does not exist')
+        self.logger.info(f'Copying {self.db_file} into a read-only in-memory replica ...')
+        try:
+            this_uri = 'file:replica_{}_{}?mode=memory&cache=shared'.format(
+                os.path.splitext(os.path.basename(self.db_file))[0], next(_REPLICA_COUNTER))
+            this_source = sqlite3.connect(read_only_uri(self.db_file), uri=True)
+            try:
+                # the connection keeps the in-memory database alive, any thread may close it
+                self._conn = sqlite3.connect(this_uri, uri=True, check_same_thread=False)
+                this_source.backup(self._conn)
+                self._conn.execute("PRAGMA query_only = ON;")
+            finally:
+                this_source.close()
+            self.uri = this_uri
+            return self.uri
+        except Exception as e:
+            self.close()
+            self.logger.error(f'Failed to copy {self.db_file} into memory -> ' + str(e))
+            raise e
+
+    def close(self):
+        """The :function: close is used to drop the in-memory copy."""
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self.uri = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -3,7 +3,7 @@ This :module: can be used to communicate with SQLite database.
 
     Original Author: Mark D
     Date created: 09/14/2019
-    Date Modified: 01/05/2020
+    Date Modified: 10/19/2026
     Python Version: 3.7
 
 Note:
@@ -17,14 +17,22 @@ Examples:
     test_instance.create_table_watch_list()
     test_instance.create_table_holding_cost()
     test_instance.create_view_positions()
+    test_instance.create_table_materialized_positions()
+    test_instance.create_table_cumulative_holdings()
+    test_instance.create_table_price_history()
+    test_instance.create_table_daily_valuation()
     test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 120.0, 10, 'stock', 'TD')
     test_instance.backup_table_transactions('transaction_test.csv')
     test_instance.load_backup_to_table_transactions('backup/transaction_test.csv')
     test_instance.sync_table_watch_list()
     test_instance.update_table_watch_list('AAPL', 'stock', 220.0, 140.0, 240.0, '100M', 18.0, 0.015, 3.05, '2019-07-31')
     table_data_transactions = test_instance.get_table_transactions()
+    account_transactions = test_instance.get_transactions(v_account='TD', v_columns=['SYMBOL', 'TYPE', 'UNITS'])
+    stock_positions = test_instance.get_positions(v_investment_type='stock')
     table_data_watch_list = test_instance.get_table_watch_list()
     view_data_positions = test_instance.get_view_positions()
+    holdings_at_year_end = test_instance.holdings_as_of('2019-12-31')
+    holdings_change = test_instance.holdings_between('2019-01-01', '2019-12-31')
 
 """
 
@@ -33,8 +41,19 @@ import json
 import sqlite3
 import pandas as pd
 from datetime import datetime
+from collections import deque
 
 from .logger import UseLogging
+from .metrics import connection_factory, metered, metered_write
+from .run_profiler import profiled_stage
+from .tracing import traced
+
+
+# columns :function: get_transactions and :function: get_positions may project, in default order
+TRANSACTIONS_COLUMNS = ['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE', 'DESCRIPTION',
+                        'ACCOUNT', 'TOTAL_DOLLARS']
+POSITIONS_COLUMNS = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS', 'UNITS', 'LAST_UPDATED',
+                     'MKT_VALUE', 'GAIN_PER_SHARE', 'GAIN_TOTAL', 'GAIN_PERCENTAGE']
 
 
 class SQLiteRequest(object):
@@ -52,6 +71,7 @@ class SQLiteRequest(object):
         self.db_file = v_db_filename
         self.table_schema_file = "templates/equity_tables_schema.json"
         self.view_query_positions = "templates/equity_positions_view_query.sql"
+        self.trigger_query_positions = "templates/equity_positions_triggers.sql"
         _logger_ref = UseLogging(__name__)
         self.logger = _logger_ref.use_loggers('portfolio_management')
 
@@ -88,6 +108,31 @@ class SQLiteRequest(object):
             raise e
         return that_result
 
+    def _add_generated_columns(self, v_cursor, v_table_name):
+        """
+        The :function: _add_generated_columns is used to add the generated columns declared in the JSON schema file
+            to a table created before they were declared, columns already in the table are left as they are.
+
+        Args:
+            v_cursor (sqlite3.Cursor): cursor of an open connection.
+            v_table_name (str): The table name to read from JSON file.
+
+        Returns:
+            :list: of str, the columns added.
+
+        """
+        with open(self.table_schema_file, 'r', newline='') as rf:
+            this_columns = [x for x in json.load(rf)[v_table_name.upper()] if x['mode'].startswith('GENERATED')]
+        this_existing = [x[1] for x in v_cursor.execute("PRAGMA table_xinfo({});".format(v_table_name.lower()))]
+        that_output = []
+        for column in this_columns:
+            if column['name'] not in this_existing:
+                # only VIRTUAL generated columns can be added to an existing table
+                v_cursor.execute("ALTER TABLE {} ADD COLUMN {} {} {};".format(
+                    v_table_name.lower(), column['name'], column['type'], column['mode']))
+                that_output.append(column['name'])
+        return that_output
+
     def _create_connection(self):
         """
         The :function: _create_connection is used to initialize the SQLite connection.
@@ -99,9 +144,14 @@ class SQLiteRequest(object):
 
         """
         try:
-            this_conn = sqlite3.connect(self.db_file)
-            self.logger.info("Connection to {} has been created ...".format(self.db_file))
-            self.logger.info("SQLite version is: " + sqlite3.version)
+            # 'file:' URIs open read-only files or in-memory replicas, see src/db_replica
+            this_conn = sqlite3.connect(self.db_file, uri=self.db_file.startswith('file:'),
+                                        factory=connection_factory())
+            if self.db_file.startswith('file:'):
+                # a shared in-memory replica is writable by any connection, never change the frozen copy
+                this_conn.execute("PRAGMA query_only = ON;")
+            self.logger.info("Connection to %s has been created ...", self.db_file)
+            self.logger.info("SQLite version is: %s", sqlite3.version)
         except sqlite3.Error as e:
             self.logger.error("Failed to connect to {} ! -> {}".format(self.db_file, str(e)))
             raise e
@@ -130,7 +180,8 @@ class SQLiteRequest(object):
 
     def create_table_transactions(self):
         """
-        The :function: create_table_transaction is used to create :table: 'transactions' in the SQLite DB file.
+        The :function: create_table_transaction is used to create :table: 'transactions' in the SQLite DB file,
+            with an index on ACCOUNT for account-scoped reads.
 
         Args:
 
@@ -143,6 +194,11 @@ class SQLiteRequest(object):
             this_conn = self._create_connection()
             this_cursor = this_conn.cursor()
             this_cursor.execute(create_table_sql)
+            # no read filters transactions on a date range, older files drop the DATE_DAY index kept on every insert
+            this_cursor.execute("DROP INDEX IF EXISTS idx_transactions_date_day;")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_account "
+                                "ON transactions (ACCOUNT, SYMBOL);")
+            this_conn.commit()
             self.logger.info(":table: 'transactions' has been created ...")
             this_conn.close()
             self.logger.info("Connection closed !")
@@ -224,6 +280,229 @@ class SQLiteRequest(object):
             self.logger.error("Failed to create :view: 'positions' ! -> " + str(e))
             raise e
 
+    def create_table_materialized_positions(self):
+        """
+        The :function: create_table_materialized_positions is used to create :table: 'materialized_positions', a
+            stored copy of :view: 'positions' kept current by triggers on :table: 'tmp_holdings' and
+            :table: 'watch_list', every write recomputes the rows of the symbols it touched only.
+
+        Requires :table: 'tmp_holdings', :table: 'watch_list' and :view: 'positions'. Once created,
+            :function: get_view_positions reads the table instead of the view.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        create_table_sql = self._read_json_schema_file('MATERIALIZED_POSITIONS')
+        try:
+            self.logger.info("Loading triggers for :table: 'materialized_positions' from {} ...".format(
+                self.trigger_query_positions)
+            )
+            with open(self.trigger_query_positions, 'r', newline='') as rf:
+                create_triggers_sql = rf.read()
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(create_table_sql)
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_materialized_positions_symbol "
+                                "ON materialized_positions (SYMBOL);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_materialized_positions_investment_type "
+                                "ON materialized_positions (INVESTMENT_TYPE);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_tmp_holdings_symbol ON tmp_holdings (SYMBOL);")
+            this_conn.commit()
+            this_conn.executescript(create_triggers_sql)
+            this_conn.close()
+            self.logger.info(":table: 'materialized_positions' has been created ...")
+            return self.refresh_table_materialized_positions()
+        except Exception as e:
+            self.logger.error("Failed to create :table: 'materialized_positions' ! -> " + str(e))
+            raise e
+
+    @traced()
+    @metered_write()
+    def refresh_table_materialized_positions(self):
+        """
+        The :function: refresh_table_materialized_positions is used to rebuild :table: 'materialized_positions'
+            from :view: 'positions', only needed after writes that bypass the triggers.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        list_of_header = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS', 'UNITS',
+                          'LAST_UPDATED', 'MKT_VALUE', 'GAIN_PER_SHARE', 'GAIN_TOTAL', 'GAIN_PERCENTAGE']
+        try:
+            self.logger.info("Rebuilding :table: 'materialized_positions' ...")
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute("DELETE FROM materialized_positions;")
+            this_cursor.execute("INSERT INTO materialized_positions ({0}) SELECT {0} FROM positions;".format(
+                ', '.join(list_of_header)))
+            this_conn.commit()
+            this_conn.close()
+            return True
+        except Exception as e:
+            self.logger.error("Failed to rebuild :table: 'materialized_positions' ! -> " + str(e))
+            raise e
+
+    def create_table_cumulative_holdings(self):
+        """
+        The :function: create_table_cumulative_holdings is used to create :table: 'cumulative_holdings' in the
+            SQLite DB file, with the indexes used for point-in-time lookups, and fill it from the existing
+            :table: 'transactions'.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        create_table_sql = self._read_json_schema_file('CUMULATIVE_HOLDINGS')
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(create_table_sql)
+            this_cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_cumulative_holdings_symbol_date "
+                                "ON cumulative_holdings (SYMBOL, DATE);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_symbol_date "
+                                "ON transactions (SYMBOL, DATE);")
+            this_conn.commit()
+            self.logger.info(":table: 'cumulative_holdings' has been created ...")
+            this_conn.close()
+            self.logger.info("Connection closed !")
+            # inserts only refresh the symbols they touch, the symbols already traded are backfilled here
+            return self.sync_table_cumulative_holdings()
+        except Exception as e:
+            self.logger.error("Failed to create :table: 'cumulative_holdings' ! -> " + str(e))
+            raise e
+
+    def create_table_price_history(self):
+        """
+        The :function: create_table_price_history is used to create :table: 'price_history' in the SQLite DB file.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        create_table_sql = self._read_json_schema_file('PRICE_HISTORY')
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(create_table_sql)
+            this_cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_price_history_symbol_date "
+                                "ON price_history (SYMBOL, DATE);")
+            this_conn.commit()
+            self.logger.info(":table: 'price_history' has been created ...")
+            this_conn.close()
+            self.logger.info("Connection closed !")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to create :table: 'price_history' ! -> " + str(e))
+            raise e
+
+    def create_table_daily_valuation(self):
+        """
+        The :function: create_table_daily_valuation is used to create :table: 'daily_valuation' and
+            :table: 'cache_metadata' in the SQLite DB file.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(self._read_json_schema_file('DAILY_VALUATION'))
+            this_cursor.execute(self._read_json_schema_file('CACHE_METADATA'))
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_valuation_date ON daily_valuation (DATE);")
+            this_conn.commit()
+            self.logger.info(":table: 'daily_valuation' has been created ...")
+            this_conn.close()
+            self.logger.info("Connection closed !")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to create :table: 'daily_valuation' ! -> " + str(e))
+            raise e
+
+    @staticmethod
+    def _accumulate_holdings(v_transactions):
+        """
+        The :function: _accumulate_holdings is used to roll transactions forward into end-of-day holdings, a SELL
+            releases the cost of the oldest BUY lots first (FIFO), the same as :function: sync_table_holdings.
+
+        Args:
+            v_transactions (list): rows of (ID, SYMBOL, TYPE, DATE, DOLLARS, UNITS), sorted by SYMBOL, DATE, ID,
+                starting from the first transaction of every SYMBOL.
+
+        Returns:
+            :list: of (SYMBOL, DATE, CUM_UNITS, CUM_COST, LAST_ID), one row per SYMBOL and DATE.
+
+        """
+        that_output = []
+        this_symbol = None
+        this_lots, v_units, v_cost = deque(), 0, 0.0
+        for this_id, this_row_symbol, this_type, this_date, this_dollars, this_row_units in v_transactions:
+            if this_row_symbol != this_symbol:
+                this_lots, v_units, v_cost = deque(), 0, 0.0
+            this_symbol = this_row_symbol
+            if str(this_type).upper() == 'BUY':
+                this_lots.append([int(this_row_units), float(this_dollars)])
+                v_cost = v_cost + float(this_dollars) * int(this_row_units)
+                v_units = v_units + int(this_row_units)
+            else:
+                this_delta_units = int(this_row_units)
+                while this_delta_units > 0 and this_lots:
+                    this_used = min(this_delta_units, this_lots[0][0])
+                    v_cost = v_cost - this_lots[0][1] * this_used
+                    this_lots[0][0] = this_lots[0][0] - this_used
+                    this_delta_units = this_delta_units - this_used
+                    if this_lots[0][0] == 0:
+                        this_lots.popleft()
+                v_units = v_units - int(this_row_units)
+                if v_units <= 0:
+                    v_cost = 0.0
+            this_entry = (this_symbol, this_date, v_units, round(v_cost, 6), this_id)
+            if that_output and that_output[-1][0] == this_symbol and that_output[-1][1] == this_date:
+                that_output[-1] = this_entry
+            else:
+                that_output.append(this_entry)
+        return that_output
+
+    def _refresh_cumulative_holdings(self, v_conn, v_symbol, v_from_date):
+        """
+        The :function: _refresh_cumulative_holdings is used to recompute :table: 'cumulative_holdings' for one
+            SYMBOL from v_from_date onwards. The open FIFO lots at v_from_date depend on every earlier BUY and
+            SELL, so the transactions of the SYMBOL are replayed from the first one and only the rows from
+            v_from_date onwards are rewritten.
+
+        Args:
+            v_conn (sqlite3.Connection): open connection, the caller commits.
+            v_symbol (str): The ticker symbol.
+            v_from_date (str): first affected transaction date in format 'YYYY-MM-DD'.
+
+        Returns:
+            :int: number of rows written.
+
+        """
+        this_cursor = v_conn.cursor()
+        this_cursor.execute("SELECT ID, SYMBOL, TYPE, DATE, DOLLARS, UNITS FROM transactions "
+                            "WHERE SYMBOL = ? AND LOWER(INVESTMENT_TYPE) <> 'others' "
+                            "ORDER BY DATE, ID;", (v_symbol,))
+        this_rows = [x for x in self._accumulate_holdings(this_cursor.fetchall()) if x[1] >= v_from_date]
+        this_cursor.execute("DELETE FROM cumulative_holdings WHERE SYMBOL = ? AND DATE >= ?;", (v_symbol, v_from_date))
+        this_cursor.executemany("INSERT INTO cumulative_holdings (SYMBOL, DATE, CUM_UNITS, CUM_COST, LAST_ID) "
+                                "VALUES (?, ?, ?, ?, ?);", this_rows)
+        return len(this_rows)
+
+    @traced()
+    @metered_write()
     def insert_into_table_transactions(self, v_symbol, v_type, v_date, v_dollars, v_units,
                                        v_investment_type, v_account, v_description):
         """
@@ -294,13 +573,13 @@ class SQLiteRequest(object):
             this_conn = self._create_connection()
             this_cursor = this_conn.cursor()
             this_cursor.execute(insert_sql, this_insert_values)
+            this_cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cumulative_holdings';")
+            if this_cursor.fetchone() is not None and v_investment_type.lower() != 'others':
+                self._refresh_cumulative_holdings(this_conn, v_symbol, v_date)
             this_conn.commit()
-            self.logger.info("Entry has been inserted into :table: 'transactions' (SYMBOL={}, TYPE={}, DATE={}, "
-                             "DOLLARS={}, UNITS={}, INVESTMENT_TYPE={}, DESCRIPTION={}, ACCOUNT={}, "
-                             "TOTAL_DOLLARS={}".format(
-                                 this_insert_values[0], this_insert_values[1], this_insert_values[2],
-                                 this_insert_values[3], this_insert_values[4], this_insert_values[5],
-                                 this_insert_values[6], this_insert_values[7], this_insert_values[8]))
+            self.logger.info("Entry has been inserted into :table: 'transactions' (SYMBOL=%s, TYPE=%s, DATE=%s, "
+                             "DOLLARS=%s, UNITS=%s, INVESTMENT_TYPE=%s, DESCRIPTION=%s, ACCOUNT=%s, "
+                             "TOTAL_DOLLARS=%s", *this_insert_values[:9])
             this_conn.close()
             if int(v_date.split('-')[0]) != int(datetime.today().year):
                 self.logger.warning(f"A transaction for Year {v_date.split('-')[0]} was added !")
@@ -309,6 +588,7 @@ class SQLiteRequest(object):
             self.logger.error("Failed to insert into :table: 'transactions' ! -> "+str(e))
             raise e
 
+    @traced()
     def backup_table_transactions(self,
                                   outfile_name='equity_transaction_backup_'+datetime.now().strftime('%Y%m%d_%H%M%S') +
                                                '.csv'):
@@ -344,6 +624,8 @@ class SQLiteRequest(object):
             self.logger.error("Failed to backup :table: 'transactions' ! -> " + str(e))
             raise e
 
+    @traced()
+    @metered_write()
     def load_backup_to_table_transactions(self, infile_name):
         """
         The :function: load_backup_to_table_transaction is used to load backup file into :table: 'transactions'.
@@ -374,7 +656,75 @@ class SQLiteRequest(object):
         except Exception as e:
             self.logger.error("Failed to load backup for :table: 'transactions' ! -> " + str(e))
             raise e
+        if self._table_exists('cumulative_holdings'):
+            self.sync_table_cumulative_holdings()
+
+    def _table_exists(self, v_table_name, v_conn=None):
+        """
+        The :function: _table_exists is used to check whether a table exists in the SQLite DB file.
+
+        Args:
+            v_table_name (str): The table name to look for.
+            v_conn (sqlite3.Connection): open connection to check on, default to a new connection.
+
+        Returns:
+            :boolean: True if the table exists.
+
+        """
+        this_conn = self._create_connection() if v_conn is None else v_conn
+        this_cursor = this_conn.cursor()
+        this_cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;", (v_table_name,))
+        that_result = this_cursor.fetchone() is not None
+        if v_conn is None:
+            this_conn.close()
+        return that_result
+
+    def _positions_source(self, v_conn):
+        """:table: 'materialized_positions' when it exists on v_conn, :view: 'positions' otherwise."""
+        return 'materialized_positions' if self._table_exists('materialized_positions', v_conn) else 'positions'
 
+    def _select_rows(self, v_source, v_list_of_header, v_columns=None, v_conditions=None, v_conn=None):
+        """
+        The :function: _select_rows is used to read a projection of :v_source: filtered in SQL.
+
+        Args:
+            v_source (str): table or view name.
+            v_list_of_header (list): columns that may be selected, also the default projection.
+            v_columns (list): columns to select, a subset of :v_list_of_header:, default to all of them.
+            v_conditions (list): of (str, tuple), WHERE terms with '?' placeholders and their parameters, all of
+                them must hold.
+            v_conn (sqlite3.Connection): open connection to read from, left open, default to a new connection.
+
+        Returns:
+            :list: of dictionary, can be read by column name.
+
+        """
+        this_columns = list(v_list_of_header) if v_columns is None else list(v_columns)
+        this_invalid = [x for x in this_columns if x not in v_list_of_header]
+        if not this_columns or this_invalid:
+            raise IOError("Error in SQLiteRequest: input :v_columns: is not valid -> expect columns of {}, got {}".
+                          format(v_source, str(v_columns)))
+        this_conditions = v_conditions or []
+        query_sql = "SELECT {} FROM {}".format(', '.join(this_columns), v_source)
+        if this_conditions:
+            query_sql += " WHERE " + " AND ".join(x[0] for x in this_conditions)
+        this_params = tuple(y for x in this_conditions for y in x[1])
+        this_conn = self._create_connection() if v_conn is None else v_conn
+        this_cursor = this_conn.cursor()
+        this_cursor.execute(query_sql + ";", this_params)
+        this_result = this_cursor.fetchall()
+        if v_conn is None:
+            this_conn.close()
+        return [dict(zip(this_columns, row)) for row in this_result]
+
+    @staticmethod
+    def _investment_type_condition(v_investment_type):
+        """WHERE term matching :v_investment_type: written in lower or upper case, e.g. 'etf' or 'ETF'."""
+        return "INVESTMENT_TYPE IN (?, ?)", (v_investment_type.lower(), v_investment_type.upper())
+
+    @traced()
+    @metered_write()
+    @profiled_stage()
     def sync_table_watch_list(self, v_update_everything=0):
         """
         The :function: sync_table_watch_list is used to sync :table: watch_list to include
@@ -437,6 +787,8 @@ class SQLiteRequest(object):
             self.logger.error("Failed to sync :table: 'watch_list' ! -> " + str(e))
             raise e
 
+    @traced()
+    @metered_write()
     def update_table_watch_list(self, v_symbol, v_name, v_investment_type, v_prev_close, v_low_52wks, v_high_52wks,
                                 v_mkt_cap, v_total_assets, v_pe, v_forward_pe, v_div, v_yield, v_eps, v_forward_eps,
                                 v_beta, v_short_float, v_sector, v_category):
@@ -570,15 +922,16 @@ class SQLiteRequest(object):
                                              v_investment_type)
                                 )
             this_conn.commit()
-            self.logger.info('''SYMBOL '{}', INVESTMENT_TYPE '{}' has been updated in :table: 'watch_list' (
-            LAST_UPDATED = '{}', FULL_NAME = '{}', PREV_CLOSE = '{}', LOW_52WKS = '{}', HIGH_52WKS = '{}', 
-            MKT_CAP = '{}', TOTAL_ASSETS = '{}', PE = '{}', FORWARD_PE = '{}', DIV = '{}', YIELD = '{}', EPS = '{}', 
-            FORWARD_EPS = '{}', BETA = '{}', SHORT_FLOAT = '{}', SECTOR = '{}', 
-            CATEGORY = '{}' '''.format(
-                str(v_symbol).upper(), str(v_investment_type).upper(), _current_date, str(v_name), str(v_prev_close),
-                str(v_low_52wks), str(v_high_52wks), str(v_mkt_cap), str(v_total_assets), str(v_pe), str(v_forward_pe),
-                str(v_div), str(v_yield), str(v_eps), str(v_forward_eps), str(v_beta), str(v_short_float),
-                str(v_sector), str(v_category))
+            # arguments are formatted lazily by the logging listener, this runs once per symbol of the update job
+            self.logger.info('''SYMBOL '%s', INVESTMENT_TYPE '%s' has been updated in :table: 'watch_list' (
+            LAST_UPDATED = '%s', FULL_NAME = '%s', PREV_CLOSE = '%s', LOW_52WKS = '%s', HIGH_52WKS = '%s', 
+            MKT_CAP = '%s', TOTAL_ASSETS = '%s', PE = '%s', FORWARD_PE = '%s', DIV = '%s', YIELD = '%s', EPS = '%s', 
+            FORWARD_EPS = '%s', BETA = '%s', SHORT_FLOAT = '%s', SECTOR = '%s', 
+            CATEGORY = '%s' ''',
+                str(v_symbol).upper(), str(v_investment_type).upper(), _current_date, v_name, v_prev_close,
+                v_low_52wks, v_high_52wks, v_mkt_cap, v_total_assets, v_pe, v_forward_pe,
+                v_div, v_yield, v_eps, v_forward_eps, v_beta, v_short_float,
+                v_sector, v_category
             )
             this_conn.close()
             return True
@@ -586,6 +939,41 @@ class SQLiteRequest(object):
             self.logger.error("Failed to update :table: 'watch_list' ! -> " + str(e))
             raise e
 
+    @traced()
+    @metered_write()
+    def insert_into_table_price_history(self, v_rows):
+        """
+        The :function: insert_into_table_price_history is used to insert or replace close prices in
+            :table: 'price_history'.
+
+        Args:
+            v_rows (list): of (SYMBOL, DATE, CLOSE), DATE in format 'YYYY-MM-DD'.
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        if not isinstance(v_rows, list):
+            raise IOError("1st :argument: v_rows should be a list of (SYMBOL, DATE, CLOSE). Got {}: {}".format(
+                str(type(v_rows)), str(v_rows))
+            )
+        try:
+            self.logger.info(f"Inserting {len(v_rows)} rows into :table: 'price_history' ...")
+            insert_sql = "INSERT OR REPLACE INTO price_history (SYMBOL, DATE, CLOSE) VALUES (?, ?, ?);"
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.executemany(insert_sql, [(x[0], x[1], round(float(x[2]), 4)) for x in v_rows])
+            this_conn.commit()
+            this_conn.close()
+            return True
+        except Exception as e:
+            self.logger.error("Failed to insert into :table: 'price_history' ! -> " + str(e))
+            raise e
+
+    @traced()
+    @metered('portfolio_holdings_sync_seconds')
+    @metered_write()
+    @profiled_stage()
     def sync_table_holdings(self):
         """
         The :function: sync_table_holdings is used to update :table: tmp_holdings based on :table: transactions.
@@ -666,22 +1054,25 @@ class SQLiteRequest(object):
                 df_transactions["DOLLARS"] * df_transactions["UNITS"] - df_transactions["TOTAL_COST"]
             df_output_transactions = df_transactions[["ID", "TOTAL_GAIN"]]
 
-            self.logger.info("Truncate :table: tmp_holdings ...")
-            _truncate_sql = "DELETE FROM tmp_holdings;"
-            this_conn = self._create_connection()
-            this_cursor = this_conn.cursor()
-            this_cursor.execute(_truncate_sql)
-            this_conn.commit()
-            this_conn.close()
-            self.logger.info("Loading result into :table: tmp_holdings ...")
-            insert_sql = "INSERT INTO tmp_holdings (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, UNITS, COST_DOLLARS) " \
-                         "VALUES (?, ?, ?, ?, ?);"
-            insert_data = [tuple([x[0], x[1], x[2], x[3], round(x[4], 2)]) for x in df_output_holding.values]
+            # only changed rows are written, so triggers on tmp_holdings refresh the symbols that changed only
+            self.logger.info("Applying changed rows to :table: tmp_holdings ...")
+            insert_data = {x[0]: tuple([x[0], x[1], x[2], x[3], round(x[4], 2)]) for x in df_output_holding.values}
             this_conn = self._create_connection()
             this_cursor = this_conn.cursor()
-            this_cursor.executemany(insert_sql, insert_data)
+            this_cursor.execute("SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, UNITS, COST_DOLLARS FROM tmp_holdings;")
+            this_current = {x[0]: tuple(x) for x in this_cursor.fetchall()}
+            this_deleted = [(x,) for x in this_current if x not in insert_data]
+            this_updated = [x[1:] + x[:1] for k, x in insert_data.items() if k in this_current and this_current[k] != x]
+            this_inserted = [x for k, x in insert_data.items() if k not in this_current]
+            this_cursor.executemany("DELETE FROM tmp_holdings WHERE SYMBOL = ?;", this_deleted)
+            this_cursor.executemany("UPDATE tmp_holdings SET DESCRIPTION = ?, INVESTMENT_TYPE = ?, UNITS = ?, "
+                                    "COST_DOLLARS = ? WHERE SYMBOL = ?;", this_updated)
+            this_cursor.executemany("INSERT INTO tmp_holdings (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, UNITS, "
+                                    "COST_DOLLARS) VALUES (?, ?, ?, ?, ?);", this_inserted)
             this_conn.commit()
             this_conn.close()
+            self.logger.info(":table: tmp_holdings synced: {} inserted, {} updated, {} deleted ...".format(
+                len(this_inserted), len(this_updated), len(this_deleted)))
             self.logger.info("Updating :column: TOTAL_GAIN in :table: transactions ...")
             insert_sql = "UPDATE transactions SET TOTAL_GAIN = ? WHERE ID = ?;"
             insert_data = [tuple([round(x[1], 2), x[0]]) for x in df_output_transactions.values]
@@ -695,6 +1086,37 @@ class SQLiteRequest(object):
             self.logger.error("Failed to sync :table: tmp_holdings ! -> " + str(e))
             raise e
 
+    @traced()
+    @metered_write()
+    def sync_table_cumulative_holdings(self):
+        """
+        The :function: sync_table_cumulative_holdings is used to rebuild :table: cumulative_holdings from
+            :table: transactions in one ordered pass.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        try:
+            self.logger.info("Rebuilding :table: cumulative_holdings ...")
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute("SELECT ID, SYMBOL, TYPE, DATE, DOLLARS, UNITS FROM transactions "
+                                "WHERE LOWER(INVESTMENT_TYPE) <> 'others' ORDER BY SYMBOL, DATE, ID;")
+            this_rows = self._accumulate_holdings(this_cursor.fetchall())
+            this_cursor.execute("DELETE FROM cumulative_holdings;")
+            this_cursor.executemany("INSERT INTO cumulative_holdings (SYMBOL, DATE, CUM_UNITS, CUM_COST, LAST_ID) "
+                                    "VALUES (?, ?, ?, ?, ?);", this_rows)
+            this_conn.commit()
+            this_conn.close()
+            self.logger.info(f":table: cumulative_holdings has been rebuilt with {len(this_rows)} rows ...")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to rebuild :table: cumulative_holdings ! -> " + str(e))
+            raise e
+
     def __sync_table_holdings(self):
         """
         The :function: sync_table_holdings is used to update :table: tmp_holdings based on :table: transactions.
@@ -776,6 +1198,7 @@ class SQLiteRequest(object):
             self.logger.error("Failed to sync :table: tmp_holdings ! -> " + str(e))
             raise e
 
+    @traced()
     def get_table_transactions(self):
         """
         The :function: get_table_transaction is used to query all data from :table: 'transaction' into a list of
@@ -808,6 +1231,35 @@ class SQLiteRequest(object):
             self.logger.error("Failed to get :table: 'transactions' data ! -> " + str(e))
             raise e
 
+    @traced()
+    def get_transactions(self, v_account=None, v_investment_type=None, v_columns=None):
+        """
+        The :function: get_transactions is used to query the rows of :table: 'transactions' in one account and/or of
+            one investment type, filtered and projected in SQL so only the requested slice is read.
+
+        Args:
+            v_account (str): ACCOUNT to keep, default to all accounts.
+            v_investment_type (str): INVESTMENT_TYPE to keep in lower or upper case, e.g. 'etf', default to all.
+            v_columns (list): columns of TRANSACTIONS_COLUMNS to select, default to all of them.
+
+        Returns:
+            :list: of dictionary, can be read by column name.
+
+        """
+        this_conditions = []
+        if v_account is not None:
+            this_conditions.append(("ACCOUNT = ?", (v_account,)))
+        if v_investment_type is not None:
+            this_conditions.append(self._investment_type_condition(v_investment_type))
+        try:
+            self.logger.info("Attempt to get :table: 'transactions' data for account {} and type {} ...".format(
+                v_account, v_investment_type))
+            return self._select_rows('transactions', TRANSACTIONS_COLUMNS, v_columns, this_conditions)
+        except Exception as e:
+            self.logger.error("Failed to get :table: 'transactions' data ! -> " + str(e))
+            raise e
+
+    @traced()
     def get_table_watch_list(self):
         """
         The :function: get_table_watch_list is used to query all data from :table: 'watch_list' into a list of
@@ -841,10 +1293,38 @@ class SQLiteRequest(object):
             self.logger.error("Failed to get :table: 'watch_list' data ! -> " + str(e))
             raise e
 
+    @traced()
+    def get_table_price_history(self):
+        """
+        The :function: get_table_price_history is used to query all data from :table: 'price_history' into a list
+            of dictionary, use column name as dictionary key.
+
+        Args:
+
+        Returns:
+            :list: of dictionary, can be read by column name.
+
+        """
+        list_of_header = ['SYMBOL', 'DATE', 'CLOSE']
+        try:
+            self.logger.info("Attempt to get :table: 'price_history' data ...")
+            query_sql = "SELECT {} FROM price_history ORDER BY DATE;".format(', '.join(list_of_header))
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(query_sql)
+            this_result = this_cursor.fetchall()
+            this_conn.close()
+            return [dict(zip(list_of_header, row)) for row in this_result]
+        except Exception as e:
+            self.logger.error("Failed to get :table: 'price_history' data ! -> " + str(e))
+            raise e
+
+    @traced()
     def get_view_positions(self):
         """
         The :function: get_view_positions is used to query all data from :view: 'positions' into a list of
-            dictionary, use column name as dictionary key.
+            dictionary, use column name as dictionary key. :table: 'materialized_positions' is read instead when
+            it exists.
 
         Args:
 
@@ -855,9 +1335,11 @@ class SQLiteRequest(object):
         list_of_header = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS', 'UNITS',
                           'LAST_UPDATED', 'MKT_VALUE', 'GAIN_PER_SHARE', 'GAIN_TOTAL', 'GAIN_PERCENTAGE']
         try:
-            self.logger.info("Attempt to get :view: 'positions' data ...")
-            query_sql = "SELECT {} FROM positions;".format(', '.join(list_of_header))
+            # the source is looked up on the connection that reads it
             this_conn = self._create_connection()
+            this_source = self._positions_source(this_conn)
+            self.logger.info(f"Attempt to get :view: 'positions' data from {this_source} ...")
+            query_sql = "SELECT {} FROM {};".format(', '.join(list_of_header), this_source)
             this_cursor = this_conn.cursor()
             this_cursor.execute(query_sql)
             this_result = this_cursor.fetchall()
@@ -873,3 +1355,106 @@ class SQLiteRequest(object):
         except Exception as e:
             self.logger.error("Failed to get :view: 'positions' data ! -> " + str(e))
             raise e
+
+    @traced()
+    def get_positions(self, v_investment_type=None, v_columns=None):
+        """
+        The :function: get_positions is used to query the positions of one investment type, filtered and projected
+            in SQL. :table: 'materialized_positions' is read when it exists, :view: 'positions' otherwise.
+
+        Args:
+            v_investment_type (str): INVESTMENT_TYPE to keep in lower or upper case, e.g. 'stock', default to all.
+            v_columns (list): columns of POSITIONS_COLUMNS to select, default to all of them.
+
+        Returns:
+            :list: of dictionary, can be read by column name.
+
+        """
+        this_conditions = []
+        if v_investment_type is not None:
+            this_conditions.append(self._investment_type_condition(v_investment_type))
+        try:
+            # the source is looked up on the connection that reads it
+            this_conn = self._create_connection()
+            try:
+                this_source = self._positions_source(this_conn)
+                self.logger.info(f"Attempt to get :view: 'positions' data of type {v_investment_type} "
+                                 f"from {this_source} ...")
+                return self._select_rows(this_source, POSITIONS_COLUMNS, v_columns, this_conditions, this_conn)
+            finally:
+                this_conn.close()
+        except Exception as e:
+            self.logger.error("Failed to get :view: 'positions' data ! -> " + str(e))
+            raise e
+
+    @traced()
+    def holdings_as_of(self, v_date):
+        """
+        The :function: holdings_as_of is used to get the units and cost basis held at the end of v_date, with one
+            index seek per SYMBOL on :table: 'cumulative_holdings' instead of replaying :table: 'transactions'.
+
+        Args:
+            v_date (str): Date in format 'YYYY-MM-DD'.
+
+        Returns:
+            :list: of dictionary, can be read by column name (SYMBOL, DATE, UNITS, COST_DOLLARS).
+
+        """
+        try:
+            datetime.strptime(v_date, '%Y-%m-%d')
+        except (TypeError, ValueError):
+            raise IOError("1st :argument: v_date should be in 'YYYY-MM-DD' format. Got {}: {}".format(
+                str(type(v_date)), str(v_date))
+            )
+        list_of_header = ['SYMBOL', 'DATE', 'UNITS', 'COST_DOLLARS']
+        try:
+            self.logger.info(f"Attempt to get holdings as of {v_date} ...")
+            query_sql = """SELECT t1.SYMBOL, t1.DATE, t1.CUM_UNITS, ROUND(t1.CUM_COST, 2)
+            FROM (SELECT DISTINCT SYMBOL FROM cumulative_holdings) t0
+            JOIN cumulative_holdings t1
+              ON t1.SYMBOL = t0.SYMBOL
+              AND t1.DATE = (SELECT MAX(t2.DATE) FROM cumulative_holdings t2
+                             WHERE t2.SYMBOL = t0.SYMBOL AND t2.DATE <= ?)
+            WHERE t1.CUM_UNITS <> 0
+            ORDER BY t1.SYMBOL;"""
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(query_sql, (v_date,))
+            this_result = this_cursor.fetchall()
+            this_conn.close()
+            return [dict(zip(list_of_header, row)) for row in this_result]
+        except Exception as e:
+            self.logger.error(f"Failed to get holdings as of {v_date} ! -> " + str(e))
+            raise e
+
+    @traced()
+    def holdings_between(self, v_start_date, v_end_date):
+        """
+        The :function: holdings_between is used to compare holdings at the end of v_start_date and v_end_date.
+
+        Args:
+            v_start_date (str): Date in format 'YYYY-MM-DD'.
+            v_end_date (str): Date in format 'YYYY-MM-DD', not earlier than v_start_date.
+
+        Returns:
+            :list: of dictionary, can be read by column name (SYMBOL, START_UNITS, START_COST_DOLLARS,
+                END_UNITS, END_COST_DOLLARS, UNITS_CHANGE), for every SYMBOL held on either date.
+
+        """
+        if not isinstance(v_start_date, str) or not isinstance(v_end_date, str) or v_start_date > v_end_date:
+            raise IOError("v_start_date should not be later than v_end_date. Got {} and {}".format(
+                str(v_start_date), str(v_end_date))
+            )
+        this_start = {x['SYMBOL']: x for x in self.holdings_as_of(v_start_date)}
+        this_end = {x['SYMBOL']: x for x in self.holdings_as_of(v_end_date)}
+        that_output = []
+        for this_symbol in sorted(set(this_start) | set(this_end)):
+            this_start_units = this_start.get(this_symbol, {}).get('UNITS', 0)
+            this_end_units = this_end.get(this_symbol, {}).get('UNITS', 0)
+            that_output.append({'SYMBOL': this_symbol,
+                                'START_UNITS': this_start_units,
+                                'START_COST_DOLLARS': this_start.get(this_symbol, {}).get('COST_DOLLARS', 0.0),
+                                'END_UNITS': this_end_units,
+                                'END_COST_DOLLARS': this_end.get(this_symbol, {}).get('COST_DOLLARS', 0.0),
+                                'UNITS_CHANGE': this_end_units - this_start_units})
+        return that_output
@@ -3,7 +3,7 @@ This module is the master for FinAPI_utility, eq_SQLite_utility
 
     Original Author: Mark D
     Date created: 09/28/2019
-    Date Modified: 01/05/2020
+    Date Modified: 10/19/2026
     Python Version: 3.7
 
 Note:
@@ -45,11 +45,13 @@ Examples:
 
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 
 from .logger import UseLogging
 from .eq_SQLite_utility import SQLiteRequest
+from .tracing import TRACER, traced
+from .metrics import METRICS, metered
 # from .financial_API_utility import Stock, ETF
 from .financial_API_utility_alternative import Stock, ETF
 
@@ -70,6 +72,8 @@ class DbCommands(object):
         self._current_date = datetime.now().strftime('%Y%m%d')
         self.backup_db_file = f'equity_transaction_backup_{self._current_date}.csv'
 
+    @traced()
+    @metered('portfolio_quote_fetch_seconds', investment_type='stock')
     def _get_stock_information(self, v_ticker):
         """
         The :function: _get_stock_information is used to get specific financial data for an individual stock.
@@ -81,7 +85,7 @@ class DbCommands(object):
             :str: The value for that key.
 
         """
-        self.logger.info(f'Retrieving stock information for ticker: {v_ticker}...')
+        self.logger.info('Retrieving stock information for ticker: %s...', v_ticker)
         _df = Stock(v_ticker)
         v_prev_close = _df.get_previous_close()
         v_low_52wks = _df.get_low_52wks()
@@ -96,14 +100,16 @@ class DbCommands(object):
         v_beta = _df.get_beta()
         v_short_float = _df.get_short_float()
         v_name = _df.get_name()
-        self.logger.info(f'.. Got: PREV_CLOSE={v_prev_close}, 52WEEKS_LOW={v_low_52wks}, 52WEEKS_HIGH={v_high_52wks}, '
-                         f'MARKET_CAP={v_mkt_cap}, trailing P/E={v_pe}, forward P/E={v_forward_pe}, '
-                         f'DIVIDEND_RATIO={v_div}, trailing EPS={v_eps}, forward EPS={v_forward_eps}, '
-                         f'sector={v_sector}, beta ratio={v_beta}, short float={v_short_float}, Name={v_name}'
+        self.logger.info('.. Got: PREV_CLOSE=%s, 52WEEKS_LOW=%s, 52WEEKS_HIGH=%s, MARKET_CAP=%s, trailing P/E=%s, '
+                         'forward P/E=%s, DIVIDEND_RATIO=%s, trailing EPS=%s, forward EPS=%s, sector=%s, '
+                         'beta ratio=%s, short float=%s, Name=%s', v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap,
+                         v_pe, v_forward_pe, v_div, v_eps, v_forward_eps, v_sector, v_beta, v_short_float, v_name
                          )
         return v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, v_forward_eps, \
             v_sector, v_beta, v_short_float, v_name
 
+    @traced()
+    @metered('portfolio_quote_fetch_seconds', investment_type='etf')
     def _get_etf_information(self, v_ticker):
         """
         The :function: _get_etf_information is used to get specific financial data for an ETF fund.
@@ -115,7 +121,7 @@ class DbCommands(object):
             :str: The value for that key.
 
         """
-        self.logger.info(f'Retrieving ETF information for ticker: {v_ticker}...')
+        self.logger.info('Retrieving ETF information for ticker: %s...', v_ticker)
         _df = ETF(v_ticker)
         v_prev_close = _df.get_previous_close()
         v_low_52wks = _df.get_low_52wks()
@@ -133,12 +139,13 @@ class DbCommands(object):
         v_total_assets = _df.get_total_assets()
         v_yield = _df.get_yield()
         v_category = _df.get_category()
-        self.logger.info(f'.. Got: PREV_CLOSE={v_prev_close}, Total Assets={v_total_assets}, Yield={v_yield}, '
-                         f'Category={v_category}, Name={v_name}'
+        self.logger.info('.. Got: PREV_CLOSE=%s, Total Assets=%s, Yield=%s, Category=%s, Name=%s',
+                         v_prev_close, v_total_assets, v_yield, v_category, v_name
                          )
         return v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, v_forward_eps, \
             v_sector, v_beta, v_short_float, v_name, v_total_assets, v_yield, v_category
 
+    @traced()
     def backup(self):
         """Call eq_SQLite_utility to create a backup from current equity database.
 
@@ -154,6 +161,7 @@ class DbCommands(object):
             raise e
         self.logger.info(f'.. Backup has been created as: backup/{self.backup_db_file}')
 
+    @traced()
     def restore(self):
         """Call eq_SQLite_utility to re-create equity database from the latest backup file.
 
@@ -168,6 +176,10 @@ class DbCommands(object):
             _instance.create_table_watch_list()
             _instance.create_table_holdings()
             _instance.create_view_positions()
+            _instance.create_table_materialized_positions()
+            _instance.create_table_cumulative_holdings()
+            _instance.create_table_price_history()
+            _instance.create_table_daily_valuation()
             backup_file = [x for x in sorted(os.listdir('backup/'), reverse=True)
                            if x.startswith('equity_transaction_')][0]
             _instance.load_backup_to_table_transactions('backup/' + backup_file)
@@ -176,6 +188,19 @@ class DbCommands(object):
             raise e
         self.logger.info(f'.. Database has been restored from: backup/{backup_file}')
 
+    @staticmethod
+    def _previous_trading_date(v_date):
+        """Get the last weekday before v_date in format 'YYYY-MM-DD', the date the previous close was traded on.
+
+        Exchange holidays are not known here, a close quoted after a holiday is kept under the holiday itself.
+
+        """
+        this_date = v_date - timedelta(days=1)
+        while this_date.weekday() >= 5:
+            this_date = this_date - timedelta(days=1)
+        return this_date.strftime('%Y-%m-%d')
+
+    @traced()
     def update(self):
         """Call eq_SQLite_utility to update :table: tmp_holdings and :table: watch_list in equity database.
 
@@ -192,41 +217,52 @@ class DbCommands(object):
         self.logger.info('Updating :table: watch_list ...')
         try:
             _instance.sync_table_watch_list()
+            _instance.create_table_price_history()
+            # the quote is the previous close, store it under the day it was traded on
+            _price_date = self._previous_trading_date(datetime.now())
             data_watch_list = [x for x in _instance.get_table_watch_list() if int(x['ENABLED']) == 1]
             for i in range(len(data_watch_list)):
                 v_symbol = data_watch_list[i]['SYMBOL']
                 v_investment_type = data_watch_list[i]['INVESTMENT_TYPE']
-                if v_investment_type.lower() == 'stock':
-                    v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, \
-                        v_forward_eps, v_sector, v_beta, v_short_float, v_name = self._get_stock_information(v_symbol)
-                    v_total_assets, v_yield, v_category = 0, float('nan'), ''
-                    _instance.update_table_watch_list(v_symbol, v_name, v_investment_type, v_prev_close,
-                                                      v_low_52wks, v_high_52wks, v_mkt_cap, v_total_assets, v_pe,
-                                                      v_forward_pe, v_div, v_yield, v_eps, v_forward_eps, v_beta,
-                                                      v_short_float, v_sector, v_category
-                                                      )
-                elif v_investment_type.lower() == 'etf':
-                    v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, \
-                        v_forward_eps, v_sector, v_beta, v_short_float, v_name, v_total_assets, v_yield, \
-                        v_category = self._get_etf_information(v_symbol)
-                    _instance.update_table_watch_list(v_symbol, v_name, v_investment_type, v_prev_close,
-                                                      v_low_52wks, v_high_52wks, v_mkt_cap, v_total_assets,
-                                                      v_pe, v_forward_pe, v_div, v_yield, v_eps, v_forward_eps,
-                                                      v_beta, v_short_float, v_sector, v_category
-                                                      )
-                else:
-                    self.logger.error("Investment type should be :string: stock/etf. Got {}: {}".format(
-                        str(type(v_investment_type)), str(v_investment_type)
-                    ))
-                    raise IOError("Investment type should be :string: stock/etf. Got {}: {}".format(
-                        str(type(v_investment_type)), str(v_investment_type)
-                    ))
+                # one span per symbol, so the slow quotes can be told apart in the trace
+                with TRACER.span('DbCommands.update.quote', SYMBOL=v_symbol, INVESTMENT_TYPE=v_investment_type), \
+                        METRICS.count_outcome('portfolio_symbols_refreshed_total', 'portfolio_symbols_failed_total',
+                                              investment_type=str(v_investment_type).lower()):
+                    if v_investment_type.lower() == 'stock':
+                        v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, \
+                            v_forward_eps, v_sector, v_beta, v_short_float, \
+                            v_name = self._get_stock_information(v_symbol)
+                        v_total_assets, v_yield, v_category = 0, float('nan'), ''
+                        _instance.update_table_watch_list(v_symbol, v_name, v_investment_type, v_prev_close,
+                                                          v_low_52wks, v_high_52wks, v_mkt_cap, v_total_assets, v_pe,
+                                                          v_forward_pe, v_div, v_yield, v_eps, v_forward_eps, v_beta,
+                                                          v_short_float, v_sector, v_category
+                                                          )
+                        _instance.insert_into_table_price_history([(v_symbol, _price_date, v_prev_close)])
+                    elif v_investment_type.lower() == 'etf':
+                        v_prev_close, v_low_52wks, v_high_52wks, v_mkt_cap, v_pe, v_div, v_eps, v_forward_pe, \
+                            v_forward_eps, v_sector, v_beta, v_short_float, v_name, v_total_assets, v_yield, \
+                            v_category = self._get_etf_information(v_symbol)
+                        _instance.update_table_watch_list(v_symbol, v_name, v_investment_type, v_prev_close,
+                                                          v_low_52wks, v_high_52wks, v_mkt_cap, v_total_assets,
+                                                          v_pe, v_forward_pe, v_div, v_yield, v_eps, v_forward_eps,
+                                                          v_beta, v_short_float, v_sector, v_category
+                                                          )
+                        _instance.insert_into_table_price_history([(v_symbol, _price_date, v_prev_close)])
+                    else:
+                        self.logger.error("Investment type should be :string: stock/etf. Got {}: {}".format(
+                            str(type(v_investment_type)), str(v_investment_type)
+                        ))
+                        raise IOError("Investment type should be :string: stock/etf. Got {}: {}".format(
+                            str(type(v_investment_type)), str(v_investment_type)
+                        ))
         except Exception as e:
             self.logger.error('Failed to update :table: watch_list -> ' + str(e))
             raise e
         self.logger.info(f'.. :table: watch_list and :table: tmp_holding_cost have been '
                          f'updated on {self._current_date}')
 
+    @traced()
     def add(self, v_symbol, v_type, v_date, v_dollars, v_units, v_investment_type, v_account, v_memo=''):
         """Call eq_SQLite_utility to add a new entry into equity database.
         e.g. 'AAPL', 'BUY', '2018-12-31', 120.0, 10, 'stock', 'TD', 'Bought stock for Apple.inc'
@@ -3,26 +3,46 @@ This :module: can be used to communicate with SQLite database.
 
     Original Author: Mark D
     Date created: 12/08/2019
-    Date Modified: 12/29/2019
+    Date Modified: 10/19/2026
     Python Version: 3.7
 
 Note:
     This module depend on following third-party Python library:
      - none
 
+    ADD_DAY and END_DAY are generated from ADD_DATE and END_DATE as days since 1970-01-01, END_DAY is indexed so
+    active positions are read with a range seek on END_DAY >= TODAY_DAY_SQL instead of parsing every END_DATE.
+    Databases created before these columns are upgraded in place by :function: upgrade_schema_fixed, which only the
+    write entry points call (fixed income add, restore and upgrade). Reads never change the schema, on an older
+    database they filter on END_DAY_SQL computed from END_DATE instead.
+
 Examples:
     test_instance = FixedSQLiteRequest('test/test.db')
     test_instance.create_database()
     test_instance.create_table_transactions_fixed()
     test_instance.create_view_positions_fixed()
+    test_instance.upgrade_schema_fixed()
+    active_in_account = test_instance.get_transactions_fixed(v_account='TD', v_active_only=True)
 
 """
 
+import os
 import csv
 from datetime import datetime
 
 from .logger import UseLogging
 from .eq_SQLite_utility import SQLiteRequest
+from .tracing import traced
+from .metrics import metered_write
+
+
+# today as days since 1970-01-01, constant for the whole statement so it can bound an index range
+TODAY_DAY_SQL = "CAST(JULIANDAY(DATE('now')) - 2440587.5 AS INTEGER)"
+# columns :function: get_transactions_fixed may project, in default order
+TRANSACTIONS_FIXED_COLUMNS = ['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE', 'TOTAL_DOLLARS',
+                              'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM', 'ACCOUNT']
+# END_DAY computed from END_DATE, the same expression as the generated column, for databases created before it
+END_DAY_SQL = "CAST(JULIANDAY(END_DATE) - 2440587.5 AS INTEGER)"
 
 
 class FixedSQLiteRequest(SQLiteRequest):
@@ -54,7 +74,9 @@ class FixedSQLiteRequest(SQLiteRequest):
 
     def create_table_transactions_fixed(self):
         """
-        The :function: create_table_transaction is used to create :table: 'transactions' in the SQLite DB file.
+        The :function: create_table_transaction is used to create :table: 'transactions' in the SQLite DB file,
+            with the generated day columns and the indexes on END_DAY and (ACCOUNT, END_DAY), tables created before
+            are upgraded in place.
 
         Args:
 
@@ -67,6 +89,11 @@ class FixedSQLiteRequest(SQLiteRequest):
             this_conn = self._create_connection()
             this_cursor = this_conn.cursor()
             this_cursor.execute(create_table_sql)
+            self._add_generated_columns(this_cursor, 'TRANSACTIONS')
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_end_day ON transactions (END_DAY);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_account_end_day "
+                                "ON transactions (ACCOUNT, END_DAY);")
+            this_conn.commit()
             self.logger.info(":table: 'transactions' has been created ...")
             this_conn.close()
             self.logger.info("Connection closed !")
@@ -77,7 +104,8 @@ class FixedSQLiteRequest(SQLiteRequest):
 
     def create_view_positions_fixed(self):
         """
-        The :function: create_view_positions_fixed is used to create :view: 'positions' in the SQLite DB file.
+        The :function: create_view_positions_fixed is used to create :view: 'positions' in the SQLite DB file, an
+            existing :view: 'positions' is replaced.
 
         Args:
 
@@ -93,6 +121,7 @@ class FixedSQLiteRequest(SQLiteRequest):
                 create_view_sql = rf.read()
                 this_conn = self._create_connection()
                 this_cursor = this_conn.cursor()
+                this_cursor.execute("DROP VIEW IF EXISTS positions;")
                 this_cursor.execute(create_view_sql)
                 self.logger.info(":view: 'positions' has been created ...")
                 this_conn.close()
@@ -102,6 +131,54 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to create :view: 'positions' ! -> " + str(e))
             raise e
 
+    @staticmethod
+    def _end_day(v_source, v_conn):
+        """END_DAY when :v_source: has the generated column on v_conn, END_DAY_SQL on a schema not upgraded yet."""
+        this_columns = [x[1] for x in v_conn.execute("PRAGMA table_xinfo({});".format(v_source))]
+        return 'END_DAY' if 'END_DAY' in this_columns else END_DAY_SQL
+
+    @metered_write()
+    def upgrade_schema_fixed(self):
+        """
+        The :function: upgrade_schema_fixed is used to upgrade a database created before the generated day columns:
+            the missing columns of :table: 'transactions' are added, the END_DAY indexes are created and a :view:
+            'positions' without END_DAY is re-created. 'file:' URIs and database files not created yet are skipped.
+
+        Args:
+
+        Returns:
+            :boolean: True if the database has been checked, False if it was skipped.
+
+        """
+        if self.db_file.startswith('file:') or not os.path.exists(self.db_file):
+            return False
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_objects = dict(this_cursor.execute("SELECT name, type FROM sqlite_master "
+                                                    "WHERE name IN ('transactions', 'positions');").fetchall())
+            this_columns = [x[1] for x in this_cursor.execute("PRAGMA table_xinfo(transactions);")]
+            # the day columns are generated from the dates, other tables named transactions are left alone
+            if this_objects.get('transactions') == 'table' and {'ADD_DATE', 'END_DATE'}.issubset(this_columns):
+                this_added = self._add_generated_columns(this_cursor, 'TRANSACTIONS')
+                this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_end_day ON transactions (END_DAY);")
+                this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_account_end_day "
+                                    "ON transactions (ACCOUNT, END_DAY);")
+                if this_added:
+                    self.logger.info(":table: 'transactions' has been upgraded with {} ...".format(this_added))
+            this_stale_view = this_objects.get('positions') == 'view' and \
+                'END_DAY' not in [x[1] for x in this_cursor.execute("PRAGMA table_info(positions);")]
+            this_conn.commit()
+            this_conn.close()
+            if this_stale_view:
+                self.create_view_positions_fixed()
+            return True
+        except Exception as e:
+            self.logger.error("Failed to upgrade :database: {} ! -> {}".format(self.db_file, str(e)))
+            raise e
+
+    @traced()
+    @metered_write()
     def insert_into_table_transactions_fixed(self, v_name, v_symbol, v_investment_type, v_units, v_face_value,
                                              v_add_date, v_end_date, v_total_cost, v_account, **kwargs):
         """
@@ -209,6 +286,7 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to insert into :table: 'transactions' ! -> "+str(e))
             raise e
 
+    @traced()
     def backup_table_transactions_fixed(self,
                                         outfile_name='fixed_transaction_backup_' +
                                                      datetime.now().strftime('%Y%m%d_%H%M%S') + '.csv'):
@@ -244,6 +322,8 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to backup :table: 'transactions' ! -> " + str(e))
             raise e
 
+    @traced()
+    @metered_write()
     def load_backup_to_table_transactions_fixed(self, infile_name):
         """
         The :function: load_backup_to_table_transaction_fixed is used to load backup file into :table: 'transactions'.
@@ -277,6 +357,7 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to load backup for :table: 'transactions' ! -> " + str(e))
             raise e
 
+    @traced()
     def get_table_transactions_fixed(self):
         """
         The :function: get_table_transaction_fixed is used to query all data from :table: 'transaction' into a list of
@@ -311,6 +392,40 @@ class FixedSQLiteRequest(SQLiteRequest):
             self.logger.error("Failed to get :table: 'transactions' data ! -> " + str(e))
             raise e
 
+    @traced()
+    def get_transactions_fixed(self, v_account=None, v_active_only=False, v_columns=None):
+        """
+        The :function: get_transactions_fixed is used to query the rows of :table: 'transactions' in one account
+            and/or not matured yet, filtered and projected in SQL with the index on (ACCOUNT, END_DAY).
+
+        Args:
+            v_account (str): ACCOUNT to keep, default to all accounts.
+            v_active_only (bool): keep positions maturing today or later only, default to False.
+            v_columns (list): columns of TRANSACTIONS_FIXED_COLUMNS to select, default to all of them.
+
+        Returns:
+            :list: of dictionary, can be read by column name.
+
+        """
+        this_conditions = []
+        if v_account is not None:
+            this_conditions.append(("ACCOUNT = ?", (v_account,)))
+        try:
+            self.logger.info("Attempt to get :table: 'transactions' data for account {} ...".format(v_account))
+            this_conn = self._create_connection()
+            try:
+                if v_active_only:
+                    this_conditions.append(("{} >= {}".format(self._end_day('transactions', this_conn),
+                                                              TODAY_DAY_SQL), ()))
+                return self._select_rows('transactions', TRANSACTIONS_FIXED_COLUMNS, v_columns, this_conditions,
+                                         this_conn)
+            finally:
+                this_conn.close()
+        except Exception as e:
+            self.logger.error("Failed to get :table: 'transactions' data ! -> " + str(e))
+            raise e
+
+    @traced()
     def get_view_positions_fixed(self):
         """
         The :function: get_view_positions_fixed is used to query all data from :view: 'positions' into a list of
@@ -328,8 +443,9 @@ class FixedSQLiteRequest(SQLiteRequest):
                           'END_DATE', 'TOTAL_COST', 'RETURN_RATE', 'RETURN_DOLLARS', 'IS_MATURED']
         try:
             self.logger.info("Attempt to get :view: 'positions' data ...")
-            query_sql = "SELECT {} FROM positions WHERE IS_MATURED = 0;".format(', '.join(list_of_header))
             this_conn = self._create_connection()
+            query_sql = "SELECT {} FROM positions WHERE {} >= {};".format(
+                ', '.join(list_of_header), self._end_day('positions', this_conn), TODAY_DAY_SQL)
             this_cursor = this_conn.cursor()
             this_cursor.execute(query_sql)
             this_result = this_cursor.fetchall()
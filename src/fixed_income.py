@@ -21,6 +21,11 @@ Examples:
         this_instance = fixed_DbCommands()
         this_instance.restore()
 
+    -- Upgrade SQLite Database 'fixed_income' created before the generated day columns, reads do not change it.
+        from src.fixed_income import DbCommands as fixed_DbCommands
+        this_instance = fixed_DbCommands()
+        this_instance.upgrade()
+
     -- Add new transaction into SQLite Database 'fixed_income' Table 'transactions'.
         from src.fixed_income import DbCommands as fixed_DbCommands
         this_instance = fixed_DbCommands()
@@ -47,6 +52,7 @@ import os
 
 from .logger import UseLogging
 from .fixed_SQLite_utility import FixedSQLiteRequest
+from .tracing import traced
 
 
 class DbCommands(object):
@@ -65,6 +71,7 @@ class DbCommands(object):
         self._current_date = datetime.now().strftime('%Y%m%d')
         self.backup_db_file = f'fixed_transaction_backup_{self._current_date}.csv'
 
+    @traced()
     def backup(self):
         """Call fixed_SQLite_utility to create a backup from current fixed income database.
 
@@ -80,6 +87,7 @@ class DbCommands(object):
             raise e
         self.logger.info(f'.. Backup has been created as: backup/{self.backup_db_file}')
 
+    @traced()
     def restore(self):
         """Call fixed_SQLite_utility to re-create fixed income database from the latest backup file.
 
@@ -100,6 +108,22 @@ class DbCommands(object):
             raise e
         self.logger.info(f'.. Database has been restored from: backup/{backup_file}')
 
+    @traced()
+    def upgrade(self):
+        """Call fixed_SQLite_utility to upgrade a fixed income database created before the generated day columns.
+
+        Return: none.
+
+        """
+        self.logger.info('Upgrading database schema...')
+        try:
+            FixedSQLiteRequest(self.production_db_file).upgrade_schema_fixed()
+        except Exception as e:
+            self.logger.error('Failed to upgrade database schema -> '+str(e))
+            raise e
+        self.logger.info(f'.. Database schema has been upgraded: {self.production_db_file}')
+
+    @traced()
     def add(self, v_name, v_symbol, v_investment_type, v_units, v_face_value, v_add_date, v_end_date, v_total_cost,
             v_account, **kwargs):
         """Call fixed_SQLite_utility to add a new entry into fixed income database.
@@ -119,6 +143,7 @@ class DbCommands(object):
             v_ytm = 0.0
         try:
             _instance = FixedSQLiteRequest(self.production_db_file)
+            _instance.upgrade_schema_fixed()
             _instance.insert_into_table_transactions_fixed(v_name, v_symbol, v_investment_type, v_units, v_face_value,
                                                            v_add_date, v_end_date, v_total_cost, v_account,
                                                            YTM=v_ytm, APR=v_apr)
@@ -0,0 +1,313 @@
+"""
+This module is used to project fixed income cash flows, build the maturity calendar and compute bond analytics with
+NumPy arrays.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - numpy
+
+    Dates are converted once to integer months (months since 1970-01), every payment of every position is then
+    generated by np.repeat over the number of payments and aggregated by (month, account) with np.bincount, there is
+    no per-row or per-group Python call. Cash flow conventions, since :table: transactions has no coupon column:
+     - principal TOTAL_DOLLARS (UNITS*FACE_VALUE) is repaid in the month of END_DATE;
+     - APR is the annual coupon/interest rate on principal, paid every COUPON_MONTHS counting back from END_DATE
+       for terms longer than 12 months, and once at maturity as simple interest for shorter terms;
+     - positions with APR = 0 (e.g. bills and notes bought at a discount with YTM only) are zero-coupon.
+
+    Bond analytics reuse the same schedule with exact payment times in years, coupons are placed every
+    COUPON_MONTHS/12 year counting back from END_DATE. YTM is the annual rate equating TOTAL_COST paid on ADD_DATE with
+    all payments, solved for every position at once by the safeguarded Newton iteration src.returns.solve_irr. Current
+    yield, Macaulay/modified duration and convexity are measured on the payments left after the reference date,
+    discounted at that YTM with annual compounding. Yields are in percent, durations in years.
+
+Examples:
+    -- Initialize class:
+        from src.fixed_income_analytics import FixedIncomeAnalytics
+        this_instance = FixedIncomeAnalytics()
+
+    -- Get monthly principal and interest by account over the next 30 years:
+        this_instance.project_cash_flows(v_horizon_months=360)
+
+    -- Get the maturity calendar from a fixed income transactions frame:
+        FixedIncomeAnalytics.mature_calender(df_fixed)
+
+    -- Get YTM, current yield, duration and convexity of every position in :table: transactions:
+        this_instance.compute_bond_analytics()
+
+"""
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from .logger import UseLogging
+from .fixed_SQLite_utility import FixedSQLiteRequest as fixed_SQLiteRequest
+from .returns import solve_irr
+
+
+COUPON_MONTHS = 6
+DAYS_PER_YEAR = 365.25
+BOND_ANALYTICS_COLUMNS = ['CURRENT_YIELD', 'YTM', 'YEARS_TO_MATURITY', 'MACAULAY_DURATION', 'MODIFIED_DURATION',
+                          'CONVEXITY']
+
+
+def to_days(v_dates):
+    """Convert 'YYYY-MM-DD' strings to a datetime64[D] array in one pass."""
+    return np.asarray(np.asarray(v_dates, dtype=object), dtype='datetime64[D]')
+
+
+def to_months(v_dates):
+    """Convert 'YYYY-MM-DD' strings or datetime64 values to integer months since 1970-01."""
+    this_dates = np.asarray(v_dates)
+    if this_dates.dtype.kind != 'M':
+        this_dates = to_days(this_dates)
+    return this_dates.astype('datetime64[M]').astype(np.int64)
+
+
+def month_labels(v_months):
+    """Convert integer months since 1970-01 to 'YYYY-MM' strings."""
+    return np.datetime_as_string(np.asarray(v_months, dtype=np.int64).astype('datetime64[M]'), unit='M')
+
+
+def build_cash_flow_schedule(v_add_days, v_end_days, v_principal, v_coupon_rates, v_coupon_months=COUPON_MONTHS):
+    """Generate every payment of every position.
+
+    Args:
+        v_add_days (np.ndarray): datetime64[D] purchase dates.
+        v_end_days (np.ndarray): datetime64[D] maturity dates.
+        v_principal (np.ndarray): principal repaid at maturity.
+        v_coupon_rates (np.ndarray): annual coupon/interest rate on principal, 0 for zero-coupon.
+        v_coupon_months (int): months between coupons for terms longer than 12 months.
+
+    Returns:
+        :tuple: (position index, month, principal, interest) arrays with one element per payment.
+
+    """
+    this_add_months = v_add_days.astype('datetime64[M]').astype(np.int64)
+    this_end_months = v_end_days.astype('datetime64[M]').astype(np.int64)
+    this_principal = np.asarray(v_principal, dtype=float)
+    this_rates = np.nan_to_num(np.asarray(v_coupon_rates, dtype=float))
+    this_term_months = this_end_months - this_add_months
+    this_is_periodic = (this_rates > 0) & (this_term_months > 12)
+    this_counts = np.where(this_is_periodic, np.maximum(-(-this_term_months // v_coupon_months), 1), 1)
+    that_index = np.repeat(np.arange(this_principal.shape[0]), this_counts)
+    this_k = np.arange(that_index.shape[0]) - np.repeat(np.cumsum(this_counts) - this_counts, this_counts)
+    that_months = this_end_months[that_index] - v_coupon_months * this_k
+    this_term_years = (v_end_days - v_add_days).astype(np.int64) / DAYS_PER_YEAR
+    that_interest = np.where(this_is_periodic[that_index],
+                             this_principal[that_index] * this_rates[that_index] * v_coupon_months / 12,
+                             this_principal[that_index] * this_rates[that_index] *
+                             np.maximum(this_term_years[that_index], 0))
+    that_principal = np.where(this_k == 0, this_principal[that_index], 0.0)
+    return that_index, that_months, that_principal, that_interest
+
+
+def payment_times(v_add_days, v_end_days, v_index, v_months, v_coupon_months=COUPON_MONTHS):
+    """Get the time in years from the purchase date of every payment of build_cash_flow_schedule().
+
+    Args:
+        v_add_days (np.ndarray): datetime64[D] purchase dates.
+        v_end_days (np.ndarray): datetime64[D] maturity dates.
+        v_index (np.ndarray): position index of every payment.
+        v_months (np.ndarray): month of every payment.
+        v_coupon_months (int): months between coupons.
+
+    Returns:
+        :np.ndarray: years from ADD_DATE, the payment at maturity is exactly the term of the position.
+
+    """
+    this_end_months = v_end_days.astype('datetime64[M]').astype(np.int64)
+    this_k = (this_end_months[v_index] - v_months) // v_coupon_months
+    this_term_years = (v_end_days - v_add_days).astype(np.int64) / DAYS_PER_YEAR
+    return np.maximum(this_term_years[v_index] - this_k * v_coupon_months / 12, 0.0)
+
+
+class FixedIncomeAnalytics(object):
+    """
+    The :class: FixedIncomeAnalytics can be used to get the maturity calendar, the monthly cash flow ladder and the
+    yield, duration and convexity of all fixed income positions.
+    """
+    def __init__(self):
+        """
+        constructor for :class: FixedIncomeAnalytics.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.fixed_db_file = 'databases/fixed_income.db'
+
+    def _get_fixed_transactions_data(self):
+        """Read data from :table: transactions in SQLite fixed_income.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = fixed_SQLiteRequest(self.fixed_db_file)
+        return pd.DataFrame(_this_instance.get_table_transactions_fixed(),
+                            columns=['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE',
+                                     'TOTAL_DOLLARS', 'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM',
+                                     'ACCOUNT'])
+
+    @staticmethod
+    def mature_calender(df_fixed, v_today=None):
+        """The :function: mature_calender is used to aggregate positions by maturity month.
+
+        Args:
+            df_fixed (DataFrame): fixed income transactions with SYMBOL, END_DATE, TOTAL_DOLLARS, APR, YTM, ACCOUNT.
+            v_today (str): reference date in format 'YYYY-MM-DD', months before it are dropped, default to today.
+
+        Returns: :object: Pandas dataframe with columns MATURE_DATE, TOTAL_DOLLARS, TOTAL_COUNT, YIELD, SYMBOL_REF,
+            IS_TOTAL.
+
+        """
+        this_months = to_months(df_fixed['END_DATE'].values)
+        this_current_month = to_months([v_today or datetime.today().strftime('%Y-%m-%d')])[0]
+        this_dollars = df_fixed['TOTAL_DOLLARS'].values.astype(float)
+        df_calc = pd.DataFrame({
+            'MONTH': this_months,
+            'ACCOUNT': df_fixed['ACCOUNT'].values,
+            'SYMBOL_REF': (df_fixed['SYMBOL'] + '(' + df_fixed['ACCOUNT'] + ')').str.replace('n/a', 'CD',
+                                                                                              regex=False).values,
+            'DOLLARS': this_dollars,
+            'RETURN': this_dollars * df_fixed[['APR', 'YTM']].astype(float).max(axis=1).values
+        })[this_months >= this_current_month]
+        # references are listed by account, ties keep the ledger order
+        df_calc = df_calc.sort_values(['MONTH', 'ACCOUNT'], kind='mergesort')
+        df_output = df_calc.groupby('MONTH', sort=True).agg({
+            'DOLLARS': ['sum', 'count'], 'RETURN': 'sum', 'SYMBOL_REF': ', '.join}).reset_index()
+        df_output.columns = ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF']
+        df_output['MATURE_DATE'] = month_labels(df_output['MATURE_DATE'].values)
+        df_output['YIELD'] = df_output['YIELD'] / df_output['TOTAL_DOLLARS'] * 100
+        df_output['IS_TOTAL'] = False
+        return df_output
+
+    @staticmethod
+    def cash_flow_ladder(df_fixed, v_start_date=None, v_horizon_months=360):
+        """The :function: cash_flow_ladder is used to project principal and interest by month and account.
+
+        Args:
+            df_fixed (DataFrame): fixed income transactions with ADD_DATE, END_DATE, TOTAL_DOLLARS, APR, ACCOUNT.
+            v_start_date (str): first month of the ladder in format 'YYYY-MM-DD', default to today.
+            v_horizon_months (int): number of months projected.
+
+        Returns: :object: Pandas dataframe with columns MONTH, ACCOUNT, PRINCIPAL, INTEREST, TOTAL, only months
+            with a payment.
+
+        """
+        if not isinstance(v_horizon_months, int) or v_horizon_months < 1:
+            raise IOError('Error in FixedIncomeAnalytics.cash_flow_ladder(): horizon is not valid -> expect '
+                          'positive int, got {}: {}'.format(str(type(v_horizon_months)), str(v_horizon_months)))
+        that_columns = ['MONTH', 'ACCOUNT', 'PRINCIPAL', 'INTEREST', 'TOTAL']
+        if df_fixed.shape[0] == 0:
+            return pd.DataFrame(columns=that_columns)
+        this_start = to_months([v_start_date or datetime.today().strftime('%Y-%m-%d')])[0]
+        this_accounts, this_account_codes = np.unique(df_fixed['ACCOUNT'].values.astype(str), return_inverse=True)
+        this_index, this_months, this_principal, this_interest = build_cash_flow_schedule(
+            to_days(df_fixed['ADD_DATE'].values), to_days(df_fixed['END_DATE'].values),
+            df_fixed['TOTAL_DOLLARS'].values, df_fixed['APR'].values)
+        this_offsets = this_months - this_start
+        this_keep = (this_offsets >= 0) & (this_offsets < v_horizon_months)
+        this_codes = this_offsets[this_keep] * this_accounts.shape[0] + this_account_codes[this_index[this_keep]]
+        this_size = v_horizon_months * this_accounts.shape[0]
+        this_principal = np.bincount(this_codes, weights=this_principal[this_keep], minlength=this_size)
+        this_interest = np.bincount(this_codes, weights=this_interest[this_keep], minlength=this_size)
+        this_cells = np.flatnonzero((this_principal != 0) | (this_interest != 0))
+        return pd.DataFrame({
+            'MONTH': month_labels(this_start + this_cells // this_accounts.shape[0]),
+            'ACCOUNT': this_accounts[this_cells % this_accounts.shape[0]],
+            'PRINCIPAL': this_principal[this_cells],
+            'INTEREST': this_interest[this_cells],
+            'TOTAL': this_principal[this_cells] + this_interest[this_cells]
+        }, columns=that_columns)
+
+    @staticmethod
+    def bond_analytics(df_fixed, v_today=None):
+        """The :function: bond_analytics is used to compute yield and risk measures of every position at once.
+
+        Args:
+            df_fixed (DataFrame): fixed income transactions with ADD_DATE, END_DATE, TOTAL_DOLLARS, TOTAL_COST, APR.
+            v_today (str): reference date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with the index of df_fixed and columns CURRENT_YIELD, YTM (percent),
+            YEARS_TO_MATURITY, MACAULAY_DURATION, MODIFIED_DURATION, CONVEXITY, risk measures are NaN once matured.
+
+        """
+        if df_fixed.shape[0] == 0:
+            return pd.DataFrame(columns=BOND_ANALYTICS_COLUMNS)
+        this_count = df_fixed.shape[0]
+        this_add_days = to_days(df_fixed['ADD_DATE'].values)
+        this_end_days = to_days(df_fixed['END_DATE'].values)
+        this_today = to_days([v_today or datetime.today().strftime('%Y-%m-%d')])[0]
+        this_cost = df_fixed['TOTAL_COST'].values.astype(float)
+        this_rates = np.nan_to_num(df_fixed['APR'].values.astype(float))
+        this_index, this_months, this_principal, this_interest = build_cash_flow_schedule(
+            this_add_days, this_end_days, df_fixed['TOTAL_DOLLARS'].values, this_rates)
+        this_times = payment_times(this_add_days, this_end_days, this_index, this_months)
+        this_amounts = this_principal + this_interest
+        # purchase at t = 0 followed by every payment, one IRR group per position
+        this_ytm = solve_irr(np.concatenate([np.arange(this_count), this_index]),
+                             np.concatenate([np.zeros(this_count), this_times]),
+                             np.concatenate([-this_cost, this_amounts]), this_count)
+        this_elapsed = (this_today - this_add_days).astype(np.int64) / DAYS_PER_YEAR
+        this_remaining = this_times - this_elapsed[this_index]
+        this_keep = this_remaining >= 0
+        that_index = this_index[this_keep]
+        that_times = this_remaining[this_keep]
+        this_growth = 1.0 + this_ytm[that_index]
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            this_pv = this_amounts[this_keep] * np.power(this_growth, -that_times)
+            this_price = np.bincount(that_index, this_pv, minlength=this_count)
+            this_price = np.where(this_price > 0, this_price, np.nan)
+            this_macaulay = np.bincount(that_index, that_times * this_pv, minlength=this_count) / this_price
+            this_convexity = np.bincount(that_index, that_times * (that_times + 1) * this_pv / this_growth ** 2,
+                                         minlength=this_count) / this_price
+            this_current_yield = np.where(this_cost > 0, this_rates * df_fixed['TOTAL_DOLLARS'].values.astype(float)
+                                          / this_cost * 100, np.nan)
+        this_years = (this_end_days - this_today).astype(np.int64) / DAYS_PER_YEAR
+        return pd.DataFrame({
+            'CURRENT_YIELD': this_current_yield,
+            'YTM': this_ytm * 100,
+            'YEARS_TO_MATURITY': np.where(this_years >= 0, this_years, np.nan),
+            'MACAULAY_DURATION': this_macaulay,
+            'MODIFIED_DURATION': this_macaulay / (1.0 + this_ytm),
+            'CONVEXITY': this_convexity
+        }, index=df_fixed.index, columns=BOND_ANALYTICS_COLUMNS)
+
+    def compute_bond_analytics(self, v_today=None):
+        """The :function: compute_bond_analytics is used to get the bond analytics of :table: transactions.
+
+        Args:
+            v_today (str): reference date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe of :table: transactions with the columns of :function: bond_analytics.
+
+        """
+        self.logger.info('Computing yield, duration and convexity of fixed income positions ...')
+        try:
+            df_fixed = self._get_fixed_transactions_data()
+            return pd.concat([df_fixed, self.bond_analytics(df_fixed, v_today)], axis=1)
+        except Exception as e:
+            self.logger.error('Failed to compute fixed income bond analytics -> ' + str(e))
+            raise e
+
+    def project_cash_flows(self, v_start_date=None, v_horizon_months=360):
+        """The :function: project_cash_flows is used to get the cash flow ladder of :table: transactions.
+
+        Args:
+            v_start_date (str): first month of the ladder in format 'YYYY-MM-DD', default to today.
+            v_horizon_months (int): number of months projected, default to 30 years.
+
+        Returns: :object: Pandas dataframe with columns MONTH, ACCOUNT, PRINCIPAL, INTEREST, TOTAL.
+
+        """
+        self.logger.info(f'Projecting fixed income cash flows over {v_horizon_months} months ...')
+        try:
+            return self.cash_flow_ladder(self._get_fixed_transactions_data(), v_start_date, v_horizon_months)
+        except Exception as e:
+            self.logger.error('Failed to project fixed income cash flows -> ' + str(e))
+            raise e
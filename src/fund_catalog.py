@@ -0,0 +1,153 @@
+"""
+This module is used to classify fund symbols from the versioned catalog in templates/fund_catalog.json.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - numpy
+
+    The catalog is read once per file version and kept as categorical columns behind a symbol index, every lookup is
+    one get_indexer() call plus a take(), so classifying n rows is O(n) without Python-level per-row calls.
+    Symbols missing from the catalog can fall back to the CATEGORY column of :table: watch_list.
+
+Examples:
+    -- Initialize class:
+        from src.fund_catalog import FundCatalog
+        this_catalog = FundCatalog()
+
+    -- Look up one column, NaN when the symbol is not in the catalog:
+        this_catalog.lookup(['VOO', 'AAPL'], 'ASSET_CLASS')
+
+    -- Classify symbols, with watch_list CATEGORY as fallback:
+        this_catalog.classify(['VOO', 'ARKK'], lambda: pd.Series({'ARKK': 'Mid-Cap Growth'}))
+
+"""
+
+import os
+import json
+import threading
+import numpy as np
+import pandas as pd
+
+from .logger import UseLogging
+
+
+_catalog_cache = {}
+_catalog_lock = threading.Lock()
+
+
+class FundCatalog(object):
+    """
+    The :class: FundCatalog can be used to map fund symbols to MAJOR_TYPE, MINOR_TYPE, ASSET_CLASS and SUBCLASS.
+    """
+    list_of_columns = ['FULL_NAME', 'MAJOR_TYPE', 'MINOR_TYPE', 'ASSET_CLASS', 'SUBCLASS']
+
+    def __init__(self, v_catalog_file='templates/fund_catalog.json'):
+        """
+        constructor for :class: FundCatalog.
+
+        Args:
+            v_catalog_file (str): path to the versioned JSON catalog.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.catalog_file = v_catalog_file
+        self.version, self.df_catalog = self._load()
+
+    def _load(self):
+        """Read the catalog file, memoized per (path, modified time) so each version is parsed once per process.
+
+        Returns:
+            :tuple: (version, Pandas dataframe indexed by upper case SYMBOL with categorical columns).
+
+        """
+        try:
+            this_key = (os.path.abspath(self.catalog_file), os.path.getmtime(self.catalog_file))
+            with _catalog_lock:
+                if this_key not in _catalog_cache:
+                    self.logger.info(f'Loading fund catalog from {self.catalog_file} ...')
+                    with open(self.catalog_file, 'r', newline='') as rf:
+                        this_data = json.load(rf)
+                    df = pd.DataFrame(this_data['FUNDS'], columns=['SYMBOL'] + self.list_of_columns)
+                    df['SYMBOL'] = df['SYMBOL'].str.upper()
+                    if df['SYMBOL'].duplicated().any():
+                        raise IOError('Duplicated SYMBOL in fund catalog -> {}'.format(
+                            ', '.join(df.loc[df['SYMBOL'].duplicated(), 'SYMBOL'])))
+                    df = df.set_index('SYMBOL').astype('category')
+                    _catalog_cache[this_key] = (int(this_data['VERSION']), df)
+                return _catalog_cache[this_key]
+        except Exception as e:
+            self.logger.error(f'Failed to load fund catalog from {self.catalog_file} -> ' + str(e))
+            raise e
+
+    def _positions(self, v_symbols):
+        """Row position of each symbol in the catalog, -1 when missing."""
+        return self.df_catalog.index.get_indexer(pd.Series(v_symbols, dtype=object).str.upper())
+
+    def _values(self, v_positions, v_column):
+        """Values of one catalog column at row positions, NaN for missing symbols and null cells (code -1)."""
+        this_values = np.append(np.asarray(self.df_catalog[v_column].cat.categories, dtype=object), np.nan)
+        this_codes = np.full(len(v_positions), -1, dtype=np.int64)
+        this_found = v_positions >= 0
+        this_codes[this_found] = self.df_catalog[v_column].cat.codes.values[v_positions[this_found]]
+        # code -1 picks the trailing NaN
+        return this_values[this_codes]
+
+    def lookup(self, v_symbols, v_column):
+        """The :function: lookup is used to get one catalog column for every symbol.
+
+        Args:
+            v_symbols (list-like): fund symbols, case insensitive.
+            v_column (str): one of FULL_NAME, MAJOR_TYPE, MINOR_TYPE, ASSET_CLASS, SUBCLASS.
+
+        Returns:
+            :np.ndarray: of object, NaN where the symbol is not in the catalog.
+
+        """
+        if v_column not in self.list_of_columns:
+            raise IOError('Error in FundCatalog.lookup(): column is not valid -> expect one of {}, got {}'.format(
+                ', '.join(self.list_of_columns), str(v_column)))
+        return self._values(self._positions(v_symbols), v_column)
+
+    def contains(self, v_symbols):
+        """The :function: contains is used to get a boolean mask of symbols present in the catalog."""
+        return self._positions(v_symbols) >= 0
+
+    def classify(self, v_symbols, v_category_loader=None, v_default='Others'):
+        """The :function: classify is used to get MAJOR_TYPE, MINOR_TYPE, ASSET_CLASS and SUBCLASS for every symbol.
+
+        Symbols missing from the catalog get MAJOR_TYPE 'EQUITY' and take MINOR_TYPE, ASSET_CLASS and SUBCLASS from
+        the category returned by v_category_loader, which is only called when at least one symbol is missing.
+
+        Args:
+            v_symbols (list-like): fund symbols, case insensitive.
+            v_category_loader (callable): returns a Pandas series of CATEGORY indexed by SYMBOL, default to None.
+            v_default (str): value used when neither the catalog nor the category has an answer.
+
+        Returns:
+            :object: Pandas dataframe with columns SYMBOL, IN_CATALOG, MAJOR_TYPE, MINOR_TYPE, ASSET_CLASS, SUBCLASS.
+
+        """
+        this_symbols = pd.Series(v_symbols, dtype=object).reset_index(drop=True)
+        this_positions = self._positions(this_symbols)
+        df_output = pd.DataFrame({'SYMBOL': this_symbols, 'IN_CATALOG': this_positions >= 0})
+        for this_column in ['MAJOR_TYPE', 'MINOR_TYPE', 'ASSET_CLASS', 'SUBCLASS']:
+            df_output[this_column] = self._values(this_positions, this_column)
+        this_fallback = pd.Series(np.nan, index=df_output.index, dtype=object)
+        if v_category_loader is not None and not df_output['IN_CATALOG'].all():
+            self.logger.info('Falling back to watch_list CATEGORY for symbols not in fund catalog ...')
+            this_categories = v_category_loader()
+            this_categories = this_categories[this_categories.notnull() & (this_categories != '')]
+            this_categories.index = this_categories.index.str.upper()
+            this_categories = this_categories[~this_categories.index.duplicated()]
+            this_fallback = this_symbols.str.upper().map(this_categories)
+        df_output['MAJOR_TYPE'] = df_output['MAJOR_TYPE'].fillna('EQUITY')
+        for this_column in ['MINOR_TYPE', 'ASSET_CLASS', 'SUBCLASS']:
+            df_output[this_column] = df_output[this_column].fillna(this_fallback).fillna(v_default)
+        return df_output
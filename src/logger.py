@@ -3,13 +3,22 @@ This module contains decorator for Logging and Testing.
 
     Original Author: Mark D
     Date created: 08/24/2019
-    Date Modified: 09/07/2019
+    Date Modified: 10/19/2026
     Python Version: 3.7
 
 Note:
     This module depend on following third-party Python library:
      - none
 
+    :function: UseLogging.use_loggers is called by the constructor of every class of this package, so it shares one
+    process-wide setup per log file prefix instead of adding handlers on every call: each logger gets the same
+    QueueHandler once, and a single QueueListener thread writes the records to one StreamHandler and one FileHandler
+    (one log file per process). Callers only merge the message with its arguments, and the traceback if any, before
+    putting the record on a queue; the listener applies the formatter when they are written, so pass arguments
+    lazily, e.g. logger.info('Connection to %s has been created ...', v_db_file), on hot paths.
+    Levels can be set per module with :function: set_logging_levels, the most specific dotted name wins. The
+    listeners are stopped, and their queues flushed, at process exit.
+
 Examples:
     logger_ref = UseLogging(__name__)
     logger = logger_ref.use_stream_logger()
@@ -20,10 +29,118 @@ Examples:
     logger = logger_ref.use_file_logger('temp_solution')
     logger.debug('This is another example.')
 
+    logger_ref = UseLogging(__name__)
+    logger = logger_ref.use_loggers('portfolio_management')
+    logger.info('This is the package logger, %s.', 'shared by every module')
+
+    set_logging_levels({'': 'WARNING', 'src.overview_generator': 'DEBUG'})
+
 """
 
 from datetime import datetime
+import atexit
+import copy
 import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+
+LOGGING_LEVELS = {'CRITICAL': logging.CRITICAL, 'ERROR': logging.ERROR, 'WARNING': logging.WARNING,
+                  'INFO': logging.INFO, 'DEBUG': logging.DEBUG}
+
+_logging_lock = threading.RLock()
+# log file prefix -> (QueueHandler, QueueListener) shared by every logger of the process
+_queue_handlers = {}
+# logger name -> level, '' is the default of every logger, see set_logging_levels
+_configured_levels = {'': logging.INFO}
+_logger_names = set()
+
+
+def _configured_level(v_logger_name):
+    """Get the level of the most specific configured name among v_logger_name and its dotted parents."""
+    this_name = v_logger_name
+    while this_name not in _configured_levels:
+        this_name = this_name.rsplit('.', 1)[0] if '.' in this_name else ''
+    return _configured_levels[this_name]
+
+
+def set_logging_levels(v_levels):
+    """The :function: set_logging_levels is used to set the level of loggers by module name.
+
+    Args:
+        v_levels (dict): logger name or dotted prefix, e.g. 'src.eq_SQLite_utility' -> level name, e.g. 'WARNING',
+            '' sets the default of every logger.
+
+    """
+    this_levels = {}
+    for this_name, this_level in v_levels.items():
+        if str(this_level).upper().strip() not in LOGGING_LEVELS:
+            raise IOError("Error: Logging Level is not valid ! Expect CRITICAL/ERROR/WARNING/INFO/DEBUG, got {}: {}".
+                          format(str(type(this_level)), str(this_level)))
+        this_levels[this_name] = LOGGING_LEVELS[str(this_level).upper().strip()]
+    with _logging_lock:
+        _configured_levels.update(this_levels)
+        for this_name in _logger_names:
+            logging.getLogger(this_name).setLevel(_configured_level(this_name))
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    The :class: _LazyQueueHandler puts a snapshot of the records on the queue, the listener thread formats them.
+    """
+    _exception_format = logging.Formatter()
+
+    def prepare(self, record):
+        """Merge the message with its arguments and render the traceback now, they may change before the listener
+        writes them, the formatter is left to the listener."""
+        this_record = copy.copy(record)
+        this_record.message = record.getMessage()
+        this_record.msg = this_record.message
+        this_record.args = None
+        if record.exc_info and not record.exc_text:
+            this_record.exc_text = self._exception_format.formatException(record.exc_info)
+        this_record.exc_info = None
+        return this_record
+
+
+def _shared_queue_handler(v_log_file_prefix, v_logging_format):
+    """Get the QueueHandler of a log file prefix, starting its listener on first use."""
+    with _logging_lock:
+        if v_log_file_prefix not in _queue_handlers:
+            this_queue = SimpleQueue()
+            _stream_handler = logging.StreamHandler()
+            _stream_handler.setFormatter(v_logging_format)
+            _file_handler = logging.FileHandler('logs/'+v_log_file_prefix+'_logging_' +
+                                                datetime.now().strftime('%Y%m%d_%H%M%S') + '.log', delay=True)
+            _file_handler.setFormatter(v_logging_format)
+            this_listener = QueueListener(this_queue, _stream_handler, _file_handler)
+            this_listener.start()
+            _queue_handlers[v_log_file_prefix] = (_LazyQueueHandler(this_queue), this_listener)
+        return _queue_handlers[v_log_file_prefix][0]
+
+
+def shutdown_logging(v_log_file_prefix=None):
+    """The :function: shutdown_logging is used to write every queued record and stop the listeners.
+
+    Loggers are detached from the stopped handlers, the next call of :function: UseLogging.use_loggers starts a new
+    listener and log file.
+
+    Args:
+        v_log_file_prefix (str): stop the listener of this prefix only, default to None for all of them.
+
+    """
+    with _logging_lock:
+        for this_prefix in [x for x in list(_queue_handlers) if v_log_file_prefix in (None, x)]:
+            this_handler, this_listener = _queue_handlers.pop(this_prefix)
+            for this_name in _logger_names:
+                logging.getLogger(this_name).removeHandler(this_handler)
+            this_listener.stop()
+            for this_target in this_listener.handlers:
+                this_target.close()
+
+
+atexit.register(shutdown_logging)
 
 
 class UseLogging(object):
@@ -37,7 +154,7 @@ class UseLogging(object):
         self._logging_level = logging.INFO
         self._logging_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         self._logger = logging.getLogger(v_logger_name)
-        self._logger.setLevel(logging.DEBUG)
+        self._logger.setLevel(_configured_level(v_logger_name))
 
     @property
     def logging_level(self):
@@ -66,6 +183,7 @@ class UseLogging(object):
                 self._logging_level = logging.INFO
             elif v_logging_level.upper().strip() == 'CRITICAL':
                 self._logging_level = logging.CRITICAL
+            self._logger.setLevel(self._logging_level)
 
     def use_stream_logger(self):
         """
@@ -106,6 +224,9 @@ class UseLogging(object):
         """
         The :function: use_loggers will create a logging object which send logging output to streams and file.
 
+        The handlers are shared by the whole process and added once per logger, so calling it again, e.g. from every
+        constructor, neither duplicates log lines nor opens another log file.
+
         Args:
             v_log_file_prefix (str): Filename prefix for logging output.
 
@@ -113,13 +234,9 @@ class UseLogging(object):
             :logging.logger: object.
 
         """
-        _stream_handler = logging.StreamHandler()
-        _stream_handler.setLevel(self._logging_level)
-        _stream_handler.setFormatter(self._logging_format)
-        self._logger.addHandler(_stream_handler)
-        _file_handler = logging.FileHandler('logs/'+v_log_file_prefix+'_logging_' +
-                                            datetime.now().strftime('%Y%m%d_%H%M%S') + '.log')
-        _file_handler.setLevel(self._logging_level)
-        _file_handler.setFormatter(self._logging_format)
-        self._logger.addHandler(_file_handler)
+        _queue_handler = _shared_queue_handler(v_log_file_prefix, self._logging_format)
+        with _logging_lock:
+            _logger_names.add(self._logger.name)
+            if _queue_handler not in self._logger.handlers:
+                self._logger.addHandler(_queue_handler)
         return self._logger
@@ -0,0 +1,390 @@
+"""
+This module is used to collect run metrics of the batch jobs and write them in Prometheus text format.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    Every metric is declared once in METRIC_DEFINITIONS with its type and help text. The registry is opt-in: once
+    enabled, the jobs add samples to it, and :function: MetricsRegistry.write renders all of them in the Prometheus
+    text exposition format into a '.prom' file, e.g. for the textfile collector of node exporter. The file is written
+    to a temporary file first and then renamed, so the collector never reads a half written file.
+    Rows written are counted from sqlite3 total_changes when a :class: MeteredConnection is closed, and charged to
+    the outermost :function: metered_write operation running on the same thread.
+    Peak RSS is read from the standard library resource module, which does not exist on Windows; the metric is
+    omitted there.
+    A disabled registry ignores every sample.
+
+Examples:
+    -- Enable metrics for this process:
+        from src.metrics import METRICS
+        METRICS.enable('logs/metrics_overview.prom')
+
+    -- Add samples:
+        METRICS.inc('portfolio_symbols_refreshed_total', investment_type='etf')
+        METRICS.observe('portfolio_quote_fetch_seconds', 0.42, investment_type='etf')
+
+    -- Time every call of a function:
+        from src.metrics import metered
+
+        @metered('portfolio_holdings_sync_seconds')
+        def sync_table_holdings(self):
+            ...
+
+    -- Write the file:
+        METRICS.write()
+
+"""
+
+import os
+import sys
+import time
+import functools
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .logger import UseLogging
+from .sql_profiler import SQL_PROFILER, ProfiledConnection
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+QUOTE_FETCH_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# metric name -> (type, help text, histogram buckets)
+METRIC_DEFINITIONS = OrderedDict([
+    ('portfolio_run_success', ('gauge', '1 if the last run of the job completed, 0 otherwise.', None)),
+    ('portfolio_run_duration_seconds', ('gauge', 'Wall time of the last run of the job.', None)),
+    ('portfolio_run_last_timestamp_seconds', ('gauge', 'Unix time the last run of the job ended.', None)),
+    ('portfolio_peak_rss_bytes', ('gauge', 'Peak resident set size of the last run of the job.', None)),
+    ('portfolio_symbols_refreshed_total', ('counter', 'Watch list symbols refreshed with a new quote.', None)),
+    ('portfolio_symbols_failed_total', ('counter', 'Watch list symbols whose refresh failed.', None)),
+    ('portfolio_quote_fetch_seconds', ('histogram', 'Latency of one quote fetch.', QUOTE_FETCH_BUCKETS)),
+    ('portfolio_db_writes_total', ('counter', 'Database write operations completed.', None)),
+    ('portfolio_db_write_seconds_total', ('counter', 'Time spent in database write operations.', None)),
+    ('portfolio_db_rows_written_total', ('counter', 'Rows inserted, updated or deleted by database writes.', None)),
+    ('portfolio_holdings_sync_seconds', ('gauge', 'Duration of the last holdings sync.', None)),
+    ('portfolio_overview_report_seconds', ('gauge', 'Duration of each report of the last overview run.', None))
+])
+
+
+def _escape(v_value):
+    """Escape a label value for the Prometheus text format."""
+    return str(v_value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(v_labels):
+    """Format a tuple of (name, value) pairs as {name="value",...}, '' when empty."""
+    if not v_labels:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(k, _escape(v)) for k, v in v_labels) + '}'
+
+
+def _format_value(v_value):
+    """Format a sample value, integers without a decimal part."""
+    if v_value == float('inf'):
+        return '+Inf'
+    return repr(int(v_value)) if float(v_value).is_integer() else repr(float(v_value))
+
+
+def peak_rss_bytes():
+    """The :function: peak_rss_bytes is used to get the peak resident set size of this process.
+
+    Returns: :int: bytes, None when the resource module is not available.
+
+    """
+    if resource is None:
+        return None
+    this_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return this_peak if sys.platform == 'darwin' else this_peak * 1024
+
+
+class MetricsRegistry(object):
+    """
+    The :class: MetricsRegistry can be used to collect counters, gauges and histograms of one run.
+    """
+    def __init__(self):
+        """
+        constructor for :class: MetricsRegistry.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.enabled = False
+        self.metrics_file = None
+        self._samples = OrderedDict((k, OrderedDict()) for k in METRIC_DEFINITIONS)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self, v_metrics_file):
+        """The :function: enable is used to collect samples from now on.
+
+        Args:
+            v_metrics_file (str): '.prom' file :function: write renders the metrics into.
+
+        """
+        self.enabled = True
+        self.metrics_file = v_metrics_file
+        self.logger.info(f'Metrics enabled, they are written to {v_metrics_file} ...')
+
+    def disable(self):
+        """The :function: disable is used to ignore new samples, collected samples are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """The :function: reset is used to drop every sample."""
+        with self._lock:
+            for this_series in self._samples.values():
+                this_series.clear()
+
+    def _series(self, v_name, v_labels):
+        """Get the sample of one label set, creating it on first use. Must be called with the lock held."""
+        if v_name not in METRIC_DEFINITIONS:
+            raise IOError('Error in MetricsRegistry: metric name is not valid -> expect one of {}, got {}'.format(
+                ', '.join(METRIC_DEFINITIONS), str(v_name)))
+        this_key = tuple(sorted(v_labels.items()))
+        this_series = self._samples[v_name]
+        if this_key not in this_series:
+            this_buckets = METRIC_DEFINITIONS[v_name][2]
+            this_series[this_key] = {'VALUE': 0.0, 'SUM': 0.0, 'COUNT': 0,
+                                     'BUCKETS': [0] * len(this_buckets) if this_buckets else None}
+        return this_series[this_key]
+
+    def inc(self, v_name, v_value=1, **kwargs):
+        """The :function: inc is used to add to a counter.
+
+        Args:
+            v_name (str): metric name, one of METRIC_DEFINITIONS.
+            v_value (float): increment, default to 1.
+            kwargs: labels.
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._series(v_name, kwargs)['VALUE'] += v_value
+
+    def set(self, v_name, v_value, **kwargs):
+        """The :function: set is used to set a gauge.
+
+        Args:
+            v_name (str): metric name, one of METRIC_DEFINITIONS.
+            v_value (float): value.
+            kwargs: labels.
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._series(v_name, kwargs)['VALUE'] = v_value
+
+    def observe(self, v_name, v_value, **kwargs):
+        """The :function: observe is used to add an observation to a histogram.
+
+        Args:
+            v_name (str): metric name, one of METRIC_DEFINITIONS.
+            v_value (float): observed value.
+            kwargs: labels.
+
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            this_sample = self._series(v_name, kwargs)
+            this_sample['SUM'] += v_value
+            this_sample['COUNT'] += 1
+            for i, this_bound in enumerate(METRIC_DEFINITIONS[v_name][2]):
+                if v_value <= this_bound:
+                    this_sample['BUCKETS'][i] += 1
+
+    def record(self, v_name, v_value, **kwargs):
+        """The :function: record is used to add a value to a metric according to its type, see :function: metered."""
+        this_type = METRIC_DEFINITIONS[v_name][0] if v_name in METRIC_DEFINITIONS else None
+        if this_type == 'histogram':
+            self.observe(v_name, v_value, **kwargs)
+        elif this_type == 'counter':
+            self.inc(v_name, v_value, **kwargs)
+        else:
+            self.set(v_name, v_value, **kwargs)
+
+    @contextmanager
+    def count_outcome(self, v_success_name, v_failure_name, **kwargs):
+        """The :function: count_outcome is used to count the enclosed block as a success or, if it raises, a failure.
+
+        Args:
+            v_success_name (str): counter added to when the block completes.
+            v_failure_name (str): counter added to when the block raises, the exception is raised again.
+            kwargs: labels.
+
+        """
+        try:
+            yield
+        except Exception:
+            self.inc(v_failure_name, **kwargs)
+            raise
+        self.inc(v_success_name, **kwargs)
+
+    def get(self, v_name, **kwargs):
+        """The :function: get is used to read a counter or gauge, the observation count of a histogram.
+
+        Returns: :float: 0 when no sample was added with these labels.
+
+        """
+        with self._lock:
+            this_sample = self._samples[v_name].get(tuple(sorted(kwargs.items())))
+        if this_sample is None:
+            return 0
+        return this_sample['COUNT'] if this_sample['BUCKETS'] is not None else this_sample['VALUE']
+
+    def write_operation(self):
+        """The :function: write_operation is used to get the :function: metered_write operation of this thread."""
+        return getattr(self._local, 'operation', None)
+
+    def record_rows_written(self, v_rows):
+        """The :function: record_rows_written is used to charge rows to the write operation of this thread."""
+        if v_rows:
+            self.inc('portfolio_db_rows_written_total', v_rows, operation=self.write_operation() or 'other')
+
+    def render(self):
+        """The :function: render is used to format every metric with samples in the Prometheus text format.
+
+        Returns: :str:
+
+        """
+        that_lines = []
+        with self._lock:
+            for this_name, (this_type, this_help, this_buckets) in METRIC_DEFINITIONS.items():
+                this_series = self._samples[this_name]
+                if not this_series:
+                    continue
+                that_lines.append(f'# HELP {this_name} {this_help}')
+                that_lines.append(f'# TYPE {this_name} {this_type}')
+                for this_labels, this_sample in this_series.items():
+                    if this_type != 'histogram':
+                        that_lines.append(this_name + _format_labels(this_labels) + ' ' +
+                                          _format_value(this_sample['VALUE']))
+                        continue
+                    for this_bound, this_count in zip(list(this_buckets) + [float('inf')],
+                                                      this_sample['BUCKETS'] + [this_sample['COUNT']]):
+                        that_lines.append(this_name + '_bucket' +
+                                          _format_labels(this_labels + (('le', _format_value(this_bound)),)) +
+                                          ' ' + _format_value(this_count))
+                    that_lines.append(this_name + '_sum' + _format_labels(this_labels) + ' ' +
+                                      _format_value(this_sample['SUM']))
+                    that_lines.append(this_name + '_count' + _format_labels(this_labels) + ' ' +
+                                      _format_value(this_sample['COUNT']))
+        return '\n'.join(that_lines) + '\n' if that_lines else ''
+
+    def write(self, v_metrics_file=None):
+        """The :function: write is used to replace the metrics file with :function: render.
+
+        Args:
+            v_metrics_file (str): output file, default to the file given to :function: enable.
+
+        Returns: :str: the file written.
+
+        """
+        this_file = v_metrics_file or self.metrics_file
+        this_tmp_file = this_file + '.tmp'
+        with open(this_tmp_file, 'w', newline='\n') as wf:
+            wf.write(self.render())
+        os.replace(this_tmp_file, this_file)
+        self.logger.info(f'Metrics written to {this_file} ...')
+        return this_file
+
+
+METRICS = MetricsRegistry()
+
+
+def metered(v_name, **kwargs):
+    """The :function: metered is used to decorate a function with a metric of its duration in seconds.
+
+    Histograms observe the duration, counters add it and gauges are set to it.
+
+    Args:
+        v_name (str): metric name, one of METRIC_DEFINITIONS.
+        kwargs: labels.
+
+    Returns: :callable: decorator.
+
+    """
+    def this_decorator(v_function):
+        @functools.wraps(v_function)
+        def this_wrapper(*args, **kw):
+            if not METRICS.enabled:
+                return v_function(*args, **kw)
+            this_start = time.perf_counter()
+            try:
+                return v_function(*args, **kw)
+            finally:
+                METRICS.record(v_name, time.perf_counter() - this_start, **kwargs)
+        return this_wrapper
+    return this_decorator
+
+
+def metered_write(v_operation=None):
+    """The :function: metered_write is used to decorate a database write with its duration and rows written.
+
+    Writes nested in another metered write are charged to the outer one.
+
+    Args:
+        v_operation (str): label of the operation, default to the name of the function.
+
+    Returns: :callable: decorator.
+
+    """
+    def this_decorator(v_function):
+        this_operation = v_operation or v_function.__name__
+
+        @functools.wraps(v_function)
+        def this_wrapper(*args, **kwargs):
+            if not METRICS.enabled or METRICS.write_operation() is not None:
+                return v_function(*args, **kwargs)
+            METRICS._local.operation = this_operation
+            this_start = time.perf_counter()
+            try:
+                this_output = v_function(*args, **kwargs)
+            finally:
+                METRICS._local.operation = None
+            METRICS.inc('portfolio_db_write_seconds_total', time.perf_counter() - this_start, operation=this_operation)
+            METRICS.inc('portfolio_db_writes_total', operation=this_operation)
+            return this_output
+        return this_wrapper
+    return this_decorator
+
+
+class MeteredConnection(sqlite3.Connection):
+    """
+    The :class: MeteredConnection charges the rows it changed to :data: METRICS when it is closed.
+    """
+    def close(self):
+        METRICS.record_rows_written(self.total_changes)
+        sqlite3.Connection.close(self)
+
+
+class ProfiledMeteredConnection(ProfiledConnection, MeteredConnection):
+    """
+    The :class: ProfiledMeteredConnection is a :class: ProfiledConnection that is also metered.
+    """
+    pass
+
+
+def connection_factory():
+    """The :function: connection_factory is used to get the sqlite3 connection class for the enabled instruments.
+
+    Returns: :class: sqlite3.Connection or one of its subclasses.
+
+    """
+    if METRICS.enabled:
+        return ProfiledMeteredConnection if SQL_PROFILER.enabled else MeteredConnection
+    return ProfiledConnection if SQL_PROFILER.enabled else sqlite3.Connection
@@ -3,13 +3,18 @@ This module is used to generate overview from db files for equity, fixed_income
 
     Original Author: Mark D
     Date created: 01/05/2019
-    Date Modified: 11/29/2021
+    Date Modified: 10/19/2026
     Python Version: 3.7
 
 Note:
     This module depend on following third party library:
      - pandas v0.25.0
 
+    Every generate_* method returns numbers, the formatting and the totals row style live in src/report_renderer.
+    The Investment Type and Broker allocations read rows already summed in SQL across both databases and others.json
+    (src/portfolio_query), so only a few dozen rows reach pandas. Both share one PortfolioQuery connection until
+    close_portfolio_query() is called, and the stock positions are taken from the positions frame already loaded.
+
 Examples:
     -- Initialize class:
         from src.overview_generator import SummaryTool as SummaryTool
@@ -27,140 +32,30 @@ Examples:
     -- Generate allocation summary for Fixed Income ETF:
         this_instance.generate_allocation_report_fixed_etf()
 
+    -- Generate allocation summary for Equity ETF of every account, in one pass:
+        this_instance.generate_allocation_report_etf_all_accounts()
+
     -- Generate Mature Calender for Fixed Income:
         this_instance.generate_mature_calender()
 
+    -- Reload inputs after the databases were updated:
+        this_instance.data_context.invalidate()
+
 """
 
 from datetime import datetime
+import threading
 import pandas as pd
 import numpy as np
 
 from .logger import UseLogging
-from .eq_SQLite_utility import SQLiteRequest as eq_SQLiteRequest
-from .fixed_SQLite_utility import FixedSQLiteRequest as fixed_SQLiteRequest
-
-
-this_fixed_income_funds = {
-    'BND': ['Vanguard Total Bond Market ETF',
-            'Fixed Income', 'Intermediate-Term Blend'
-            ],
-    'VGSH': ['Vanguard Short-Term Treasury Index Fund',
-             'Fixed Income', 'Short-Term Treasury'
-             ],
-    'VGIT': ['Vanguard Intermediate-Term Treasury Index Fund',
-             'Fixed Income', 'Intermediate-Term Treasury'
-             ],
-    'VGLT': ['Vanguard Long-Term Treasury Index Fund',
-             'Fixed Income', 'Long-Term Treasury'
-             ],
-    'VCSH': ['Vanguard Short-Term Corporate Bond Index Fund',
-             'Fixed Income', 'Short-Term Corporate'
-             ],
-    'VCIT': ['Vanguard Intermediate-Term Corporate Bond Index Fund',
-             'Fixed Income', 'Intermediate-Term Corporate'
-             ],
-    'VCLT': ['Vanguard Long-Term Corporate Bond Index Fund',
-             'Fixed Income', 'Long-Term Corporate'
-             ],
-    'BSV': ['Vanguard Short-Term Bond Index Fund',
-            'Fixed Income', 'Short-Term Blend'
-            ],
-    'BIV': ['Vanguard Intermediate-Term Bond Index Fund',
-            'Fixed Income', 'Intermediate-Term Blend'
-            ],
-    'BLV': ['Vanguard Long-Term Bond Index Fund',
-            'Fixed Income', 'Long-Term Blend'
-            ],
-    'VTIP': ['Vanguard Short-Term Inflation Protected Securities',
-             'Fixed Income', 'Short-Term Inflation-protected'
-             ],
-    'PIMIX': ['PIMCO Income Fund Institutional Class',
-              'Fixed Income', 'Multi-sector'
-              ],
-    'DODIX': ['Dodge & Cox Income Fund',
-              'Fixed Income', 'Intermediate-Term Blend'
-              ],
-    'BHYAX': ['BlackRock High Yield Bond Portfolio Investor A Shares',
-              'Fixed Income', 'High-Yield'
-              ],
-    'VWEHX': ['Vanguard High-Yield Corporate Fund Investor Shares',
-              'Fixed Income', 'High-Yield']
-}
-
-this_equity_funds = {
-    'VOO': ['Vanguard S&P 500 Index Fund',
-            'Large-Cap', 'Blend'
-            ],
-    'IVV': ['iShares Core S&P 500 ETF',
-            'Large-Cap', 'Blend'
-            ],
-    'VTI': ['Vanguard Total Stock Market ETF',
-            'Large-Cap', 'Blend'
-            ],
-    'VTV': ['Vanguard Value Index Fund',
-            'Large-Cap', 'Value'
-            ],
-    'VUG': ['Vanguard Growth Index Fund',
-            'Large-Cap', 'Growth'
-            ],
-    'VO': ['Vanguard Mid-Cap Index Fund',
-           'Mid-Cap', 'Blend'
-           ],
-    'IJH': ['iShares Core S&P Mid-Cap Index Fund',
-            'Mid-Cap', 'Blend'
-            ],
-    'VOE': ['Vanguard Mid-Cap Value Index Fund',
-            'Mid-Cap', 'Value'
-            ],
-    'VOT': ['Vanguard Mid-Cap Growth Index Fund',
-            'Mid-Cap', 'Growth'
-            ],
-    'VB': ['Vanguard Small-Cap Index Fund',
-           'Small-Cap', 'Blend'
-           ],
-    'VBR': ['Vanguard Small-Cap Value Index Fund',
-            'Small-Cap', 'Value'
-            ],
-    'VBK': ['Vanguard Small-Cap Growth Index Fund',
-            'Small-Cap', 'Growth'
-            ],
-    'VGT': ['Vanguard Information Technology Index Fund',
-            'Sector-Specific Equity', 'Information Technology'
-            ],
-    'VHT': ['Vanguard Health Care Index Fund',
-            'Sector-Specific Equity', 'Health Care'
-            ],
-    'VDC': ['Vanguard Consumer Staples Index Fund',
-            'Sector-Specific Equity', 'Consumer Staples'
-            ],
-    'VCR': ['Vanguard Consumer Discretionary Index Fund',
-            'Sector-Specific Equity', 'Consumer Discretionary'
-            ],
-    'VNQ': ['Vanguard Real Estate Index Fund',
-            'Alternative', 'REITs'
-            ],
-    'VPU': ['Vanguard Utility Index Fund',
-            'Sector-Specific Equity', 'Utility'
-            ],
-    'VIS': ['Vanguard Industrial Index Fund',
-            'Sector-Specific Equity', 'Industrial'
-            ],
-    'VXUS': ['Vanguard Total International Stock ETF',
-             'Foreign Equity', 'Large Blend'
-             ],
-    'VEA': ['Vanguard FTSE Developed Markets ETF',
-            'Foreign Equity', 'Developed Markets'
-            ],
-    'VGK': ['Vanguard FTSE Europe ETF',
-            'Foreign Equity', 'Europe Markets'
-            ],
-    'VPL': ['Vanguard FTSE Pacific ETF',
-            'Foreign Equity', 'Pacific-Asia Markets'
-            ],
-    'VWO': ['Vanguard FTSE Emerging Markets ETF',
-            'Foreign Equity', 'Emerging Markets']
-}
+from .eq_SQLite_utility import SQLiteRequest as eq_SQLiteRequest, TRANSACTIONS_COLUMNS, POSITIONS_COLUMNS
+from .fixed_SQLite_utility import FixedSQLiteRequest as fixed_SQLiteRequest, TRANSACTIONS_FIXED_COLUMNS
+from .data_context import PortfolioDataContext
+from .fund_catalog import FundCatalog
+from .portfolio_query import PortfolioQuery
+from .fixed_income_analytics import FixedIncomeAnalytics, BOND_ANALYTICS_COLUMNS
+from .tracing import traced
 
 
 class SummaryTool(object):
@@ -176,46 +71,64 @@ class SummaryTool(object):
         self.eq_db_file = 'databases/equity.db'
         self.fixed_db_file = 'databases/fixed_income.db'
         self.other_investment_file = 'databases/others.json'
-
-    def _get_eq_transactions_data(self):
+        # frames are resolved through the _get_* methods at call time and shared by every generate_* method
+        self.data_context = PortfolioDataContext({
+            'eq_transactions': lambda: self._get_eq_transactions_data(),
+            'eq_positions': lambda: self._get_eq_positions_data(),
+            'eq_stock_positions': lambda: self._get_eq_stock_positions_data(),
+            'fixed_transactions': lambda: self._get_fixed_transactions_data(),
+            'other_investment': lambda: self._get_other_investment_information(),
+            'watch_list': lambda: self._get_watch_list_data(),
+            'allocation_account': lambda: self._get_allocation_account_data(),
+            'allocation_type': lambda: self._get_allocation_type_data()
+        })
+        self.fund_catalog = FundCatalog()
+        self._portfolio_query_ref = None
+        self._portfolio_query_lock = threading.Lock()
+
+    @traced()
+    def _get_eq_transactions_data(self, v_account=None, v_columns=None):
         """Read data from :table: transactions in SQLite equity.db.
 
+        Args:
+            v_account (str): read the rows of this ACCOUNT only, filtered in SQL, default to all accounts.
+            v_columns (list): columns to read, default to all of them.
+
         Returns: :object: Pandas dataframe.
 
         """
         self.logger.info(f'Attempt to retrieve data from :table: transactions in {self.eq_db_file}...')
         try:
             _this_instance = eq_SQLiteRequest(self.eq_db_file)
-            _this_output = _this_instance.get_table_transactions()
-            df = pd.DataFrame(_this_output,
-                              columns=['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE',
-                                       'DESCRIPTION', 'ACCOUNT', 'TOTAL_DOLLARS']
-                              )
+            _this_output = _this_instance.get_transactions(v_account=v_account, v_columns=v_columns)
+            df = pd.DataFrame(_this_output, columns=v_columns or TRANSACTIONS_COLUMNS)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :table: transactions in {self.eq_db_file} -> '+str(e))
             raise e
 
-    def _get_eq_positions_data(self):
+    @traced()
+    def _get_eq_positions_data(self, v_investment_type=None, v_columns=None):
         """Read data from :view: positions in SQLite equity.db.
 
+        Args:
+            v_investment_type (str): read positions of this INVESTMENT_TYPE only, filtered in SQL, default to all.
+            v_columns (list): columns to read, default to all of them.
+
         Returns: :object: Pandas dataframe.
 
         """
         self.logger.info(f'Attempt to retrieve data from :view: positions in {self.eq_db_file}...')
         try:
             _this_instance = eq_SQLiteRequest(self.eq_db_file)
-            _this_output = _this_instance.get_view_positions()
-            df = pd.DataFrame(_this_output,
-                              columns=['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'COST_DOLLARS', 'DOLLARS',
-                                       'UNITS', 'LAST_UPDATED', 'MKT_VALUE', 'GAIN_PER_SHARE', 'GAIN_TOTAL',
-                                       'GAIN_PERCENTAGE']
-                              )
+            _this_output = _this_instance.get_positions(v_investment_type=v_investment_type, v_columns=v_columns)
+            df = pd.DataFrame(_this_output, columns=v_columns or POSITIONS_COLUMNS)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :view: positions in {self.eq_db_file} -> '+str(e))
             raise e
 
+    @traced()
     def _get_fixed_positions_data(self):
         """Read data from :view: positions in SQLite fixed_income.db.
 
@@ -236,26 +149,30 @@ class SummaryTool(object):
             self.logger.error(f'Failed to retrieve data from :view: positions in {self.fixed_db_file} -> '+str(e))
             raise e
 
-    def _get_fixed_transactions_data(self):
+    @traced()
+    def _get_fixed_transactions_data(self, v_account=None, v_active_only=False, v_columns=None):
         """Read data from :table: transactions in SQLite fixed_income.db.
 
+        Args:
+            v_account (str): read the rows of this ACCOUNT only, filtered in SQL, default to all accounts.
+            v_active_only (bool): read positions not matured yet only, default to False.
+            v_columns (list): columns to read, default to all of them.
+
         Returns: :object: Pandas dataframe.
 
         """
         self.logger.info(f'Attempt to retrieve data from :table: transactions in {self.fixed_db_file}...')
         try:
             _this_instance = fixed_SQLiteRequest(self.fixed_db_file)
-            _this_output = _this_instance.get_table_transactions_fixed()
-            df = pd.DataFrame(_this_output,
-                              columns=['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE',
-                                       'TOTAL_DOLLARS', 'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM',
-                                       'ACCOUNT']
-                              )
+            _this_output = _this_instance.get_transactions_fixed(v_account=v_account, v_active_only=v_active_only,
+                                                                 v_columns=v_columns)
+            df = pd.DataFrame(_this_output, columns=v_columns or TRANSACTIONS_FIXED_COLUMNS)
             return df
         except Exception as e:
             self.logger.error(f'Failed to retrieve data from :table: transactions in {self.fixed_db_file} -> '+str(e))
             raise e
 
+    @traced()
     def _get_other_investment_information(self):
         """Read data from hard-coded cash_equivalent csv file.
 
@@ -273,58 +190,130 @@ class SummaryTool(object):
             self.logger.error(f'Failed to retrieve data from {self.other_investment_file} -> '+str(e))
             raise e
 
+    @traced()
+    def _get_watch_list_data(self):
+        """Read SYMBOL and CATEGORY from :table: watch_list in SQLite equity.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        self.logger.info(f'Attempt to retrieve data from :table: watch_list in {self.eq_db_file}...')
+        try:
+            _this_instance = eq_SQLiteRequest(self.eq_db_file)
+            _this_output = _this_instance.get_table_watch_list()
+            df = pd.DataFrame(_this_output, columns=['SYMBOL', 'CATEGORY'])
+            return df
+        except Exception as e:
+            self.logger.error(f'Failed to retrieve data from :table: watch_list in {self.eq_db_file} -> '+str(e))
+            raise e
+
+    @traced()
+    def _get_eq_stock_positions_data(self):
+        """Get the stock rows of the memoized :view: positions frame, without reading the view again.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        df_positions = self.data_context.get('eq_positions')
+        df = df_positions[df_positions['INVESTMENT_TYPE'].isin(['stock', 'STOCK'])]
+        return df[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'MKT_VALUE']].reset_index(drop=True)
+
+    def _portfolio_query(self):
+        """Get the :class: PortfolioQuery over the current database files, which may be replica URIs, it is kept
+        with its connection until close_portfolio_query() or until the database files change."""
+        this_files = (self.eq_db_file, self.fixed_db_file, self.other_investment_file)
+        with self._portfolio_query_lock:
+            this_query = self._portfolio_query_ref
+            if this_query is not None and \
+                    (this_query.eq_db_file, this_query.fixed_db_file, this_query.other_investment_file) == this_files:
+                return this_query
+            if this_query is not None:
+                this_query.close()
+            self._portfolio_query_ref = PortfolioQuery(*this_files)
+            return self._portfolio_query_ref
+
+    def close_portfolio_query(self):
+        """The :function: close_portfolio_query is used to close the connection shared by the SQL allocations."""
+        with self._portfolio_query_lock:
+            if self._portfolio_query_ref is not None:
+                self._portfolio_query_ref.close()
+            self._portfolio_query_ref = None
+
+    @traced()
+    def _get_allocation_account_data(self):
+        """Read total dollars of every ACCOUNT, aggregated in SQL across equity.db, fixed_income.db and others.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        self.logger.info('Attempt to retrieve dollars by ACCOUNT from all investments...')
+        try:
+            _this_output = self._portfolio_query().get_allocation_account()
+            df = pd.DataFrame(_this_output, columns=['ACCOUNT', 'TOTAL_DOLLARS'])
+            return df
+        except Exception as e:
+            self.logger.error('Failed to retrieve dollars by ACCOUNT from all investments -> '+str(e))
+            raise e
+
+    @traced()
+    def _get_allocation_type_data(self):
+        """Read total dollars of every SYMBOL and type, aggregated in SQL across equity.db, fixed_income.db and others.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        self.logger.info('Attempt to retrieve dollars by investment type from all investments...')
+        try:
+            _this_output = self._portfolio_query().get_allocation_type()
+            df = pd.DataFrame(_this_output, columns=['SOURCE', 'SYMBOL', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS'])
+            return df
+        except Exception as e:
+            self.logger.error('Failed to retrieve dollars by investment type from all investments -> '+str(e))
+            raise e
+
+    @traced()
+    def _get_fund_categories(self):
+        """Get watch_list CATEGORY indexed by SYMBOL, the fallback for symbols not in the fund catalog.
+
+        Returns: :object: Pandas series.
+
+        """
+        df_watch_list = self.data_context.get('watch_list')
+        return df_watch_list.set_index('SYMBOL')['CATEGORY']
+
+    @traced()
     def generate_allocation_report_type(self):
         """Get allocation report based on investment type.
 
-        Return: :object: Pandas dataframe.
+        Return: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
 
         """
 
-        def _set_major_investment_type_equity(v_symbol):
-            """Set MAJOR_TYPE based on SYMBOL for Equity entries"""
-            if v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_major_type = 'FIXED_INCOME'
-            else:
-                out_major_type = 'EQUITY'
-            return out_major_type
-
-        def _set_minor_investment_type_equity(v_symbol, v_minor_type):
-            """Set MINOR_TYPE based on SYMBOL and INVESTMENT_TYPE for Equity entries"""
-            if v_minor_type.lower() == 'stock':
-                out_minor_type = 'Individual Stock'
-            elif v_minor_type.lower() == 'etf' and v_symbol.upper() in list(this_equity_funds.keys()):
-                out_minor_type = this_equity_funds.get(v_symbol.upper())[1]
-            elif v_minor_type.lower() == 'etf' and v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_minor_type = this_fixed_income_funds.get(v_symbol.upper())[2]
-            else:
-                out_minor_type = 'Others'
-            return out_minor_type
-
-        def _set_minor_investment_type_others(v_symbol, v_major_type, v_minor_type):
-            """Set MINOR_TYPE based on SYMBOL and MINOR type for Other entries"""
-            if v_minor_type.lower() == 'mutual fund' and v_major_type.lower() == 'fixed_income' and v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_minor_type = this_fixed_income_funds.get(v_symbol.upper())[2]
-            else:
-                out_minor_type = v_minor_type
-            return out_minor_type
-
         self.logger.info('Generating Allocation report based on investment_type ...')
         try:
-            df_eq = self._get_eq_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']]
-            df_fixed = self._get_fixed_positions_data()[['SYMBOL', 'INVESTMENT_TYPE', 'TOTAL_DOLLARS']]
-            df_other_investment = self._get_other_investment_information()[['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE',
-                                                                            'MINOR_TYPE', 'DOLLARS']]
-            df_eq.columns = ['SYMBOL', 'MINOR_TYPE', 'DOLLARS']
-            df_fixed.columns = ['SYMBOL', 'MINOR_TYPE', 'DOLLARS']
-            df_other_investment.columns = ['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']
-            self.logger.info('Applying logic to build :column: MAJOR_TYPE ...')
-            df_eq['MAJOR_TYPE'] = df_eq['SYMBOL'].apply(lambda x: _set_major_investment_type_equity(x))
+            # one row per equity SYMBOL, fixed income INVESTMENT_TYPE and other investment, summed in SQL
+            df_input = self.data_context.get('allocation_type')
+            df_eq = df_input[df_input['SOURCE'] == 'EQUITY'][['SYMBOL', 'MINOR_TYPE', 'DOLLARS']]
+            df_fixed = df_input[df_input['SOURCE'] == 'FIXED_INCOME'][['MINOR_TYPE', 'DOLLARS']]
+            df_other_investment = df_input[df_input['SOURCE'] == 'OTHERS'][['SYMBOL', 'MAJOR_TYPE', 'MINOR_TYPE',
+                                                                            'DOLLARS']]
+            df_other_investment.columns = ['SUFFIX', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']
+            self.logger.info('Applying fund catalog to build :column: MAJOR_TYPE and MINOR_TYPE ...')
+            this_investment_type = df_eq['MINOR_TYPE'].str.lower().values
+            this_is_etf = this_investment_type == 'etf'
+            df_eq['MAJOR_TYPE'] = pd.Series(self.fund_catalog.lookup(df_eq['SYMBOL'], 'MAJOR_TYPE'),
+                                            index=df_eq.index).fillna('EQUITY')
+            df_eq['MINOR_TYPE'] = np.where(this_investment_type == 'stock', 'Individual Stock', 'Others')
+            df_eq.loc[this_is_etf, 'MINOR_TYPE'] = self.fund_catalog.classify(
+                df_eq.loc[this_is_etf, 'SYMBOL'], self._get_fund_categories)['MINOR_TYPE'].values
             df_fixed['MAJOR_TYPE'] = 'FIXED_INCOME'
-            self.logger.info('Applying logic to build :column: MINOR_TYPE ...')
-            df_eq['MINOR_TYPE'] = df_eq.apply(
-                lambda x: _set_minor_investment_type_equity(x['SYMBOL'], x['MINOR_TYPE']), axis=1)
-            df_other_investment['MINOR_TYPE'] = df_other_investment.apply(
-                lambda x: _set_minor_investment_type_others(x['SUFFIX'], x['MAJOR_TYPE'], x['MINOR_TYPE']), axis=1)
+            this_fund_major_type = self.fund_catalog.lookup(df_other_investment['SUFFIX'], 'MAJOR_TYPE')
+            this_is_fixed_fund = ((df_other_investment['MINOR_TYPE'].str.lower() == 'mutual fund') &
+                                  (df_other_investment['MAJOR_TYPE'].str.lower() == 'fixed_income')).values & \
+                                 (this_fund_major_type == 'FIXED_INCOME')
+            df_other_investment['MINOR_TYPE'] = np.where(
+                this_is_fixed_fund, self.fund_catalog.lookup(df_other_investment['SUFFIX'], 'SUBCLASS'),
+                df_other_investment['MINOR_TYPE'].values)
             self.logger.info('Preparing allocation summary ...')
             df_combined = pd.concat([
                 df_eq[['MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS']],
@@ -345,136 +334,121 @@ class SummaryTool(object):
             df_allocation_report = df_allocation_major_type.merge(df_allocation_minor_type, on='MAJOR_TYPE')
             df_allocation_report = df_allocation_report.sort_values(
                 ['MAJOR_ALLOCATION', 'MINOR_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION',
-                                              'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION'
-                                              ]].append(
-                {'MAJOR_TYPE': 'TOTAL',
-                    'MAJOR_TOTAL_DOLLARS': df_allocation_report['MINOR_TOTAL_DOLLARS'].sum(),
-                    'MAJOR_ALLOCATION': 100.0,
-                    'MINOR_TYPE': '',
-                    'MINOR_TOTAL_DOLLARS': float('nan'),
-                    'MINOR_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['MAJOR_ALLOCATION'] = df_output['MAJOR_ALLOCATION'].map('{:.0f}%'.format)
-            df_output['MINOR_ALLOCATION'] = df_output['MINOR_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['MAJOR_TOTAL_DOLLARS'] = df_output['MAJOR_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['MINOR_TOTAL_DOLLARS'] = df_output['MINOR_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['MAJOR_IS_DUPLICATE'] = df_output[
-                ['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['MAJOR_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['MAJOR_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['MAJOR_IS_DUPLICATE'])
+            df_output = pd.concat([
+                df_allocation_report[['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION',
+                                      'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION']],
+                pd.DataFrame([{'MAJOR_TYPE': 'TOTAL',
+                               'MAJOR_TOTAL_DOLLARS': df_allocation_report['MINOR_TOTAL_DOLLARS'].sum(),
+                               'MAJOR_ALLOCATION': 100.0,
+                               'MINOR_TYPE': '',
+                               'MINOR_TOTAL_DOLLARS': float('nan'),
+                               'MINOR_ALLOCATION': float('nan'),
+                               'IS_TOTAL': True}])], ignore_index=True)
+            df_output['IS_TOTAL'] = df_output['IS_TOTAL'].fillna(False).astype(bool)
+            return df_output
         except Exception as e:
             self.logger.error('Failed to generate allocation report based on investment_type  -> '+str(e))
             raise e
 
+    @traced()
     def generate_mature_calender(self):
         """Get mature calender for fixed income.
 
-        Returns: :object: Pandas dataframe.
+        Returns: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
 
         """
         self.logger.info('Generating Mature Calender for fixed income investment ...')
         try:
-            df_fixed = self._get_fixed_transactions_data()[['SYMBOL', 'END_DATE', 'TOTAL_DOLLARS', 'APR', 'YTM', 'ACCOUNT']]
-            self.logger.info('Updating Pandas Dataframe column label ...')
-            df_fixed.columns = ['SYMBOL', 'MATURE_DATE', 'DOLLARS', 'APR', 'YTM', 'ACCOUNT']
-            df_fixed['RETURN_RATE'] = df_fixed[['APR', 'YTM']].max(axis=1)
-            df_fixed['RETURN'] = df_fixed['DOLLARS']*df_fixed['RETURN_RATE']
-            self.logger.info('Updating :column: MATURE_DATE format from YYYY-MM-DD to YYYY-MM ...')
-            df_fixed['MATURE_DATE'] = df_fixed['MATURE_DATE'].apply(
-                lambda x: datetime.strptime(datetime.strptime(x, '%Y-%m-%d').strftime('%Y-%m'), '%Y-%m'))
-            df_fixed['SYMBOL_REF'] = df_fixed['SYMBOL']+'('+df_fixed['ACCOUNT']+')'
-            self.logger.info('Aggregate the mature calender by MATURE_DATE and ACCOUNT ...')
-            df_mature_calender = df_fixed.groupby(by=['MATURE_DATE']).agg(
-                {'DOLLARS': ['sum', 'count'],
-                 'RETURN': ['sum'],
-                 'SYMBOL_REF': [lambda x: ', '.join(sorted([y.replace('n/a', 'CD') for y in x],key=lambda z: z.split('(')[1]))]
-                 }).reset_index()
-            df_mature_calender.columns = ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF']
-            df_mature_calender['YIELD'] = df_mature_calender['YIELD']/df_mature_calender['TOTAL_DOLLARS']*100
-            self.logger.info('Filtering Pandas Dataframe to exclude rows with MATURE_DATE < CURRENT_MONTH ...')
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m'), '%Y-%m')
-            _delete_row = df_mature_calender[df_mature_calender['MATURE_DATE'] < _current_month].index
-            df_mature_calender = df_mature_calender.drop(_delete_row)
-            df_mature_calender['MATURE_DATE'] = df_mature_calender['MATURE_DATE'].apply(lambda x: x.strftime('%Y-%m'))
-            df_output = df_mature_calender.sort_values(by=['MATURE_DATE'], ascending=True).reset_index(drop=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['TOTAL_DOLLARS'] = df_output['TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['YIELD'] = df_output['YIELD'].map('{:.2f}%'.format)
-            return df_output
+            return FixedIncomeAnalytics.mature_calender(self.data_context.get('fixed_transactions'))
         except Exception as e:
             self.logger.error('Failed to generate Mature Calender for fixed income investment  -> '+str(e))
             raise e
 
+    @traced()
+    def generate_cash_flow_ladder(self, v_horizon_months=360):
+        """Get projected fixed income principal and interest by month and account.
+
+        Args:
+            v_horizon_months (int): number of months projected from the current month, default to 30 years.
+
+        Returns: :object: Pandas dataframe with columns MONTH, ACCOUNT, PRINCIPAL, INTEREST, TOTAL.
+
+        """
+        self.logger.info('Generating Cash Flow Ladder for fixed income investment ...')
+        try:
+            return FixedIncomeAnalytics.cash_flow_ladder(self.data_context.get('fixed_transactions'),
+                                                         v_horizon_months=v_horizon_months)
+        except Exception as e:
+            self.logger.error('Failed to generate Cash Flow Ladder for fixed income investment -> '+str(e))
+            raise e
+
+    @traced()
+    def generate_fixed_income_analytics(self):
+        """Get current yield, YTM, duration and convexity of every fixed income position not matured yet.
+
+        The TOTAL row averages every measure weighted by :column: DOLLARS.
+
+        Returns: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
+
+        """
+        self.logger.info('Generating Bond Analytics for fixed income investment ...')
+        try:
+            df_fixed = self.data_context.get('fixed_transactions')
+            df_output = pd.concat([
+                df_fixed[['SYMBOL', 'ACCOUNT', 'END_DATE', 'TOTAL_DOLLARS']].rename(
+                    columns={'TOTAL_DOLLARS': 'DOLLARS'}),
+                FixedIncomeAnalytics.bond_analytics(df_fixed)], axis=1)
+            df_output = df_output[df_output['YEARS_TO_MATURITY'].notnull()].sort_values(['END_DATE', 'ACCOUNT'],
+                                                                                        kind='mergesort')
+            df_output['SYMBOL'] = df_output['SYMBOL'].str.replace('n/a', 'CD', regex=False)
+            this_weights = df_output['DOLLARS'].values.astype(float)
+            this_total = {'SYMBOL': 'TOTAL', 'ACCOUNT': 'N/A', 'END_DATE': 'N/A', 'DOLLARS': this_weights.sum(),
+                          'IS_TOTAL': True}
+            for this_column in BOND_ANALYTICS_COLUMNS:
+                this_values = df_output[this_column].values.astype(float)
+                this_valid = ~np.isnan(this_values)
+                this_total[this_column] = np.average(this_values[this_valid], weights=this_weights[this_valid]) \
+                    if this_weights[this_valid].sum() > 0 else np.nan
+            df_output = pd.concat([df_output, pd.DataFrame([this_total])], ignore_index=True)
+            df_output['IS_TOTAL'] = df_output['IS_TOTAL'].fillna(False).astype(bool)
+            return df_output
+        except Exception as e:
+            self.logger.error('Failed to generate Bond Analytics for fixed income investment -> '+str(e))
+            raise e
+
+    @traced()
     def generate_allocation_report_account(self):
         """Get allocation report based on Broker(Account).
 
-        Returns: :object: Pandas dataframe.
+        Returns: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
 
         """
         self.logger.info('Generating Allocation report based on ACCOUNT ...')
         try:
-            df_eq_positions = self._get_eq_positions_data()[['SYMBOL', 'DOLLARS']]
-            df_eq_transactions = self._get_eq_transactions_data()[['SYMBOL', 'TYPE', 'UNITS', 'ACCOUNT']]
-            df_eq_transactions['UNITS'].loc[df_eq_transactions['TYPE'] == 'SELL'] = -1*df_eq_transactions['UNITS']
-            df_eq_aggregated_transactions = df_eq_transactions.groupby(
-                ['ACCOUNT', 'SYMBOL'])['UNITS'].sum().reset_index(name='TOTAL_UNITS')
-            df_eq_aggregated_transactions.drop(
-                df_eq_aggregated_transactions[df_eq_aggregated_transactions['TOTAL_UNITS'] <= 0].index,
-                inplace=True)
-            df_eq_combined = df_eq_aggregated_transactions.merge(df_eq_positions, left_on='SYMBOL', right_on='SYMBOL')
-            df_eq_combined['TOTAL_DOLLARS'] = df_eq_combined['DOLLARS']*df_eq_combined['TOTAL_UNITS']
-            df_eq = df_eq_combined.groupby(['ACCOUNT'])['TOTAL_DOLLARS'].sum().reset_index(name='DOLLARS')
-            df_fixed = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'END_DATE', 'ACCOUNT']]
-            df_fixed.columns = ['DOLLARS', 'END_DATE', 'ACCOUNT']
-            df_fixed['END_DATE'] = df_fixed['END_DATE'].apply(lambda x: datetime.strptime(x, '%Y-%m-%d'))
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m-%d'), '%Y-%m-%d')
-            _delete_row = df_fixed[df_fixed['END_DATE'] < _current_month].index
-            df_fixed = df_fixed.drop(_delete_row)
-            df_other_investment = self._get_other_investment_information()[['ACCOUNT', 'DOLLARS']]
-            df_combined = pd.concat([
-                df_eq[['ACCOUNT', 'DOLLARS']],
-                df_fixed[['ACCOUNT', 'DOLLARS']],
-                df_other_investment[['ACCOUNT', 'DOLLARS']]
-            ])
-            df_allocation_account = df_combined['DOLLARS'].groupby(
-                df_combined['ACCOUNT']).sum().reset_index(name='TOTAL_DOLLARS')
+            # equity, fixed income and other investments are summed per ACCOUNT in one SQL query
+            df_allocation_account = self.data_context.get('allocation_account')
             df_allocation_account['ALLOCATION'] = (
                     df_allocation_account['TOTAL_DOLLARS'] / df_allocation_account['TOTAL_DOLLARS'].sum() * 100)
             df_output = df_allocation_account.sort_values('ALLOCATION', ascending=False)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ALLOCATION'] = df_output['ALLOCATION'].map('{:.0f}%'.format)
-            df_output['TOTAL_DOLLARS'] = df_output['TOTAL_DOLLARS'].map('${:,.0f}'.format)
+            df_output['IS_TOTAL'] = False
             return df_output
         except Exception as e:
             self.logger.error('Failed to generate Allocation report based on ACCOUNT  -> '+str(e))
             raise e
 
+    @traced()
     def generate_allocation_report_equity_stock(self):
         """Get allocation report for Equity Stock.
 
-        Return: :object: Pandas DataFrame.
+        Return: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
 
         """
         self.logger.info('Generating Allocation report for Equity Stock ...')
         try:
             pd.options.mode.chained_assignment = None
-            df_eq = self._get_eq_positions_data()[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'MKT_VALUE']]
+            # stock positions only, taken from the memoized positions frame
+            df_eq = self.data_context.get('eq_stock_positions')[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE',
+                                                                 'MKT_VALUE']]
             df_eq.columns = ['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'DOLLARS']
             df_allocation_report = df_eq[((df_eq['INVESTMENT_TYPE'] == 'STOCK') | (df_eq['INVESTMENT_TYPE'] == 'stock'))
                                          & ~(df_eq['SYMBOL'].isin(['GPRO']))]
@@ -482,134 +456,162 @@ class SummaryTool(object):
                     df_allocation_report['DOLLARS'] / df_allocation_report['DOLLARS'].sum() * 100)
             df_allocation_report = df_allocation_report.sort_values(['STOCK_ALLOCATION'], ascending=False)[
                 ['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION']]
-            df_output = df_allocation_report[['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION'
-                                              ]].append(
-                {'SYMBOL': 'TOTAL',
-                 'DESCRIPTION': 'N/A',
-                 'DOLLARS': df_allocation_report['DOLLARS'].sum(),
-                 'STOCK_ALLOCATION': 100.0
-                 }, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['STOCK_ALLOCATION'] = df_output['STOCK_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['DOLLARS'] = df_output['DOLLARS'].map('${:,.0f}'.format)
+            df_output = pd.concat([
+                df_allocation_report[['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION']],
+                pd.DataFrame([{'SYMBOL': 'TOTAL',
+                               'DESCRIPTION': 'N/A',
+                               'DOLLARS': df_allocation_report['DOLLARS'].sum(),
+                               'STOCK_ALLOCATION': 100.0,
+                               'IS_TOTAL': True}])], ignore_index=True)
+            df_output['IS_TOTAL'] = df_output['IS_TOTAL'].fillna(False).astype(bool)
             return df_output
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Equity Stock -> '+str(e))
             raise e
 
-    def generate_allocation_report_etf_w_account(self, v_account):
-        """Get allocation report for Equity ETF.
+    @traced()
+    def generate_position_values(self):
+        """Get market value of every open position by account, for equity, fixed income and other investments.
 
-        Return: :object: Pandas DataFrame.
+        Return: :object: Pandas dataframe with columns ACCOUNT, SYMBOL, INVESTMENT_TYPE, UNITS, PRICE, MKT_VALUE.
 
         """
-        def _set_asset_class(v_symbol, v_index):
-            """Set ETF Asset Class based on SYMBOL"""
-            if v_symbol.upper() in list(this_equity_funds.keys()):
-                out_asset_class = this_equity_funds.get(v_symbol.upper())[v_index]
-            elif v_symbol.upper() in list(this_fixed_income_funds.keys()):
-                out_asset_class = this_fixed_income_funds.get(v_symbol.upper())[v_index]
-            else:
-                out_asset_class = 'Others'
-            return out_asset_class
-
-        self.logger.info('Generating Allocation report for Equity ETF, group by account ...')
+        self.logger.info('Generating market value of every position by ACCOUNT ...')
         try:
-            pd.options.mode.chained_assignment = None
-            df_transactions = self._get_eq_transactions_data()[['SYMBOL', 'ACCOUNT', 'TYPE', 'UNITS']]
+            that_columns = ['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'PRICE', 'MKT_VALUE']
+            df_transactions = self.data_context.get('eq_transactions')[['SYMBOL', 'ACCOUNT', 'TYPE', 'UNITS']]
             df_transactions['ADJUSTED_UNITS'] = np.where(df_transactions['TYPE'] == 'BUY',
                                                          df_transactions['UNITS'],
                                                          -1 * df_transactions['UNITS'])
-            df_positions = self._get_eq_positions_data()[['SYMBOL', 'DESCRIPTION', 'INVESTMENT_TYPE', 'DOLLARS']]
-            df_other_investment = self._get_other_investment_information()[['SUFFIX', 'MAJOR_TYPE', 'MINOR_TYPE',
-                                                                            'ACCOUNT', 'DOLLARS']]
-            df_cash_equivalent = df_other_investment[(df_other_investment['ACCOUNT'] == v_account) &
-                                                     (df_other_investment['MAJOR_TYPE'] == 'Cash Equivalent'
-                                                      )].groupby(['MAJOR_TYPE'])['DOLLARS'].sum().\
-                reset_index(name='TOTAL_DOLLARS')
-            df_cash_equivalent.columns = ['ASSET_CLASS', 'DOLLARS']
-            df_mutual_fund = df_other_investment[(df_other_investment['ACCOUNT'] == v_account) &
-                                                 (df_other_investment['MAJOR_TYPE'] != 'Cash Equivalent')]
-            df_mutual_fund.columns = ['SYMBOL', 'MAJOR_TYPE', 'INVESTMENT_TYPE', 'ACCOUNT', 'DOLLARS']
-            df_fixed_trans = self._get_fixed_transactions_data()[['TOTAL_DOLLARS', 'END_DATE', 'INVESTMENT_TYPE', 'ACCOUNT']]
-            df_fixed_trans.columns = ['DOLLARS', 'END_DATE', 'TYPE', 'ACCOUNT']
-            df_fixed_trans['END_DATE'] = df_fixed_trans['END_DATE'].apply(lambda x: datetime.strptime(x, '%Y-%m-%d'))
-            _current_month = datetime.strptime(datetime.today().strftime('%Y-%m-%d'), '%Y-%m-%d')
-            _delete_row = df_fixed_trans[df_fixed_trans['END_DATE'] < _current_month].index
-            df_fixed_trans = df_fixed_trans.drop(_delete_row)
-            df_fixed = df_fixed_trans[(df_fixed_trans['ACCOUNT'] == v_account)][['DOLLARS', 'TYPE']]
-            df_fixed_final = df_fixed['DOLLARS'].groupby(
-                df_fixed['TYPE']).sum().reset_index()
-            df_eq = df_transactions.groupby(['SYMBOL', 'ACCOUNT'])['ADJUSTED_UNITS'].sum().\
-                reset_index(name='TOTAL_UNITS').query('TOTAL_UNITS > 0').\
-                join(df_positions.set_index('SYMBOL'), on='SYMBOL')
-            df_eq['TOTAL_DOLLARS'] = df_eq['TOTAL_UNITS'] * df_eq['DOLLARS']
-            df_final = df_eq[(df_eq['ACCOUNT'] == v_account)][['SYMBOL', 'INVESTMENT_TYPE', 'TOTAL_DOLLARS']]
-            df_final.columns = ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']
-            df_combined = df_final[((df_final['INVESTMENT_TYPE'] == 'ETF') | (df_final['INVESTMENT_TYPE'] == 'etf'))]
-            df_combined = df_combined.append(df_mutual_fund[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']], ignore_index=True)
-            df_combined['ASSET_CLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_asset_class(x, 1))
-            df_combined['SUBCLASS'] = df_combined['SYMBOL'].apply(lambda x: _set_asset_class(x, 2))
-            if df_cash_equivalent.shape[0] > 0:
-                df_cash_equivalent['SYMBOL'] = 'n/a'
-                df_cash_equivalent['INVESTMENT_TYPE'] = 'Cash'
-                df_cash_equivalent['SUBCLASS'] = 'Cash'
-                df_combined = df_combined.append(df_cash_equivalent[[
-                    'SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS', 'ASSET_CLASS', 'SUBCLASS']], ignore_index=True)
-            if df_fixed_final.shape[0] > 0:
-                df_fixed_final['SYMBOL'] = 'n/a'
-                df_fixed_final['ASSET_CLASS'] = 'Fixed Income'
-                df_fixed_final['INVESTMENT_TYPE'] = 'Bond/CD'
-                df_fixed_final['SUBCLASS'] = df_fixed_final['TYPE']
-                df_combined = df_combined.append(df_fixed_final[[
-                    'SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS', 'ASSET_CLASS', 'SUBCLASS']], ignore_index=True)
-            df_allocation_class = df_combined['DOLLARS'].groupby(
-                df_combined['ASSET_CLASS']).sum().reset_index(name='ASSET_CLASS_TOTAL_DOLLARS')
-            df_allocation_class['ASSET_CLASS_ALLOCATION'] = (
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'] /
-                    df_allocation_class['ASSET_CLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_subclass = df_combined['DOLLARS'].groupby(
-                [df_combined['ASSET_CLASS'],
-                 df_combined['SUBCLASS']]).sum().reset_index(name='SUBCLASS_TOTAL_DOLLARS')
-            df_allocation_subclass['SUBCLASS_ALLOCATION'] = (
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'] /
-                    df_allocation_subclass['SUBCLASS_TOTAL_DOLLARS'].sum() * 100)
-            df_allocation_report = df_allocation_class.merge(df_allocation_subclass, on='ASSET_CLASS')
-            df_allocation_report = df_allocation_report.sort_values(
-                ['ASSET_CLASS_ALLOCATION', 'SUBCLASS_ALLOCATION'], ascending=False)
-            df_output = df_allocation_report[['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
-                                              'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'
-                                              ]].append(
-                {'ASSET_CLASS': 'TOTAL',
-                 'ASSET_CLASS_TOTAL_DOLLARS': df_allocation_report['SUBCLASS_TOTAL_DOLLARS'].sum(),
-                 'ASSET_CLASS_ALLOCATION': 100.0,
-                 'SUBCLASS': '',
-                 'SUBCLASS_TOTAL_DOLLARS': float('nan'),
-                 'SUBCLASS_ALLOCATION': float('nan')}, ignore_index=True)
-            self.logger.info('Formatting columns with float data type ...')
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output['ASSET_CLASS_ALLOCATION'].map('{:.1f}%'.format)
-            df_output['SUBCLASS_ALLOCATION'] = df_output['SUBCLASS_ALLOCATION'].map('{:.2f}%'.format)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output['ASSET_CLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            df_output['SUBCLASS_TOTAL_DOLLARS'] = df_output['SUBCLASS_TOTAL_DOLLARS'].map('${:,.0f}'.format)
-            self.logger.info('Making Pandas Dataframe easy to read ...')
-            df_output['ASSET_CLASS_IS_DUPLICATE'] = df_output[
-                ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION']].duplicated()
-
-            def _func_clean_major_allocation(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[2]
-
-            def _func_clean_major_total_dollars(row):
-                if row[6] is True:
-                    return ''
-                else:
-                    return row[1]
-
-            df_output['ASSET_CLASS_ALLOCATION'] = df_output.apply(_func_clean_major_allocation, axis=1)
-            df_output['ASSET_CLASS_TOTAL_DOLLARS'] = df_output.apply(_func_clean_major_total_dollars, axis=1)
-            return df_output.drop(columns=['ASSET_CLASS_IS_DUPLICATE'])
+            df_positions = self.data_context.get('eq_positions')[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']]
+            df_eq = df_transactions.groupby(['ACCOUNT', 'SYMBOL'])['ADJUSTED_UNITS'].sum().\
+                reset_index(name='UNITS').query('UNITS > 0').\
+                join(df_positions.set_index('SYMBOL'), on='SYMBOL', how='inner').rename(columns={'DOLLARS': 'PRICE'})
+            df_eq['MKT_VALUE'] = df_eq['UNITS'] * df_eq['PRICE']
+            df_fixed = self.data_context.get('fixed_transactions')[['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS',
+                                                                     'TOTAL_DOLLARS', 'END_DATE']]
+            df_fixed = df_fixed[df_fixed['END_DATE'] >= datetime.today().strftime('%Y-%m-%d')]
+            df_fixed = df_fixed.groupby(['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE'])[['UNITS', 'TOTAL_DOLLARS']].sum().\
+                reset_index().rename(columns={'TOTAL_DOLLARS': 'MKT_VALUE'})
+            df_fixed['PRICE'] = np.nan
+            df_other_investment = self.data_context.get('other_investment')[['ACCOUNT', 'SUFFIX', 'MAJOR_TYPE',
+                                                                            'DOLLARS']]
+            df_other_investment.columns = ['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE', 'MKT_VALUE']
+            df_other_investment['UNITS'] = np.nan
+            df_other_investment['PRICE'] = np.nan
+            return pd.concat([df_eq[that_columns], df_fixed[that_columns], df_other_investment[that_columns]],
+                             ignore_index=True)
+        except Exception as e:
+            self.logger.error('Failed to generate market value of every position by ACCOUNT -> '+str(e))
+            raise e
+
+    @traced()
+    def generate_allocation_report_etf_all_accounts(self):
+        """Get allocation report for Equity ETF, mutual funds, cash equivalent and fixed income of every account.
+
+        All accounts are aggregated by one groupby over ACCOUNT, ASSET_CLASS and SUBCLASS, then split per account.
+
+        Return: :dict: of Pandas DataFrame, ACCOUNT as key, ordered by account total dollars descending.
+
+        """
+        self.logger.info('Generating Allocation report for Equity ETF for all accounts ...')
+        try:
+            return self._allocation_report_etf(
+                self.data_context.get('eq_transactions'), self.data_context.get('eq_positions'),
+                self.data_context.get('other_investment'), self.data_context.get('fixed_transactions'))
+        except Exception as e:
+            self.logger.error('Failed to generate allocation report for Equity ETF for all accounts -> '+str(e))
+            raise e
+
+    def _allocation_report_etf(self, df_transactions, df_positions, df_other_investment, df_fixed):
+        """Build the Equity ETF allocation of every account found in the input frames.
+
+        Return: :dict: of Pandas DataFrame, ACCOUNT as key, ordered by account total dollars descending.
+
+        """
+        df_transactions = df_transactions[['SYMBOL', 'ACCOUNT', 'TYPE', 'UNITS']]
+        df_transactions['ADJUSTED_UNITS'] = np.where(df_transactions['TYPE'] == 'BUY',
+                                                     df_transactions['UNITS'],
+                                                     -1 * df_transactions['UNITS'])
+        df_positions = df_positions[['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']]
+        df_eq = df_transactions.groupby(['SYMBOL', 'ACCOUNT'])['ADJUSTED_UNITS'].sum().\
+            reset_index(name='TOTAL_UNITS').query('TOTAL_UNITS > 0').\
+            join(df_positions.set_index('SYMBOL'), on='SYMBOL')
+        df_eq = df_eq[df_eq['INVESTMENT_TYPE'].str.lower() == 'etf']
+        df_eq['DOLLARS'] = df_eq['TOTAL_UNITS'] * df_eq['DOLLARS']
+        df_other_investment = df_other_investment[['SUFFIX', 'MAJOR_TYPE', 'ACCOUNT', 'DOLLARS']]
+        this_is_cash = df_other_investment['MAJOR_TYPE'] == 'Cash Equivalent'
+        df_funds = pd.concat([df_eq[['ACCOUNT', 'SYMBOL', 'DOLLARS']],
+                              df_other_investment[~this_is_cash].rename(columns={'SUFFIX': 'SYMBOL'})[
+                                  ['ACCOUNT', 'SYMBOL', 'DOLLARS']]], ignore_index=True)
+        df_funds_class = self.fund_catalog.classify(df_funds['SYMBOL'], self._get_fund_categories)
+        df_funds['ASSET_CLASS'] = df_funds_class['ASSET_CLASS'].values
+        df_funds['SUBCLASS'] = df_funds_class['SUBCLASS'].values
+        df_cash = df_other_investment[this_is_cash][['ACCOUNT', 'MAJOR_TYPE', 'DOLLARS']].rename(
+            columns={'MAJOR_TYPE': 'ASSET_CLASS'})
+        df_cash['SUBCLASS'] = 'Cash'
+        df_fixed = df_fixed[['TOTAL_DOLLARS', 'END_DATE', 'INVESTMENT_TYPE', 'ACCOUNT']]
+        df_fixed = df_fixed[df_fixed['END_DATE'] >= datetime.today().strftime('%Y-%m-%d')]
+        df_fixed = df_fixed.rename(columns={'TOTAL_DOLLARS': 'DOLLARS', 'INVESTMENT_TYPE': 'SUBCLASS'})
+        df_fixed['ASSET_CLASS'] = 'Fixed Income'
+        that_columns = ['ACCOUNT', 'ASSET_CLASS', 'SUBCLASS', 'DOLLARS']
+        df_combined = pd.concat([df_funds[that_columns], df_cash[that_columns], df_fixed[that_columns]],
+                                ignore_index=True)
+        self.logger.info('Aggregating all accounts by ACCOUNT, ASSET_CLASS and SUBCLASS ...')
+        df_report = df_combined.groupby(['ACCOUNT', 'ASSET_CLASS', 'SUBCLASS'])['DOLLARS'].sum().\
+            reset_index(name='SUBCLASS_TOTAL_DOLLARS')
+        df_report['ASSET_CLASS_TOTAL_DOLLARS'] = df_report.groupby(
+            ['ACCOUNT', 'ASSET_CLASS'])['SUBCLASS_TOTAL_DOLLARS'].transform('sum')
+        df_report['ACCOUNT_TOTAL_DOLLARS'] = df_report.groupby('ACCOUNT')['SUBCLASS_TOTAL_DOLLARS'].\
+            transform('sum')
+        df_report['ASSET_CLASS_ALLOCATION'] = (df_report['ASSET_CLASS_TOTAL_DOLLARS'] /
+                                               df_report['ACCOUNT_TOTAL_DOLLARS'] * 100)
+        df_report['SUBCLASS_ALLOCATION'] = (df_report['SUBCLASS_TOTAL_DOLLARS'] /
+                                            df_report['ACCOUNT_TOTAL_DOLLARS'] * 100)
+        df_totals = df_report.groupby('ACCOUNT')['SUBCLASS_TOTAL_DOLLARS'].sum().sort_values(ascending=False)
+        df_report = df_report.sort_values(['ACCOUNT', 'ASSET_CLASS_ALLOCATION', 'ASSET_CLASS',
+                                           'SUBCLASS_ALLOCATION'], ascending=[True, False, True, False])
+        df_total_rows = pd.DataFrame({
+            'ACCOUNT': df_totals.index,
+            'ASSET_CLASS': 'TOTAL',
+            'ASSET_CLASS_TOTAL_DOLLARS': df_totals.values,
+            'ASSET_CLASS_ALLOCATION': 100.0,
+            'SUBCLASS': '',
+            'SUBCLASS_TOTAL_DOLLARS': float('nan'),
+            'SUBCLASS_ALLOCATION': float('nan'),
+            'IS_TOTAL': True})
+        df_output = pd.concat([df_report, df_total_rows], ignore_index=True, sort=False).\
+            sort_values('ACCOUNT', kind='mergesort')
+        df_output['IS_TOTAL'] = df_output['IS_TOTAL'].fillna(False).astype(bool)
+        that_columns = ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
+                        'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION', 'IS_TOTAL']
+        df_by_account = dict(list(df_output.groupby('ACCOUNT', sort=False)))
+        return {k: df_by_account[k][that_columns].reset_index(drop=True) for k in df_totals.index}
+
+    @traced()
+    def generate_allocation_report_etf_w_account(self, v_account):
+        """Get allocation report for Equity ETF in one account.
+
+        Args:
+            v_account (str): account name, e.g. 'Fidelity'.
+
+        Return: :object: Pandas dataframe of numbers with :column: IS_TOTAL, formatted by src/report_renderer.
+
+        """
+        self.logger.info(f'Generating Allocation report for Equity ETF in account {v_account} ...')
+        try:
+            # only the rows of v_account and the ETF positions are read, filtered in SQL
+            this_reports = self._allocation_report_etf(
+                self._get_eq_transactions_data(v_account, ['SYMBOL', 'ACCOUNT', 'TYPE', 'UNITS']),
+                self._get_eq_positions_data('etf', ['SYMBOL', 'INVESTMENT_TYPE', 'DOLLARS']),
+                self.data_context.get('other_investment'),
+                self._get_fixed_transactions_data(v_account, True, ['TOTAL_DOLLARS', 'END_DATE', 'INVESTMENT_TYPE',
+                                                                    'ACCOUNT']))
+            if v_account in this_reports:
+                return this_reports[v_account]
+            return pd.DataFrame([['TOTAL', 0.0, 100.0, '', float('nan'), float('nan'), True]],
+                                columns=['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION',
+                                         'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION', 'IS_TOTAL'])
         except Exception as e:
             self.logger.error('Failed to generate allocation report for Equity ETF group by Account -> '+str(e))
             raise e
@@ -0,0 +1,180 @@
+"""
+This module is used to compute all Allocation Reports of the Overview Snapshot concurrently.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+
+    All shared inputs are loaded once into the data context of :class: SummaryTool, then every report is submitted
+    to a thread pool and the results are assembled in the fixed order of REPORTS, so the snapshot is the same for any
+    worker count and the wall time is bounded by the slowest report instead of the sum of all of them.
+    Threads are used rather than processes: the reports share the memoized frames in memory, and pandas and sqlite3
+    release the GIL for most of their work.
+    With v_replica, both databases are first copied into read-only in-memory replicas (src/db_replica) and the
+    shared inputs are loaded from them, so every report sees one point-in-time state and the update job is never
+    blocked by overview reads.
+
+Examples:
+    -- Initialize class:
+        from src.overview_pipeline import OverviewPipeline
+        this_pipeline = OverviewPipeline(v_workers=4)
+
+    -- Get (title, report frame) pairs in snapshot order:
+        this_pipeline.sections()
+
+    -- Stream sections into a snapshot while later reports are still running:
+        this_renderer.write_snapshot(out_filename, 'Oct 19, 2026', this_pipeline.iter_sections())
+
+"""
+
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from .logger import UseLogging
+from .overview_generator import SummaryTool
+from .db_replica import DatabaseReplica
+from .tracing import TRACER
+from .metrics import METRICS
+from .run_profiler import RUN_PROFILER
+
+
+# report name -> (:class: SummaryTool method, section title), in snapshot order, reports without a title are
+# computed for exports and history only
+REPORTS = OrderedDict([
+    ('allocation_type', ('generate_allocation_report_type', 'Allocation Report - Investment Type')),
+    ('allocation_account', ('generate_allocation_report_account', 'Allocation Report - Broker')),
+    ('allocation_etf_by_account', ('generate_allocation_report_etf_all_accounts', 'Allocation Report - ')),
+    ('allocation_equity_stock', ('generate_allocation_report_equity_stock', 'Allocation Report - Individual Stock')),
+    ('mature_calender', ('generate_mature_calender', 'Fixed Income Mature Calender')),
+    ('fixed_income_analytics', ('generate_fixed_income_analytics', 'Fixed Income Analytics')),
+    ('cash_flow_ladder', ('generate_cash_flow_ladder', None))
+])
+
+
+class OverviewPipeline(object):
+    """
+    The :class: OverviewPipeline can be used to run every report of the Overview Snapshot on a pool of workers.
+    """
+    def __init__(self, v_workers=4, v_summary_tool=None, v_replica=False):
+        """
+        constructor for :class: OverviewPipeline.
+
+        Args:
+            v_workers (int): size of the thread pool, 1 runs every report in sequence, default to 4.
+            v_summary_tool (SummaryTool): report generator, a new one is created when None.
+            v_replica (bool): load inputs from in-memory replicas of the databases, default to False.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        if not isinstance(v_workers, int) or isinstance(v_workers, bool) or v_workers < 1:
+            raise IOError('Error in OverviewPipeline(): input :v_workers: is not valid -> expect positive int, '
+                          'got {}: {}'.format(str(type(v_workers)), str(v_workers)))
+        self.workers = v_workers
+        self.replica = bool(v_replica)
+        self.summary_tool = v_summary_tool if v_summary_tool is not None else SummaryTool()
+        self.timings = OrderedDict()
+        self.reports = OrderedDict()
+
+    @contextmanager
+    def _replicas(self):
+        """Point the summary tool at in-memory replicas of its databases while the shared inputs are loaded."""
+        if not self.replica:
+            yield
+            return
+        this_files = (self.summary_tool.eq_db_file, self.summary_tool.fixed_db_file)
+        this_replicas = [DatabaseReplica(x) for x in this_files]
+        try:
+            self.summary_tool.eq_db_file, self.summary_tool.fixed_db_file = [x.open() for x in this_replicas]
+            yield
+        finally:
+            # the shared query connection attaches the replicas, it would keep them in memory
+            self.summary_tool.close_portfolio_query()
+            self.summary_tool.eq_db_file, self.summary_tool.fixed_db_file = this_files
+            for this_replica in this_replicas:
+                this_replica.close()
+
+    def _timed(self, v_name):
+        """Run one report and record its elapsed seconds."""
+        this_start = time.perf_counter()
+        with RUN_PROFILER.stage('OverviewPipeline.report.' + v_name):
+            this_output = getattr(self.summary_tool, REPORTS[v_name][0])()
+        self.timings[v_name] = time.perf_counter() - this_start
+        METRICS.set('portfolio_overview_report_seconds', self.timings[v_name], report=v_name)
+        self.logger.info('Report {} completed in {:.3f}s'.format(v_name, self.timings[v_name]))
+        return this_output
+
+    def iter_reports(self):
+        """The :function: iter_reports is used to load the shared inputs once and compute every report.
+
+        Reports are yielded in the order of REPORTS as soon as each one and all reports before it are done, and are
+        kept in self.reports afterwards.
+
+        Returns: :generator: of (report name, report output).
+
+        """
+        self.logger.info(f'Running overview pipeline with {self.workers} worker(s) ...')
+        try:
+            self.timings.clear()
+            self.reports.clear()
+            if self.workers == 1:
+                with self._replicas(), TRACER.span('OverviewPipeline.preload'), \
+                        RUN_PROFILER.stage('OverviewPipeline.preload'):
+                    self.summary_tool.data_context.preload()
+                for this_name in REPORTS:
+                    self.reports[this_name] = self._timed(this_name)
+                    yield this_name, self.reports[this_name]
+                return
+            with ThreadPoolExecutor(max_workers=self.workers) as this_executor:
+                with self._replicas(), TRACER.span('OverviewPipeline.preload'), \
+                        RUN_PROFILER.stage('OverviewPipeline.preload'):
+                    self.summary_tool.data_context.preload(this_executor)
+                # reports run on worker threads as children of the span open on this thread
+                this_futures = OrderedDict((k, this_executor.submit(TRACER.propagate(self._timed), k))
+                                           for k in REPORTS)
+                for this_name, this_future in this_futures.items():
+                    self.reports[this_name] = this_future.result()
+                    yield this_name, self.reports[this_name]
+        except Exception as e:
+            self.logger.error('Failed to run overview pipeline -> ' + str(e))
+            raise e
+        finally:
+            # one cross-asset query connection per run
+            self.summary_tool.close_portfolio_query()
+
+    def run(self):
+        """The :function: run is used to compute every report.
+
+        Returns: :object: OrderedDict of report name -> report output, in the order of REPORTS.
+
+        """
+        return OrderedDict(self.iter_reports())
+
+    def iter_sections(self):
+        """The :function: iter_sections is used to get every report with its section title, in snapshot order.
+
+        The ETF report is expanded into one section per :broker:, reports without a title are skipped.
+
+        Returns: :generator: of (str, DataFrame).
+
+        """
+        for this_name, this_report in self.iter_reports():
+            this_title = REPORTS[this_name][1]
+            if this_title is None:
+                continue
+            if isinstance(this_report, dict):
+                for this_account, df_report in this_report.items():
+                    yield this_title + this_account, df_report
+            else:
+                yield this_title, this_report
+
+    def sections(self):
+        """The :function: sections is used to get all sections of :function: iter_sections as a list."""
+        return list(self.iter_sections())
@@ -0,0 +1,228 @@
+"""
+This module is used to run cross-asset aggregates on one SQLite connection over equity, fixed income and others.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    An in-memory main database ATTACHes equity.db as 'eq' and fixed_income.db as 'fixed', both read-only, and
+    others.json is loaded into :table: temp.others. Allocation aggregates are then pushed down into single
+    UNION ALL ... GROUP BY queries, so only the summarized rows (one per account, or one per type, ETFs one per
+    symbol for the fund catalog) are transferred into pandas instead of the full transactions and positions tables.
+    The connection is opened on the first query and shared by all queries of the instance until close(), so the
+    databases are attached and others.json is loaded once per run.
+    Database files may also be 'file:' URIs, e.g. the in-memory replicas of src/db_replica.
+
+Examples:
+    -- Initialize class:
+        from src.portfolio_query import PortfolioQuery
+        this_query = PortfolioQuery('databases/equity.db', 'databases/fixed_income.db', 'databases/others.json')
+
+    -- Get dollars per ACCOUNT across all investments:
+        this_query.get_allocation_account()
+
+    -- Get dollars per type, the input of the Investment Type allocation:
+        this_query.get_allocation_type()
+
+    -- Close the shared connection:
+        this_query.close()
+
+"""
+
+import os
+import json
+import sqlite3
+import threading
+
+from .logger import UseLogging
+from .db_replica import read_only_uri
+from .fixed_SQLite_utility import TODAY_DAY_SQL, END_DAY_SQL
+from .sql_profiler import SQL_PROFILER, ProfiledConnection
+
+
+OTHERS_COLUMNS = ['SUFFIX', 'DESCRIPTION', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS', 'ACCOUNT']
+
+
+class PortfolioQuery(object):
+    """
+    The :class: PortfolioQuery can be used to query equity, fixed income and other investments together.
+    """
+    def __init__(self, v_eq_db_file, v_fixed_db_file, v_other_investment_file):
+        """
+        constructor for :class: PortfolioQuery.
+
+        Args:
+            v_eq_db_file (str): path or 'file:' URI of equity.db.
+            v_fixed_db_file (str): path or 'file:' URI of fixed_income.db.
+            v_other_investment_file (str): path of others.json.
+
+        """
+        for this_name, this_value in [('v_eq_db_file', v_eq_db_file), ('v_fixed_db_file', v_fixed_db_file),
+                                      ('v_other_investment_file', v_other_investment_file)]:
+            if not isinstance(this_value, str):
+                raise IOError('Error in PortfolioQuery(): input :{}: is not valid -> expect str, got {}: {}'.
+                              format(this_name, str(type(this_value)), str(this_value)))
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.eq_db_file = v_eq_db_file
+        self.fixed_db_file = v_fixed_db_file
+        self.other_investment_file = v_other_investment_file
+        self._conn = None
+        # report threads share the connection, one query runs at a time
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _source_uri(v_db_file):
+        """Get a read-only URI for a database path, 'file:' URIs are used as they are."""
+        if v_db_file.startswith('file:'):
+            return v_db_file
+        if not os.path.exists(v_db_file):
+            raise IOError(f'Error in PortfolioQuery: database {v_db_file} does not exist')
+        return read_only_uri(v_db_file)
+
+    def _read_other_investment(self):
+        """Read others.json as a list of tuples in the order of OTHERS_COLUMNS."""
+        with open(self.other_investment_file, 'r') as rf:
+            this_records = json.load(rf)
+        return [tuple(x.get(k) for k in OTHERS_COLUMNS) for x in this_records]
+
+    def _create_connection(self):
+        """
+        The :function: _create_connection is used to attach both databases and load :table: temp.others.
+
+        Returns:
+            sqlite3.Connection object.
+
+        """
+        this_conn = sqlite3.connect(':memory:', uri=True, check_same_thread=False,
+                                    factory=ProfiledConnection if SQL_PROFILER.enabled else sqlite3.Connection)
+        try:
+            this_conn.execute("ATTACH DATABASE ? AS eq;", (self._source_uri(self.eq_db_file),))
+            this_conn.execute("ATTACH DATABASE ? AS fixed;", (self._source_uri(self.fixed_db_file),))
+            this_conn.execute("CREATE TEMP TABLE others (SUFFIX text, DESCRIPTION text, MAJOR_TYPE text, "
+                              "MINOR_TYPE text, DOLLARS real, ACCOUNT text);")
+            this_conn.executemany("INSERT INTO temp.others VALUES (?, ?, ?, ?, ?, ?);", self._read_other_investment())
+            # replica URIs are attached writable, nothing is written once temp.others is loaded
+            this_conn.execute("PRAGMA query_only = ON;")
+            self.logger.info("Attached {} and {} with {} ...".format(self.eq_db_file, self.fixed_db_file,
+                                                                     self.other_investment_file))
+        except Exception as e:
+            this_conn.close()
+            raise e
+        return this_conn
+
+    @staticmethod
+    def _eq_positions_source(v_conn):
+        """Get :table: materialized_positions when it exists, :view: positions otherwise."""
+        this_row = v_conn.execute("SELECT 1 FROM eq.sqlite_master WHERE type = 'table' "
+                                  "AND name = 'materialized_positions';").fetchone()
+        return 'eq.materialized_positions' if this_row is not None else 'eq.positions'
+
+    @staticmethod
+    def _fixed_end_day(v_conn):
+        """Get END_DAY of fixed.transactions, computed from END_DATE on a schema not upgraded yet."""
+        this_columns = [x[1] for x in v_conn.execute("PRAGMA fixed.table_xinfo(transactions);")]
+        return 'END_DAY' if 'END_DAY' in this_columns else END_DAY_SQL
+
+    def _query(self, v_query_sql, v_list_of_header):
+        """Run one aggregate query and return a list of dictionary, use column name as dictionary key."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._create_connection()
+            this_result = self._conn.execute(v_query_sql.format(
+                positions=self._eq_positions_source(self._conn), end_day=self._fixed_end_day(self._conn),
+                today_day=TODAY_DAY_SQL)).fetchall()
+        return [dict(zip(v_list_of_header, row)) for row in this_result]
+
+    def close(self):
+        """The :function: close is used to close the shared connection, the next query opens a new one."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_allocation_account(self):
+        """
+        The :function: get_allocation_account is used to get total dollars of every ACCOUNT: equity holdings at the
+            latest close, fixed income not matured yet and other investments.
+
+        Returns:
+            :list: of dictionary with keys ACCOUNT, TOTAL_DOLLARS.
+
+        """
+        query_sql = """
+            SELECT ACCOUNT, TOTAL(DOLLARS) AS TOTAL_DOLLARS
+            FROM (
+                SELECT t1.ACCOUNT AS ACCOUNT, SUM(t1.TOTAL_UNITS * t2.DOLLARS) AS DOLLARS
+                FROM (
+                    SELECT ACCOUNT, SYMBOL, SUM(CASE WHEN TYPE = 'SELL' THEN -UNITS ELSE UNITS END) AS TOTAL_UNITS
+                    FROM eq.transactions
+                    GROUP BY ACCOUNT, SYMBOL
+                    HAVING TOTAL_UNITS > 0
+                ) t1
+                JOIN {positions} t2
+                  ON t1.SYMBOL = t2.SYMBOL
+                GROUP BY t1.ACCOUNT
+                UNION ALL
+                SELECT ACCOUNT, SUM(TOTAL_DOLLARS)
+                FROM fixed.transactions
+                WHERE {end_day} >= {today_day}
+                GROUP BY ACCOUNT
+                UNION ALL
+                SELECT ACCOUNT, SUM(DOLLARS)
+                FROM temp.others
+                GROUP BY ACCOUNT
+            )
+            WHERE ACCOUNT IS NOT NULL
+            GROUP BY ACCOUNT;
+        """
+        self.logger.info('Attempt to aggregate dollars by ACCOUNT across all investments ...')
+        try:
+            return self._query(query_sql, ['ACCOUNT', 'TOTAL_DOLLARS'])
+        except Exception as e:
+            self.logger.error('Failed to aggregate dollars by ACCOUNT -> ' + str(e))
+            raise e
+
+    def get_allocation_type(self):
+        """
+        The :function: get_allocation_type is used to get total dollars of every equity INVESTMENT_TYPE, ETFs per
+            SYMBOL as they are classified by the fund catalog, fixed income INVESTMENT_TYPE not matured yet and
+            other investment SUFFIX, with the types needed for classification.
+
+        Returns:
+            :list: of dictionary with keys SOURCE ('EQUITY', 'FIXED_INCOME' or 'OTHERS'), SYMBOL, MAJOR_TYPE,
+                MINOR_TYPE, DOLLARS.
+
+        """
+        query_sql = """
+            SELECT 'EQUITY', CASE WHEN LOWER(INVESTMENT_TYPE) = 'etf' THEN SYMBOL END, NULL, INVESTMENT_TYPE,
+                SUM(MKT_VALUE)
+            FROM {positions}
+            GROUP BY INVESTMENT_TYPE, CASE WHEN LOWER(INVESTMENT_TYPE) = 'etf' THEN SYMBOL END
+            UNION ALL
+            SELECT 'FIXED_INCOME', NULL, NULL, INVESTMENT_TYPE, SUM(TOTAL_DOLLARS)
+            FROM fixed.transactions
+            WHERE {end_day} >= {today_day}
+            GROUP BY INVESTMENT_TYPE
+            UNION ALL
+            SELECT 'OTHERS', SUFFIX, MAJOR_TYPE, MINOR_TYPE, SUM(DOLLARS)
+            FROM temp.others
+            GROUP BY SUFFIX, MAJOR_TYPE, MINOR_TYPE;
+        """
+        self.logger.info('Attempt to aggregate dollars by investment type across all investments ...')
+        try:
+            return self._query(query_sql, ['SOURCE', 'SYMBOL', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS'])
+        except Exception as e:
+            self.logger.error('Failed to aggregate dollars by investment type -> ' + str(e))
+            raise e
@@ -0,0 +1,167 @@
+"""
+This module is used to write the numeric report frames of the Overview Snapshot in machine-readable formats.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - pyarrow (optional, only for parquet)
+
+    Every report is written as one frame; the per-account ETF reports are stacked into a single frame with a leading
+    ACCOUNT column. Formats:
+     - json: one JSON Lines file, one record per line with a REPORT field, so consumers can stream it;
+     - csv: one file per report;
+     - parquet: one file per report with typed columns (float64 amounts, bool IS_TOTAL, string labels).
+    Files are written next to the HTML snapshot with the same stem and replaced atomically.
+
+Examples:
+    -- Initialize class:
+        from src.report_exporter import ReportExporter
+        this_exporter = ReportExporter()
+
+    -- Write reports returned by OverviewPipeline.run():
+        this_exporter.export('snapshots/snapshot_20261019', this_pipeline.run(), ['json', 'csv'])
+
+    -- Load one report back:
+        pd.read_json('snapshots/snapshot_20261019.jsonl', lines=True).query('REPORT == "allocation_type"')
+
+"""
+
+import os
+import pandas as pd
+
+from .logger import UseLogging
+from .tracing import traced
+
+
+EXPORT_FORMATS = ['json', 'csv', 'parquet']
+
+
+class ReportExporter(object):
+    """
+    The :class: ReportExporter can be used to export numeric report frames to JSON Lines, CSV and Parquet.
+    """
+    def __init__(self):
+        """
+        constructor for :class: ReportExporter.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+
+    @staticmethod
+    def _check_formats(v_formats):
+        """Raise IOError for unknown formats."""
+        this_invalid = [x for x in v_formats if x not in EXPORT_FORMATS]
+        if this_invalid:
+            raise IOError('Error in ReportExporter: format is not valid -> expect one of {}, got {}'.format(
+                ', '.join(EXPORT_FORMATS), ', '.join(str(x) for x in this_invalid)))
+
+    def output_files(self, v_stem, v_report_names, v_formats):
+        """The :function: output_files is used to get every file written by :function: export.
+
+        Args:
+            v_stem (str): path without extension, e.g. 'snapshots/snapshot_20261019'.
+            v_report_names (list): report names, e.g. the keys of src.overview_pipeline.REPORTS.
+            v_formats (list): subset of EXPORT_FORMATS.
+
+        Returns: :list: of str.
+
+        """
+        self._check_formats(v_formats)
+        that_output = []
+        for this_format in v_formats:
+            if this_format == 'json':
+                that_output.append(v_stem + '.jsonl')
+            else:
+                that_output.extend('{}_{}.{}'.format(v_stem, x, this_format) for x in v_report_names)
+        return that_output
+
+    @staticmethod
+    def to_frame(v_report):
+        """The :function: to_frame is used to turn one report output into a single typed frame.
+
+        Args:
+            v_report (DataFrame or dict): report frame, or dict of ACCOUNT -> report frame.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        if isinstance(v_report, dict):
+            this_frames = [x.assign(ACCOUNT=k) for k, x in v_report.items()]
+            if not this_frames:
+                return pd.DataFrame(columns=['ACCOUNT'])
+            df_output = pd.concat(this_frames, ignore_index=True, sort=False)
+            df_output = df_output[['ACCOUNT'] + [x for x in df_output.columns if x != 'ACCOUNT']]
+        else:
+            df_output = v_report.reset_index(drop=True)
+        for this_column in df_output.columns:
+            if this_column == 'IS_TOTAL':
+                df_output[this_column] = df_output[this_column].fillna(False).astype(bool)
+            elif df_output[this_column].dtype == object:
+                df_output[this_column] = df_output[this_column].where(df_output[this_column].notnull(), None)
+            elif pd.api.types.is_numeric_dtype(df_output[this_column]) and \
+                    not pd.api.types.is_bool_dtype(df_output[this_column]):
+                df_output[this_column] = df_output[this_column].astype('float64')
+        return df_output
+
+    def _write_json(self, v_filename, v_frames):
+        """Write all reports into one JSON Lines file."""
+        with open(v_filename + '.tmp', 'w') as wf:
+            for this_name, df_report in v_frames.items():
+                if df_report.shape[0]:
+                    wf.write(df_report.assign(REPORT=this_name)[['REPORT'] + list(df_report.columns)].to_json(
+                        orient='records', lines=True).rstrip('\n') + '\n')
+        os.replace(v_filename + '.tmp', v_filename)
+
+    def _write_csv(self, v_filename, df_report):
+        """Write one report into a CSV file."""
+        df_report.to_csv(v_filename + '.tmp', index=False)
+        os.replace(v_filename + '.tmp', v_filename)
+
+    def _write_parquet(self, v_filename, df_report):
+        """Write one report into a Parquet file with typed columns, requires pyarrow."""
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise IOError('Error in ReportExporter: parquet output requires pyarrow -> pip3 install pyarrow')
+        this_table = pyarrow.Table.from_pandas(df_report, preserve_index=False)
+        pyarrow.parquet.write_table(this_table, v_filename + '.tmp')
+        os.replace(v_filename + '.tmp', v_filename)
+
+    @traced()
+    def export(self, v_stem, v_reports, v_formats):
+        """The :function: export is used to write every report in every requested format.
+
+        Args:
+            v_stem (str): path without extension, e.g. 'snapshots/snapshot_20261019'.
+            v_reports (dict): report name -> report output, as returned by OverviewPipeline.run().
+            v_formats (list): subset of EXPORT_FORMATS.
+
+        Returns: :list: of str, the files written.
+
+        """
+        self._check_formats(v_formats)
+        if not v_formats:
+            return []
+        self.logger.info('Exporting reports to {} as {} ...'.format(v_stem, ', '.join(v_formats)))
+        try:
+            this_frames = {k: self.to_frame(v) for k, v in v_reports.items()}
+            for this_format in v_formats:
+                if this_format == 'json':
+                    self._write_json(v_stem + '.jsonl', this_frames)
+                    continue
+                for this_name, df_report in this_frames.items():
+                    this_filename = '{}_{}.{}'.format(v_stem, this_name, this_format)
+                    if this_format == 'csv':
+                        self._write_csv(this_filename, df_report)
+                    else:
+                        self._write_parquet(this_filename, df_report)
+            return self.output_files(v_stem, list(v_reports.keys()), v_formats)
+        except Exception as e:
+            self.logger.error(f'Failed to export reports to {v_stem} -> ' + str(e))
+            raise e
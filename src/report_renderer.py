@@ -0,0 +1,253 @@
+"""
+This module is used to render the numeric report frames of overview_generator into presentation formats.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - numpy
+
+    Report frames keep typed numeric columns and a boolean IS_TOTAL column, every format is looked up by column name
+    in COLUMN_FORMATS, repeated group totals listed in DUPLICATE_GROUPS are blanked, and IS_TOTAL rows are rendered
+    in bold. Each column is formatted in one pass, there is no row-wise apply.
+
+    Snapshots are streamed: HTML rows are formatted, escaped and emitted v_chunk_rows at a time, the page skeleton
+    comes from the string.Template files in templates/html/, and every section is written to a temporary file as it
+    arrives, which replaces the snapshot only once complete.
+
+Examples:
+    -- Initialize class:
+        from src.report_renderer import ReportRenderer
+        this_renderer = ReportRenderer()
+
+    -- Get a display frame of formatted strings:
+        this_renderer.format_frame(this_summary_tool.generate_allocation_report_type())
+
+    -- Get a HTML table:
+        this_renderer.to_html(this_summary_tool.generate_allocation_report_type())
+
+    -- Write a whole snapshot from (title, report frame) pairs:
+        this_renderer.write_snapshot('snapshots/snapshot_20261019.html', 'Oct 19, 2026', this_sections)
+
+"""
+
+import os
+import html
+from string import Template
+import numpy as np
+import pandas as pd
+
+from .logger import UseLogging
+from .tracing import traced
+from .run_profiler import RUN_PROFILER, profiled_stage
+
+
+COLUMN_FORMATS = {
+    'MAJOR_TOTAL_DOLLARS': '${:,.0f}',
+    'MINOR_TOTAL_DOLLARS': '${:,.0f}',
+    'ASSET_CLASS_TOTAL_DOLLARS': '${:,.0f}',
+    'SUBCLASS_TOTAL_DOLLARS': '${:,.0f}',
+    'TOTAL_DOLLARS': '${:,.0f}',
+    'DOLLARS': '${:,.0f}',
+    'MAJOR_ALLOCATION': '{:.0f}%',
+    'MINOR_ALLOCATION': '{:.2f}%',
+    'ASSET_CLASS_ALLOCATION': '{:.1f}%',
+    'SUBCLASS_ALLOCATION': '{:.2f}%',
+    'ALLOCATION': '{:.0f}%',
+    'STOCK_ALLOCATION': '{:.2f}%',
+    'YIELD': '{:.2f}%',
+    'CURRENT_YIELD': '{:.2f}%',
+    'YTM': '{:.2f}%',
+    'YEARS_TO_MATURITY': '{:.1f}',
+    'MACAULAY_DURATION': '{:.2f}',
+    'MODIFIED_DURATION': '{:.2f}',
+    'CONVEXITY': '{:.1f}'
+}
+
+# group column -> columns shown only on the first row of each group
+DUPLICATE_GROUPS = {
+    'MAJOR_TYPE': ['MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION'],
+    'ASSET_CLASS': ['ASSET_CLASS_TOTAL_DOLLARS', 'ASSET_CLASS_ALLOCATION']
+}
+
+HTML_HEADER_CELL = '<th align="center"; bgcolor="E0FFFF">'
+
+HTML_TEMPLATES = ['snapshot_header', 'section_header', 'section_footer', 'snapshot_footer']
+
+
+def format_column(v_values, v_format):
+    """Format one numeric column with v_format, missing values become ''.
+
+    Args:
+        v_values (list-like): numbers.
+        v_format (str): str.format pattern, e.g. '${:,.0f}'.
+
+    Returns:
+        :np.ndarray: of str.
+
+    """
+    this_values = pd.to_numeric(pd.Series(v_values), errors='coerce').values
+    that_output = np.full(len(this_values), '', dtype=object)
+    this_valid = ~np.isnan(this_values)
+    that_output[this_valid] = [v_format.format(x) for x in this_values[this_valid]]
+    return that_output
+
+
+class ReportRenderer(object):
+    """
+    The :class: ReportRenderer can be used to format numeric report frames for display.
+    """
+    def __init__(self, v_template_dir='templates/html', v_chunk_rows=500):
+        """
+        constructor for :class: ReportRenderer.
+
+        Args:
+            v_template_dir (str): directory of the snapshot templates, one <name>.html per HTML_TEMPLATES entry.
+            v_chunk_rows (int): number of table rows written at once.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.template_dir = v_template_dir
+        self.chunk_rows = v_chunk_rows
+        self._templates = None
+
+    def format_frame(self, df_report):
+        """The :function: format_frame is used to convert a numeric report frame into formatted strings.
+
+        Args:
+            df_report (DataFrame): report frame, optionally with a boolean IS_TOTAL column.
+
+        Returns: :object: Pandas dataframe of str, without IS_TOTAL.
+
+        """
+        return self._format_rows(df_report, self._duplicate_masks(df_report))
+
+    @staticmethod
+    def _duplicate_masks(df_report):
+        """Boolean mask of the repeated group totals of every DUPLICATE_GROUPS entry, over the whole frame."""
+        that_output = []
+        for this_group, this_blank_columns in DUPLICATE_GROUPS.items():
+            if this_group in df_report.columns:
+                this_blank_columns = [x for x in this_blank_columns if x in df_report.columns]
+                that_output.append((this_blank_columns,
+                                    df_report[[this_group] + this_blank_columns].duplicated().values))
+        return that_output
+
+    @staticmethod
+    def _format_rows(df_report, v_masks):
+        """Format the rows of df_report, v_masks are the rows of _duplicate_masks() matching df_report."""
+        this_columns = [x for x in df_report.columns if x != 'IS_TOTAL']
+        df_output = pd.DataFrame(index=df_report.index)
+        for this_column in this_columns:
+            if this_column in COLUMN_FORMATS:
+                df_output[this_column] = format_column(df_report[this_column].values, COLUMN_FORMATS[this_column])
+            else:
+                df_output[this_column] = df_report[this_column].where(df_report[this_column].notnull(), '').\
+                    astype(str).values
+        for this_blank_columns, this_is_duplicate in v_masks:
+            df_output.loc[this_is_duplicate, this_blank_columns] = ''
+        return df_output.reset_index(drop=True)
+
+    def _is_total(self, df_report):
+        """Boolean mask of total rows."""
+        if 'IS_TOTAL' in df_report.columns:
+            return df_report['IS_TOTAL'].fillna(False).astype(bool).values
+        return np.zeros(df_report.shape[0], dtype=bool)
+
+    def iter_html(self, df_report):
+        """The :function: iter_html is used to render a numeric report frame as HTML table chunks, totals in bold.
+
+        Rows are formatted, escaped and styled v_chunk_rows at a time, only the duplicate and total masks are
+        computed over the whole frame.
+
+        Args:
+            df_report (DataFrame): report frame, optionally with a boolean IS_TOTAL column.
+
+        Returns: :generator: of str.
+
+        """
+        this_masks = self._duplicate_masks(df_report)
+        this_is_total = self._is_total(df_report)
+        yield '<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n' + \
+              ''.join(['      ' + HTML_HEADER_CELL + html.escape(str(x)) + '</th>\n'
+                       for x in df_report.columns if x != 'IS_TOTAL']) + \
+              '    </tr>\n  </thead>\n  <tbody>\n'
+        for this_start in range(0, df_report.shape[0], self.chunk_rows):
+            this_stop = this_start + self.chunk_rows
+            df_output = self._format_rows(df_report.iloc[this_start:this_stop],
+                                          [(x, y[this_start:this_stop]) for x, y in this_masks])
+            this_chunk_total = this_is_total[this_start:this_stop]
+            this_columns = []
+            for this_column in df_output.columns:
+                this_cells = np.array(['      <td>' + html.escape(x) + '</td>\n'
+                                       for x in df_output[this_column].values], dtype=object)
+                this_cells[this_chunk_total] = ['      <td><strong>' + html.escape(x) + '</strong></td>\n'
+                                                for x in df_output[this_column].values[this_chunk_total]]
+                this_columns.append(this_cells)
+            yield ''.join(['    <tr>\n' + ''.join(x) + '    </tr>\n' for x in zip(*this_columns)])
+        yield '  </tbody>\n</table>'
+
+    @profiled_stage()
+    def to_html(self, df_report):
+        """The :function: to_html is used to render a numeric report frame as a HTML table, totals in bold.
+
+        Args:
+            df_report (DataFrame): report frame, optionally with a boolean IS_TOTAL column.
+
+        Returns: :str: HTML table.
+
+        """
+        self.logger.info('Rendering report frame to HTML ...')
+        try:
+            return ''.join(self.iter_html(df_report))
+        except Exception as e:
+            self.logger.error('Failed to render report frame to HTML -> ' + str(e))
+            raise e
+
+    def _get_templates(self):
+        """Read the snapshot templates on first use."""
+        if self._templates is None:
+            this_templates = {}
+            for this_name in HTML_TEMPLATES:
+                with open(os.path.join(self.template_dir, this_name + '.html'), 'r') as rf:
+                    this_templates[this_name] = Template(rf.read())
+            self._templates = this_templates
+        return self._templates
+
+    @traced()
+    def write_snapshot(self, v_out_filename, v_report_date, v_sections):
+        """The :function: write_snapshot is used to stream a whole snapshot into v_out_filename.
+
+        Sections are written as they are produced into v_out_filename + '.tmp', which replaces v_out_filename only
+        after the last section, so a failed run never leaves a truncated snapshot behind.
+
+        Args:
+            v_out_filename (str): path to the HTML snapshot.
+            v_report_date (str): date shown in the snapshot title.
+            v_sections (iterable): of (str, DataFrame), section title and numeric report frame.
+
+        """
+        self.logger.info(f'Writing snapshot {v_out_filename} ...')
+        this_tmp_filename = v_out_filename + '.tmp'
+        try:
+            this_templates = self._get_templates()
+            with open(this_tmp_filename, 'w') as wf:
+                wf.write(this_templates['snapshot_header'].substitute(report_date=html.escape(v_report_date)))
+                for this_title, df_report in v_sections:
+                    wf.write(this_templates['section_header'].substitute(title=html.escape(this_title)))
+                    with RUN_PROFILER.stage('ReportRenderer.iter_html'):
+                        for this_chunk in self.iter_html(df_report):
+                            wf.write(this_chunk)
+                    wf.write(this_templates['section_footer'].substitute())
+                wf.write(this_templates['snapshot_footer'].substitute())
+            os.replace(this_tmp_filename, v_out_filename)
+        except Exception as e:
+            self.logger.error(f'Failed to write snapshot {v_out_filename} -> ' + str(e))
+            if os.path.exists(this_tmp_filename):
+                os.remove(this_tmp_filename)
+            raise e
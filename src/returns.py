@@ -0,0 +1,370 @@
+"""
+This module is used to compute time-weighted and money-weighted returns for every account.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - numpy
+
+    External cash flows are derived from the ledgers, contributions are positive:
+     - equity BUY rows add DOLLARS*UNITS, SELL rows withdraw DOLLARS*UNITS;
+     - fixed income rows add TOTAL_COST on ADD_DATE and withdraw the redemption value on END_DATE.
+    Fixed income positions accrete from TOTAL_COST at their RETURN_RATE (the larger of APR and YTM), so the
+    redemption value is TOTAL_COST*(1+RETURN_RATE)^years.
+
+Examples:
+    -- Initialize class:
+        from src.returns import ReturnsCalculator
+        this_instance = ReturnsCalculator()
+
+    -- Get external cash flows for all accounts:
+        this_instance.get_cash_flows()
+
+    -- Get time-weighted and money-weighted returns for all accounts:
+        this_instance.generate_returns_report('2020-01-01', '2020-12-31')
+
+"""
+
+from datetime import datetime
+import numpy as np
+import pandas as pd
+
+from .logger import UseLogging
+from .eq_SQLite_utility import SQLiteRequest as eq_SQLiteRequest
+from .fixed_SQLite_utility import FixedSQLiteRequest as fixed_SQLiteRequest
+from .valuation import PortfolioValuation, _to_days
+
+
+DAYS_PER_YEAR = 365.25
+
+
+def chain_link_returns(v_values, v_flows):
+    """Chain-link daily sub-period returns for every column at once.
+
+    Flows are assumed to happen at the end of the day, so r_t = (V_t - CF_t) / V_(t-1) - 1, and days that start
+    with no capital contribute a zero return.
+
+    Args:
+        v_values (np.ndarray): (dates, accounts) end-of-day market values, row 0 is the base date.
+        v_flows (np.ndarray): (dates, accounts) net external flows, contributions positive.
+
+    Returns:
+        :tuple: ((dates - 1, accounts) daily returns, (accounts,) linked return over the whole period).
+
+    """
+    this_prev = v_values[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        that_daily = np.where(this_prev > 0, (v_values[1:] - v_flows[1:]) / this_prev - 1.0, 0.0)
+    that_daily = np.maximum(that_daily, -1.0)
+    with np.errstate(divide='ignore'):
+        that_linked = np.expm1(np.log1p(that_daily).sum(axis=0))
+    return that_daily, that_linked
+
+
+def solve_irr(v_group_codes, v_times, v_amounts, v_number_of_groups, v_tolerance=1e-10, v_max_iterations=100):
+    """Solve the annual IRR of every group at once with a safeguarded Newton iteration.
+
+    Each group keeps a bracket [lo, hi] with a sign change of its NPV, a Newton step that leaves the bracket is
+    replaced by bisection, so every group converges even when Newton alone would diverge.
+
+    Args:
+        v_group_codes (np.ndarray): integer group of each cash flow.
+        v_times (np.ndarray): time of each cash flow in years.
+        v_amounts (np.ndarray): cash flow amount from the investor's point of view (invested amounts negative).
+        v_number_of_groups (int): number of groups.
+        v_tolerance (float): relative NPV tolerance.
+        v_max_iterations (int): iteration cap.
+
+    Returns:
+        :np.ndarray: IRR of each group, NaN where the cash flows have no sign change.
+
+    """
+    def _npv(v_rates):
+        this_growth = 1.0 + v_rates[v_group_codes]
+        this_discounted = v_amounts * np.power(this_growth, -v_times)
+        that_value = np.bincount(v_group_codes, this_discounted, minlength=v_number_of_groups)
+        that_slope = np.bincount(v_group_codes, -v_times * this_discounted / this_growth,
+                                 minlength=v_number_of_groups)
+        return that_value, that_slope
+
+    this_scale = np.maximum(np.bincount(v_group_codes, np.abs(v_amounts), minlength=v_number_of_groups), 1e-12)
+    this_lo = np.full(v_number_of_groups, -0.9999)
+    this_hi = np.full(v_number_of_groups, 1e9)
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        this_f_lo = _npv(this_lo)[0]
+        this_f_hi = _npv(this_hi)[0]
+        this_valid = np.sign(this_f_lo) * np.sign(this_f_hi) < 0
+        that_rates = np.full(v_number_of_groups, 0.05)
+        for _ in range(v_max_iterations):
+            this_value, this_slope = _npv(that_rates)
+            this_done = np.abs(this_value) <= v_tolerance * this_scale
+            if np.all(this_done | ~this_valid):
+                break
+            this_same_side = np.sign(this_value) == np.sign(this_f_lo)
+            this_lo = np.where(this_same_side, that_rates, this_lo)
+            this_f_lo = np.where(this_same_side, this_value, this_f_lo)
+            this_hi = np.where(this_same_side, this_hi, that_rates)
+            this_newton = that_rates - this_value / this_slope
+            this_newton_ok = np.isfinite(this_newton) & (this_newton > this_lo) & (this_newton < this_hi)
+            that_rates = np.where(this_done, that_rates,
+                                  np.where(this_newton_ok, this_newton, (this_lo + this_hi) / 2.0))
+    return np.where(this_valid, that_rates, np.nan)
+
+
+def accrete_fixed_income(v_dates, v_add_days, v_end_days, v_costs, v_rates, v_group_codes, v_number_of_groups,
+                         v_chunk_cells=4000000):
+    """Build the (dates, groups) matrix of accreted fixed income value, held from ADD_DATE until END_DATE.
+
+    Each position is only evaluated on the dates it is held: its (date, position) cells are laid out flat, in
+    chunks of about v_chunk_cells, and summed into their (date, group) cell with np.bincount. Memory stays bounded
+    by the chunk and the output matrix, positions matured before or added after v_dates cost nothing.
+
+    Returns:
+        :np.ndarray: float matrix of shape (len(v_dates), v_number_of_groups).
+
+    """
+    that_matrix = np.zeros((len(v_dates), v_number_of_groups))
+    v_add_days = np.asarray(v_add_days, dtype='datetime64[D]')
+    v_end_days = np.asarray(v_end_days, dtype='datetime64[D]')
+    v_group_codes = np.asarray(v_group_codes)
+    # held on the dates in [ADD_DATE, END_DATE), as a range of row numbers of the sorted calendar
+    this_first = np.searchsorted(v_dates, v_add_days, side='left')
+    this_lengths = np.maximum(np.searchsorted(v_dates, v_end_days, side='left') - this_first, 0)
+    this_held = np.flatnonzero(this_lengths)
+    if len(this_held) == 0:
+        return that_matrix
+    this_chunk_of = (np.cumsum(this_lengths[this_held]) - 1) // v_chunk_cells
+    for this_idx in np.split(this_held, np.flatnonzero(np.diff(this_chunk_of)) + 1):
+        this_counts = this_lengths[this_idx]
+        this_position = np.repeat(this_idx, this_counts)
+        this_offsets = np.arange(this_counts.sum()) - np.repeat(np.cumsum(this_counts) - this_counts, this_counts)
+        this_rows = this_first[this_position] + this_offsets
+        this_age = (v_dates[this_rows] - v_add_days[this_position]).astype(float) / DAYS_PER_YEAR
+        this_values = v_costs[this_position] * np.power(1.0 + v_rates[this_position], this_age)
+        that_matrix += np.bincount(this_rows * v_number_of_groups + v_group_codes[this_position], this_values,
+                                   minlength=that_matrix.size).reshape(that_matrix.shape)
+    return that_matrix
+
+
+class ReturnsCalculator(object):
+    """
+    The :class: ReturnsCalculator can be used to get time-weighted (TWR) and money-weighted (IRR) returns
+    per account from the equity and fixed income ledgers.
+    """
+    def __init__(self):
+        """
+        constructor for :class: ReturnsCalculator.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.eq_db_file = 'databases/equity.db'
+        self.fixed_db_file = 'databases/fixed_income.db'
+        self.max_matrix_cells = 20000000
+
+    def _get_eq_transactions_data(self):
+        """Read data from :table: transactions in SQLite equity.db, excluding 'others'.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = eq_SQLiteRequest(self.eq_db_file)
+        df = pd.DataFrame(_this_instance.get_table_transactions(),
+                          columns=['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE',
+                                   'DESCRIPTION', 'ACCOUNT', 'TOTAL_DOLLARS'])
+        return df[df['INVESTMENT_TYPE'].str.lower() != 'others']
+
+    def _get_fixed_transactions_data(self):
+        """Read data from :table: transactions in SQLite fixed_income.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = fixed_SQLiteRequest(self.fixed_db_file)
+        return pd.DataFrame(_this_instance.get_table_transactions_fixed(),
+                            columns=['ID', 'NAME', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'FACE_VALUE',
+                                     'TOTAL_DOLLARS', 'ADD_DATE', 'END_DATE', 'TOTAL_COST', 'APR', 'YTM',
+                                     'ACCOUNT'])
+
+    def _get_price_history_data(self):
+        """Read data from :table: price_history in SQLite equity.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = eq_SQLiteRequest(self.eq_db_file)
+        return pd.DataFrame(_this_instance.get_table_price_history(), columns=['SYMBOL', 'DATE', 'CLOSE'])
+
+    @staticmethod
+    def _prepare_fixed(df_fixed):
+        """Add ADD_DAY, END_DAY, RETURN_RATE and REDEMPTION columns to fixed income transactions."""
+        df_fixed = df_fixed.copy()
+        df_fixed['ADD_DAY'] = _to_days(df_fixed['ADD_DATE'])
+        df_fixed['END_DAY'] = _to_days(df_fixed['END_DATE'])
+        df_fixed['RETURN_RATE'] = df_fixed[['APR', 'YTM']].astype(float).max(axis=1)
+        df_fixed['REDEMPTION'] = df_fixed['TOTAL_COST'].astype(float) * np.power(
+            1.0 + df_fixed['RETURN_RATE'].values,
+            (df_fixed['END_DAY'] - df_fixed['ADD_DAY']).dt.days.values / DAYS_PER_YEAR)
+        return df_fixed
+
+    def _build_cash_flows(self, df_eq, df_fixed, v_end_day):
+        """Vectorized external cash flows up to v_end_day, contributions positive."""
+        df_eq_flows = pd.DataFrame({
+            'ACCOUNT': df_eq['ACCOUNT'].values,
+            'DAY': _to_days(df_eq['DATE']),
+            'AMOUNT': np.where(df_eq['TYPE'].str.upper().values == 'SELL', -1.0, 1.0) *
+            df_eq['DOLLARS'].values.astype(float) * df_eq['UNITS'].values.astype(float),
+            'SOURCE': 'EQUITY'
+        })
+        df_matured = df_fixed[df_fixed['END_DAY'] <= v_end_day]
+        df_fixed_flows = pd.DataFrame({
+            'ACCOUNT': np.concatenate([df_fixed['ACCOUNT'].values, df_matured['ACCOUNT'].values]),
+            'DAY': np.concatenate([df_fixed['ADD_DAY'].values, df_matured['END_DAY'].values]),
+            'AMOUNT': np.concatenate([df_fixed['TOTAL_COST'].values.astype(float),
+                                      -df_matured['REDEMPTION'].values]),
+            'SOURCE': 'FIXED_INCOME'
+        })
+        df_flows = pd.concat([df_eq_flows, df_fixed_flows], ignore_index=True)
+        return df_flows[df_flows['DAY'] <= v_end_day].sort_values(['DAY', 'ACCOUNT'], kind='mergesort')
+
+    def get_cash_flows(self, v_end_date=None):
+        """Get external cash flows derived from BUY/SELL rows in equity and fixed income transactions.
+
+        Args:
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns ACCOUNT, DATE, AMOUNT, SOURCE.
+
+        """
+        self.logger.info('Deriving external cash flows from equity and fixed income transactions ...')
+        try:
+            this_end_day = np.datetime64(v_end_date or datetime.now().strftime('%Y-%m-%d'), 'D')
+            df_flows = self._build_cash_flows(self._get_eq_transactions_data(),
+                                              self._prepare_fixed(self._get_fixed_transactions_data()),
+                                              this_end_day)
+            df_flows['DATE'] = np.datetime_as_string(df_flows['DAY'].values.astype('datetime64[D]'))
+            return df_flows[['ACCOUNT', 'DATE', 'AMOUNT', 'SOURCE']].reset_index(drop=True)
+        except Exception as e:
+            self.logger.error('Failed to derive external cash flows -> ' + str(e))
+            raise e
+
+    def _build_account_matrices(self, v_start_date, v_end_date):
+        """Build the (dates, accounts) market value and cash flow matrices.
+
+        Row 0 is the day before the first date, its value is the opening balance, flows before the first date are
+        already part of it.
+
+        Returns:
+            :tuple: (dates, accounts, values, flows).
+
+        """
+        df_eq = self._get_eq_transactions_data()
+        df_fixed = self._prepare_fixed(self._get_fixed_transactions_data())
+        df_prices = self._get_price_history_data()
+        this_end = np.datetime64(v_end_date or datetime.now().strftime('%Y-%m-%d'), 'D')
+        df_flows = self._build_cash_flows(df_eq, df_fixed, this_end)
+        this_accounts = pd.Index(sorted(set(df_eq['ACCOUNT']) | set(df_fixed['ACCOUNT'])))
+        if df_flows.shape[0] == 0:
+            return np.array([], dtype='datetime64[D]'), this_accounts, np.zeros((0, 0)), np.zeros((0, 0))
+        this_start = np.datetime64(v_start_date, 'D') if v_start_date else df_flows['DAY'].values.min().astype('datetime64[D]')
+        this_dates = np.arange(this_start - 1, this_end + 1, dtype='datetime64[D]')
+        that_values = np.zeros((len(this_dates), len(this_accounts)))
+        # equity valuation runs over chunks of accounts to bound the (dates, ACCOUNT x SYMBOL) units matrix
+        _valuation = PortfolioValuation(self.eq_db_file)
+        df_keys = df_eq[['ACCOUNT', 'SYMBOL']].drop_duplicates()
+        this_keys_per_account = df_keys.groupby('ACCOUNT').size()
+        this_chunk_of = (this_keys_per_account.cumsum() * len(this_dates) // self.max_matrix_cells).to_dict()
+        for _, df_chunk in df_eq.groupby(df_eq['ACCOUNT'].map(this_chunk_of)):
+            # a holding is valued at its trade price until the next close, so a flow is matched by its value
+            this_chunk_values, df_groups = _valuation.compute_group_values(df_chunk, df_prices, this_dates,
+                                                                           ('ACCOUNT',), v_trade_prices=True)
+            that_values[:, this_accounts.get_indexer(df_groups['ACCOUNT'])] += this_chunk_values
+        if df_fixed.shape[0] > 0:
+            that_values += accrete_fixed_income(this_dates, df_fixed['ADD_DAY'].values, df_fixed['END_DAY'].values,
+                                                df_fixed['TOTAL_COST'].values.astype(float),
+                                                df_fixed['RETURN_RATE'].values,
+                                                this_accounts.get_indexer(df_fixed['ACCOUNT']), len(this_accounts))
+        that_flows = np.zeros_like(that_values)
+        df_in_range = df_flows[df_flows['DAY'] >= this_start]
+        np.add.at(that_flows, (np.searchsorted(this_dates, df_in_range['DAY'].values),
+                               this_accounts.get_indexer(df_in_range['ACCOUNT'])), df_in_range['AMOUNT'].values)
+        return this_dates, this_accounts, that_values, that_flows
+
+    @staticmethod
+    def _irr_from_matrices(v_dates, v_values, v_flows):
+        """IRR per account: opening balance and contributions invested, closing balance returned."""
+        this_rows, this_cols = np.nonzero(v_flows[1:])
+        this_last = len(v_dates) - 1
+        this_codes = np.concatenate([np.arange(v_values.shape[1]), this_cols, np.arange(v_values.shape[1])])
+        this_times = np.concatenate([np.zeros(v_values.shape[1]), this_rows + 1.0,
+                                     np.full(v_values.shape[1], float(this_last))]) / DAYS_PER_YEAR
+        this_amounts = np.concatenate([-v_values[0], -v_flows[1:][this_rows, this_cols], v_values[-1]])
+        return solve_irr(this_codes, this_times, this_amounts, v_values.shape[1])
+
+    def compute_time_weighted_returns(self, v_start_date=None, v_end_date=None):
+        """Get time-weighted return per account.
+
+        Args:
+            v_start_date (str): first date in format 'YYYY-MM-DD', default to the first cash flow.
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns ACCOUNT, START_DATE, END_DATE, TWR, TWR_ANNUALIZED.
+
+        """
+        return self.generate_returns_report(v_start_date, v_end_date)[
+            ['ACCOUNT', 'START_DATE', 'END_DATE', 'TWR', 'TWR_ANNUALIZED']]
+
+    def compute_money_weighted_returns(self, v_start_date=None, v_end_date=None):
+        """Get money-weighted return (annual IRR) per account.
+
+        Args:
+            v_start_date (str): first date in format 'YYYY-MM-DD', default to the first cash flow.
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns ACCOUNT, START_DATE, END_DATE, IRR.
+
+        """
+        return self.generate_returns_report(v_start_date, v_end_date)[['ACCOUNT', 'START_DATE', 'END_DATE', 'IRR']]
+
+    def generate_returns_report(self, v_start_date=None, v_end_date=None):
+        """Get time-weighted and money-weighted returns per account from one pass over the ledgers.
+
+        Args:
+            v_start_date (str): first date in format 'YYYY-MM-DD', default to the first cash flow.
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns ACCOUNT, START_DATE, END_DATE, START_VALUE, END_VALUE,
+            NET_CONTRIBUTIONS, TWR, TWR_ANNUALIZED, IRR.
+
+        """
+        self.logger.info('Generating returns report for all accounts ...')
+        try:
+            this_dates, this_accounts, this_values, this_flows = self._build_account_matrices(v_start_date,
+                                                                                              v_end_date)
+            that_columns = ['ACCOUNT', 'START_DATE', 'END_DATE', 'START_VALUE', 'END_VALUE', 'NET_CONTRIBUTIONS',
+                            'TWR', 'TWR_ANNUALIZED', 'IRR']
+            if len(this_dates) < 2:
+                return pd.DataFrame(columns=that_columns)
+            _, this_twr = chain_link_returns(this_values, this_flows)
+            this_years = (len(this_dates) - 1) / DAYS_PER_YEAR
+            with np.errstate(invalid='ignore'):
+                this_twr_annualized = np.power(1.0 + this_twr, 1.0 / this_years) - 1.0
+            df_output = pd.DataFrame({
+                'ACCOUNT': this_accounts.values,
+                'START_DATE': np.datetime_as_string(this_dates[1]),
+                'END_DATE': np.datetime_as_string(this_dates[-1]),
+                'START_VALUE': np.round(this_values[0], 2),
+                'END_VALUE': np.round(this_values[-1], 2),
+                'NET_CONTRIBUTIONS': np.round(this_flows[1:].sum(axis=0), 2),
+                'TWR': this_twr,
+                'TWR_ANNUALIZED': this_twr_annualized,
+                'IRR': self._irr_from_matrices(this_dates, this_values, this_flows)
+            })
+            return df_output[that_columns]
+        except Exception as e:
+            self.logger.error('Failed to generate returns report -> ' + str(e))
+            raise e
@@ -0,0 +1,315 @@
+"""
+This module is used to profile the CPU time and memory allocations of one run of main.py.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    In 'cpu' mode the standard library cProfile profiles the main thread and, through threading.setprofile, every
+    thread started during the run, e.g. the workers of the overview pipeline. At stop, the merged statistics are
+    written as a pstats file (for pstats, snakeviz, ...), as a text listing sorted by cumulative time, and as
+    collapsed stacks ('a;b;c <microseconds>' per line) for flamegraph.pl or speedscope. cProfile records caller and
+    callee pairs rather than whole stacks, so the time of a function called from several places is split across
+    its call paths in proportion to the time of each caller -> callee edge.
+    In 'mem' mode tracemalloc traces every allocation, and each :function: RunProfiler.stage, e.g. the holdings
+    sync or the HTML rendering of a report, compares a snapshot taken at its end with one taken at its start, which
+    gives the net memory of the stage and its top allocation sites. tracemalloc is process wide: a stage running
+    while other threads allocate (overview with -w > 1) also counts their allocations, use -w 1 for a clean split.
+    'both' does both. All files go to logs/profiles/ and are named after the job and the run timestamp.
+    Nothing is profiled unless a run is started, a stage then costs one attribute lookup.
+
+Examples:
+    -- Profile one run:
+        from src.run_profiler import RUN_PROFILER
+        RUN_PROFILER.start('both', v_run_name='overview')
+        with RUN_PROFILER.stage('render'):
+            ...
+        RUN_PROFILER.stop()
+
+    -- Take memory snapshots around every call of a function:
+        from src.run_profiler import profiled_stage
+
+        @profiled_stage()
+        def sync_table_holdings(self):
+            ...
+
+    -- From the command line:
+        python main.py overview --profile both -w 1
+
+"""
+
+import os
+import io
+import sys
+import pstats
+import cProfile
+import functools
+import threading
+import tracemalloc
+from datetime import datetime
+from contextlib import contextmanager
+from collections import OrderedDict, Counter
+
+from .logger import UseLogging
+
+
+PROFILE_MODES = ['cpu', 'mem', 'both']
+# call paths deeper than this are cut, recursion is cut at the first repeated function
+_MAX_STACK_DEPTH = 64
+_MIN_STACK_SECONDS = 1e-6
+
+
+def _frame_label(v_function):
+    """Label of a pstats function key (file, line, name) in a collapsed stack."""
+    this_file, this_line, this_name = v_function
+    if this_file == '~':
+        this_label = this_name
+    else:
+        this_label = '{}:{}:{}'.format(os.path.basename(this_file), this_name, this_line)
+    return this_label.replace(';', ',').replace(' ', '_')
+
+
+def collapsed_stacks(v_stats):
+    """The :function: collapsed_stacks is used to turn cProfile statistics into collapsed stacks.
+
+    Args:
+        v_stats (dict): the stats attribute of a pstats.Stats object, function -> (cc, nc, tt, ct, callers).
+
+    Returns: :list: of str 'root;caller;function <own microseconds>', sorted.
+
+    """
+    this_callees = {}
+    for this_function, (_, _, _, _, this_callers) in v_stats.items():
+        for this_caller, this_edge in this_callers.items():
+            this_callees.setdefault(this_caller, []).append((this_function, this_edge[3]))
+    that_output = Counter()
+
+    def this_walk(v_stack, v_scale):
+        this_function = v_stack[-1]
+        this_own = v_stats[this_function][2] * v_scale
+        if this_own >= _MIN_STACK_SECONDS:
+            that_output[';'.join(_frame_label(x) for x in v_stack)] += this_own
+        if len(v_stack) >= _MAX_STACK_DEPTH:
+            return
+        for this_callee, this_edge_time in this_callees.get(this_function, []):
+            this_total = v_stats[this_callee][3]
+            if this_callee in v_stack or this_total <= 0:
+                continue
+            this_scale = v_scale * min(1.0, this_edge_time / this_total)
+            if this_total * this_scale >= _MIN_STACK_SECONDS:
+                this_walk(v_stack + [this_callee], this_scale)
+
+    for this_root in [k for k, v in v_stats.items() if not v[4]]:
+        this_walk([this_root], 1.0)
+    return sorted('{} {}'.format(k, int(round(v * 1e6))) for k, v in that_output.items() if round(v * 1e6) > 0)
+
+
+def _format_size(v_bytes):
+    """Format a byte count as a signed KiB/MiB string."""
+    if abs(v_bytes) >= 1024 * 1024:
+        return '{:+.1f} MiB'.format(v_bytes / 1024 / 1024)
+    return '{:+.1f} KiB'.format(v_bytes / 1024)
+
+
+class RunProfiler(object):
+    """
+    The :class: RunProfiler can be used to profile one run with cProfile, tracemalloc or both.
+    """
+    def __init__(self):
+        """
+        constructor for :class: RunProfiler.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.mode = None
+        self.out_stem = None
+        self._cpu_profiles = []
+        self._stages = OrderedDict()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    @property
+    def running(self):
+        """True between :function: start and :function: stop."""
+        return self.mode is not None
+
+    @property
+    def cpu(self):
+        return self.mode in ('cpu', 'both')
+
+    @property
+    def mem(self):
+        return self.mode in ('mem', 'both')
+
+    def start(self, v_mode, v_out_dir='logs/profiles', v_run_name='run'):
+        """The :function: start is used to start profiling the current run.
+
+        Args:
+            v_mode (str): cpu, mem or both.
+            v_out_dir (str): output directory, created when missing, default to logs/profiles.
+            v_run_name (str): prefix of the output files, e.g. the job name.
+
+        """
+        if not isinstance(v_mode, str) or v_mode.lower() not in PROFILE_MODES:
+            raise IOError('Error in RunProfiler.start(): input :v_mode: is not valid -> expect {}, got {}: {}'.format(
+                '/'.join(PROFILE_MODES), str(type(v_mode)), str(v_mode)))
+        if self.running:
+            raise IOError('Error in RunProfiler.start(): a {} profile is already running'.format(self.mode))
+        os.makedirs(v_out_dir, exist_ok=True)
+        self.out_stem = os.path.join(v_out_dir, '{}_{}'.format(v_run_name, datetime.now().strftime('%Y%m%d_%H%M%S')))
+        self.mode = v_mode.lower()
+        self._cpu_profiles = []
+        self._stages.clear()
+        if self.mem and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.cpu:
+            threading.setprofile(self._profile_thread)
+            this_profile = cProfile.Profile()
+            self._cpu_profiles.append(this_profile)
+            this_profile.enable()
+        self.logger.info(f'Profiling {self.mode} of this run into {self.out_stem}* ...')
+
+    def _profile_thread(self, v_frame, v_event, v_arg):
+        """Profile hook of new threads, replaced by a cProfile profiler of the thread at its first event."""
+        this_profile = cProfile.Profile()
+        try:
+            this_profile.enable()
+        except ValueError:
+            # a profiler that already covers every thread is active, drop this hook
+            sys.setprofile(None)
+            return
+        with self._lock:
+            self._cpu_profiles.append(this_profile)
+
+    def _snapshot(self):
+        """Take a tracemalloc snapshot without the allocations of tracemalloc and the import machinery."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>')])
+
+    @contextmanager
+    def stage(self, v_name):
+        """The :function: stage is used to record the net memory and the top allocation sites of the enclosed block.
+
+        Args:
+            v_name (str): stage name, statistics of stages with the same name are added up.
+
+        """
+        if not self.mem:
+            yield
+            return
+        this_before = self._snapshot()
+        try:
+            yield
+        finally:
+            if self.mem:
+                this_diff = self._snapshot().compare_to(this_before, 'lineno')
+                with self._lock:
+                    this_stage = self._stages.setdefault(v_name, {'COUNT': 0, 'SIZE_DIFF': 0, 'SITES': Counter(),
+                                                                  'BLOCKS': Counter()})
+                    this_stage['COUNT'] += 1
+                    for this_stat in this_diff:
+                        this_site = '{}:{}'.format(this_stat.traceback[0].filename, this_stat.traceback[0].lineno)
+                        this_stage['SIZE_DIFF'] += this_stat.size_diff
+                        this_stage['SITES'][this_site] += this_stat.size_diff
+                        this_stage['BLOCKS'][this_site] += this_stat.count_diff
+
+    def memory_report(self, v_top=10):
+        """The :function: memory_report is used to format the stages and the top allocation sites as text.
+
+        Args:
+            v_top (int): allocation sites listed per stage, default to 10.
+
+        Returns: :str:
+
+        """
+        this_current, this_peak = tracemalloc.get_traced_memory()
+        that_lines = ['Memory profile {}: {} stage(s), traced memory {} current, {} peak'.format(
+            self.out_stem, len(self._stages), _format_size(this_current), _format_size(this_peak))]
+        with self._lock:
+            this_stages = [(k, dict(v)) for k, v in self._stages.items()]
+        for this_name, this_stage in this_stages:
+            that_lines.append('')
+            that_lines.append('Stage {}: {} net over {} call(s)'.format(
+                this_name, _format_size(this_stage['SIZE_DIFF']), this_stage['COUNT']))
+            for this_site, this_size in sorted(this_stage['SITES'].items(), key=lambda x: -abs(x[1]))[:v_top]:
+                that_lines.append('    {:>12}  {:>8} blocks  {}'.format(_format_size(this_size),
+                                                                        this_stage['BLOCKS'][this_site], this_site))
+        that_lines.append('')
+        that_lines.append('Top allocation sites still allocated at stop:')
+        for this_stat in self._snapshot().statistics('lineno')[:v_top]:
+            that_lines.append('    {:>12}  {:>8} blocks  {}:{}'.format(
+                _format_size(this_stat.size), this_stat.count, this_stat.traceback[0].filename,
+                this_stat.traceback[0].lineno))
+        return '\n'.join(that_lines) + '\n'
+
+    def stop(self):
+        """The :function: stop is used to stop profiling and write the output files.
+
+        Returns: :list: of files written.
+
+        """
+        if not self.running:
+            return []
+        that_output = []
+        try:
+            if self.cpu:
+                threading.setprofile(None)
+                with self._lock:
+                    this_profiles = list(self._cpu_profiles)
+                this_profiles[0].disable()
+                this_stats = pstats.Stats(this_profiles[0])
+                for this_profile in this_profiles[1:]:
+                    this_stats.add(this_profile)
+                this_stats.dump_stats(self.out_stem + '.pstats')
+                this_listing = io.StringIO()
+                pstats.Stats(self.out_stem + '.pstats', stream=this_listing).sort_stats('cumulative').print_stats(60)
+                with open(self.out_stem + '_cpu.txt', 'w') as wf:
+                    wf.write(this_listing.getvalue())
+                with open(self.out_stem + '.collapsed', 'w') as wf:
+                    wf.write('\n'.join(collapsed_stacks(this_stats.stats)) + '\n')
+                that_output += [self.out_stem + '.pstats', self.out_stem + '_cpu.txt', self.out_stem + '.collapsed']
+            if self.mem:
+                with open(self.out_stem + '_mem.txt', 'w') as wf:
+                    wf.write(self.memory_report())
+                that_output.append(self.out_stem + '_mem.txt')
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+            self.mode = None
+        self.logger.info('Profile written to ' + ', '.join(that_output))
+        return that_output
+
+
+RUN_PROFILER = RunProfiler()
+
+
+def profiled_stage(v_name=None):
+    """The :function: profiled_stage is used to decorate a function with a :function: RunProfiler.stage.
+
+    Args:
+        v_name (str): stage name, default to the qualified name of the function.
+
+    Returns: :callable: decorator.
+
+    """
+    def this_decorator(v_function):
+        this_name = v_name or v_function.__qualname__
+
+        @functools.wraps(v_function)
+        def this_wrapper(*args, **kwargs):
+            if not RUN_PROFILER.mem:
+                return v_function(*args, **kwargs)
+            with RUN_PROFILER.stage(this_name):
+                return v_function(*args, **kwargs)
+        return this_wrapper
+    return this_decorator
@@ -0,0 +1,173 @@
+"""
+This module is used to skip Overview Snapshot generation when none of its inputs changed since the last run.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    The fingerprint is a SHA-256 over cheap summaries of every input: COUNT(*), MAX(ID) and ID-weighted sums of
+    UNITS * DOLLARS, DATE and TYPE of :table: transactions in equity.db, so rows edited in place change it too,
+    every row of :table: watch_list, as prices are updated more than once a day under the same LAST_UPDATED, every
+    row of :table: transactions in fixed_income.db, mtime and content hash of others.json and of the fund catalog,
+    plus the snapshot date. It is stored next to the snapshots, a run with the same fingerprint reuses the rendered
+    snapshot files as they are.
+    Only the standard library is imported here, so a cache hit does not pay for loading pandas.
+
+Examples:
+    -- Initialize class:
+        from src.snapshot_cache import SnapshotCache
+        this_cache = SnapshotCache()
+
+    -- Check whether a snapshot can be reused:
+        this_fingerprint = this_cache.compute_fingerprint('20261019', {'FORMATS': ['html']})
+        this_cache.is_fresh(this_fingerprint)
+
+    -- Record the fingerprint of a new snapshot:
+        this_cache.save(this_fingerprint, 'snapshots/snapshot_20261019.html')
+
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+
+from .logger import UseLogging
+from .db_replica import read_only_uri
+
+
+class SnapshotCache(object):
+    """
+    The :class: SnapshotCache can be used to fingerprint the Overview Snapshot inputs and detect unchanged runs.
+    """
+    def __init__(self, v_eq_db_file='databases/equity.db', v_fixed_db_file='databases/fixed_income.db',
+                 v_other_investment_file='databases/others.json', v_catalog_file='templates/fund_catalog.json',
+                 v_cache_file='snapshots/snapshot_cache.json'):
+        """
+        constructor for :class: SnapshotCache.
+
+        Args:
+            v_eq_db_file (str): path to the equity SQLite database.
+            v_fixed_db_file (str): path to the fixed income SQLite database.
+            v_other_investment_file (str): path to the JSON file of other investments.
+            v_catalog_file (str): path to the fund catalog.
+            v_cache_file (str): path to the JSON file keeping the fingerprint of the last snapshot.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.eq_db_file = v_eq_db_file
+        self.fixed_db_file = v_fixed_db_file
+        self.other_investment_file = v_other_investment_file
+        self.catalog_file = v_catalog_file
+        self.cache_file = v_cache_file
+
+    @staticmethod
+    def _query(v_db_file, v_queries):
+        """Run read-only queries against v_db_file, a missing database gives None instead of creating the file."""
+        if not os.path.exists(v_db_file):
+            return None
+        this_conn = sqlite3.connect(read_only_uri(v_db_file), uri=True)
+        try:
+            that_output = []
+            for this_query in v_queries:
+                try:
+                    that_output.append(this_conn.execute(this_query).fetchall())
+                except sqlite3.OperationalError:
+                    # table not created yet
+                    that_output.append(None)
+            return that_output
+        finally:
+            this_conn.close()
+
+    @staticmethod
+    def _file_signature(v_file):
+        """mtime and SHA-256 of v_file, None when missing."""
+        if not os.path.exists(v_file):
+            return None
+        with open(v_file, 'rb') as rf:
+            return [os.path.getmtime(v_file), hashlib.sha256(rf.read()).hexdigest()]
+
+    def compute_fingerprint(self, v_snapshot_date, v_options=None):
+        """The :function: compute_fingerprint is used to summarize all inputs of the Overview Snapshot.
+
+        Args:
+            v_snapshot_date (str): date of the snapshot, reports depend on today, e.g. the mature calender.
+            v_options (dict): run options changing the output, e.g. the output formats, default to None.
+
+        Returns: :str: hex digest.
+
+        """
+        try:
+            this_inputs = {
+                'SNAPSHOT_DATE': v_snapshot_date,
+                'OPTIONS': v_options,
+                'EQUITY': self._query(self.eq_db_file, [
+                    "SELECT COUNT(*), IFNULL(MAX(ID), 0), TOTAL(ID * UNITS * DOLLARS), TOTAL(ID * JULIANDAY(DATE)), "
+                    "TOTAL(CASE WHEN TYPE = 'SELL' THEN ID ELSE 0 END) FROM transactions;",
+                    "SELECT * FROM watch_list ORDER BY SYMBOL;"]),
+                # the fixed income table is small and rows may be edited in place, every row is its own version
+                'FIXED': self._query(self.fixed_db_file, ["SELECT * FROM transactions ORDER BY ID;"]),
+                'OTHERS': self._file_signature(self.other_investment_file),
+                'CATALOG': self._file_signature(self.catalog_file)
+            }
+            return hashlib.sha256(json.dumps(this_inputs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        except Exception as e:
+            self.logger.error('Failed to compute fingerprint of overview inputs -> ' + str(e))
+            raise e
+
+    @staticmethod
+    def _output_files(v_output_files):
+        """Normalized list of output paths, a single path is accepted as well."""
+        if isinstance(v_output_files, str):
+            v_output_files = [v_output_files]
+        return sorted(os.path.normpath(x) for x in v_output_files)
+
+    def is_fresh(self, v_fingerprint, v_output_files=None):
+        """The :function: is_fresh is used to check whether v_output_files were rendered from the same inputs.
+
+        Args:
+            v_fingerprint (str): fingerprint of the current inputs.
+            v_output_files (str or list): path(s) to the snapshot files, default to the files recorded by save().
+
+        Returns: :bool: True if the snapshot can be reused.
+
+        """
+        if not os.path.exists(self.cache_file):
+            return False
+        try:
+            with open(self.cache_file, 'r') as rf:
+                this_cache = json.load(rf)
+        except ValueError:
+            self.logger.warning(f'Snapshot cache {self.cache_file} is not valid JSON, ignoring it ...')
+            return False
+        this_files = sorted(this_cache.get('OUTPUT_FILES') or {}) if v_output_files is None else \
+            self._output_files(v_output_files)
+        if not this_files or not all(os.path.exists(x) for x in this_files):
+            return False
+        return this_cache.get('FINGERPRINT') == v_fingerprint and \
+            this_cache.get('OUTPUT_FILES') == {x: os.path.getmtime(x) for x in this_files}
+
+    def save(self, v_fingerprint, v_output_files):
+        """The :function: save is used to record the fingerprint of freshly rendered snapshot files.
+
+        Args:
+            v_fingerprint (str): fingerprint of the inputs the snapshot was rendered from.
+            v_output_files (str or list): path(s) to the snapshot files.
+
+        """
+        try:
+            this_tmp_file = self.cache_file + '.tmp'
+            with open(this_tmp_file, 'w') as wf:
+                json.dump({'FINGERPRINT': v_fingerprint,
+                           'OUTPUT_FILES': {x: os.path.getmtime(x) for x in self._output_files(v_output_files)}},
+                          wf)
+            os.replace(this_tmp_file, self.cache_file)
+        except Exception as e:
+            self.logger.error(f'Failed to save snapshot cache {self.cache_file} -> ' + str(e))
+            raise e
@@ -0,0 +1,251 @@
+"""
+This module is used to keep the numeric results of every Overview Snapshot for trend queries.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+
+    Every overview run appends one partition, keyed by SNAPSHOT_DATE, to :table: allocation_history (DOLLARS and
+    ALLOCATION by DIMENSION MAJOR_TYPE, MINOR_TYPE, ACCOUNT, ASSET_CLASS, SUBCLASS and PORTFOLIO) and to
+    :table: position_history (MKT_VALUE by ACCOUNT and SYMBOL). Re-running on the same date replaces its partition.
+    Time series are read through the unique indexes on (DIMENSION, KEY, SNAPSHOT_DATE) and
+    (SYMBOL, ACCOUNT, SNAPSHOT_DATE), so a query is one index range scan and nothing is recomputed.
+    ASSET_CLASS and SUBCLASS come from the per-account fund reports and do not include individual stocks.
+
+Examples:
+    -- Initialize class:
+        from src.snapshot_history import SnapshotHistory
+        this_history = SnapshotHistory()
+
+    -- Record one overview run:
+        this_history.record('2026-10-19', this_pipeline.run(), this_summary_tool.generate_position_values())
+
+    -- EQUITY allocation over 3 years:
+        this_history.get_time_series('MAJOR_TYPE', 'EQUITY', '2023-10-19')
+
+    -- Market value of one symbol over all accounts:
+        this_history.get_position_series('VOO')
+
+"""
+
+import pandas as pd
+
+from .logger import UseLogging
+from .eq_SQLite_utility import SQLiteRequest
+from .tracing import traced
+from .metrics import metered_write
+
+
+DIMENSIONS = ['PORTFOLIO', 'MAJOR_TYPE', 'MINOR_TYPE', 'ACCOUNT', 'ASSET_CLASS', 'SUBCLASS']
+
+
+class SnapshotHistory(SQLiteRequest):
+    """
+    The :class: SnapshotHistory can be used to store and query the numeric results of Overview Snapshots.
+    """
+    def __init__(self, v_db_filename='databases/history.db'):
+        """
+        constructor for :class: SnapshotHistory.
+        """
+        if not isinstance(v_db_filename, str):
+            raise IOError("Constructor for :class: SnapshotHistory take a string argument. Got {}: {}".
+                          format(str(type(v_db_filename)), str(v_db_filename))
+                          )
+        super().__init__(v_db_filename)
+        self.table_schema_file = "templates/history_tables_schema.json"
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+
+    def create_tables_history(self):
+        """
+        The :function: create_tables_history is used to create :table: 'allocation_history' and
+            :table: 'position_history' in the SQLite DB file.
+
+        Args:
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        try:
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute(self._read_json_schema_file('ALLOCATION_HISTORY'))
+            this_cursor.execute(self._read_json_schema_file('POSITION_HISTORY'))
+            this_cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_allocation_history_series "
+                                "ON allocation_history (DIMENSION, KEY, SNAPSHOT_DATE);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_allocation_history_date "
+                                "ON allocation_history (SNAPSHOT_DATE);")
+            this_cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_position_history_series "
+                                "ON position_history (SYMBOL, ACCOUNT, SNAPSHOT_DATE);")
+            this_cursor.execute("CREATE INDEX IF NOT EXISTS idx_position_history_date "
+                                "ON position_history (SNAPSHOT_DATE);")
+            this_conn.commit()
+            self.logger.info(":table: 'allocation_history' and 'position_history' have been created ...")
+            this_conn.close()
+            self.logger.info("Connection closed !")
+            return True
+        except Exception as e:
+            self.logger.error("Failed to create history tables ! -> " + str(e))
+            raise e
+
+    @staticmethod
+    def _allocation_rows(v_reports):
+        """Flatten the overview reports into DIMENSION, KEY, DOLLARS, ALLOCATION rows."""
+        that_frames = []
+        df_type = v_reports['allocation_type']
+        df_type_rows = df_type[~df_type['IS_TOTAL']]
+        that_frames.append(pd.DataFrame({'DIMENSION': 'PORTFOLIO', 'KEY': 'TOTAL',
+                                         'DOLLARS': df_type_rows['MINOR_TOTAL_DOLLARS'].sum(),
+                                         'ALLOCATION': 100.0}, index=[0]))
+        df_major = df_type_rows.drop_duplicates('MAJOR_TYPE')
+        that_frames.append(pd.DataFrame({'DIMENSION': 'MAJOR_TYPE', 'KEY': df_major['MAJOR_TYPE'].values,
+                                         'DOLLARS': df_major['MAJOR_TOTAL_DOLLARS'].values,
+                                         'ALLOCATION': df_major['MAJOR_ALLOCATION'].values}))
+        df_minor = df_type_rows.groupby('MINOR_TYPE')[['MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION']].sum().\
+            reset_index()
+        that_frames.append(pd.DataFrame({'DIMENSION': 'MINOR_TYPE', 'KEY': df_minor['MINOR_TYPE'].values,
+                                         'DOLLARS': df_minor['MINOR_TOTAL_DOLLARS'].values,
+                                         'ALLOCATION': df_minor['MINOR_ALLOCATION'].values}))
+        df_account = v_reports['allocation_account']
+        that_frames.append(pd.DataFrame({'DIMENSION': 'ACCOUNT', 'KEY': df_account['ACCOUNT'].values,
+                                         'DOLLARS': df_account['TOTAL_DOLLARS'].values,
+                                         'ALLOCATION': df_account['ALLOCATION'].values}))
+        this_funds = [x[~x['IS_TOTAL']] for x in v_reports['allocation_etf_by_account'].values()]
+        if this_funds:
+            df_funds = pd.concat(this_funds, ignore_index=True)
+            this_total = df_funds['SUBCLASS_TOTAL_DOLLARS'].sum()
+            for this_dimension in ['ASSET_CLASS', 'SUBCLASS']:
+                df_class = df_funds.groupby(this_dimension)['SUBCLASS_TOTAL_DOLLARS'].sum().reset_index()
+                that_frames.append(pd.DataFrame({
+                    'DIMENSION': this_dimension, 'KEY': df_class[this_dimension].values,
+                    'DOLLARS': df_class['SUBCLASS_TOTAL_DOLLARS'].values,
+                    'ALLOCATION': df_class['SUBCLASS_TOTAL_DOLLARS'].values / this_total * 100 if this_total else
+                    float('nan')}))
+        return pd.concat(that_frames, ignore_index=True, sort=False)[['DIMENSION', 'KEY', 'DOLLARS', 'ALLOCATION']]
+
+    @traced()
+    @metered_write()
+    def record(self, v_snapshot_date, v_reports, df_positions=None):
+        """The :function: record is used to store the partition of one snapshot date, replacing any previous one.
+
+        Args:
+            v_snapshot_date (str): snapshot date in format 'YYYY-MM-DD'.
+            v_reports (dict): report name -> report output, as returned by OverviewPipeline.run().
+            df_positions (DataFrame): output of SummaryTool.generate_position_values(), default to None.
+
+        Returns:
+            :boolean: True if job completed successfully.
+
+        """
+        self.logger.info(f'Recording snapshot {v_snapshot_date} into history ...')
+        try:
+            self.create_tables_history()
+            df_allocation = self._allocation_rows(v_reports)
+            this_conn = self._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute("DELETE FROM allocation_history WHERE SNAPSHOT_DATE = ?;", (v_snapshot_date,))
+            this_cursor.executemany(
+                "INSERT INTO allocation_history (SNAPSHOT_DATE, DIMENSION, KEY, DOLLARS, ALLOCATION) "
+                "VALUES (?, ?, ?, ?, ?);",
+                [(v_snapshot_date, x[0], str(x[1]), float(x[2]), None if pd.isnull(x[3]) else float(x[3]))
+                 for x in df_allocation.itertuples(index=False, name=None)])
+            if df_positions is not None:
+                this_cursor.execute("DELETE FROM position_history WHERE SNAPSHOT_DATE = ?;", (v_snapshot_date,))
+                df_positions = df_positions.groupby(['ACCOUNT', 'SYMBOL'], as_index=False).agg(
+                    {'INVESTMENT_TYPE': 'first', 'UNITS': 'sum', 'PRICE': 'first', 'MKT_VALUE': 'sum'})
+                this_cursor.executemany(
+                    "INSERT INTO position_history (SNAPSHOT_DATE, ACCOUNT, SYMBOL, INVESTMENT_TYPE, UNITS, PRICE, "
+                    "MKT_VALUE) VALUES (?, ?, ?, ?, ?, ?, ?);",
+                    [(v_snapshot_date, x[0], x[1], x[2], None if pd.isnull(x[3]) else float(x[3]),
+                      None if pd.isnull(x[4]) else float(x[4]), float(x[5]))
+                     for x in df_positions[['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'PRICE',
+                                            'MKT_VALUE']].itertuples(index=False, name=None)])
+            this_conn.commit()
+            this_conn.close()
+            return True
+        except Exception as e:
+            self.logger.error(f'Failed to record snapshot {v_snapshot_date} into history -> ' + str(e))
+            raise e
+
+    def _query(self, v_query, v_params):
+        """Run a read query and return a Pandas dataframe."""
+        self.create_tables_history()
+        this_conn = self._create_connection()
+        try:
+            return pd.read_sql_query(v_query, this_conn, params=v_params)
+        finally:
+            this_conn.close()
+
+    def get_time_series(self, v_dimension, v_key, v_start_date=None, v_end_date=None):
+        """The :function: get_time_series is used to get DOLLARS and ALLOCATION of one key across snapshots.
+
+        Args:
+            v_dimension (str): one of DIMENSIONS.
+            v_key (str): e.g. 'EQUITY' for MAJOR_TYPE, 'Schwab' for ACCOUNT.
+            v_start_date (str): first snapshot date in format 'YYYY-MM-DD', default to None.
+            v_end_date (str): last snapshot date in format 'YYYY-MM-DD', default to None.
+
+        Returns: :object: Pandas dataframe with columns SNAPSHOT_DATE, DOLLARS, ALLOCATION.
+
+        """
+        if v_dimension not in DIMENSIONS:
+            raise IOError('Error in SnapshotHistory.get_time_series(): dimension is not valid -> expect one of {}, '
+                          'got {}'.format(', '.join(DIMENSIONS), str(v_dimension)))
+        try:
+            return self._query("SELECT SNAPSHOT_DATE, DOLLARS, ALLOCATION FROM allocation_history "
+                               "WHERE DIMENSION = ? AND KEY = ? AND SNAPSHOT_DATE BETWEEN ? AND ? "
+                               "ORDER BY SNAPSHOT_DATE;",
+                               (v_dimension, v_key, v_start_date or '0000-00-00', v_end_date or '9999-99-99'))
+        except Exception as e:
+            self.logger.error(f'Failed to get history of {v_dimension} {v_key} -> ' + str(e))
+            raise e
+
+    def get_position_series(self, v_symbol, v_account=None, v_start_date=None, v_end_date=None):
+        """The :function: get_position_series is used to get UNITS and MKT_VALUE of one symbol across snapshots.
+
+        Args:
+            v_symbol (str): position symbol.
+            v_account (str): account name, all accounts are summed when None.
+            v_start_date (str): first snapshot date in format 'YYYY-MM-DD', default to None.
+            v_end_date (str): last snapshot date in format 'YYYY-MM-DD', default to None.
+
+        Returns: :object: Pandas dataframe with columns SNAPSHOT_DATE, UNITS, MKT_VALUE.
+
+        """
+        try:
+            this_params = [v_symbol]
+            this_filter = ''
+            if v_account is not None:
+                this_filter = 'AND ACCOUNT = ? '
+                this_params.append(v_account)
+            this_params += [v_start_date or '0000-00-00', v_end_date or '9999-99-99']
+            return self._query("SELECT SNAPSHOT_DATE, SUM(UNITS) AS UNITS, SUM(MKT_VALUE) AS MKT_VALUE "
+                               "FROM position_history WHERE SYMBOL = ? " + this_filter +
+                               "AND SNAPSHOT_DATE BETWEEN ? AND ? GROUP BY SNAPSHOT_DATE ORDER BY SNAPSHOT_DATE;",
+                               tuple(this_params))
+        except Exception as e:
+            self.logger.error(f'Failed to get position history of {v_symbol} -> ' + str(e))
+            raise e
+
+    def get_snapshot(self, v_snapshot_date, v_dimension):
+        """The :function: get_snapshot is used to get every key of one dimension on one snapshot date.
+
+        Args:
+            v_snapshot_date (str): snapshot date in format 'YYYY-MM-DD'.
+            v_dimension (str): one of DIMENSIONS.
+
+        Returns: :object: Pandas dataframe with columns KEY, DOLLARS, ALLOCATION.
+
+        """
+        if v_dimension not in DIMENSIONS:
+            raise IOError('Error in SnapshotHistory.get_snapshot(): dimension is not valid -> expect one of {}, '
+                          'got {}'.format(', '.join(DIMENSIONS), str(v_dimension)))
+        return self._query("SELECT KEY, DOLLARS, ALLOCATION FROM allocation_history "
+                           "WHERE SNAPSHOT_DATE = ? AND DIMENSION = ? ORDER BY DOLLARS DESC;",
+                           (v_snapshot_date, v_dimension))
@@ -0,0 +1,321 @@
+"""
+This module is used to profile every SQL statement run through :class: SQLiteRequest and its subclasses.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    The profiler is opt-in: once enabled, SQLiteRequest._create_connection opens connections with
+    :class: ProfiledConnection, whose cursors time every execute and count the rows fetched afterwards. Statements are
+    grouped by their text with literals replaced by '?', so the same query with different values is one entry.
+    EXPLAIN QUERY PLAN is captured once for every distinct SELECT/INSERT/UPDATE/DELETE, and the tables it reads with
+    a full scan (no index) are flagged. The report is written at process exit, slowest statements first.
+    A disabled profiler costs nothing, connections are plain sqlite3 connections.
+
+Examples:
+    -- Enable profiling for this process, the report is written to logs/sql_profile.txt at exit:
+        from src.sql_profiler import SQL_PROFILER
+        SQL_PROFILER.enable()
+
+    -- From the command line:
+        python main.py overview --sql_profile
+
+    -- Read the statistics without waiting for exit:
+        SQL_PROFILER.summary()
+        print(SQL_PROFILER.report())
+
+"""
+
+import re
+import atexit
+import sqlite3
+import threading
+import itertools
+import time
+from collections import OrderedDict
+
+from .logger import UseLogging
+
+
+# statements worth an EXPLAIN QUERY PLAN, DDL and PRAGMA have no plan
+_EXPLAINED_STATEMENTS = ('SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH')
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+# 'SCAN t' / 'SCAN TABLE t' without 'USING ... INDEX' reads every row of t
+_FULL_SCAN_PATTERN = re.compile(r'^SCAN (?:TABLE )?(?!SUBQUERY|CONSTANT ROW|\()(\S+)'
+                                r'(?!.*USING (?:COVERING |INTEGER )?(?:PRIMARY KEY|INDEX))')
+
+
+def normalize_statement(v_sql):
+    """The :function: normalize_statement is used to group statements that only differ by literal values.
+
+    Args:
+        v_sql (str): SQL text.
+
+    Returns: :str: SQL text on one line with string and number literals replaced by '?'.
+
+    """
+    return ' '.join(_LITERAL_PATTERN.sub('?', v_sql).split())
+
+
+def full_scans(v_plan):
+    """The :function: full_scans is used to find the tables a query plan reads without an index.
+
+    Args:
+        v_plan (list): detail lines of EXPLAIN QUERY PLAN.
+
+    Returns: :list: of table names.
+
+    """
+    that_output = []
+    for this_detail in v_plan:
+        this_match = _FULL_SCAN_PATTERN.match(this_detail)
+        if this_match and this_match.group(1) not in that_output:
+            that_output.append(this_match.group(1))
+    return that_output
+
+
+def _percentile(v_sorted, v_quantile):
+    """Nearest-rank percentile of an already sorted list."""
+    return v_sorted[min(len(v_sorted) - 1, max(0, int(round(v_quantile * len(v_sorted) + 0.5)) - 1))]
+
+
+class SQLProfiler(object):
+    """
+    The :class: SQLProfiler can be used to collect per-statement latency, row count and query plan.
+    """
+    def __init__(self):
+        """
+        constructor for :class: SQLProfiler.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.enabled = False
+        self.report_file = None
+        self._statements = OrderedDict()
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    def enable(self, v_report_file='logs/sql_profile.txt'):
+        """The :function: enable is used to profile every connection opened from now on.
+
+        Args:
+            v_report_file (str): file the report is written to at process exit, None to skip writing it.
+
+        """
+        self.enabled = True
+        self.report_file = v_report_file
+        if not self._atexit_registered:
+            atexit.register(self._dump_at_exit)
+            self._atexit_registered = True
+        self.logger.info(f'SQL profiling enabled, the report is written to {v_report_file} at exit ...')
+
+    def disable(self):
+        """The :function: disable is used to stop profiling new connections, statistics are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """The :function: reset is used to drop every statistic collected so far."""
+        with self._lock:
+            self._statements.clear()
+
+    def _entry(self, v_conn, v_sql, v_params):
+        """Get the statistic entry of a statement, capturing its plan on first execution."""
+        this_key = normalize_statement(v_sql)
+        with self._lock:
+            this_entry = self._statements.get(this_key)
+            if this_entry is None:
+                this_entry = {'STATEMENT': this_key, 'EXECUTIONS': [], 'PLAN': None}
+                self._statements[this_key] = this_entry
+        if this_entry['PLAN'] is None:
+            this_entry['PLAN'] = self._explain(v_conn, v_sql, v_params)
+        return this_entry
+
+    @staticmethod
+    def _explain(v_conn, v_sql, v_params):
+        """Run EXPLAIN QUERY PLAN on the connection of the statement, [] when it has no plan."""
+        if v_sql.lstrip().split(None, 1)[0].upper() not in _EXPLAINED_STATEMENTS or ';' in v_sql.strip()[:-1]:
+            return []
+        try:
+            # the base class cursor, so EXPLAIN itself is not profiled
+            this_cursor = sqlite3.Connection.cursor(v_conn)
+            this_rows = this_cursor.execute('EXPLAIN QUERY PLAN ' + v_sql, v_params).fetchall()
+            this_cursor.close()
+            return [str(x[-1]) for x in this_rows]
+        except sqlite3.Error:
+            return []
+
+    def start(self, v_conn, v_sql, v_params=()):
+        """The :function: start is used to open the record of one execution.
+
+        Returns: :list: [seconds, rows], updated in place while the result is fetched.
+
+        """
+        this_entry = self._entry(v_conn, v_sql, v_params)
+        this_record = [0.0, 0]
+        with self._lock:
+            this_entry['EXECUTIONS'].append(this_record)
+        return this_record
+
+    def summary(self):
+        """The :function: summary is used to get the statistics of every statement, slowest total first.
+
+        Returns: :list: of dictionary with keys STATEMENT, COUNT, TOTAL_MS, P50_MS, P95_MS, P99_MS, MAX_MS, ROWS,
+            FULL_SCANS, PLAN.
+
+        """
+        with self._lock:
+            this_entries = [(x['STATEMENT'], list(x['EXECUTIONS']), x['PLAN'] or []) for x in
+                            self._statements.values()]
+        that_output = []
+        for this_statement, this_executions, this_plan in this_entries:
+            if not this_executions:
+                continue
+            this_latencies = sorted(x[0] * 1000 for x in this_executions)
+            that_output.append({
+                'STATEMENT': this_statement,
+                'COUNT': len(this_executions),
+                'TOTAL_MS': sum(this_latencies),
+                'P50_MS': _percentile(this_latencies, 0.50),
+                'P95_MS': _percentile(this_latencies, 0.95),
+                'P99_MS': _percentile(this_latencies, 0.99),
+                'MAX_MS': this_latencies[-1],
+                'ROWS': sum(x[1] for x in this_executions),
+                'FULL_SCANS': full_scans(this_plan),
+                'PLAN': this_plan})
+        return sorted(that_output, key=lambda x: x['TOTAL_MS'], reverse=True)
+
+    def report(self):
+        """The :function: report is used to format :function: summary as plain text.
+
+        Returns: :str:
+
+        """
+        this_summary = self.summary()
+        that_lines = ['SQL profile: {} distinct statement(s), {} execution(s), {:.1f} ms in total, '
+                      '{} with full table scans'.format(len(this_summary), sum(x['COUNT'] for x in this_summary),
+                                                        sum(x['TOTAL_MS'] for x in this_summary),
+                                                        sum(1 for x in this_summary if x['FULL_SCANS']))]
+        for this_rank, this_item in enumerate(this_summary, 1):
+            that_lines.append('')
+            that_lines.append('#{} count={} total={:.2f}ms p50={:.3f}ms p95={:.3f}ms p99={:.3f}ms max={:.3f}ms '
+                              'rows={}{}'.format(this_rank, this_item['COUNT'], this_item['TOTAL_MS'],
+                                                 this_item['P50_MS'], this_item['P95_MS'], this_item['P99_MS'],
+                                                 this_item['MAX_MS'], this_item['ROWS'],
+                                                 ' FULL SCAN: ' + ', '.join(this_item['FULL_SCANS'])
+                                                 if this_item['FULL_SCANS'] else ''))
+            that_lines.append('    ' + this_item['STATEMENT'])
+            that_lines.extend('    | ' + x for x in this_item['PLAN'])
+        return '\n'.join(that_lines) + '\n'
+
+    def dump(self, v_report_file=None):
+        """The :function: dump is used to write :function: report to a file.
+
+        Args:
+            v_report_file (str): output file, default to the file given to :function: enable.
+
+        Returns: :str: the file written.
+
+        """
+        this_file = v_report_file or self.report_file
+        with open(this_file, 'w') as wf:
+            wf.write(self.report())
+        self.logger.info(f'SQL profile written to {this_file} ...')
+        return this_file
+
+    def _dump_at_exit(self):
+        """Write the report at process exit when profiling was enabled and a report file is set."""
+        if self.report_file is None or not self._statements:
+            return
+        try:
+            self.dump()
+        except Exception as e:
+            self.logger.error('Failed to write SQL profile -> ' + str(e))
+
+
+SQL_PROFILER = SQLProfiler()
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """
+    The :class: ProfiledCursor times every execute and the fetches of its result into :data: SQL_PROFILER.
+    """
+    _record = None
+
+    def _timed(self, v_method, v_sql, v_params, v_explain_params=None):
+        this_record = SQL_PROFILER.start(self.connection, v_sql,
+                                         v_params if v_explain_params is None else v_explain_params)
+        this_start = time.perf_counter()
+        try:
+            return v_method(self, v_sql, v_params)
+        finally:
+            this_record[0] += time.perf_counter() - this_start
+            self._record = this_record
+
+    def execute(self, v_sql, v_params=()):
+        return self._timed(sqlite3.Cursor.execute, v_sql, v_params)
+
+    def executemany(self, v_sql, v_seq_of_params):
+        # the plan is explained with the first parameter row, which is chained back in front of the others
+        this_params = iter(v_seq_of_params)
+        this_first = list(itertools.islice(this_params, 1))
+        return self._timed(sqlite3.Cursor.executemany, v_sql, itertools.chain(this_first, this_params),
+                           this_first[0] if this_first else ())
+
+    def executescript(self, v_sql_script):
+        this_record = SQL_PROFILER.start(self.connection, v_sql_script)
+        this_start = time.perf_counter()
+        try:
+            return sqlite3.Cursor.executescript(self, v_sql_script)
+        finally:
+            this_record[0] += time.perf_counter() - this_start
+            self._record = this_record
+
+    def _fetched(self, v_method, *args):
+        this_start = time.perf_counter()
+        this_rows = v_method(self, *args)
+        if self._record is not None:
+            self._record[0] += time.perf_counter() - this_start
+            self._record[1] += len(this_rows) if isinstance(this_rows, list) else int(this_rows is not None)
+        return this_rows
+
+    def fetchone(self):
+        return self._fetched(sqlite3.Cursor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._fetched(sqlite3.Cursor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._fetched(sqlite3.Cursor.fetchall)
+
+    def __next__(self):
+        this_start = time.perf_counter()
+        try:
+            this_row = sqlite3.Cursor.__next__(self)
+        finally:
+            if self._record is not None:
+                self._record[0] += time.perf_counter() - this_start
+        if self._record is not None:
+            self._record[1] += 1
+        return this_row
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """
+    The :class: ProfiledConnection is a sqlite3 connection whose cursors are :class: ProfiledCursor.
+    """
+    def cursor(self, factory=ProfiledCursor):
+        return sqlite3.Connection.cursor(self, factory)
+
+    def execute(self, v_sql, v_params=()):
+        return self.cursor().execute(v_sql, v_params)
+
+    def executemany(self, v_sql, v_seq_of_params):
+        return self.cursor().executemany(v_sql, v_seq_of_params)
+
+    def executescript(self, v_sql_script):
+        return self.cursor().executescript(v_sql_script)
@@ -0,0 +1,360 @@
+"""
+This module is used to generate a deterministic synthetic portfolio at a configurable scale.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    The generator writes equity.db, fixed_income.db and others.json with the same schema, views, triggers and
+    indexes as :function: DbCommands.restore, so every job of main.py runs on them unchanged. The same scale and seed
+    always give the same files: every input is drawn from its own seeded random.Random in a fixed order, and dates
+    are spread over DATE_RANGE by row number instead of the current date.
+    Transactions are streamed into SQLite by executemany in one transaction, so the 5 million rows of the 'large'
+    scale are never held in memory at once. A SELL never exceeds the units its account holds in the symbol, so the
+    holdings of every account, and of every symbol, stay non-negative.
+    About a third of the symbols are ETFs, the symbols of templates/fund_catalog.json first, so the fund catalog and
+    the watch_list CATEGORY fallback are both exercised by the allocation reports.
+
+Examples:
+    -- Write the 'small' portfolio into databases/ of a scratch directory:
+        from src.synthetic_portfolio import SyntheticPortfolio
+        this_portfolio = SyntheticPortfolio('small', v_seed=0)
+        this_portfolio.write('/tmp/bench/databases')
+
+    -- Scale presets with overrides:
+        from src.synthetic_portfolio import parse_scale
+        parse_scale('large,transactions=1000000')
+
+"""
+
+import os
+import json
+import random
+from datetime import datetime, timedelta
+from collections import OrderedDict
+
+from .logger import UseLogging
+from .eq_SQLite_utility import SQLiteRequest
+from .fixed_SQLite_utility import FixedSQLiteRequest
+
+
+# scale name -> number of rows of every generated input
+SCALES = OrderedDict([
+    ('tiny', OrderedDict([('SYMBOLS', 20), ('TRANSACTIONS', 500), ('ACCOUNTS', 4), ('BONDS', 40), ('OTHERS', 8)])),
+    ('small', OrderedDict([('SYMBOLS', 200), ('TRANSACTIONS', 20000), ('ACCOUNTS', 20), ('BONDS', 1000),
+                           ('OTHERS', 50)])),
+    ('medium', OrderedDict([('SYMBOLS', 2000), ('TRANSACTIONS', 500000), ('ACCOUNTS', 100), ('BONDS', 10000),
+                            ('OTHERS', 200)])),
+    ('large', OrderedDict([('SYMBOLS', 10000), ('TRANSACTIONS', 5000000), ('ACCOUNTS', 200), ('BONDS', 50000),
+                           ('OTHERS', 1000)]))
+])
+DATE_RANGE = ('2010-01-04', '2025-12-31')
+ETF_RATIO = 0.3
+SELL_RATIO = 0.3
+# watch_list CATEGORY of the ETFs missing from the fund catalog
+ETF_CATEGORIES = ['Large Blend', 'Large Growth', 'Large Value', 'Mid-Cap Blend', 'Small Blend',
+                  'Foreign Large Blend', 'Diversified Emerging Mkts', 'Intermediate Core Bond', 'Real Estate']
+# fixed income INVESTMENT_TYPE -> (term range in months, rate range, rate column)
+BOND_TYPES = OrderedDict([
+    ('CD', ((3, 60), (0.005, 0.055), 'APR')),
+    ('TREASURY', ((1, 360), (0.001, 0.05), 'YTM')),
+    ('CORP BOND', ((12, 360), (0.02, 0.07), 'YTM')),
+    ('HIGHYIELD', ((12, 120), (0.05, 0.11), 'YTM')),
+    ('TIPS', ((60, 360), (0.0, 0.025), 'YTM'))
+])
+
+
+def parse_scale(v_scale):
+    """The :function: parse_scale is used to read a scale preset name with optional row count overrides.
+
+    Args:
+        v_scale (str/dict): 'small', 'large,transactions=1000000' or 'symbols=500,accounts=10' (on top of 'small'),
+            or a dict of row counts on top of 'small'.
+
+    Returns: :object: OrderedDict of SYMBOLS, TRANSACTIONS, ACCOUNTS, BONDS and OTHERS.
+
+    """
+    if isinstance(v_scale, dict):
+        this_base, this_overrides = 'small', list(v_scale.items())
+    elif isinstance(v_scale, str) and v_scale.strip():
+        this_parts = [x.strip() for x in v_scale.split(',') if x.strip()]
+        this_base = 'small' if '=' in this_parts[0] else this_parts.pop(0).lower()
+        this_overrides = [x.split('=', 1) for x in this_parts]
+    else:
+        raise IOError('Error in parse_scale(): input :v_scale: is not valid -> expect str/dict, got {}: {}'.format(
+            str(type(v_scale)), str(v_scale)))
+    if this_base not in SCALES:
+        raise IOError('Error in parse_scale(): scale is not valid -> expect {}, got {}'.format(
+            '/'.join(SCALES), this_base))
+    that_scale = OrderedDict(SCALES[this_base])
+    for this_override in this_overrides:
+        if len(this_override) != 2 or str(this_override[0]).strip().upper() not in that_scale:
+            raise IOError('Error in parse_scale(): override is not valid -> expect {}=n, got {}'.format(
+                '/'.join(x.lower() for x in that_scale), '='.join(str(x) for x in this_override)))
+        try:
+            this_value = int(this_override[1])
+        except ValueError:
+            this_value = -1
+        if this_value < 1:
+            raise IOError('Error in parse_scale(): override is not valid -> expect positive int, got {}'.format(
+                '='.join(str(x) for x in this_override)))
+        that_scale[str(this_override[0]).strip().upper()] = this_value
+    return that_scale
+
+
+def _ticker(v_prefix, v_index):
+    """Deterministic ticker of 4 letters after v_prefix, unique for v_index < 26 ** 4."""
+    this_letters = []
+    for _ in range(4):
+        v_index, this_remainder = divmod(v_index, 26)
+        this_letters.append(chr(ord('A') + this_remainder))
+    return v_prefix + ''.join(reversed(this_letters))
+
+
+class SyntheticPortfolio(object):
+    """
+    The :class: SyntheticPortfolio can be used to write equity.db, fixed_income.db and others.json of any size.
+    """
+    def __init__(self, v_scale='small', v_seed=0, v_catalog_file='templates/fund_catalog.json'):
+        """
+        constructor for :class: SyntheticPortfolio.
+
+        Args:
+            v_scale (str/dict): scale preset with optional overrides, see :function: parse_scale.
+            v_seed (int): seed of the random generator, default to 0.
+            v_catalog_file (str): fund catalog whose symbols are used as the first ETFs, skipped when missing.
+
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        if not isinstance(v_seed, int) or isinstance(v_seed, bool):
+            raise IOError('Error in SyntheticPortfolio(): input :v_seed: is not valid -> expect int, '
+                          'got {}: {}'.format(str(type(v_seed)), str(v_seed)))
+        self.scale = parse_scale(v_scale)
+        self.seed = v_seed
+        self.catalog_file = v_catalog_file
+        self._start_date = datetime.strptime(DATE_RANGE[0], '%Y-%m-%d')
+        self._span_days = (datetime.strptime(DATE_RANGE[1], '%Y-%m-%d') - self._start_date).days
+
+    def _random(self, v_stream):
+        """Random generator of one input, so the rows of one input do not depend on the size of another."""
+        return random.Random('{}:{}'.format(self.seed, v_stream))
+
+    def _date(self, v_index, v_count):
+        """Date of row v_index out of v_count, ascending over DATE_RANGE."""
+        return self._start_date + timedelta(days=v_index * self._span_days // max(v_count, 1))
+
+    def accounts(self):
+        """The :function: accounts is used to get the account names.
+
+        Returns: :list: of str.
+
+        """
+        return ['ACCOUNT_{:03d}'.format(x + 1) for x in range(self.scale['ACCOUNTS'])]
+
+    def _catalog_funds(self):
+        """Funds of the fund catalog as (SYMBOL, FULL_NAME, MAJOR_TYPE), empty when the catalog is missing."""
+        if not self.catalog_file or not os.path.exists(self.catalog_file):
+            return []
+        with open(self.catalog_file, 'r') as rf:
+            return [(x['SYMBOL'], x['FULL_NAME'], x['MAJOR_TYPE']) for x in json.load(rf)['FUNDS']]
+
+    def symbols(self):
+        """The :function: symbols is used to get every symbol with its type, name, base price and yearly growth.
+
+        Returns: :list: of tuple (SYMBOL, INVESTMENT_TYPE, DESCRIPTION, CATEGORY, BASE_PRICE, GROWTH).
+
+        """
+        this_random = self._random('symbols')
+        this_etf_count = min(self.scale['SYMBOLS'], max(1, int(round(self.scale['SYMBOLS'] * ETF_RATIO))))
+        this_funds = self._catalog_funds()[:this_etf_count]
+        that_symbols = [(x[0], 'ETF', x[1], '') for x in this_funds]
+        for i in range(this_etf_count - len(this_funds)):
+            this_symbol = _ticker('E', i)
+            that_symbols.append((this_symbol, 'ETF', 'Synthetic ETF ' + this_symbol,
+                                 ETF_CATEGORIES[i % len(ETF_CATEGORIES)]))
+        for i in range(self.scale['SYMBOLS'] - this_etf_count):
+            this_symbol = _ticker('S', i)
+            that_symbols.append((this_symbol, 'stock', 'Synthetic Stock ' + this_symbol, ''))
+        return [x + (round(this_random.uniform(5.0, 500.0), 2), this_random.uniform(0.95, 1.15))
+                for x in that_symbols]
+
+    def iter_transactions(self):
+        """The :function: iter_transactions is used to generate the rows of equity :table: transactions.
+
+        Returns: :generator: of tuple (SYMBOL, TYPE, DATE, DOLLARS, UNITS, INVESTMENT_TYPE, DESCRIPTION, ACCOUNT,
+            TOTAL_DOLLARS), in ascending DATE.
+
+        """
+        this_random = self._random('transactions')
+        this_symbols = self.symbols()
+        this_accounts = self.accounts()
+        this_count = self.scale['TRANSACTIONS']
+        # units held per account and symbol, keyed by account index * symbol count + symbol index
+        this_held = {}
+        for i in range(this_count):
+            this_date = self._date(i, this_count)
+            this_account = this_random.randrange(len(this_accounts))
+            this_index = this_random.randrange(len(this_symbols))
+            this_key = this_account * len(this_symbols) + this_index
+            this_units = this_held.get(this_key, 0)
+            if this_units > 0 and this_random.random() < SELL_RATIO:
+                this_type = 'SELL'
+                this_delta = this_random.randint(1, this_units)
+                this_held[this_key] = this_units - this_delta
+            else:
+                this_type = 'BUY'
+                this_delta = this_random.randint(1, 200)
+                this_held[this_key] = this_units + this_delta
+            this_symbol, this_investment_type, this_description, _, this_base, this_growth = this_symbols[this_index]
+            this_price = round(this_base * this_growth ** ((this_date - self._start_date).days / 365.0) *
+                               this_random.uniform(0.95, 1.05), 2)
+            yield (this_symbol, this_type, this_date.strftime('%Y-%m-%d'), this_price, this_delta,
+                   this_investment_type, this_description, this_accounts[this_account],
+                   round(this_price * this_delta, 2))
+
+    def iter_bonds(self):
+        """The :function: iter_bonds is used to generate the rows of fixed income :table: transactions.
+
+        Returns: :generator: of tuple (NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, TOTAL_DOLLARS, ADD_DATE,
+            END_DATE, TOTAL_COST, APR, YTM, ACCOUNT).
+
+        """
+        this_random = self._random('bonds')
+        this_accounts = self.accounts()
+        this_types = list(BOND_TYPES)
+        this_count = self.scale['BONDS']
+        for i in range(this_count):
+            this_type = this_types[this_random.randrange(len(this_types))]
+            (this_min_term, this_max_term), (this_min_rate, this_max_rate), this_rate_column = BOND_TYPES[this_type]
+            this_add_date = self._date(i, this_count)
+            this_end_date = this_add_date + timedelta(days=30 * this_random.randint(this_min_term, this_max_term))
+            this_rate = round(this_random.uniform(this_min_rate, this_max_rate), 4)
+            if this_type == 'CD':
+                this_face_value, this_units = 1.0, 1000 * this_random.randint(1, 100)
+                this_symbol = 'n/a'
+            else:
+                this_face_value, this_units = 100.0, this_random.randint(1, 500)
+                this_symbol = '9128{:05d}'.format(i)
+            this_total_dollars = this_face_value * this_units
+            this_total_cost = round(this_total_dollars * this_random.uniform(0.95, 1.02), 2)
+            yield ('{} {:.2%} {}'.format(this_type, this_rate, this_end_date.strftime('%m/%Y')), this_symbol,
+                   this_type, this_units, this_face_value, this_total_dollars, this_add_date.strftime('%Y-%m-%d'),
+                   this_end_date.strftime('%Y-%m-%d'), this_total_cost,
+                   this_rate if this_rate_column == 'APR' else 0.0, this_rate if this_rate_column == 'YTM' else 0.0,
+                   this_accounts[this_random.randrange(len(this_accounts))])
+
+    def others(self):
+        """The :function: others is used to generate the Cash Equivalent and Mutual Fund rows of others.json.
+
+        Returns: :list: of dict with SUFFIX, DESCRIPTION, MAJOR_TYPE, MINOR_TYPE, DOLLARS and ACCOUNT.
+
+        """
+        this_random = self._random('others')
+        this_accounts = self.accounts()
+        this_funds = [x for x in self._catalog_funds() if x[2] == 'FIXED_INCOME']
+        that_output = []
+        for i in range(self.scale['OTHERS']):
+            this_account = this_accounts[this_random.randrange(len(this_accounts))]
+            this_dollars = round(this_random.uniform(100.0, 250000.0), 2)
+            if this_funds and i % 2 == 1:
+                this_fund = this_funds[this_random.randrange(len(this_funds))]
+                that_output.append({'SUFFIX': this_fund[0], 'DESCRIPTION': this_fund[1], 'MAJOR_TYPE': 'FIXED_INCOME',
+                                    'MINOR_TYPE': 'Mutual Fund', 'DOLLARS': this_dollars, 'ACCOUNT': this_account})
+            else:
+                that_output.append({'SUFFIX': 'n/a', 'DESCRIPTION': 'Cash Sweep {}'.format(i + 1),
+                                    'MAJOR_TYPE': 'Cash Equivalent', 'MINOR_TYPE': 'Cash', 'DOLLARS': this_dollars,
+                                    'ACCOUNT': this_account})
+        return that_output
+
+    def write_equity(self, v_db_file):
+        """The :function: write_equity is used to create equity.db with every table of a restore and its transactions.
+
+        Args:
+            v_db_file (str): database file to create, it must not exist.
+
+        Returns: :int: number of transactions written.
+
+        """
+        this_instance = SQLiteRequest(v_db_file)
+        this_instance.create_database()
+        this_instance.create_table_transactions()
+        this_instance.create_table_watch_list()
+        this_instance.create_table_holdings()
+        this_instance.create_view_positions()
+        this_instance.create_table_materialized_positions()
+        this_instance.create_table_cumulative_holdings()
+        this_instance.create_table_price_history()
+        this_instance.create_table_daily_valuation()
+        self.logger.info('Writing {} synthetic transactions into {} ...'.format(self.scale['TRANSACTIONS'], v_db_file))
+        this_conn = this_instance._create_connection()
+        try:
+            this_cursor = this_conn.cursor()
+            this_cursor.executemany('INSERT INTO transactions (SYMBOL, TYPE, DATE, DOLLARS, UNITS, INVESTMENT_TYPE, '
+                                    'DESCRIPTION, ACCOUNT, TOTAL_DOLLARS) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);',
+                                    self.iter_transactions())
+            this_conn.commit()
+        finally:
+            this_conn.close()
+        # rows written in bulk bypass the per-insert refresh, rebuild it once as a restore does
+        this_instance.sync_table_cumulative_holdings()
+        return self.scale['TRANSACTIONS']
+
+    def write_fixed(self, v_db_file):
+        """The :function: write_fixed is used to create fixed_income.db with its bond transactions.
+
+        Args:
+            v_db_file (str): database file to create, it must not exist.
+
+        Returns: :int: number of bonds written.
+
+        """
+        this_instance = FixedSQLiteRequest(v_db_file)
+        this_instance.create_database()
+        this_instance.create_table_transactions_fixed()
+        this_instance.create_view_positions_fixed()
+        self.logger.info('Writing {} synthetic bonds into {} ...'.format(self.scale['BONDS'], v_db_file))
+        this_conn = this_instance._create_connection()
+        try:
+            this_cursor = this_conn.cursor()
+            this_cursor.executemany('INSERT INTO transactions (NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, '
+                                    'TOTAL_DOLLARS, ADD_DATE, END_DATE, TOTAL_COST, APR, YTM, ACCOUNT) '
+                                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);', self.iter_bonds())
+            this_conn.commit()
+        finally:
+            this_conn.close()
+        return self.scale['BONDS']
+
+    def write(self, v_directory='databases'):
+        """The :function: write is used to write equity.db, fixed_income.db and others.json into v_directory.
+
+        Args:
+            v_directory (str): output directory, created when missing, existing files are never overwritten.
+
+        Returns: :object: OrderedDict of output name -> rows written.
+
+        """
+        this_existing = [x for x in ['equity.db', 'fixed_income.db', 'others.json'] if os.path.exists(os.path.join(v_directory, x))]
+        if this_existing:
+            raise IOError('Error in SyntheticPortfolio.write(): {} already exist in {}, expect an empty '
+                          'directory'.format(', '.join(this_existing), v_directory))
+        os.makedirs(v_directory, exist_ok=True)
+        self.logger.info('Generating synthetic portfolio (seed={}, {}) into {} ...'.format(
+            self.seed, ', '.join('{}={}'.format(k, v) for k, v in self.scale.items()), v_directory))
+        try:
+            that_output = OrderedDict()
+            that_output['TRANSACTIONS'] = self.write_equity(os.path.join(v_directory, 'equity.db'))
+            that_output['BONDS'] = self.write_fixed(os.path.join(v_directory, 'fixed_income.db'))
+            this_others = self.others()
+            with open(os.path.join(v_directory, 'others.json'), 'w') as wf:
+                json.dump(this_others, wf, indent=1)
+            that_output['OTHERS'] = len(this_others)
+        except Exception as e:
+            self.logger.error('Failed to generate synthetic portfolio into {} -> {}'.format(v_directory, str(e)))
+            raise e
+        return that_output
@@ -0,0 +1,285 @@
+"""
+This module is used to time nested stages of the update and overview pipelines with lightweight spans.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - none
+
+    A span is one timed stage: :function: Tracer.span is a context manager and :function: traced decorates a
+    function or method with a span named after it. Spans opened inside another span on the same thread become its
+    children, and :function: Tracer.propagate carries the current span into worker threads, so reports computed on
+    the overview thread pool are nested under the stage that submitted them. Timings use the monotonic
+    time.perf_counter clock.
+    The tracer is opt-in: once enabled, every finished span is kept in memory, :function: Tracer.dump appends them
+    to a JSON-lines file (one object per span, tagged with the RUN_ID of this process, so the same file accumulates
+    the latency of every stage over time) and :function: Tracer.summary_tree aggregates them per path as text.
+    A disabled tracer costs one attribute lookup per decorated call.
+
+Examples:
+    -- Enable tracing for this process:
+        from src.tracing import TRACER
+        TRACER.enable('logs/trace.jsonl')
+
+    -- Time a stage, nested stages become its children:
+        with TRACER.span('DbCommands.update'):
+            with TRACER.span('quote', SYMBOL='VOO'):
+                ...
+
+    -- Time every call of a function:
+        from src.tracing import traced
+
+        @traced()
+        def sync_table_holdings(self):
+            ...
+
+    -- Write the trace and print the summary:
+        TRACER.dump()
+        print(TRACER.summary_tree())
+
+"""
+
+import json
+import functools
+import itertools
+import threading
+import time
+from datetime import datetime
+from contextlib import contextmanager
+
+from .logger import UseLogging
+
+
+class Tracer(object):
+    """
+    The :class: Tracer can be used to collect hierarchical timing spans.
+    """
+    def __init__(self):
+        """
+        constructor for :class: Tracer.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.enabled = False
+        self.trace_file = None
+        self.run_id = None
+        self._spans = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._origin = time.perf_counter()
+
+    def enable(self, v_trace_file='logs/trace.jsonl'):
+        """The :function: enable is used to record every span opened from now on.
+
+        Args:
+            v_trace_file (str): JSON-lines file :function: dump appends to, None to keep the spans in memory only.
+
+        """
+        self.enabled = True
+        self.trace_file = v_trace_file
+        self.run_id = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.%f')
+        self._origin = time.perf_counter()
+        self.logger.info(f'Tracing enabled, spans are appended to {v_trace_file} ...')
+
+    def disable(self):
+        """The :function: disable is used to stop recording new spans, finished spans are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """The :function: reset is used to drop every finished span."""
+        with self._lock:
+            self._spans = []
+
+    def _stack(self):
+        """Get the stack of open spans of the current thread."""
+        this_stack = getattr(self._local, 'stack', None)
+        if this_stack is None:
+            this_stack = self._local.stack = []
+        return this_stack
+
+    def current(self):
+        """The :function: current is used to get the innermost open span of the current thread, None if any."""
+        this_stack = self._stack()
+        return this_stack[-1] if this_stack else None
+
+    @contextmanager
+    def span(self, v_name, **kwargs):
+        """The :function: span is used to time the enclosed block as a child of the current span.
+
+        Args:
+            v_name (str): stage name.
+            kwargs: attributes kept with the span, e.g. SYMBOL='VOO'.
+
+        Returns: :dict: the span record, None when the tracer is disabled.
+
+        """
+        if not self.enabled:
+            yield None
+            return
+        this_stack = self._stack()
+        this_parent = this_stack[-1] if this_stack else None
+        this_span = {
+            'SPAN_ID': next(self._ids),
+            'PARENT_ID': this_parent['SPAN_ID'] if this_parent else None,
+            'NAME': v_name,
+            'PATH': (this_parent['PATH'] if this_parent else ()) + (v_name,),
+            'THREAD': threading.current_thread().name,
+            'ATTRIBUTES': kwargs,
+            'ERROR': None}
+        this_stack.append(this_span)
+        this_start = time.perf_counter()
+        try:
+            yield this_span
+        except BaseException as e:
+            this_span['ERROR'] = type(e).__name__
+            raise
+        finally:
+            this_end = time.perf_counter()
+            this_stack.pop()
+            this_span['START_MS'] = (this_start - self._origin) * 1000
+            this_span['DURATION_MS'] = (this_end - this_start) * 1000
+            with self._lock:
+                self._spans.append(this_span)
+
+    def propagate(self, v_callable):
+        """The :function: propagate is used to run a callable on another thread as a child of the current span.
+
+        Args:
+            v_callable (callable): function submitted to a thread pool.
+
+        Returns: :callable: the same callable when the tracer is disabled or no span is open.
+
+        """
+        this_parent = self.current() if self.enabled else None
+        if this_parent is None:
+            return v_callable
+
+        @functools.wraps(v_callable)
+        def this_wrapper(*args, **kwargs):
+            this_stack = self._stack()
+            this_stack.append(this_parent)
+            try:
+                return v_callable(*args, **kwargs)
+            finally:
+                this_stack.pop()
+        return this_wrapper
+
+    def records(self):
+        """The :function: records is used to get every finished span, in order of start.
+
+        Returns: :list: of dictionary with keys RUN_ID, SPAN_ID, PARENT_ID, NAME, PATH, DEPTH, THREAD, START_MS,
+            DURATION_MS, ATTRIBUTES, ERROR.
+
+        """
+        with self._lock:
+            this_spans = sorted(self._spans, key=lambda x: (x['START_MS'], x['SPAN_ID']))
+        return [{'RUN_ID': self.run_id,
+                 'SPAN_ID': x['SPAN_ID'],
+                 'PARENT_ID': x['PARENT_ID'],
+                 'NAME': x['NAME'],
+                 'PATH': '/'.join(x['PATH']),
+                 'DEPTH': len(x['PATH']) - 1,
+                 'THREAD': x['THREAD'],
+                 'START_MS': round(x['START_MS'], 3),
+                 'DURATION_MS': round(x['DURATION_MS'], 3),
+                 'ATTRIBUTES': x['ATTRIBUTES'],
+                 'ERROR': x['ERROR']} for x in this_spans]
+
+    def summary(self):
+        """The :function: summary is used to aggregate finished spans by path, parents before their children.
+
+        Returns: :list: of dictionary with keys PATH, NAME, DEPTH, COUNT, TOTAL_MS, MEAN_MS, MAX_MS, ERRORS.
+
+        """
+        with self._lock:
+            this_spans = list(self._spans)
+        this_paths = {}
+        for this_span in this_spans:
+            this_item = this_paths.setdefault(this_span['PATH'], {'FIRST': this_span['START_MS'], 'DURATIONS': [],
+                                                                  'ERRORS': 0})
+            this_item['FIRST'] = min(this_item['FIRST'], this_span['START_MS'])
+            this_item['DURATIONS'].append(this_span['DURATION_MS'])
+            this_item['ERRORS'] += int(this_span['ERROR'] is not None)
+
+        def this_order(v_path):
+            # a path sorts by the first start of each of its prefixes, which puts every child under its parent
+            return tuple(this_paths[v_path[:i]]['FIRST'] if v_path[:i] in this_paths else 0.0
+                         for i in range(1, len(v_path) + 1))
+        that_output = []
+        for this_path in sorted(this_paths, key=this_order):
+            this_durations = this_paths[this_path]['DURATIONS']
+            that_output.append({
+                'PATH': '/'.join(this_path),
+                'NAME': this_path[-1],
+                'DEPTH': len(this_path) - 1,
+                'COUNT': len(this_durations),
+                'TOTAL_MS': sum(this_durations),
+                'MEAN_MS': sum(this_durations) / len(this_durations),
+                'MAX_MS': max(this_durations),
+                'ERRORS': this_paths[this_path]['ERRORS']})
+        return that_output
+
+    def summary_tree(self):
+        """The :function: summary_tree is used to format :function: summary as an indented tree.
+
+        Returns: :str:
+
+        """
+        this_summary = self.summary()
+        this_width = max([len(x['NAME']) + 2 * x['DEPTH'] for x in this_summary] + [5])
+        that_lines = ['Trace summary: {} span(s) on {} path(s)'.format(sum(x['COUNT'] for x in this_summary),
+                                                                      len(this_summary)),
+                      '{:<{}}  {:>6}  {:>11}  {:>10}  {:>10}'.format('STAGE', this_width, 'COUNT', 'TOTAL_MS',
+                                                                    'MEAN_MS', 'MAX_MS')]
+        for this_item in this_summary:
+            that_lines.append('{:<{}}  {:>6}  {:>11.1f}  {:>10.1f}  {:>10.1f}{}'.format(
+                '  ' * this_item['DEPTH'] + this_item['NAME'], this_width, this_item['COUNT'], this_item['TOTAL_MS'],
+                this_item['MEAN_MS'], this_item['MAX_MS'],
+                '  ({} failed)'.format(this_item['ERRORS']) if this_item['ERRORS'] else ''))
+        return '\n'.join(that_lines) + '\n'
+
+    def dump(self, v_trace_file=None):
+        """The :function: dump is used to append every finished span to a JSON-lines file.
+
+        Args:
+            v_trace_file (str): output file, default to the file given to :function: enable.
+
+        Returns: :str: the file written.
+
+        """
+        this_file = v_trace_file or self.trace_file
+        with open(this_file, 'a') as wf:
+            for this_record in self.records():
+                wf.write(json.dumps(this_record, default=str) + '\n')
+        self.logger.info(f'Trace appended to {this_file} ...')
+        return this_file
+
+
+TRACER = Tracer()
+
+
+def traced(v_name=None):
+    """The :function: traced is used to decorate a function with a span of :data: TRACER.
+
+    Args:
+        v_name (str): span name, default to the qualified name of the function, e.g. 'SQLiteRequest.get_positions'.
+
+    Returns: :callable: decorator.
+
+    """
+    def this_decorator(v_function):
+        this_name = v_name or v_function.__qualname__
+
+        @functools.wraps(v_function)
+        def this_wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return v_function(*args, **kwargs)
+            with TRACER.span(this_name):
+                return v_function(*args, **kwargs)
+        return this_wrapper
+    return this_decorator
@@ -0,0 +1,320 @@
+"""
+This module is used to build the daily market value time series for equity holdings.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    This module depend on following third party library:
+     - pandas v0.25.0
+     - numpy
+
+    The series is computed as a date x (ACCOUNT, SYMBOL) units matrix (cumulative sum of signed transaction units)
+    multiplied element-wise by a date x SYMBOL close price matrix (forward-filled from :table: price_history), then
+    aggregated by (ACCOUNT, ASSET_CLASS) with a single matrix product.
+
+Examples:
+    -- Initialize class:
+        from src.valuation import PortfolioValuation
+        this_instance = PortfolioValuation()
+
+    -- Get daily market value by ACCOUNT and ASSET_CLASS, served from :table: daily_valuation when possible:
+        this_instance.get_daily_values('2020-01-01', '2020-12-31')
+
+    -- Compute daily market value without touching the cache:
+        this_instance.compute_daily_values('2020-01-01', '2020-12-31')
+
+"""
+
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+
+from .logger import UseLogging
+from .eq_SQLite_utility import SQLiteRequest
+from .fund_catalog import FundCatalog
+
+
+def _to_days(v_dates):
+    """Convert an iterable of 'YYYY-MM-DD' strings into numpy datetime64[D]."""
+    return pd.to_datetime(pd.Series(v_dates, dtype=object)).values.astype('datetime64[D]')
+
+
+def build_units_matrix(v_dates, v_trans_dates, v_key_codes, v_signed_units, v_number_of_keys):
+    """Build the date x key matrix of units held at the end of each date.
+
+    Transactions dated before v_dates[0] are folded into the first row, transactions dated after v_dates[-1]
+    are ignored.
+
+    Args:
+        v_dates (np.ndarray): sorted datetime64[D] calendar.
+        v_trans_dates (np.ndarray): datetime64[D] date of each transaction.
+        v_key_codes (np.ndarray): integer column of each transaction.
+        v_signed_units (np.ndarray): units of each transaction, negative for SELL.
+        v_number_of_keys (int): number of columns.
+
+    Returns:
+        :np.ndarray: float matrix of shape (len(v_dates), v_number_of_keys).
+
+    """
+    this_rows = np.searchsorted(v_dates, v_trans_dates, side='left')
+    this_mask = this_rows < len(v_dates)
+    that_delta = np.zeros((len(v_dates), v_number_of_keys))
+    np.add.at(that_delta, (this_rows[this_mask], v_key_codes[this_mask]), v_signed_units[this_mask])
+    return np.cumsum(that_delta, axis=0)
+
+
+def build_price_matrix(v_dates, v_price_dates, v_symbol_codes, v_prices, v_number_of_symbols):
+    """Build the date x symbol matrix of the last known close price at each date.
+
+    Prices dated before v_dates[0] seed the first row, so the latest one per symbol carries forward.
+
+    Args:
+        v_dates (np.ndarray): sorted datetime64[D] calendar.
+        v_price_dates (np.ndarray): datetime64[D] date of each price, sorted ascending.
+        v_symbol_codes (np.ndarray): integer column of each price.
+        v_prices (np.ndarray): close prices.
+        v_number_of_symbols (int): number of columns.
+
+    Returns:
+        :np.ndarray: float matrix of shape (len(v_dates), v_number_of_symbols), NaN before the first price.
+
+    """
+    this_rows = np.clip(np.searchsorted(v_dates, v_price_dates, side='right') - 1, 0, None)
+    this_mask = v_price_dates <= v_dates[-1]
+    that_matrix = np.full((len(v_dates), v_number_of_symbols), np.nan)
+    # prices are sorted by date, so the last assignment to a cell is the latest price for that cell
+    this_flat = this_rows[this_mask] * v_number_of_symbols + v_symbol_codes[this_mask]
+    this_last = len(this_flat) - 1 - np.unique(this_flat[::-1], return_index=True)[1]
+    that_matrix.flat[this_flat[this_last]] = v_prices[this_mask][this_last]
+    return pd.DataFrame(that_matrix).ffill().values
+
+
+def set_asset_class(v_symbols, v_investment_types, v_category_loader=None):
+    """Vectorized ASSET_CLASS for equity holdings: 'Individual Stock', fund catalog class, watch_list CATEGORY or
+    'Others'."""
+    this_symbols = pd.Series(v_symbols, dtype=object).reset_index(drop=True)
+    this_investment_types = pd.Series(v_investment_types, dtype=object).str.lower().values
+    that_result = np.full(len(this_symbols), 'Others', dtype=object)
+    that_result[this_investment_types == 'stock'] = 'Individual Stock'
+    this_is_fund = this_investment_types != 'stock'
+    if this_is_fund.any():
+        that_result[this_is_fund] = FundCatalog().classify(this_symbols[this_is_fund],
+                                                           v_category_loader)['ASSET_CLASS'].values
+    return that_result
+
+
+class PortfolioValuation(object):
+    """
+    The :class: PortfolioValuation can be used to get the daily market value of equity holdings.
+    """
+    def __init__(self, v_db_file='databases/equity.db'):
+        """
+        constructor for :class: PortfolioValuation.
+        """
+        _logger_ref = UseLogging(__name__)
+        self.logger = _logger_ref.use_loggers('portfolio_management')
+        self.eq_db_file = v_db_file
+        self.cache_name = 'daily_valuation'
+
+    def _get_transactions_data(self):
+        """Read data from :table: transactions in SQLite equity.db, excluding 'others'.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = SQLiteRequest(self.eq_db_file)
+        df = pd.DataFrame(_this_instance.get_table_transactions(),
+                          columns=['ID', 'SYMBOL', 'TYPE', 'DATE', 'DOLLARS', 'UNITS', 'INVESTMENT_TYPE',
+                                   'DESCRIPTION', 'ACCOUNT', 'TOTAL_DOLLARS'])
+        return df[df['INVESTMENT_TYPE'].str.lower() != 'others']
+
+    def _get_price_history_data(self):
+        """Read data from :table: price_history in SQLite equity.db.
+
+        Returns: :object: Pandas dataframe.
+
+        """
+        _this_instance = SQLiteRequest(self.eq_db_file)
+        return pd.DataFrame(_this_instance.get_table_price_history(), columns=['SYMBOL', 'DATE', 'CLOSE'])
+
+    def _get_fund_categories(self):
+        """Read CATEGORY indexed by SYMBOL from :table: watch_list in SQLite equity.db.
+
+        Returns: :object: Pandas series.
+
+        """
+        _this_instance = SQLiteRequest(self.eq_db_file)
+        return pd.DataFrame(_this_instance.get_table_watch_list(), columns=['SYMBOL', 'CATEGORY']).\
+            set_index('SYMBOL')['CATEGORY']
+
+    def compute_daily_values(self, v_start_date=None, v_end_date=None):
+        """Compute the daily market value by ACCOUNT and ASSET_CLASS.
+
+        Args:
+            v_start_date (str): first date in format 'YYYY-MM-DD', default to the first transaction date.
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns DATE, ACCOUNT, ASSET_CLASS, MKT_VALUE (non-zero rows only).
+
+        """
+        self.logger.info('Computing daily market value time series ...')
+        try:
+            df_transactions = self._get_transactions_data()
+            df_prices = self._get_price_history_data()
+            return self._compute_daily_values(df_transactions, df_prices, v_start_date, v_end_date)
+        except Exception as e:
+            self.logger.error('Failed to compute daily market value time series -> ' + str(e))
+            raise e
+
+    def compute_group_values(self, df_transactions, df_prices, v_dates, v_group_by=('ACCOUNT', 'ASSET_CLASS'),
+                             v_trade_prices=False):
+        """Compute the date x group market value matrix from already loaded frames.
+
+        Args:
+            df_transactions (DataFrame): SYMBOL, TYPE, DATE, UNITS, INVESTMENT_TYPE, ACCOUNT, and DOLLARS with
+                v_trade_prices.
+            df_prices (DataFrame): SYMBOL, DATE, CLOSE.
+            v_dates (np.ndarray): sorted datetime64[D] calendar.
+            v_group_by (tuple): columns among ACCOUNT, SYMBOL, ASSET_CLASS to aggregate by.
+            v_trade_prices (bool): use the DOLLARS of every transaction as a price observation too, so a holding
+                is valued from its trade date, :table: price_history wins on the same SYMBOL and DATE. Default to
+                False, only :table: price_history is used.
+
+        Returns:
+            :tuple: (np.ndarray of shape (len(v_dates), number of groups), DataFrame of group labels).
+
+        """
+        # columns of the units matrix are (ACCOUNT, SYMBOL) pairs
+        this_key_codes, df_keys = pd.MultiIndex.from_arrays(
+            [df_transactions['ACCOUNT'].values, df_transactions['SYMBOL'].values]).factorize()
+        df_keys = df_keys.to_frame(index=False, name=['ACCOUNT', 'SYMBOL'])
+        this_signed_units = np.where(df_transactions['TYPE'].str.upper().values == 'SELL',
+                                     -1.0, 1.0) * df_transactions['UNITS'].values.astype(float)
+        this_units = build_units_matrix(v_dates, _to_days(df_transactions['DATE']), this_key_codes,
+                                        this_signed_units, df_keys.shape[0])
+        this_symbols = pd.Index(df_keys['SYMBOL'].unique())
+        df_observed = df_prices[df_prices['SYMBOL'].isin(this_symbols)][['SYMBOL', 'DATE', 'CLOSE']]
+        if v_trade_prices:
+            # trade prices first, the price matrix keeps the last observation of a day
+            df_observed = pd.concat([
+                df_transactions[['SYMBOL', 'DATE', 'DOLLARS']].rename(columns={'DOLLARS': 'CLOSE'}), df_observed
+            ], ignore_index=True)
+        this_observed_days = _to_days(df_observed['DATE'])
+        this_order = np.argsort(this_observed_days, kind='mergesort')
+        this_prices = build_price_matrix(v_dates, this_observed_days[this_order],
+                                         this_symbols.get_indexer(df_observed['SYMBOL'].values[this_order]),
+                                         df_observed['CLOSE'].values.astype(float)[this_order], len(this_symbols))
+        this_values = np.nan_to_num(this_units * this_prices[:, this_symbols.get_indexer(df_keys['SYMBOL'])])
+        if 'ASSET_CLASS' in v_group_by:
+            df_investment_type = df_transactions.groupby('SYMBOL')['INVESTMENT_TYPE'].first()
+            df_keys['ASSET_CLASS'] = set_asset_class(df_keys['SYMBOL'],
+                                                     df_investment_type.reindex(df_keys['SYMBOL']).values,
+                                                     self._get_fund_categories)
+        # aggregate (ACCOUNT, SYMBOL) columns into groups, sorted by group so each one is a contiguous slice
+        this_group_codes, df_groups = pd.MultiIndex.from_frame(df_keys[list(v_group_by)]).factorize()
+        this_order = np.argsort(this_group_codes, kind='mergesort')
+        this_starts = np.searchsorted(this_group_codes[this_order], np.arange(len(df_groups)))
+        return np.add.reduceat(this_values[:, this_order], this_starts, axis=1), \
+            df_groups.to_frame(index=False, name=list(v_group_by))
+
+    def _compute_daily_values(self, df_transactions, df_prices, v_start_date, v_end_date):
+        """Long-format wrapper of compute_group_values() grouped by ACCOUNT and ASSET_CLASS."""
+        that_columns = ['DATE', 'ACCOUNT', 'ASSET_CLASS', 'MKT_VALUE']
+        if df_transactions.shape[0] == 0:
+            return pd.DataFrame(columns=that_columns)
+        this_start = np.datetime64(v_start_date, 'D') if v_start_date else _to_days(df_transactions['DATE']).min()
+        this_end = np.datetime64(v_end_date or datetime.now().strftime('%Y-%m-%d'), 'D')
+        if this_end < this_start:
+            return pd.DataFrame(columns=that_columns)
+        this_dates = np.arange(this_start, this_end + 1, dtype='datetime64[D]')
+        this_group_values, df_groups = self.compute_group_values(df_transactions, df_prices, this_dates)
+        df_output = pd.DataFrame({
+            'DATE': np.repeat(np.datetime_as_string(this_dates), df_groups.shape[0]),
+            'ACCOUNT': np.tile(df_groups['ACCOUNT'].values, len(this_dates)),
+            'ASSET_CLASS': np.tile(df_groups['ASSET_CLASS'].values, len(this_dates)),
+            'MKT_VALUE': np.round(this_group_values.ravel(), 2)
+        })
+        return df_output[df_output['MKT_VALUE'] != 0].reset_index(drop=True)
+
+    def _get_cache_signature(self, v_conn, v_state):
+        """Return the current table signature and the first date invalidated since v_state was stored."""
+        this_cursor = v_conn.cursor()
+        this_max_id = v_state[3] if v_state else -1
+        this_max_rowid = v_state[5] if v_state else -1
+        this_cursor.execute("SELECT COUNT(*), IFNULL(MAX(ID), 0), MIN(CASE WHEN ID > ? THEN DATE END) "
+                            "FROM transactions WHERE LOWER(INVESTMENT_TYPE) <> 'others';", (this_max_id,))
+        this_trans = this_cursor.fetchone()
+        this_cursor.execute("SELECT COUNT(*), IFNULL(MAX(ROWID), 0), MIN(CASE WHEN ROWID > ? THEN DATE END) "
+                            "FROM price_history;", (this_max_rowid,))
+        this_prices = this_cursor.fetchone()
+        that_signature = (this_trans[0], this_trans[1], this_prices[0], this_prices[1])
+        if v_state is None:
+            return that_signature, None
+        this_new_trans = this_cursor.execute("SELECT COUNT(*) FROM transactions WHERE ID > ? "
+                                             "AND LOWER(INVESTMENT_TYPE) <> 'others';",
+                                             (this_max_id,)).fetchone()[0]
+        this_new_prices = this_cursor.execute("SELECT COUNT(*) FROM price_history WHERE ROWID > ?;",
+                                              (this_max_rowid,)).fetchone()[0]
+        if this_trans[0] != v_state[2] + this_new_trans or this_prices[0] > v_state[4] + this_new_prices:
+            # rows were deleted, the whole cache is stale
+            return that_signature, ''
+        this_next_day = (datetime.strptime(v_state[1], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        return that_signature, min([x for x in [this_trans[2], this_prices[2], this_next_day] if x])
+
+    def get_daily_values(self, v_start_date=None, v_end_date=None):
+        """Get the daily market value by ACCOUNT and ASSET_CLASS, extending :table: daily_valuation incrementally.
+
+        Only dates after the cached range, or on/after the earliest date touched by new transactions or prices,
+        are recomputed.
+
+        Args:
+            v_start_date (str): first date in format 'YYYY-MM-DD', default to the first cached date.
+            v_end_date (str): last date in format 'YYYY-MM-DD', default to today.
+
+        Returns: :object: Pandas dataframe with columns DATE, ACCOUNT, ASSET_CLASS, MKT_VALUE.
+
+        """
+        this_end = v_end_date or datetime.now().strftime('%Y-%m-%d')
+        self.logger.info(f'Retrieving daily market value time series up to {this_end} ...')
+        try:
+            _this_instance = SQLiteRequest(self.eq_db_file)
+            _this_instance.create_table_price_history()
+            _this_instance.create_table_daily_valuation()
+            this_conn = _this_instance._create_connection()
+            this_cursor = this_conn.cursor()
+            this_cursor.execute("SELECT CACHE_NAME, LAST_DATE, TRANSACTIONS_COUNT, TRANSACTIONS_MAX_ID, "
+                                "PRICES_COUNT, PRICES_MAX_ROWID FROM cache_metadata WHERE CACHE_NAME = ?;",
+                                (self.cache_name,))
+            this_state = this_cursor.fetchone()
+            this_signature, this_refresh_from = self._get_cache_signature(this_conn, this_state)
+            if this_state is None or this_refresh_from == '':
+                self.logger.info('.. cache is empty or stale, rebuilding :table: daily_valuation ...')
+                this_refresh_from, this_last_date = None, this_end
+                this_cursor.execute("DELETE FROM daily_valuation;")
+            else:
+                # never shrink the cached range, re-computed rows always run up to the previous LAST_DATE
+                this_last_date = max(this_end, this_state[1])
+            if this_refresh_from is None or this_refresh_from <= this_last_date:
+                self.logger.info(f'.. extending :table: daily_valuation from {this_refresh_from} to '
+                                 f'{this_last_date} ...')
+                if this_refresh_from is not None:
+                    this_cursor.execute("DELETE FROM daily_valuation WHERE DATE >= ?;", (this_refresh_from,))
+                df_new = self._compute_daily_values(self._get_transactions_data(), self._get_price_history_data(),
+                                                    this_refresh_from, this_last_date)
+                this_cursor.executemany("INSERT INTO daily_valuation (DATE, ACCOUNT, ASSET_CLASS, MKT_VALUE) "
+                                        "VALUES (?, ?, ?, ?);", df_new.itertuples(index=False, name=None))
+            this_cursor.execute("INSERT OR REPLACE INTO cache_metadata (CACHE_NAME, LAST_DATE, TRANSACTIONS_COUNT, "
+                                "TRANSACTIONS_MAX_ID, PRICES_COUNT, PRICES_MAX_ROWID) VALUES (?, ?, ?, ?, ?, ?);",
+                                (self.cache_name, this_last_date) + this_signature)
+            this_conn.commit()
+            df_output = pd.read_sql_query("SELECT DATE, ACCOUNT, ASSET_CLASS, MKT_VALUE FROM daily_valuation "
+                                          "WHERE DATE >= ? AND DATE <= ? ORDER BY DATE, ACCOUNT, ASSET_CLASS;",
+                                          this_conn, params=(v_start_date or '0000-00-00', this_end))
+            this_conn.close()
+            return df_output
+        except Exception as e:
+            self.logger.error('Failed to retrieve daily market value time series -> ' + str(e))
+            raise e
@@ -0,0 +1,60 @@
+CREATE TRIGGER IF NOT EXISTS trg_tmp_holdings_insert AFTER INSERT ON tmp_holdings
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL = NEW.SYMBOL;
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL = NEW.SYMBOL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tmp_holdings_update AFTER UPDATE ON tmp_holdings
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL IN (OLD.SYMBOL, NEW.SYMBOL);
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL IN (OLD.SYMBOL, NEW.SYMBOL);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tmp_holdings_delete AFTER DELETE ON tmp_holdings
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL = OLD.SYMBOL;
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL = OLD.SYMBOL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_watch_list_insert AFTER INSERT ON watch_list
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL = NEW.SYMBOL;
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL = NEW.SYMBOL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_watch_list_update AFTER UPDATE OF SYMBOL, FULL_NAME, PREV_CLOSE, LAST_UPDATED
+  ON watch_list
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL IN (OLD.SYMBOL, NEW.SYMBOL);
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL IN (OLD.SYMBOL, NEW.SYMBOL);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_watch_list_delete AFTER DELETE ON watch_list
+BEGIN
+  DELETE FROM materialized_positions WHERE SYMBOL = OLD.SYMBOL;
+  INSERT INTO materialized_positions (SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE)
+  SELECT SYMBOL, DESCRIPTION, INVESTMENT_TYPE, COST_DOLLARS, DOLLARS, UNITS,
+    LAST_UPDATED, MKT_VALUE, GAIN_PER_SHARE, GAIN_TOTAL, GAIN_PERCENTAGE
+  FROM positions WHERE SYMBOL = OLD.SYMBOL;
+END;
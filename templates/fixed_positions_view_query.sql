@@ -10,6 +10,7 @@ CREATE VIEW positions (
  TOTAL_COST,
  RETURN_RATE,
  RETURN_DOLLARS,
+ END_DAY,
  IS_MATURED
 )
 AS
@@ -25,13 +26,6 @@ SELECT
   t1.TOTAL_COST AS TOTAL_COST,
   CASE WHEN t1.YTM = 0.0 THEN t1.APR ELSE t1.YTM END AS RETURN_RATE,
   CASE WHEN t1.YTM = 0.0 THEN t1.TOTAL_COST*t1.APR ELSE t1.TOTAL_COST*t1.YTM END AS RETURN_DOLLARS,
-  CASE
-    WHEN CAST(SUBSTR(t1.END_DATE,1,4) AS INTEGER) < CAST(STRFTIME('%Y',DATE('now')) AS INTEGER) THEN 1
-    WHEN CAST(SUBSTR(t1.END_DATE,1,4) AS INTEGER) = CAST(STRFTIME('%Y',DATE('now')) AS INTEGER)
-      AND CAST(SUBSTR(t1.END_DATE,6,2) AS INTEGER) < CAST(STRFTIME('%m',DATE('now')) AS INTEGER) THEN 1
-    WHEN CAST(SUBSTR(t1.END_DATE,1,4) AS INTEGER) = CAST(STRFTIME('%Y',DATE('now')) AS INTEGER)
-      AND CAST(SUBSTR(t1.END_DATE,6,2) AS INTEGER) = CAST(STRFTIME('%m',DATE('now')) AS INTEGER)
-      AND CAST(SUBSTR(t1.END_DATE,9,2) AS INTEGER) < CAST(STRFTIME('%d',DATE('now')) AS INTEGER) THEN 1
-    ELSE 0 END AS IS_MATURED
-FROM transactions t1
-ORDER BY IS_MATURED;
+  t1.END_DAY AS END_DAY,
+  CASE WHEN t1.END_DAY < CAST(JULIANDAY(DATE('now')) - 2440587.5 AS INTEGER) THEN 1 ELSE 0 END AS IS_MATURED
+FROM transactions t1;
@@ -0,0 +1,91 @@
+"""
+This :module: contains Test Calls to :module: src/benchmark.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_benchmark
+
+
+"""
+
+import os
+import json
+import tempfile
+import importlib.util
+import unittest
+
+from src.benchmark import ScaleBenchmark, FakeQuote, compare_results
+from src.overview_pipeline import REPORTS
+
+
+# src/equity needs the quote API package, its stages fail without it
+_EQUITY_STAGES = ['equity.update', 'equity.backup', 'equity.restore']
+_HAS_QUOTE_API = importlib.util.find_spec('yahooquery') is not None
+
+
+class TestScaleBenchmark(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_fake_quote(self):
+        """
+        TestCase for FakeQuote, quotes are derived from the ticker.
+        """
+        _test_quote = FakeQuote('VOO')
+        self.assertEqual(_test_quote.get_previous_close(), FakeQuote('VOO').get_previous_close())
+        self.assertNotEqual(_test_quote.get_previous_close(), FakeQuote('VTI').get_previous_close())
+        self.assertTrue(_test_quote.get_low_52wks() <= _test_quote.get_previous_close() <=
+                        _test_quote.get_high_52wks())
+        self.assertTrue(isinstance(_test_quote.get_market_cap(), int))
+        self.assertTrue(isinstance(_test_quote.get_total_assets(), int))
+        self.assertTrue(isinstance(_test_quote.get_yield(), float))
+
+    def test_run(self):
+        """
+        TestCase for ScaleBenchmark.run() and ScaleBenchmark.write().
+        """
+        self.assertRaises(IOError, ScaleBenchmark, 'tiny', 0, 0)
+        _test_work_dir = os.path.join(self._tmp_dir.name, 'work')
+        _test_instance = ScaleBenchmark('tiny', v_workers=2, v_work_dir=_test_work_dir)
+        self.assertRaises(IOError, _test_instance.write, os.path.join(self._tmp_dir.name, 'results.json'))
+        _test_cwd = os.getcwd()
+        _test_results = _test_instance.run()
+        self.assertEqual(os.getcwd(), _test_cwd)
+        self.assertEqual([x['NAME'] for x in _test_results['STAGES']],
+                         ['generate', 'equity.sync_table_watch_list', 'equity.sync_table_holdings'] +
+                         _EQUITY_STAGES + ['fixed.backup', 'fixed.restore', 'overview.preload'] +
+                         ['overview.report.' + x for x in REPORTS] + ['overview.snapshot'])
+        self.assertEqual(_test_instance.failed, [] if _HAS_QUOTE_API else _EQUITY_STAGES)
+        _test_stages = {x['NAME']: x for x in _test_results['STAGES']}
+        self.assertEqual(_test_stages['generate']['ROWS'], 548)
+        self.assertEqual(_test_stages['equity.sync_table_watch_list']['ROWS'], 20)
+        self.assertEqual(_test_stages['fixed.restore']['ROWS'], 40)
+        self.assertEqual(_test_stages['overview.report.allocation_account']['ROWS'], 4)
+        self.assertTrue(all(x['PEAK_BYTES'] >= x['NET_BYTES'] for x in _test_results['STAGES']))
+        self.assertTrue(os.path.exists(os.path.join(_test_work_dir, 'snapshots', 'snapshot_benchmark.html')))
+        self.assertTrue(os.path.exists(os.path.join(_test_work_dir, 'databases', 'restored_fixed_income.db')))
+        _test_file = _test_instance.write(os.path.join(self._tmp_dir.name, 'results', 'results.json'))
+        with open(_test_file, 'r') as rf:
+            _test_loaded = json.load(rf)
+        self.assertEqual(_test_loaded['SCALE']['TRANSACTIONS'], 500)
+        self.assertTrue(_test_loaded['TRACEMALLOC'])
+        # a run compared with itself
+        _test_compared = compare_results(_test_file, _test_loaded)
+        self.assertEqual(len(_test_compared), len(_test_loaded['STAGES']))
+        self.assertEqual(set(x['RATIO'] for x in _test_compared if x['NAME'] not in _test_instance.failed), {1.0})
+        self.assertTrue(all(x['RATIO'] is None for x in _test_compared if x['NAME'] in _test_instance.failed))
+        self.assertRaises(IOError, compare_results, {'STAGES': []}, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+This :module: contains Test Calls to :module: src/data_context.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_data_context
+
+
+"""
+
+import unittest
+from unittest.mock import MagicMock
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+from src.data_context import PortfolioDataContext
+
+
+class TestPortfolioDataContext(unittest.TestCase):
+    def test_get(self):
+        """
+        TestCase for PortfolioDataContext.get().
+        """
+        _loader = MagicMock(return_value=pd.DataFrame(data={'SYMBOL': ['VOO'], 'DOLLARS': [400.0]}))
+        _test_instance = PortfolioDataContext({'eq_positions': _loader})
+        self.assertFalse(_test_instance.is_loaded('eq_positions'))
+        _test_output = _test_instance.get('eq_positions')
+        _test_output['DOLLARS'] = 0.0
+        self.assertEqual(_test_instance.get('eq_positions').iloc[0]['DOLLARS'], 400.0)
+        self.assertEqual(_loader.call_count, 1)
+        self.assertTrue(_test_instance.is_loaded('eq_positions'))
+        self.assertRaises(IOError, _test_instance.get, 'unknown')
+
+    def test_invalidate(self):
+        """
+        TestCase for PortfolioDataContext.invalidate().
+        """
+        _loader = MagicMock(return_value=pd.DataFrame(data={'SYMBOL': ['VOO']}))
+        _test_instance = PortfolioDataContext({'eq_positions': _loader, 'eq_transactions': _loader})
+        _test_instance.get('eq_positions')
+        _test_instance.get('eq_transactions')
+        _test_instance.invalidate('eq_positions')
+        self.assertFalse(_test_instance.is_loaded('eq_positions'))
+        self.assertTrue(_test_instance.is_loaded('eq_transactions'))
+        _test_instance.invalidate()
+        self.assertFalse(_test_instance.is_loaded('eq_transactions'))
+        _test_instance.get('eq_positions')
+        self.assertEqual(_loader.call_count, 3)
+
+    def test_preload(self):
+        """
+        TestCase for PortfolioDataContext.preload().
+        """
+        _loader = MagicMock(return_value=pd.DataFrame(data={'SYMBOL': ['VOO']}))
+        _test_instance = PortfolioDataContext({'eq_positions': _loader, 'eq_transactions': _loader})
+        _test_instance.get('eq_positions')
+        with ThreadPoolExecutor(max_workers=2) as _executor:
+            _test_instance.preload(_executor)
+            _test_instance.preload(_executor)
+        self.assertTrue(_test_instance.is_loaded('eq_transactions'))
+        self.assertEqual(_loader.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
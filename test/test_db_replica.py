@@ -0,0 +1,102 @@
+"""
+This :module: contains Test Calls to :module: src/db_replica.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_db_replica
+
+
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from src.db_replica import DatabaseReplica, read_only_uri
+from src.eq_SQLite_utility import SQLiteRequest
+
+
+class TestDatabaseReplica(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._db_file = os.path.join(self._tmp_dir.name, 'equity.db')
+        _conn = sqlite3.connect(self._db_file)
+        _conn.execute("CREATE TABLE watch_list (SYMBOL text PRIMARY KEY, LAST_UPDATED text);")
+        _conn.execute("INSERT INTO watch_list VALUES ('VOO', '2026-10-18');")
+        _conn.commit()
+        _conn.close()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_init(self):
+        """
+        TestCase for DatabaseReplica.__init__().
+        """
+        _test_instance = DatabaseReplica(self._db_file)
+        self.assertEqual(_test_instance.db_file, self._db_file)
+        self.assertIsNone(_test_instance.uri)
+        self.assertRaises(IOError, DatabaseReplica, None)
+
+    def test_open(self):
+        """
+        TestCase for DatabaseReplica.open() and DatabaseReplica.close().
+        """
+        with DatabaseReplica(self._db_file) as _test_instance:
+            self.assertTrue(_test_instance.uri.startswith('file:replica_equity_'))
+            # writes to the source after the copy are not visible in the replica
+            _conn = sqlite3.connect(self._db_file)
+            _conn.execute("INSERT INTO watch_list VALUES ('AAPL', '2026-10-19');")
+            _conn.commit()
+            _conn.close()
+            _test_conn = sqlite3.connect(_test_instance.uri, uri=True)
+            self.assertEqual(_test_conn.execute("SELECT SYMBOL FROM watch_list;").fetchall(), [('VOO',)])
+            _test_conn.close()
+            self.assertTrue(SQLiteRequest(_test_instance.uri)._table_exists('watch_list'))
+            # consumers cannot change the frozen copy
+            _test_conn = SQLiteRequest(_test_instance.uri)._create_connection()
+            self.assertRaises(sqlite3.OperationalError, _test_conn.execute,
+                              "INSERT INTO watch_list VALUES ('MSFT', '2026-10-19');")
+            _test_conn.close()
+            _test_conn = sqlite3.connect(_test_instance.uri, uri=True)
+            self.assertEqual(_test_conn.execute("SELECT COUNT(*) FROM watch_list;").fetchall(), [(1,)])
+            _test_conn.close()
+            _test_uri = _test_instance.uri
+        self.assertIsNone(_test_instance.uri)
+        _test_conn = sqlite3.connect(_test_uri, uri=True)
+        self.assertEqual(_test_conn.execute("SELECT name FROM sqlite_master;").fetchall(), [])
+        _test_conn.close()
+        self.assertRaises(IOError, DatabaseReplica(os.path.join(self._tmp_dir.name, 'missing.db')).open)
+
+    def test_read_only_uri(self):
+        """
+        TestCase for read_only_uri(), characters ending the path of a URI are escaped.
+        """
+        _test_dir = os.path.join(self._tmp_dir.name, 'a#b?c%d')
+        os.makedirs(_test_dir)
+        _test_file = os.path.join(_test_dir, 'equity.db')
+        shutil.copy(self._db_file, _test_file)
+        _test_conn = sqlite3.connect(read_only_uri(_test_file), uri=True)
+        self.assertEqual(_test_conn.execute("SELECT SYMBOL FROM watch_list;").fetchall(), [('VOO',)])
+        self.assertRaises(sqlite3.OperationalError, _test_conn.execute, "DELETE FROM watch_list;")
+        _test_conn.close()
+        with DatabaseReplica(_test_file) as _test_instance:
+            _test_conn = sqlite3.connect(_test_instance.uri, uri=True)
+            self.assertEqual(_test_conn.execute("SELECT SYMBOL FROM watch_list;").fetchall(), [('VOO',)])
+            _test_conn.close()
+        # nothing is created next to the database
+        self.assertEqual(sorted(os.listdir(self._tmp_dir.name)), ['a#b?c%d', 'equity.db'])
+        self.assertEqual(os.listdir(_test_dir), ['equity.db'])
+
+
+if __name__ == '__main__':
+    unittest.main()
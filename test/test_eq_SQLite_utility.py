@@ -20,6 +20,7 @@ import sqlite3
 import os
 from time import sleep
 from datetime import datetime
+from unittest.mock import patch
 import csv
 
 from src.eq_SQLite_utility import SQLiteRequest
@@ -108,6 +109,25 @@ class TestSQLiteRequests(unittest.TestCase):
         except Exception as e:
             self.fail(":function: create_view_positions() raised exception unexpectedly ! -> "+str(e))
 
+    def test_create_table_transactions_indexes(self):
+        """
+        TestCase for SQLiteRequest.create_table_transactions() on the indexes of :table: 'transactions'.
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_conn = sqlite3.connect(self.test_db_file)
+        # a file created with the former DATE_DAY index
+        _test_conn.execute("CREATE INDEX idx_transactions_date_day ON transactions (DATE);")
+        _test_conn.commit()
+        _test_conn.close()
+        _test_instance.create_table_transactions()
+        _test_conn = sqlite3.connect(self.test_db_file)
+        self.assertEqual(_test_conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                                            "AND tbl_name = 'transactions' ORDER BY name;").fetchall(),
+                         [('idx_transactions_account',)])
+        _test_conn.close()
+
     def test_insert_into_table_transactions(self):
         """
         TestCase for SQLiteRequest.insert_into_table_transactions().
@@ -246,6 +266,34 @@ class TestSQLiteRequests(unittest.TestCase):
         except Exception as e:
             self.fail(":function: get_table_transaction() raised exception unexpectedly ! -> " + str(e))
 
+    def test_get_transactions(self):
+        """
+        TestCase for SQLiteRequest.get_transactions().
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('VOO', 'BUY', '2018-12-31', 100.0, 5, 'ETF', 'TD',
+                                                      'Vanguard S&P 500')
+        _test_instance.insert_into_table_transactions('VOO', 'BUY', '2018-12-31', 100.0, 5, 'etf', 'Fidelity',
+                                                      'Vanguard S&P 500')
+        self.assertEqual(len(_test_instance.get_transactions()), 3)
+        self.assertEqual(_test_instance.get_transactions(v_account='TD', v_columns=['SYMBOL', 'UNITS']),
+                         [{'SYMBOL': 'AAPL', 'UNITS': 10}, {'SYMBOL': 'VOO', 'UNITS': 5}])
+        self.assertEqual(_test_instance.get_transactions(v_investment_type='etf', v_columns=['ACCOUNT']),
+                         [{'ACCOUNT': 'TD'}, {'ACCOUNT': 'Fidelity'}])
+        self.assertEqual(_test_instance.get_transactions(v_account='TD', v_investment_type='STOCK',
+                                                         v_columns=['SYMBOL']), [{'SYMBOL': 'AAPL'}])
+        self.assertRaises(IOError, _test_instance.get_transactions, v_columns=['SYMBOL; DROP TABLE transactions'])
+        self.assertRaises(IOError, _test_instance.get_transactions, v_columns=[])
+        _test_conn = sqlite3.connect(self.test_db_file)
+        _test_plan = _test_conn.execute("EXPLAIN QUERY PLAN SELECT SYMBOL FROM transactions "
+                                        "WHERE ACCOUNT = 'TD';").fetchall()
+        _test_conn.close()
+        self.assertIn('idx_transactions_account', str(_test_plan))
+
     def test_get_table_watch_list(self):
         """
         TestCase for SQLiteRequest.get_table_watch_list().
@@ -318,3 +366,127 @@ class TestSQLiteRequests(unittest.TestCase):
             self.assertEqual(float(test_output[0]['GAIN_PERCENTAGE']), 0.1)
         except Exception as e:
             self.fail(":function: get_view_positions() raised exception unexpectedly ! -> " + str(e))
+
+    def test_materialized_positions(self):
+        """
+        TestCase for SQLiteRequest.create_table_materialized_positions() and its triggers.
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('VOO', 'BUY', '2018-12-31', 100.0, 5, 'ETF', 'TD',
+                                                      'Vanguard S&P 500')
+        _test_instance.create_table_watch_list()
+        _test_instance.sync_table_watch_list()
+        _test_instance.create_table_holdings()
+        _test_instance.sync_table_holdings()
+        _test_instance.create_view_positions()
+        _test_instance.create_table_materialized_positions()
+        _test_instance.update_table_watch_list('AAPL', 'Apple Inc.', 'stock', 220.0, 140.0, 240.0,
+                                               100000000000, 0, 22.0, 18.0, 0.015, float('nan'), 3.05, float('nan'),
+                                               1.21, 0.0042999, 'Technology', '')
+        _test_instance.insert_into_table_transactions('VOO', 'SELL', '2019-12-31', 120.0, 5, 'ETF', 'TD',
+                                                      'Vanguard S&P 500')
+        _test_instance.sync_table_holdings()
+        _test_conn = sqlite3.connect(self.test_db_file)
+        _test_view = _test_conn.execute("SELECT * FROM positions ORDER BY SYMBOL;").fetchall()
+        _test_table = _test_conn.execute("SELECT * FROM materialized_positions ORDER BY SYMBOL;").fetchall()
+        _test_conn.close()
+        self.assertEqual(_test_table, _test_view)
+        test_output = _test_instance.get_view_positions()
+        self.assertEqual([x['SYMBOL'] for x in test_output], ['AAPL'])
+        self.assertEqual(float(test_output[0]['MKT_VALUE']), 2200.0)
+        self.assertEqual(float(test_output[0]['GAIN_TOTAL']), 200.0)
+        self.assertEqual(_test_instance.get_positions(v_investment_type='stock', v_columns=['SYMBOL', 'MKT_VALUE']),
+                         [{'SYMBOL': 'AAPL', 'MKT_VALUE': 2200.0}])
+        self.assertEqual(_test_instance.get_positions(v_investment_type='etf'), [])
+        # one connection per read, the source is looked up on it
+        with patch.object(SQLiteRequest, '_create_connection', autospec=True,
+                          side_effect=SQLiteRequest._create_connection) as mock_connection:
+            _test_instance.get_positions(v_investment_type='stock')
+            _test_instance.get_view_positions()
+        self.assertEqual(mock_connection.call_count, 2)
+
+    def test_holdings_as_of(self):
+        """
+        TestCase for SQLiteRequest.create_table_cumulative_holdings(),
+            SQLiteRequest.holdings_as_of().
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.create_table_cumulative_holdings()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-01-10', 100.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('AAPL', 'SELL', '2018-06-10', 150.0, 4, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-02-10', 120.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        try:
+            test_output = _test_instance.holdings_as_of('2018-01-31')
+            self.assertEqual(test_output, [{'SYMBOL': 'AAPL', 'DATE': '2018-01-10', 'UNITS': 10,
+                                            'COST_DOLLARS': 1000.0}])
+            # the 4 units sold come out of the first lot bought at 100.0
+            test_output = _test_instance.holdings_as_of('2018-12-31')
+            self.assertEqual(test_output, [{'SYMBOL': 'AAPL', 'DATE': '2018-06-10', 'UNITS': 16,
+                                            'COST_DOLLARS': 1800.0}])
+            self.assertEqual(_test_instance.holdings_as_of('2017-12-31'), [])
+            # same cost basis as :table: tmp_holdings
+            _test_instance.create_table_watch_list()
+            _test_instance.create_table_holdings()
+            _test_instance.sync_table_holdings()
+            _test_conn = sqlite3.connect(self.test_db_file)
+            _test_holdings = _test_conn.execute("SELECT UNITS, UNITS * COST_DOLLARS FROM tmp_holdings "
+                                                "WHERE SYMBOL = 'AAPL';").fetchall()
+            _test_conn.close()
+            test_output = _test_instance.holdings_as_of(datetime.today().strftime('%Y-%m-%d'))
+            self.assertEqual(_test_holdings, [(test_output[0]['UNITS'], test_output[0]['COST_DOLLARS'])])
+        except Exception as e:
+            self.fail(":function: holdings_as_of() raised exception unexpectedly ! -> " + str(e))
+        with self.assertRaises(IOError):
+            _test_instance.holdings_as_of('2018/12/31')
+
+    def test_create_table_cumulative_holdings(self):
+        """
+        TestCase for SQLiteRequest.create_table_cumulative_holdings() on a database with transactions.
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-01-10', 100.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        self.assertTrue(_test_instance.create_table_cumulative_holdings())
+        _test_instance.insert_into_table_transactions('VOO', 'BUY', '2018-03-01', 200.0, 5, 'etf', 'TD',
+                                                      'Vanguard S&P 500 ETF')
+        self.assertEqual(_test_instance.holdings_as_of('2018-12-31'),
+                         [{'SYMBOL': 'AAPL', 'DATE': '2018-01-10', 'UNITS': 10, 'COST_DOLLARS': 1000.0},
+                          {'SYMBOL': 'VOO', 'DATE': '2018-03-01', 'UNITS': 5, 'COST_DOLLARS': 1000.0}])
+
+    def test_holdings_between(self):
+        """
+        TestCase for SQLiteRequest.holdings_between().
+        """
+        _test_instance = SQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_instance.create_table_cumulative_holdings()
+        _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-01-10', 100.0, 10, 'stock', 'TD',
+                                                      'Apple Inc')
+        _test_instance.insert_into_table_transactions('VOO', 'BUY', '2018-03-01', 200.0, 5, 'etf', 'TD',
+                                                      'Vanguard S&P 500 ETF')
+        _test_instance.sync_table_cumulative_holdings()
+        try:
+            test_output = _test_instance.holdings_between('2018-01-31', '2018-12-31')
+            self.assertEqual(len(test_output), 2)
+            self.assertEqual(test_output[0]['SYMBOL'], 'AAPL')
+            self.assertEqual(test_output[0]['UNITS_CHANGE'], 0)
+            self.assertEqual(test_output[1]['SYMBOL'], 'VOO')
+            self.assertEqual(test_output[1]['START_UNITS'], 0)
+            self.assertEqual(test_output[1]['END_UNITS'], 5)
+            self.assertEqual(test_output[1]['END_COST_DOLLARS'], 1000.0)
+        except Exception as e:
+            self.fail(":function: holdings_between() raised exception unexpectedly ! -> " + str(e))
+        with self.assertRaises(IOError):
+            _test_instance.holdings_between('2018-12-31', '2018-01-31')
@@ -33,6 +33,16 @@ class TestEquityCommands(unittest.TestCase):
         self.assertEqual(_test_instance.production_db_file, 'databases/equity.db')
         self.assertEqual(_test_instance.backup_db_file, f'equity_transaction_backup_{_current_date}.csv')
 
+    def test_previous_trading_date(self):
+        """
+        TestCase for DbCommands._previous_trading_date().
+        """
+        self.assertEqual(DbCommands._previous_trading_date(datetime(2026, 10, 21)), '2026-10-20')
+        # Monday and the weekend go back to Friday
+        self.assertEqual(DbCommands._previous_trading_date(datetime(2026, 10, 19)), '2026-10-16')
+        self.assertEqual(DbCommands._previous_trading_date(datetime(2026, 10, 18)), '2026-10-16')
+        self.assertEqual(DbCommands._previous_trading_date(datetime(2026, 10, 17)), '2026-10-16')
+
     @patch.object(SQLiteRequest, "backup_table_transactions")
     def test_backup(self, mock_backup):
         """
@@ -47,8 +57,13 @@ class TestEquityCommands(unittest.TestCase):
     @patch.object(SQLiteRequest, "create_table_watch_list")
     @patch.object(SQLiteRequest, "create_table_holdings")
     @patch.object(SQLiteRequest, "create_view_positions")
+    @patch.object(SQLiteRequest, "create_table_materialized_positions")
+    @patch.object(SQLiteRequest, "create_table_cumulative_holdings")
+    @patch.object(SQLiteRequest, "create_table_price_history")
+    @patch.object(SQLiteRequest, "create_table_daily_valuation")
     @patch.object(SQLiteRequest, "load_backup_to_table_transactions")
-    def test_restore(self, mock_load_backup, mock_crt_position, mock_crt_holdings, mock_crt_watchlist,
+    def test_restore(self, mock_load_backup, mock_crt_valuation, mock_crt_prices, mock_crt_cumulative,
+                     mock_crt_materialized, mock_crt_position, mock_crt_holdings, mock_crt_watchlist,
                      mock_crt_transactions, mock_crt_database):
         """
         TestCase for DbCommands.restore().
@@ -60,6 +75,10 @@ class TestEquityCommands(unittest.TestCase):
         self.assertTrue(mock_crt_watchlist.called)
         self.assertTrue(mock_crt_holdings.called)
         self.assertTrue(mock_crt_position.called)
+        self.assertTrue(mock_crt_materialized.called)
+        self.assertTrue(mock_crt_cumulative.called)
+        self.assertTrue(mock_crt_prices.called)
+        self.assertTrue(mock_crt_valuation.called)
         self.assertTrue(mock_load_backup.called)
 
     @patch.object(SQLiteRequest, "insert_into_table_transactions")
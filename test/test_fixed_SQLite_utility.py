@@ -22,6 +22,7 @@ from time import sleep
 import csv
 
 from src.fixed_SQLite_utility import FixedSQLiteRequest
+from src.db_replica import read_only_uri
 
 
 class TestFixedSQLiteRequests(unittest.TestCase):
@@ -222,6 +223,33 @@ class TestFixedSQLiteRequests(unittest.TestCase):
         except Exception as e:
             self.fail(":function: get_table_transaction_fixed() raised exception unexpectedly ! -> " + str(e))
 
+    def test_get_transactions_fixed(self):
+        """
+        TestCase for FixedSQLiteRequest.get_transactions_fixed().
+        """
+        _test_instance = FixedSQLiteRequest(self.test_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions_fixed()
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX1', 'TREA', 150, 100.0,
+                                                            '2018-12-31', '2099-12-31', 14000.0, 'TD', YTM=0.025)
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX2', 'TREA', 150, 100.0,
+                                                            '2018-12-31', '2019-12-31', 14000.0, 'TD', YTM=0.025)
+        _test_instance.insert_into_table_transactions_fixed('CD', 'XXXXXXXX3', 'CD', 10, 1000.0,
+                                                            '2018-12-31', '2099-12-31', 10000.0, 'Fidelity')
+        self.assertEqual(len(_test_instance.get_transactions_fixed()), 3)
+        test_output = _test_instance.get_transactions_fixed(v_account='TD', v_columns=['SYMBOL', 'END_DATE'])
+        self.assertEqual(sorted(test_output, key=lambda x: x['SYMBOL']),
+                         [{'SYMBOL': 'XXXXXXXX1', 'END_DATE': '2099-12-31'},
+                          {'SYMBOL': 'XXXXXXXX2', 'END_DATE': '2019-12-31'}])
+        self.assertEqual(_test_instance.get_transactions_fixed(v_account='TD', v_active_only=True,
+                                                               v_columns=['SYMBOL']), [{'SYMBOL': 'XXXXXXXX1'}])
+        self.assertRaises(IOError, _test_instance.get_transactions_fixed, v_columns=['SYMBOL', 'END_DAY'])
+        _test_conn = sqlite3.connect(self.test_db_file)
+        _test_plan = _test_conn.execute("EXPLAIN QUERY PLAN SELECT SYMBOL FROM transactions "
+                                        "WHERE ACCOUNT = 'TD' AND END_DAY >= 20000;").fetchall()
+        _test_conn.close()
+        self.assertIn('idx_transactions_account_end_day', str(_test_plan))
+
     def test_get_view_positions_fixed(self):
         """
         TestCase for FixedSQLiteRequest.get_view_positions_fixed().
@@ -231,6 +259,8 @@ class TestFixedSQLiteRequests(unittest.TestCase):
         _test_instance.create_table_transactions_fixed()
         _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX1', 'TREA', 150, 100.0,
                                                             '2018-12-31', '2099-12-31', 14000.0, 'TD', YTM=0.025)
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX2', 'TREA', 150, 100.0,
+                                                            '2018-12-31', '2019-12-31', 14000.0, 'TD', YTM=0.025)
         _test_instance.create_view_positions_fixed()
         try:
             test_output = _test_instance.get_view_positions_fixed()
@@ -249,3 +279,75 @@ class TestFixedSQLiteRequests(unittest.TestCase):
             self.assertEqual(int(test_output[0]['IS_MATURED']), 0)
         except Exception as e:
             self.fail(":function: get_view_positions_fixed() raised exception unexpectedly ! -> " + str(e))
+
+    def test_end_day_index(self):
+        """
+        TestCase for the generated day columns of :table: 'transactions', on a new table and on a table created
+            before they were declared.
+        """
+        _test_conn = sqlite3.connect(self.test_db_file)
+        _test_conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY, NAME text NOT NULL, SYMBOL text, "
+                           "INVESTMENT_TYPE text NOT NULL, UNITS integer NOT NULL, FACE_VALUE real NOT NULL, "
+                           "TOTAL_DOLLARS real NOT NULL, ADD_DATE text NOT NULL, END_DATE text NOT NULL, "
+                           "TOTAL_COST real NOT NULL, APR real NOT NULL, YTM real NOT NULL, ACCOUNT text NOT NULL);")
+        _test_conn.commit()
+        _test_conn.close()
+        _test_instance = FixedSQLiteRequest(self.test_db_file)
+        _test_instance.create_table_transactions_fixed()
+        _test_instance.create_table_transactions_fixed()
+        _test_instance.insert_into_table_transactions_fixed('USTB', 'XXXXXXXX1', 'TREA', 150, 100.0,
+                                                            '1970-01-02', '1971-01-01', 14000.0, 'TD', YTM=0.025)
+        _test_instance.create_view_positions_fixed()
+        _test_instance.create_view_positions_fixed()
+        _test_conn = sqlite3.connect(self.test_db_file)
+        self.assertEqual(_test_conn.execute("SELECT ADD_DAY, END_DAY FROM transactions;").fetchall(), [(1, 365)])
+        _test_plan = _test_conn.execute("EXPLAIN QUERY PLAN SELECT NAME FROM positions "
+                                        "WHERE END_DAY >= 20000;").fetchall()
+        _test_conn.close()
+        self.assertIn('idx_transactions_end_day', str(_test_plan))
+        self.assertEqual(_test_instance.get_view_positions_fixed(), [])
+
+    def test_upgrade_schema_fixed(self):
+        """
+        TestCase for FixedSQLiteRequest.upgrade_schema_fixed() on a database created before the day columns.
+        """
+        _test_db_file = 'test/test_upgrade.db'
+        self.addCleanup(lambda: os.path.exists(_test_db_file) and os.remove(_test_db_file))
+        self.assertFalse(FixedSQLiteRequest(_test_db_file).upgrade_schema_fixed())
+        _test_conn = sqlite3.connect(_test_db_file)
+        _test_conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY, NAME text NOT NULL, SYMBOL text, "
+                           "INVESTMENT_TYPE text NOT NULL, UNITS integer NOT NULL, FACE_VALUE real NOT NULL, "
+                           "TOTAL_DOLLARS real NOT NULL, ADD_DATE text NOT NULL, END_DATE text NOT NULL, "
+                           "TOTAL_COST real NOT NULL, APR real NOT NULL, YTM real NOT NULL, ACCOUNT text NOT NULL);")
+        _test_conn.execute("CREATE VIEW positions (NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, TOTAL_DOLLARS, "
+                           "ADD_DATE, END_DATE, TOTAL_COST, RETURN_RATE, RETURN_DOLLARS, IS_MATURED) AS "
+                           "SELECT NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, TOTAL_DOLLARS, ADD_DATE, "
+                           "END_DATE, TOTAL_COST, APR, TOTAL_COST*APR, 0 FROM transactions;")
+        _test_conn.executemany("INSERT INTO transactions (NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, "
+                               "TOTAL_DOLLARS, ADD_DATE, END_DATE, TOTAL_COST, APR, YTM, ACCOUNT) "
+                               "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);",
+                               [('12-Month CD', 'XXXXXXXX1', 'CD', 10000, 1.0, 10000.0, '1970-01-02', '1971-01-01',
+                                 10000.0, 0.02, 0.0, 'TD'),
+                                ('USTB', 'XXXXXXXX2', 'TREA', 100, 100.0, 10000.0, '2020-01-01', '2999-12-31',
+                                 9500.0, 0.0, 0.025, 'TD')])
+        _test_conn.commit()
+        _test_conn.close()
+        # reads filter on END_DATE and leave the schema as it is, also through a read-only URI
+        for _test_instance in [FixedSQLiteRequest(_test_db_file), FixedSQLiteRequest(read_only_uri(_test_db_file))]:
+            self.assertEqual([x['SYMBOL'] for x in _test_instance.get_transactions_fixed(v_active_only=True)],
+                             ['XXXXXXXX2'])
+            self.assertEqual([x['SYMBOL'] for x in _test_instance.get_view_positions_fixed()], ['XXXXXXXX2'])
+        _test_conn = sqlite3.connect(_test_db_file)
+        self.assertNotIn('END_DAY', [x[1] for x in _test_conn.execute("PRAGMA table_xinfo(transactions);")])
+        _test_conn.close()
+        self.assertFalse(_test_instance.upgrade_schema_fixed())
+        _test_instance = FixedSQLiteRequest(_test_db_file)
+        self.assertTrue(_test_instance.upgrade_schema_fixed())
+        _test_conn = sqlite3.connect(_test_db_file)
+        self.assertEqual(_test_conn.execute("SELECT ADD_DAY, END_DAY FROM transactions ORDER BY ID;").fetchall(),
+                         [(1, 365), (18262, 376199)])
+        self.assertIn('END_DAY', [x[1] for x in _test_conn.execute("PRAGMA table_info(positions);")])
+        self.assertEqual(_test_conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name IN "
+                                            "('idx_transactions_end_day', 'idx_transactions_account_end_day');"
+                                            ).fetchone()[0], 2)
+        _test_conn.close()
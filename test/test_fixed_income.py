@@ -57,8 +57,18 @@ class TestFixedIncomeCommands(unittest.TestCase):
         self.assertTrue(mock_crt_position.called)
         self.assertTrue(mock_load_backup.called)
 
+    @patch.object(FixedSQLiteRequest, "upgrade_schema_fixed")
+    def test_upgrade(self, mock_upgrade):
+        """
+        TestCase for DbCommands.upgrade().
+        """
+        _test_instance = DbCommands()
+        _test_instance.upgrade()
+        self.assertTrue(mock_upgrade.called)
+
+    @patch.object(FixedSQLiteRequest, "upgrade_schema_fixed")
     @patch.object(FixedSQLiteRequest, "insert_into_table_transactions_fixed")
-    def test_add(self, mock_class_insert):
+    def test_add(self, mock_class_insert, mock_upgrade):
         """
         TestCase for DbCommands.add().
         """
@@ -66,3 +76,4 @@ class TestFixedIncomeCommands(unittest.TestCase):
         _test_instance.add('US Treasury Notes', 'XXXXXXXX1', 'TREA', 100, 100.0, '2018-12-31', '2019-12-31',
                            9500.0, 'TD', YTM=0.025)
         self.assertTrue(mock_class_insert.called)
+        self.assertTrue(mock_upgrade.called)
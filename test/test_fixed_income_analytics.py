@@ -0,0 +1,157 @@
+"""
+This :module: contains Test Calls to :module: src/fixed_income_analytics.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_fixed_income_analytics
+
+
+"""
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from src.fixed_income_analytics import FixedIncomeAnalytics, build_cash_flow_schedule, to_days, to_months, \
+    month_labels, payment_times
+
+
+class TestFixedIncomeAnalytics(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self.dict_fixed_transactions = {
+            'SYMBOL': ['TEST01', 'n/a', 'TEST03', 'TEST04'],
+            'ADD_DATE': ['2098-01-15', '2098-08-15', '2096-03-15', '2010-01-01'],
+            'END_DATE': ['2099-01-15', '2099-02-15', '2099-03-15', '2011-01-01'],
+            'TOTAL_DOLLARS': [1000.0, 2000.0, 3000.0, 2000.0],
+            'TOTAL_COST': [990.0, 2000.0, 3000.0, 2000.0],
+            'APR': [0.0, 0.04, 0.05, 0.01],
+            'YTM': [0.01, 0.0, 0.0, 0.0],
+            'ACCOUNT': ['Vanguard', 'Fidelity', 'Fidelity', 'Fidelity']
+        }
+
+    def test_to_months(self):
+        """
+        TestCase for to_months() and month_labels().
+        """
+        _test_output = to_months(['1970-01-31', '2099-02-15'])
+        self.assertEqual(list(_test_output), [0, 129 * 12 + 1])
+        self.assertEqual(list(month_labels(_test_output)), ['1970-01', '2099-02'])
+        self.assertEqual(list(to_months(to_days(['2020-02-29']))), [50 * 12 + 1])
+
+    def test_build_cash_flow_schedule(self):
+        """
+        TestCase for build_cash_flow_schedule().
+        """
+        _test_index, _test_months, _test_principal, _test_interest = build_cash_flow_schedule(
+            to_days(['2020-01-15', '2020-01-15', '2020-01-15']), to_days(['2023-01-15', '2020-07-15', '2021-01-15']),
+            np.array([1000.0, 1000.0, 500.0]), np.array([0.05, 0.04, 0.0]))
+        # 3 years semiannual coupons, 6 months simple interest at maturity, zero-coupon
+        self.assertEqual(list(_test_index), [0] * 6 + [1, 2])
+        self.assertEqual(list(month_labels(_test_months[:6])),
+                         ['2023-01', '2022-07', '2022-01', '2021-07', '2021-01', '2020-07'])
+        self.assertEqual(list(_test_principal), [1000.0, 0, 0, 0, 0, 0, 1000.0, 500.0])
+        self.assertEqual(list(_test_interest[:6]), [25.0] * 6)
+        self.assertAlmostEqual(_test_interest[6], 1000.0 * 0.04 * 182 / 365.25)
+        self.assertEqual(_test_interest[7], 0.0)
+
+    def test_mature_calender(self):
+        """
+        TestCase for FixedIncomeAnalytics.mature_calender().
+        """
+        _df_fixed = pd.DataFrame(data=self.dict_fixed_transactions)
+        _df_fixed.loc[3, 'END_DATE'] = '2099-02-01'
+        _test_output = FixedIncomeAnalytics.mature_calender(_df_fixed, '2099-01-31')
+        self.assertEqual(list(_test_output.columns),
+                         ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output['MATURE_DATE']), ['2099-01', '2099-02', '2099-03'])
+        self.assertEqual(list(_test_output.iloc[1]), ['2099-02', 4000.0, 2, 2.5,
+                                                      'CD(Fidelity), TEST04(Fidelity)', False])
+        self.assertEqual(FixedIncomeAnalytics.mature_calender(_df_fixed, '2099-03-01').shape[0], 1)
+
+    def test_cash_flow_ladder(self):
+        """
+        TestCase for FixedIncomeAnalytics.cash_flow_ladder().
+        """
+        _df_fixed = pd.DataFrame(data=self.dict_fixed_transactions)
+        _test_output = FixedIncomeAnalytics.cash_flow_ladder(_df_fixed, '2098-09-01', 12)
+        self.assertEqual(list(_test_output.columns), ['MONTH', 'ACCOUNT', 'PRINCIPAL', 'INTEREST', 'TOTAL'])
+        self.assertEqual(_test_output[['MONTH', 'ACCOUNT']].values.tolist(),
+                         [['2098-09', 'Fidelity'], ['2099-01', 'Vanguard'], ['2099-02', 'Fidelity'],
+                          ['2099-03', 'Fidelity']])
+        self.assertEqual(list(_test_output['PRINCIPAL']), [0.0, 1000.0, 2000.0, 3000.0])
+        self.assertEqual(list(_test_output['INTEREST'])[0], 75.0)
+        self.assertAlmostEqual(_test_output['INTEREST'].iloc[2], 2000.0 * 0.04 * 184 / 365.25)
+        self.assertEqual(list(_test_output['TOTAL'])[3], 3075.0)
+        self.assertEqual(FixedIncomeAnalytics.cash_flow_ladder(_df_fixed.iloc[:0]).shape[0], 0)
+        self.assertRaises(IOError, FixedIncomeAnalytics.cash_flow_ladder, _df_fixed, None, 0)
+
+    def test_payment_times(self):
+        """
+        TestCase for payment_times().
+        """
+        _add_days = to_days(['2020-01-15', '2020-01-15'])
+        _end_days = to_days(['2021-07-15', '2020-07-15'])
+        _test_index, _test_months, _, _ = build_cash_flow_schedule(_add_days, _end_days, np.array([1000.0, 1000.0]),
+                                                                   np.array([0.05, 0.04]))
+        _test_output = payment_times(_add_days, _end_days, _test_index, _test_months)
+        self.assertEqual(list(_test_index), [0, 0, 0, 1])
+        self.assertAlmostEqual(_test_output[0], 547 / 365.25)
+        self.assertAlmostEqual(_test_output[0] - _test_output[2], 1.0)
+        self.assertAlmostEqual(_test_output[3], 182 / 365.25)
+
+    def test_bond_analytics(self):
+        """
+        TestCase for FixedIncomeAnalytics.bond_analytics().
+        """
+        _df_fixed = pd.DataFrame(data={
+            'ADD_DATE': ['2020-01-15', '2020-01-15', '2020-01-15', '2010-01-01'],
+            'END_DATE': ['2030-01-15', '2025-01-15', '2021-01-15', '2011-01-01'],
+            'TOTAL_DOLLARS': [1000.0, 1000.0, 1000.0, 1000.0],
+            'TOTAL_COST': [1000.0, 900.0, 1000.0, 1000.0],
+            'APR': [0.05, 0.0, 0.02, 0.01]})
+        _test_output = FixedIncomeAnalytics.bond_analytics(_df_fixed, '2020-01-15')
+        self.assertEqual(list(_test_output.columns), ['CURRENT_YIELD', 'YTM', 'YEARS_TO_MATURITY',
+                                                      'MACAULAY_DURATION', 'MODIFIED_DURATION', 'CONVEXITY'])
+        # par bond with semiannual coupons: annual effective YTM of a 2.5% half-year rate
+        self.assertAlmostEqual(_test_output['YTM'].iloc[0], (1.025 ** 2 - 1) * 100, places=2)
+        self.assertEqual(_test_output['CURRENT_YIELD'].iloc[0], 5.0)
+        self.assertLess(_test_output['MACAULAY_DURATION'].iloc[0], _test_output['YEARS_TO_MATURITY'].iloc[0])
+        # zero-coupon bond: duration is the time to maturity
+        _years = (to_days(['2025-01-15']) - to_days(['2020-01-15'])).astype(np.int64)[0] / 365.25
+        self.assertAlmostEqual(_test_output['YTM'].iloc[1], (1000.0 / 900.0) ** (1 / _years) * 100 - 100,
+                               places=6)
+        self.assertAlmostEqual(_test_output['MACAULAY_DURATION'].iloc[1], _years)
+        self.assertAlmostEqual(_test_output['MODIFIED_DURATION'].iloc[1],
+                               _years / (1 + _test_output['YTM'].iloc[1] / 100))
+        self.assertAlmostEqual(_test_output['CONVEXITY'].iloc[1],
+                               _years * (_years + 1) / (1 + _test_output['YTM'].iloc[1] / 100) ** 2)
+        # matured position has a yield but no risk measures
+        self.assertAlmostEqual(_test_output['YTM'].iloc[3], 1.0, places=2)
+        self.assertTrue(_test_output.iloc[3][['YEARS_TO_MATURITY', 'MACAULAY_DURATION', 'CONVEXITY']].isnull().all())
+        self.assertEqual(FixedIncomeAnalytics.bond_analytics(_df_fixed.iloc[:0]).shape[0], 0)
+
+    @patch.object(FixedIncomeAnalytics, "_get_fixed_transactions_data")
+    def test_project_cash_flows(self, mock_get_fixed_transactions):
+        """
+        TestCase for FixedIncomeAnalytics.project_cash_flows().
+        """
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data=self.dict_fixed_transactions)
+        _test_output = FixedIncomeAnalytics().project_cash_flows('2096-01-01')
+        self.assertTrue(mock_get_fixed_transactions.called)
+        self.assertEqual(_test_output['PRINCIPAL'].sum(), 6000.0)
+        self.assertEqual(_test_output['MONTH'].iloc[0], '2096-09')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+This :module: contains Test Calls to :module: src/fund_catalog.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_fund_catalog
+
+
+"""
+
+import os
+import json
+import unittest
+from unittest.mock import MagicMock
+import pandas as pd
+
+from src.fund_catalog import FundCatalog
+
+
+class TestFundCatalog(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self.test_catalog_file = 'test/test_fund_catalog.json'
+        with open(self.test_catalog_file, 'w') as wf:
+            json.dump({'VERSION': 2, 'FUNDS': [
+                {'SYMBOL': 'VOO', 'FULL_NAME': 'Vanguard S&P 500 Index Fund', 'MAJOR_TYPE': 'EQUITY',
+                 'MINOR_TYPE': 'Large-Cap', 'ASSET_CLASS': 'Large-Cap', 'SUBCLASS': 'Blend'},
+                {'SYMBOL': 'bnd', 'FULL_NAME': 'Vanguard Total Bond Market ETF', 'MAJOR_TYPE': 'FIXED_INCOME',
+                 'MINOR_TYPE': 'Intermediate-Term Blend', 'ASSET_CLASS': 'Fixed Income',
+                 'SUBCLASS': 'Intermediate-Term Blend'}]}, wf)
+
+    def tearDown(self):
+        """
+        drop test files after each TestCase finished.
+        """
+        if os.path.exists(self.test_catalog_file):
+            os.remove(self.test_catalog_file)
+
+    def test_init(self):
+        """
+        TestCase for FundCatalog.__init__() with the shipped catalog.
+        """
+        _test_instance = FundCatalog()
+        self.assertEqual(_test_instance.version, 1)
+        self.assertFalse(_test_instance.df_catalog.index.duplicated().any())
+        self.assertEqual(_test_instance.lookup(['VOO'], 'ASSET_CLASS').tolist(), ['Large-Cap'])
+
+    def test_lookup(self):
+        """
+        TestCase for FundCatalog.lookup().
+        """
+        _test_instance = FundCatalog(self.test_catalog_file)
+        self.assertEqual(_test_instance.version, 2)
+        _test_output = _test_instance.lookup(['voo', 'BND', 'AAPL'], 'SUBCLASS')
+        self.assertEqual(list(_test_output[:2]), ['Blend', 'Intermediate-Term Blend'])
+        self.assertTrue(pd.isnull(_test_output[2]))
+        self.assertEqual(list(_test_instance.contains(['VOO', 'AAPL'])), [True, False])
+        self.assertRaises(IOError, _test_instance.lookup, ['VOO'], 'UNKNOWN')
+
+    def test_lookup_null(self):
+        """
+        TestCase for FundCatalog.lookup() and FundCatalog.classify() with null cells and an empty catalog.
+        """
+        _test_catalog_file = 'test/test_fund_catalog_null.json'
+        self.addCleanup(os.remove, _test_catalog_file)
+        with open(_test_catalog_file, 'w') as wf:
+            json.dump({'VERSION': 1, 'FUNDS': [
+                {'SYMBOL': 'AAA', 'FULL_NAME': 'AAA Fund', 'MAJOR_TYPE': 'EQUITY', 'MINOR_TYPE': 'Large-Cap',
+                 'ASSET_CLASS': None, 'SUBCLASS': 'Blend'},
+                {'SYMBOL': 'BBB', 'FULL_NAME': 'BBB Fund', 'MAJOR_TYPE': 'FIXED_INCOME', 'MINOR_TYPE': 'Short-Term',
+                 'ASSET_CLASS': 'Bond', 'SUBCLASS': None}]}, wf)
+        _test_instance = FundCatalog(_test_catalog_file)
+        _test_output = _test_instance.lookup(['AAA', 'BBB', 'CCC'], 'ASSET_CLASS')
+        self.assertTrue(pd.isnull(_test_output[0]))
+        self.assertEqual(_test_output[1], 'Bond')
+        self.assertTrue(pd.isnull(_test_output[2]))
+        _test_output = _test_instance.classify(['AAA', 'BBB'])
+        self.assertEqual(list(_test_output['ASSET_CLASS']), ['Others', 'Bond'])
+        self.assertEqual(list(_test_output['SUBCLASS']), ['Blend', 'Others'])
+        with open(_test_catalog_file, 'w') as wf:
+            json.dump({'VERSION': 2, 'FUNDS': []}, wf)
+        os.utime(_test_catalog_file, (0, 0))
+        _test_instance = FundCatalog(_test_catalog_file)
+        self.assertTrue(pd.isnull(_test_instance.lookup(['AAA'], 'ASSET_CLASS')).all())
+        self.assertEqual(list(_test_instance.classify(['AAA'])['MAJOR_TYPE']), ['EQUITY'])
+
+    def test_classify(self):
+        """
+        TestCase for FundCatalog.classify() with watch_list CATEGORY fallback.
+        """
+        _test_instance = FundCatalog(self.test_catalog_file)
+        _loader = MagicMock(return_value=pd.Series({'ARKK': 'Mid-Cap Growth', 'XYZ': None}))
+        _test_output = _test_instance.classify(['BND', 'arkk', 'XYZ'], _loader)
+        self.assertEqual(list(_test_output['IN_CATALOG']), [True, False, False])
+        self.assertEqual(list(_test_output['MAJOR_TYPE']), ['FIXED_INCOME', 'EQUITY', 'EQUITY'])
+        self.assertEqual(list(_test_output['ASSET_CLASS']), ['Fixed Income', 'Mid-Cap Growth', 'Others'])
+        self.assertEqual(list(_test_output['SUBCLASS']), ['Intermediate-Term Blend', 'Mid-Cap Growth', 'Others'])
+        _test_instance.classify(['VOO'], _loader)
+        self.assertEqual(_loader.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
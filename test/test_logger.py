@@ -0,0 +1,95 @@
+"""
+This :module: contains Test Calls to :module: src/logger.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_logger
+
+
+"""
+
+import os
+import sys
+import glob
+import logging
+import logging.handlers
+import unittest
+
+from src.logger import UseLogging, set_logging_levels, shutdown_logging
+
+
+class TestUseLogging(unittest.TestCase):
+    def setUp(self):
+        self._prefix = 'test_logger_{}'.format(os.getpid())
+
+    def tearDown(self):
+        set_logging_levels({'': 'INFO', 'test.logger_child': 'INFO'})
+        shutdown_logging(self._prefix)
+        for _file in glob.glob('logs/' + self._prefix + '_logging_*.log'):
+            os.remove(_file)
+
+    def test_use_loggers(self):
+        """
+        TestCase for UseLogging.use_loggers(), handlers are shared and added once.
+        """
+        _test_loggers = [UseLogging('test.logger_parent').use_loggers(self._prefix) for _ in range(3)]
+        _test_child = UseLogging('test.logger_child').use_loggers(self._prefix)
+        self.assertTrue(all(x is _test_loggers[0] for x in _test_loggers))
+        self.assertEqual(len(_test_loggers[0].handlers), 1)
+        self.assertTrue(isinstance(_test_loggers[0].handlers[0], logging.handlers.QueueHandler))
+        self.assertIs(_test_child.handlers[0], _test_loggers[0].handlers[0])
+        _test_loggers[0].info('parent %s', 'line')
+        _test_child.info('child %s', 'line')
+        _test_child.debug('child %s', 'debug')
+        shutdown_logging(self._prefix)
+        self.assertEqual(_test_child.handlers, [])
+        _test_files = glob.glob('logs/' + self._prefix + '_logging_*.log')
+        self.assertEqual(len(_test_files), 1)
+        with open(_test_files[0], 'r') as rf:
+            _test_lines = rf.read().splitlines()
+        self.assertEqual([x.split(' - ', 1)[1] for x in _test_lines],
+                         ['test.logger_parent - INFO - parent line', 'test.logger_child - INFO - child line'])
+
+    def test_prepare(self):
+        """
+        TestCase for the QueueHandler of UseLogging.use_loggers(), records are snapshot when they are queued.
+        """
+        _test_handler = UseLogging('test.logger_parent').use_loggers(self._prefix).handlers[0]
+        _test_args = ['before']
+        try:
+            raise ValueError('queued')
+        except ValueError:
+            _test_record = logging.LogRecord('test.logger_parent', logging.ERROR, __file__, 1, 'value %s',
+                                             (_test_args,), sys.exc_info())
+        _test_prepared = _test_handler.prepare(_test_record)
+        _test_args[0] = 'after'
+        self.assertEqual((_test_prepared.msg, _test_prepared.args, _test_prepared.exc_info),
+                         ("value ['before']", None, None))
+        self.assertIn('ValueError: queued', _test_prepared.exc_text)
+        self.assertIsNot(_test_prepared, _test_record)
+        self.assertEqual(_test_record.args, (_test_args,))
+        self.assertEqual(logging.Formatter('%(message)s').format(_test_prepared).splitlines()[0], "value ['before']")
+
+    def test_set_logging_levels(self):
+        """
+        TestCase for set_logging_levels(), the most specific name wins.
+        """
+        _test_parent = UseLogging('test.logger_parent').use_loggers(self._prefix)
+        _test_child = UseLogging('test.logger_child').use_loggers(self._prefix)
+        set_logging_levels({'': 'warning', 'test.logger_child': 'DEBUG'})
+        self.assertEqual(_test_parent.level, logging.WARNING)
+        self.assertEqual(_test_child.level, logging.DEBUG)
+        # a new constructor call keeps the configured level
+        self.assertEqual(UseLogging('test.logger_child').use_loggers(self._prefix).level, logging.DEBUG)
+        self.assertRaises(IOError, set_logging_levels, {'test': 'VERBOSE'})
+
+
+if __name__ == '__main__':
+    unittest.main()
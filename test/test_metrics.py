@@ -0,0 +1,145 @@
+"""
+This :module: contains Test Calls to :module: src/metrics.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_metrics
+
+
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.metrics import METRICS, MeteredConnection, metered, peak_rss_bytes
+from src.eq_SQLite_utility import SQLiteRequest
+from src.fixed_SQLite_utility import FixedSQLiteRequest
+
+
+@metered('portfolio_quote_fetch_seconds', investment_type='etf')
+def _metered_function(v_value):
+    return v_value
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        METRICS.reset()
+        METRICS.enable(os.path.join(self._tmp_dir.name, 'metrics.prom'))
+
+    def tearDown(self):
+        METRICS.disable()
+        METRICS.reset()
+        self._tmp_dir.cleanup()
+
+    def test_render(self):
+        """
+        TestCase for MetricsRegistry.render() and MetricsRegistry.write().
+        """
+        METRICS.inc('portfolio_symbols_refreshed_total', investment_type='etf')
+        METRICS.inc('portfolio_symbols_refreshed_total', investment_type='etf')
+        METRICS.set('portfolio_overview_report_seconds', 0.5, report='allocation "type"')
+        METRICS.observe('portfolio_quote_fetch_seconds', 0.3, investment_type='stock')
+        METRICS.observe('portfolio_quote_fetch_seconds', 45.0, investment_type='stock')
+        self.assertRaises(IOError, METRICS.inc, 'unknown_total')
+        _test_lines = METRICS.render().splitlines()
+        self.assertIn('# TYPE portfolio_symbols_refreshed_total counter', _test_lines)
+        self.assertIn('portfolio_symbols_refreshed_total{investment_type="etf"} 2', _test_lines)
+        self.assertIn('portfolio_overview_report_seconds{report="allocation \\"type\\""} 0.5', _test_lines)
+        self.assertIn('portfolio_quote_fetch_seconds_bucket{investment_type="stock",le="0.25"} 0', _test_lines)
+        self.assertIn('portfolio_quote_fetch_seconds_bucket{investment_type="stock",le="0.5"} 1', _test_lines)
+        self.assertIn('portfolio_quote_fetch_seconds_bucket{investment_type="stock",le="+Inf"} 2', _test_lines)
+        self.assertIn('portfolio_quote_fetch_seconds_sum{investment_type="stock"} 45.3', _test_lines)
+        self.assertIn('portfolio_quote_fetch_seconds_count{investment_type="stock"} 2', _test_lines)
+        # metrics without samples are left out
+        self.assertFalse(any('portfolio_run_success' in x for x in _test_lines))
+        _test_file = METRICS.write()
+        with open(_test_file, 'r') as rf:
+            self.assertEqual(rf.read().splitlines(), _test_lines)
+        self.assertFalse(os.path.exists(_test_file + '.tmp'))
+        # a disabled registry ignores samples
+        METRICS.disable()
+        METRICS.inc('portfolio_symbols_refreshed_total', investment_type='etf')
+        self.assertEqual(METRICS.get('portfolio_symbols_refreshed_total', investment_type='etf'), 2)
+
+    def test_count_outcome(self):
+        """
+        TestCase for MetricsRegistry.count_outcome() and metered().
+        """
+        for _value in [1, 2, None]:
+            try:
+                with METRICS.count_outcome('portfolio_symbols_refreshed_total', 'portfolio_symbols_failed_total',
+                                           investment_type='etf'):
+                    _metered_function(_value + 1)
+            except TypeError:
+                pass
+        self.assertEqual(METRICS.get('portfolio_symbols_refreshed_total', investment_type='etf'), 2)
+        self.assertEqual(METRICS.get('portfolio_symbols_failed_total', investment_type='etf'), 1)
+        self.assertEqual(METRICS.get('portfolio_quote_fetch_seconds', investment_type='etf'), 2)
+        if peak_rss_bytes() is not None:
+            self.assertTrue(peak_rss_bytes() > 1024 * 1024)
+
+    def test_metered_write(self):
+        """
+        TestCase for metered_write() on the writes of SQLiteRequest.
+        """
+        _test_instance = SQLiteRequest(os.path.join(self._tmp_dir.name, 'equity.db'))
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        _test_conn = _test_instance._create_connection()
+        self.assertTrue(isinstance(_test_conn, MeteredConnection))
+        _test_conn.close()
+        for _account in ['TD', 'Fidelity']:
+            _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', _account,
+                                                          'Apple Inc')
+        _test_instance.get_transactions()
+        self.assertEqual(METRICS.get('portfolio_db_writes_total', operation='insert_into_table_transactions'), 2)
+        self.assertEqual(METRICS.get('portfolio_db_rows_written_total', operation='insert_into_table_transactions'),
+                         2)
+        self.assertTrue(METRICS.get('portfolio_db_write_seconds_total', operation='insert_into_table_transactions')
+                        > 0)
+        self.assertEqual(METRICS.get('portfolio_db_writes_total', operation='get_transactions'), 0)
+        # a disabled registry opens plain connections
+        METRICS.disable()
+        _test_conn = _test_instance._create_connection()
+        self.assertEqual(type(_test_conn), sqlite3.Connection)
+        _test_conn.close()
+
+    def test_metered_write_fixed(self):
+        """
+        TestCase for metered_write() on the writes of FixedSQLiteRequest.
+        """
+        _test_instance = FixedSQLiteRequest(os.path.join(self._tmp_dir.name, 'fixed_income.db'))
+        _test_instance.create_database()
+        _test_instance.create_table_transactions_fixed()
+        _test_conn = _test_instance._create_connection()
+        self.assertTrue(isinstance(_test_conn, MeteredConnection))
+        _test_conn.close()
+        _test_instance.insert_into_table_transactions_fixed('CD', 'TEST01', 'CD', 5, 1000.0, '2020-02-15',
+                                                            '2099-02-15', 5000.0, 'TD', APR=0.02)
+        _test_backup_file = os.path.join(self._tmp_dir.name, 'fixed_transaction_backup.csv')
+        with open(_test_backup_file, 'w') as wf:
+            wf.write('NAME,SYMBOL,INVESTMENT_TYPE,UNITS,FACE_VALUE,TOTAL_DOLLARS,ADD_DATE,END_DATE,TOTAL_COST,APR,'
+                     'YTM,ACCOUNT\n' + 'CD,TEST02,CD,2,1000.0,2000.0,2020-01-15,2099-01-15,2000.0,0.02,0.0,TD\n' * 3)
+        _test_instance.load_backup_to_table_transactions_fixed(_test_backup_file)
+        _test_instance.upgrade_schema_fixed()
+        # reads do not change the schema
+        _test_instance.get_transactions_fixed(v_active_only=True)
+        self.assertEqual(METRICS.get('portfolio_db_rows_written_total',
+                                     operation='insert_into_table_transactions_fixed'), 1)
+        self.assertEqual(METRICS.get('portfolio_db_rows_written_total',
+                                     operation='load_backup_to_table_transactions_fixed'), 3)
+        self.assertEqual(METRICS.get('portfolio_db_writes_total', operation='upgrade_schema_fixed'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
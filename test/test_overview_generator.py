@@ -22,6 +22,7 @@ import pandas as pd
 from src.overview_generator import SummaryTool
 from src.eq_SQLite_utility import SQLiteRequest as eq_SQLiteRequest
 from src.fixed_SQLite_utility import FixedSQLiteRequest as fixed_SQLiteRequest
+from src.portfolio_query import PortfolioQuery
 
 
 class TestSummaryTool(unittest.TestCase):
@@ -34,7 +35,7 @@ class TestSummaryTool(unittest.TestCase):
         self.assertEqual(_test_instance.fixed_db_file, 'databases/fixed_income.db')
         self.assertEqual(_test_instance.other_investment_file, 'databases/others.json')
 
-    @patch.object(eq_SQLiteRequest, "get_table_transactions")
+    @patch.object(eq_SQLiteRequest, "get_transactions")
     def test_get_eq_transactions_data(self, mock_get_eq_transactions):
         """
         TestCase for SummaryTool._get_eq_transactions_data().
@@ -45,13 +46,17 @@ class TestSummaryTool(unittest.TestCase):
                                                   'DESCRIPTION': None, 'ACCOUNT': None, 'TOTAL_DOLLARS': None}
                                                  ]
         _test_output = _test_instance._get_eq_transactions_data()
-        self.assertTrue(mock_get_eq_transactions.called)
+        mock_get_eq_transactions.assert_called_with(v_account=None, v_columns=None)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'AAPL')
         self.assertEqual(_test_output.iloc[0]['DOLLARS'], 120.0)
+        mock_get_eq_transactions.return_value = [{'SYMBOL': 'AAPL', 'UNITS': 10}]
+        _test_output = _test_instance._get_eq_transactions_data('TD', ['SYMBOL', 'UNITS'])
+        mock_get_eq_transactions.assert_called_with(v_account='TD', v_columns=['SYMBOL', 'UNITS'])
+        self.assertEqual(list(_test_output.columns), ['SYMBOL', 'UNITS'])
 
-    @patch.object(eq_SQLiteRequest, "get_view_positions")
+    @patch.object(eq_SQLiteRequest, "get_positions")
     def test_eq_positions_data(self, mock_get_eq_positions):
         """
         TestCase for SummaryTool._get_eq_positions_data().
@@ -63,7 +68,7 @@ class TestSummaryTool(unittest.TestCase):
                                                'GAIN_PER_SHARE': None, 'GAIN_TOTAL': None, 'GAIN_PERCENTAGE': None}
                                               ]
         _test_output = _test_instance._get_eq_positions_data()
-        self.assertTrue(mock_get_eq_positions.called)
+        mock_get_eq_positions.assert_called_with(v_investment_type=None, v_columns=None)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'VOO')
@@ -87,7 +92,7 @@ class TestSummaryTool(unittest.TestCase):
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'BLV')
         self.assertEqual(_test_output.iloc[0]['FACE_VALUE'], 5000.0)
 
-    @patch.object(fixed_SQLiteRequest, "get_table_transactions_fixed")
+    @patch.object(fixed_SQLiteRequest, "get_transactions_fixed")
     def test_get_fixed_transactions_data(self, mock_get_fixed_transactions):
         """
         TestCase for SummaryTool._get_fixed_transactions_data().
@@ -99,7 +104,7 @@ class TestSummaryTool(unittest.TestCase):
                                                      'TOTAL_COST': None, 'APR': None, 'YTM': None, 'ACCOUNT': None}
                                                     ]
         _test_output = _test_instance._get_fixed_transactions_data()
-        self.assertTrue(mock_get_fixed_transactions.called)
+        mock_get_fixed_transactions.assert_called_with(v_account=None, v_active_only=False, v_columns=None)
         self.assertTrue(isinstance(_test_output, pd.DataFrame))
         self.assertEqual(_test_output.shape[0], 1)
         self.assertEqual(_test_output.iloc[0]['SYMBOL'], 'VTIP')
@@ -121,51 +126,100 @@ class TestSummaryTool(unittest.TestCase):
         self.assertEqual(_test_output.iloc[0]['DESCRIPTION'], 'CD')
         self.assertEqual(_test_output.iloc[0]['DOLLARS'], 500.0)
 
-    @patch.object(SummaryTool, "_get_eq_positions_data")
-    @patch.object(SummaryTool, "_get_fixed_positions_data")
-    @patch.object(SummaryTool, "_get_other_investment_information")
-    def test_generate_allocation_report_type(self, mock_get_other_investments, mock_get_fixed_positions,
-                                             mock_get_eq_positions):
+    @patch.object(PortfolioQuery, "get_allocation_type")
+    def test_get_allocation_type_data(self, mock_get_allocation_type):
+        """
+        TestCase for SummaryTool._get_allocation_type_data().
+        """
+        _test_instance = SummaryTool()
+        mock_get_allocation_type.return_value = [{'SOURCE': 'FIXED_INCOME', 'SYMBOL': None, 'MAJOR_TYPE': None,
+                                                  'MINOR_TYPE': 'CD', 'DOLLARS': 5000.0}]
+        _test_output = _test_instance._get_allocation_type_data()
+        self.assertTrue(mock_get_allocation_type.called)
+        self.assertEqual(list(_test_output.columns), ['SOURCE', 'SYMBOL', 'MAJOR_TYPE', 'MINOR_TYPE', 'DOLLARS'])
+        self.assertEqual(_test_output.iloc[0]['DOLLARS'], 5000.0)
+
+    @patch.object(PortfolioQuery, "get_allocation_account")
+    def test_get_allocation_account_data(self, mock_get_allocation_account):
+        """
+        TestCase for SummaryTool._get_allocation_account_data().
+        """
+        _test_instance = SummaryTool()
+        mock_get_allocation_account.return_value = [{'ACCOUNT': 'TD', 'TOTAL_DOLLARS': 18000.0}]
+        _test_output = _test_instance._get_allocation_account_data()
+        self.assertTrue(mock_get_allocation_account.called)
+        self.assertEqual(list(_test_output.columns), ['ACCOUNT', 'TOTAL_DOLLARS'])
+        self.assertEqual(_test_output.iloc[0]['TOTAL_DOLLARS'], 18000.0)
+
+    @patch.object(SummaryTool, "_get_allocation_type_data")
+    def test_generate_allocation_report_type(self, mock_get_allocation_type):
         """
         TestCase for SummaryTool.generate_allocation_report_type().
         """
         _test_instance = SummaryTool()
-        _dict_eq_positions = {
-            'SYMBOL': ['VOO', 'BLV', 'AAPL'],
-            'INVESTMENT_TYPE': ['etf', 'etf', 'stock'],
-            'MKT_VALUE': [10000.0, 5000.0, 2000.0]
+        _dict_allocation_type = {
+            'SOURCE': ['EQUITY', 'EQUITY', 'EQUITY', 'FIXED_INCOME', 'OTHERS'],
+            'SYMBOL': ['VOO', 'BLV', 'AAPL', None, 'TEST03'],
+            'MAJOR_TYPE': [None, None, None, None, 'Cash Equivalent'],
+            'MINOR_TYPE': ['etf', 'etf', 'stock', 'CD', 'Saving'],
+            'DOLLARS': [10000.0, 5000.0, 2000.0, 5000.0, 10000.0]
         }
-        _dict_fixed_positions = {
-            'SYMBOL': ['TEST01', 'TEST02'],
-            'INVESTMENT_TYPE': ['CD', 'CD'],
-            'TOTAL_DOLLARS': [3000.0, 2000.0]
-        }
-        _dict_other_investments = {
-            'SUFFIX': ['TEST03'],
-            'DESCRIPTION': ['This is a test'],
-            'MAJOR_TYPE': ['Cash Equivalent'],
-            'MINOR_TYPE': ['Saving'],
-            'DOLLARS': 10000.0,
-            'ACCOUNT': None
-        }
-        _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
-        _pd_fixed_positions = pd.DataFrame(data=_dict_fixed_positions)
-        _pd_other_investments = pd.DataFrame(data=_dict_other_investments)
-        mock_get_eq_positions.return_value = _pd_eq_positions
-        mock_get_fixed_positions.return_value = _pd_fixed_positions
-        mock_get_other_investments.return_value = _pd_other_investments
+        mock_get_allocation_type.return_value = pd.DataFrame(data=_dict_allocation_type)
         _test_output = _test_instance.generate_allocation_report_type()
-        self.assertTrue(mock_get_eq_positions.called)
-        self.assertTrue(mock_get_fixed_positions.called)
-        self.assertTrue(mock_get_other_investments.called)
+        self.assertTrue(mock_get_allocation_type.called)
         self.assertEqual(_test_output.shape[0], 6)
         self.assertEqual(list(_test_output.columns),
                          ['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION',
-                          'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION'])
-        self.assertEqual(list(_test_output.iloc[5]),
-                         ['TOTAL', '$32,000', '100%', '', '$nan', 'nan%'])
-        self.assertEqual(list(_test_output['MINOR_TOTAL_DOLLARS']),
-                         ['$10,000', '$2,000', '$10,000', '$5,000', '$5,000', '$nan'])
+                          'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output.iloc[5])[:4], ['TOTAL', 32000.0, 100.0, ''])
+        self.assertEqual(list(_test_output['IS_TOTAL']), [False] * 5 + [True])
+        self.assertEqual(list(_test_output['MINOR_TOTAL_DOLLARS'])[:5],
+                         [10000.0, 2000.0, 10000.0, 5000.0, 5000.0])
+        self.assertTrue(pd.isnull(_test_output['MINOR_TOTAL_DOLLARS'].iloc[5]))
+
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_allocation_type_data")
+    def test_data_context_shared_across_reports(self, mock_get_allocation_type, mock_get_eq_positions):
+        """
+        TestCase for SummaryTool.data_context, each input is read once per run.
+        """
+        _test_instance = SummaryTool()
+        mock_get_eq_positions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['VOO', 'AAPL'], 'DESCRIPTION': [None, None], 'INVESTMENT_TYPE': ['etf', 'stock'],
+            'MKT_VALUE': [10000.0, 2000.0]})
+        mock_get_allocation_type.return_value = pd.DataFrame(data={
+            'SOURCE': ['EQUITY', 'EQUITY', 'FIXED_INCOME', 'OTHERS'], 'SYMBOL': ['VOO', 'AAPL', None, 'TEST03'],
+            'MAJOR_TYPE': [None, None, None, 'Cash Equivalent'], 'MINOR_TYPE': ['etf', 'stock', 'CD', 'Saving'],
+            'DOLLARS': [10000.0, 2000.0, 3000.0, 1000.0]})
+        _first_output = _test_instance.generate_allocation_report_type()
+        _test_instance.generate_allocation_report_equity_stock()
+        _second_output = _test_instance.generate_allocation_report_type()
+        self.assertEqual(mock_get_eq_positions.call_count, 1)
+        self.assertEqual(mock_get_allocation_type.call_count, 1)
+        pd.testing.assert_frame_equal(_first_output, _second_output)
+        _test_instance.data_context.invalidate()
+        _test_instance.generate_allocation_report_equity_stock()
+        self.assertEqual(mock_get_eq_positions.call_count, 2)
+
+    @patch.object(SummaryTool, "_get_watch_list_data")
+    @patch.object(SummaryTool, "_get_allocation_type_data")
+    def test_generate_allocation_report_type_category_fallback(self, mock_get_allocation_type, mock_get_watch_list):
+        """
+        TestCase for SummaryTool.generate_allocation_report_type() with ETF missing from the fund catalog.
+        """
+        _test_instance = SummaryTool()
+        mock_get_allocation_type.return_value = pd.DataFrame(data={
+            'SOURCE': ['EQUITY', 'EQUITY', 'EQUITY', 'FIXED_INCOME', 'OTHERS'],
+            'SYMBOL': ['VOO', 'ARKK', 'AAPL', None, 'VBTLX'],
+            'MAJOR_TYPE': [None, None, None, None, 'FIXED_INCOME'],
+            'MINOR_TYPE': ['etf', 'etf', 'stock', 'CD', 'Mutual Fund'],
+            'DOLLARS': [10000.0, 5000.0, 2000.0, 3000.0, 1000.0]})
+        mock_get_watch_list.return_value = pd.DataFrame(data={
+            'SYMBOL': ['ARKK', 'AAPL'], 'CATEGORY': ['Mid-Cap Growth', None]})
+        _test_output = _test_instance.generate_allocation_report_type()
+        self.assertEqual(mock_get_watch_list.call_count, 1)
+        self.assertEqual(set(_test_output['MINOR_TYPE']),
+                         {'Large-Cap', 'Mid-Cap Growth', 'Individual Stock', 'CD', 'Mutual Fund', ''})
 
     @patch.object(SummaryTool, "_get_fixed_transactions_data")
     def test_generate_mature_calender(self, mock_get_fixed_transactions):
@@ -187,56 +241,69 @@ class TestSummaryTool(unittest.TestCase):
         self.assertTrue(mock_get_fixed_transactions.called)
         self.assertEqual(_test_output.shape[0], 3)
         self.assertEqual(list(_test_output.columns),
-                         ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF'])
+                         ['MATURE_DATE', 'TOTAL_DOLLARS', 'TOTAL_COUNT', 'YIELD', 'SYMBOL_REF', 'IS_TOTAL'])
         self.assertEqual(list(_test_output['MATURE_DATE']), ['2099-01', '2099-02', '2099-03'])
-        self.assertEqual(list(_test_output.iloc[0]), ['2099-01', '$1,000', 1, '1.00%', 'TEST01(Fidelity)'])
+        self.assertEqual(list(_test_output.iloc[0]), ['2099-01', 1000.0, 1, 1.0, 'TEST01(Fidelity)', False])
 
-    @patch.object(SummaryTool, "_get_eq_positions_data")
-    @patch.object(SummaryTool, "_get_eq_transactions_data")
     @patch.object(SummaryTool, "_get_fixed_transactions_data")
-    @patch.object(SummaryTool, "_get_other_investment_information")
-    def test_generate_allocation_report_account(self, mock_get_other_investment, mock_get_fixed_transactions,
-                                                mock_get_eq_transactions, mock_get_eq_positions):
+    def test_generate_cash_flow_ladder(self, mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_cash_flow_ladder().
+        """
+        _test_instance = SummaryTool()
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data={
+            'ADD_DATE': ['2000-01-15', '2000-01-15'],
+            'END_DATE': ['2099-01-15', '2099-02-15'],
+            'TOTAL_DOLLARS': [1000.0, 2000.0],
+            'APR': [0.0, 0.04],
+            'ACCOUNT': ['Fidelity', 'Vanguard']})
+        _test_output = _test_instance.generate_cash_flow_ladder()
+        self.assertEqual(list(_test_output.columns), ['MONTH', 'ACCOUNT', 'PRINCIPAL', 'INTEREST', 'TOTAL'])
+        # semiannual coupons of the Vanguard position over 30 years, both principals are beyond the horizon
+        self.assertEqual(_test_output.shape[0], 60)
+        self.assertEqual(list(_test_output['ACCOUNT'].unique()), ['Vanguard'])
+        self.assertEqual(list(_test_output['INTEREST'].unique()), [40.0])
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    def test_generate_fixed_income_analytics(self, mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_fixed_income_analytics().
+        """
+        _test_instance = SummaryTool()
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['TEST01', 'n/a', 'TEST03'],
+            'ADD_DATE': ['2000-01-15', '2000-01-15', '2000-01-15'],
+            'END_DATE': ['2099-02-15', '2099-01-15', '2001-01-15'],
+            'TOTAL_DOLLARS': [1000.0, 3000.0, 2000.0],
+            'TOTAL_COST': [1000.0, 3000.0, 2000.0],
+            'APR': [0.02, 0.04, 0.01],
+            'ACCOUNT': ['Fidelity', 'Vanguard', 'Fidelity']})
+        _test_output = _test_instance.generate_fixed_income_analytics()
+        self.assertEqual(list(_test_output.columns),
+                         ['SYMBOL', 'ACCOUNT', 'END_DATE', 'DOLLARS', 'CURRENT_YIELD', 'YTM', 'YEARS_TO_MATURITY',
+                          'MACAULAY_DURATION', 'MODIFIED_DURATION', 'CONVEXITY', 'IS_TOTAL'])
+        # matured position dropped, ordered by maturity, dollar-weighted total
+        self.assertEqual(list(_test_output['SYMBOL']), ['CD', 'TEST01', 'TOTAL'])
+        self.assertEqual(list(_test_output['IS_TOTAL']), [False, False, True])
+        self.assertAlmostEqual(_test_output['CURRENT_YIELD'].iloc[2], 3.5)
+        self.assertAlmostEqual(_test_output['DOLLARS'].iloc[2], 4000.0)
+
+    @patch.object(SummaryTool, "_get_allocation_account_data")
+    def test_generate_allocation_report_account(self, mock_get_allocation_account):
         """
         TestCase for SummaryTool.generate_allocation_report_account().
         """
         _test_instance = SummaryTool()
-        _dict_eq_positions = {
-            'SYMBOL': ['VOO', 'BLV'],
-            'DOLLARS': [400.0, 100.0]
-        }
-        _dict_eq_transactions = {
-            'SYMBOL': ['VOO', 'VOO', 'BLV', 'BLV'],
-            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL'],
-            'UNITS': [20, 5, 100, 50],
-            'ACCOUNT': ['TD', 'Fidelity', 'TD', 'TD']
-        }
-        _dict_fixed_transactions = {
-            'TOTAL_DOLLARS': [5000.0, 2000.0],
-            'END_DATE': ['2099-02-15', '2001-01-15'],
-            'ACCOUNT': ['TD', 'TD']
-        }
-        _dict_other_investments = {
-            'ACCOUNT': ['CITI', 'Fidelity'],
-            'DOLLARS': [5000.0, 5000.0]
-        }
-        _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
-        _pd_eq_transactions = pd.DataFrame(data=_dict_eq_transactions)
-        _pd_fixed_transactions = pd.DataFrame(data=_dict_fixed_transactions)
-        _pd_other_investments = pd.DataFrame(data=_dict_other_investments)
-        mock_get_eq_positions.return_value = _pd_eq_positions
-        mock_get_eq_transactions.return_value = _pd_eq_transactions
-        mock_get_fixed_transactions.return_value = _pd_fixed_transactions
-        mock_get_other_investment.return_value = _pd_other_investments
+        mock_get_allocation_account.return_value = pd.DataFrame(data={
+            'ACCOUNT': ['CITI', 'Fidelity', 'TD'],
+            'TOTAL_DOLLARS': [5000.0, 7000.0, 18000.0]
+        })
         _test_output = _test_instance.generate_allocation_report_account()
-        self.assertTrue(mock_get_eq_positions.called)
-        self.assertTrue(mock_get_eq_transactions.called)
-        self.assertTrue(mock_get_fixed_transactions.called)
-        self.assertTrue(mock_get_other_investment.called)
+        self.assertTrue(mock_get_allocation_account.called)
         self.assertEqual(_test_output.shape[0], 3)
-        self.assertEqual(list(_test_output.columns), ['ACCOUNT', 'TOTAL_DOLLARS', 'ALLOCATION'])
-        self.assertEqual(list(_test_output['TOTAL_DOLLARS']), ['$18,000', '$7,000', '$5,000'])
-        self.assertEqual(list(_test_output.iloc[0]), ['TD', '$18,000', '60%'])
+        self.assertEqual(list(_test_output.columns), ['ACCOUNT', 'TOTAL_DOLLARS', 'ALLOCATION', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output['TOTAL_DOLLARS']), [18000.0, 7000.0, 5000.0])
+        self.assertEqual(list(_test_output.iloc[0]), ['TD', 18000.0, 60.0, False])
 
     @patch.object(SummaryTool, "_get_eq_positions_data")
     def test_generate_allocation_report_equity_stock(self, mock_get_eq_positions):
@@ -253,11 +320,15 @@ class TestSummaryTool(unittest.TestCase):
         _pd_eq_positions = pd.DataFrame(data=_dict_eq_positions)
         mock_get_eq_positions.return_value = _pd_eq_positions
         _test_output = _test_instance.generate_allocation_report_equity_stock()
-        self.assertTrue(mock_get_eq_positions.called)
+        # stock rows come from the same positions frame as the other reports
+        self.assertEqual(mock_get_eq_positions.call_count, 1)
+        self.assertEqual(mock_get_eq_positions.call_args[0], ())
         self.assertEqual(_test_output.shape[0], 3)
-        self.assertEqual(list(_test_output.columns), ['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION'])
-        self.assertEqual(list(_test_output['DOLLARS']), ['$3,000', '$2,000', '$5,000'])
-        self.assertEqual(list(_test_output.iloc[0]), ['MSFT', None, '$3,000', '60.00%'])
+        self.assertEqual(list(_test_output.columns),
+                         ['SYMBOL', 'DESCRIPTION', 'DOLLARS', 'STOCK_ALLOCATION', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output['DOLLARS']), [3000.0, 2000.0, 5000.0])
+        self.assertEqual(list(_test_output.iloc[0]), ['MSFT', None, 3000.0, 60.0, False])
+        self.assertEqual(list(_test_output['IS_TOTAL']), [False, False, True])
 
     @patch.object(SummaryTool, "_get_fixed_transactions_data")
     @patch.object(SummaryTool, "_get_eq_transactions_data")
@@ -303,12 +374,99 @@ class TestSummaryTool(unittest.TestCase):
         mock_get_other_investments.return_value = _pd_other_investments
         mock_get_fixed_transactions.return_value = _pd_fixed_transactions
         _test_output = _test_instance.generate_allocation_report_etf_w_account('Fidelity')
-        self.assertTrue(mock_get_eq_positions.called)
+        # the account and the investment type are passed down to the SQL reads
+        self.assertEqual(mock_get_eq_transactions.call_args[0][0], 'Fidelity')
+        self.assertEqual(mock_get_eq_positions.call_args[0][0], 'etf')
+        self.assertEqual(mock_get_fixed_transactions.call_args[0][:2], ('Fidelity', True))
         self.assertEqual(_test_output.shape[0], 5)
         pd.set_option('display.expand_frame_repr', False)
         print(_test_output)
         self.assertEqual(list(_test_output.columns), ['ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS',
                                                       'ASSET_CLASS_ALLOCATION', 'SUBCLASS',
-                                                      'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION'])
-        self.assertEqual(list(_test_output['SUBCLASS_TOTAL_DOLLARS']), ['$12,000', '$6,000', '$5,000', '$5,000', '$nan'])
-        self.assertEqual(list(_test_output.iloc[0]), ['Large-Cap', '$12,000', '42.9%', 'Blend', '$12,000', '42.86%'])
+                                                      'SUBCLASS_TOTAL_DOLLARS', 'SUBCLASS_ALLOCATION', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output['SUBCLASS_TOTAL_DOLLARS'])[:4], [12000.0, 6000.0, 5000.0, 5000.0])
+        self.assertEqual(list(_test_output['IS_TOTAL']), [False] * 4 + [True])
+        self.assertEqual([round(x, 2) if isinstance(x, float) else x for x in _test_output.iloc[0]],
+                         ['Large-Cap', 12000.0, 42.86, 'Blend', 12000.0, 42.86, False])
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    def test_generate_allocation_report_etf_all_accounts(self, mock_get_other_investments, mock_get_eq_positions,
+                                                         mock_get_eq_transactions, mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_allocation_report_etf_all_accounts().
+        """
+        _test_instance = SummaryTool()
+        mock_get_eq_transactions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['VOO', 'VOO', 'VB', 'VB', 'BND', 'AAPL'],
+            'ACCOUNT': ['Fidelity', 'Vanguard', 'Fidelity', 'Fidelity', 'Vanguard', 'Fidelity'],
+            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL', 'BUY', 'BUY'],
+            'UNITS': [30, 20, 100, 50, 100, 10]})
+        mock_get_eq_positions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['VOO', 'VB', 'BND', 'AAPL'],
+            'DESCRIPTION': [None, None, None, None],
+            'INVESTMENT_TYPE': ['etf', 'etf', 'etf', 'stock'],
+            'DOLLARS': [400.0, 100.0, 100.0, 200.0]})
+        mock_get_other_investments.return_value = pd.DataFrame(data={
+            'SUFFIX': ['n/a', 'n/a'],
+            'MAJOR_TYPE': ['Cash Equivalent', 'Cash Equivalent'],
+            'MINOR_TYPE': ['Cash', 'Cash'],
+            'ACCOUNT': ['Fidelity', 'Fidelity'],
+            'DOLLARS': [3000.0, 3000.0]})
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data={
+            'TOTAL_DOLLARS': [5000.0, 3000.0, 1000.0],
+            'END_DATE': ['2099-01-01', '2010-01-01', '2099-01-01'],
+            'INVESTMENT_TYPE': ['TREASURY', 'TREASURY', 'TREASURY'],
+            'ACCOUNT': ['Fidelity', 'Fidelity', 'Vanguard']})
+        _test_output = _test_instance.generate_allocation_report_etf_all_accounts()
+        self.assertEqual(mock_get_eq_transactions.call_count, 1)
+        self.assertEqual(list(_test_output.keys()), ['Fidelity', 'Vanguard'])
+        self.assertEqual([round(x, 2) if isinstance(x, float) else x for x in _test_output['Fidelity'].iloc[0]],
+                         ['Large-Cap', 12000.0, 42.86, 'Blend', 12000.0, 42.86, False])
+        self.assertEqual([[round(x, 2) if isinstance(x, float) else x for x in y]
+                          for y in _test_output['Vanguard'].iloc[:3].values.tolist()],
+                         [['Fixed Income', 11000.0, 57.89, 'Intermediate-Term Blend', 10000.0, 52.63, False],
+                          ['Fixed Income', 11000.0, 57.89, 'TREASURY', 1000.0, 5.26, False],
+                          ['Large-Cap', 8000.0, 42.11, 'Blend', 8000.0, 42.11, False]])
+        self.assertEqual(list(_test_output['Vanguard'].iloc[3])[:4], ['TOTAL', 19000.0, 100.0, ''])
+        self.assertEqual(_test_instance.generate_allocation_report_etf_w_account('Schwab').shape[0], 1)
+
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    def test_generate_position_values(self, mock_get_other_investments, mock_get_eq_positions,
+                                      mock_get_eq_transactions, mock_get_fixed_transactions):
+        """
+        TestCase for SummaryTool.generate_position_values().
+        """
+        _test_instance = SummaryTool()
+        mock_get_eq_transactions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['VOO', 'VOO', 'AAPL', 'AAPL'],
+            'ACCOUNT': ['Fidelity', 'Vanguard', 'Fidelity', 'Fidelity'],
+            'TYPE': ['BUY', 'BUY', 'BUY', 'SELL'],
+            'UNITS': [30, 20, 10, 10]})
+        mock_get_eq_positions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['VOO', 'AAPL'],
+            'INVESTMENT_TYPE': ['etf', 'stock'],
+            'DOLLARS': [400.0, 200.0]})
+        mock_get_other_investments.return_value = pd.DataFrame(data={
+            'SUFFIX': ['n/a'],
+            'MAJOR_TYPE': ['Cash Equivalent'],
+            'ACCOUNT': ['Fidelity'],
+            'DOLLARS': [3000.0]})
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data={
+            'SYMBOL': ['XXXXXXXX1', 'XXXXXXXX1', 'XXXXXXXX2'],
+            'INVESTMENT_TYPE': ['TREASURY', 'TREASURY', 'CD'],
+            'UNITS': [5, 3, 1],
+            'TOTAL_DOLLARS': [5000.0, 3000.0, 1000.0],
+            'END_DATE': ['2099-01-01', '2099-01-01', '2010-01-01'],
+            'ACCOUNT': ['Fidelity', 'Fidelity', 'Vanguard']})
+        _test_output = _test_instance.generate_position_values()
+        self.assertEqual(list(_test_output.columns),
+                         ['ACCOUNT', 'SYMBOL', 'INVESTMENT_TYPE', 'UNITS', 'PRICE', 'MKT_VALUE'])
+        self.assertEqual(_test_output[['ACCOUNT', 'SYMBOL', 'MKT_VALUE']].values.tolist(),
+                         [['Fidelity', 'VOO', 12000.0], ['Vanguard', 'VOO', 8000.0],
+                          ['Fidelity', 'XXXXXXXX1', 8000.0], ['Fidelity', 'n/a', 3000.0]])
@@ -0,0 +1,120 @@
+"""
+This :module: contains Test Calls to :module: src/overview_pipeline.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_overview_pipeline
+
+
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+import pandas as pd
+
+from src.overview_generator import SummaryTool
+from src.overview_pipeline import OverviewPipeline
+
+
+class TestOverviewPipeline(unittest.TestCase):
+    def test_init(self):
+        """
+        TestCase for OverviewPipeline.__init__().
+        """
+        _test_instance = OverviewPipeline()
+        self.assertEqual(_test_instance.workers, 4)
+        self.assertTrue(isinstance(_test_instance.summary_tool, SummaryTool))
+        self.assertRaises(IOError, OverviewPipeline, 0)
+        self.assertRaises(IOError, OverviewPipeline, '2')
+        self.assertFalse(_test_instance.replica)
+
+    def test_replicas(self):
+        """
+        TestCase for OverviewPipeline._replicas().
+        """
+        with tempfile.TemporaryDirectory() as _tmp_dir:
+            _test_instance = OverviewPipeline(1, v_replica=True)
+            for _name in ['eq_db_file', 'fixed_db_file']:
+                _db_file = os.path.join(_tmp_dir, _name + '.db')
+                _conn = sqlite3.connect(_db_file)
+                _conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY);")
+                _conn.close()
+                setattr(_test_instance.summary_tool, _name, _db_file)
+            with _test_instance._replicas():
+                _test_uris = [_test_instance.summary_tool.eq_db_file, _test_instance.summary_tool.fixed_db_file]
+                self.assertTrue(all(x.startswith('file:replica_') for x in _test_uris))
+                _conn = sqlite3.connect(_test_uris[1], uri=True)
+                self.assertEqual(_conn.execute("SELECT COUNT(*) FROM transactions;").fetchall(), [(0,)])
+                _conn.close()
+            self.assertEqual(_test_instance.summary_tool.eq_db_file, os.path.join(_tmp_dir, 'eq_db_file.db'))
+            _test_instance.summary_tool.fixed_db_file = os.path.join(_tmp_dir, 'missing.db')
+            with self.assertRaises(IOError):
+                with _test_instance._replicas():
+                    pass
+            self.assertEqual(_test_instance.summary_tool.fixed_db_file, os.path.join(_tmp_dir, 'missing.db'))
+
+    @patch.object(SummaryTool, "_get_allocation_type_data")
+    @patch.object(SummaryTool, "_get_allocation_account_data")
+    @patch.object(SummaryTool, "_get_watch_list_data")
+    @patch.object(SummaryTool, "_get_other_investment_information")
+    @patch.object(SummaryTool, "_get_fixed_transactions_data")
+    @patch.object(SummaryTool, "_get_eq_positions_data")
+    @patch.object(SummaryTool, "_get_eq_transactions_data")
+    @patch.object(SummaryTool, "generate_cash_flow_ladder")
+    @patch.object(SummaryTool, "generate_fixed_income_analytics")
+    @patch.object(SummaryTool, "generate_mature_calender")
+    @patch.object(SummaryTool, "generate_allocation_report_equity_stock")
+    @patch.object(SummaryTool, "generate_allocation_report_etf_all_accounts")
+    @patch.object(SummaryTool, "generate_allocation_report_account")
+    @patch.object(SummaryTool, "generate_allocation_report_type")
+    def test_sections(self, mock_type, mock_account, mock_etf, mock_stock, mock_mature, mock_bond, mock_ladder,
+                      *mock_loaders):
+        """
+        TestCase for OverviewPipeline.sections().
+        """
+        for _mock in mock_loaders:
+            _mock.return_value = pd.DataFrame(data={'SYMBOL': ['VOO'], 'DESCRIPTION': ['S&P 500'],
+                                                    'INVESTMENT_TYPE': ['etf'], 'MKT_VALUE': [400.0]})
+        mock_type.return_value = pd.DataFrame(data={'MAJOR_TYPE': ['EQUITY']})
+        mock_account.return_value = pd.DataFrame(data={'ACCOUNT': ['Schwab']})
+        mock_etf.return_value = {'Vanguard': pd.DataFrame(data={'ASSET_CLASS': ['US Equity']}),
+                                 'Schwab': pd.DataFrame(data={'ASSET_CLASS': ['Bond']})}
+        mock_stock.return_value = pd.DataFrame(data={'SYMBOL': ['AAPL']})
+        mock_mature.return_value = pd.DataFrame(data={'YEAR': [2030]})
+        mock_bond.return_value = pd.DataFrame(data={'YTM': [4.5]})
+        mock_ladder.return_value = pd.DataFrame(data={'MONTH': ['2030-01']})
+        _expected_titles = ['Allocation Report - Investment Type', 'Allocation Report - Broker',
+                            'Allocation Report - Vanguard', 'Allocation Report - Schwab',
+                            'Allocation Report - Individual Stock', 'Fixed Income Mature Calender',
+                            'Fixed Income Analytics']
+        for _workers in [1, 4]:
+            _test_instance = OverviewPipeline(_workers)
+            _test_output = _test_instance.sections()
+            self.assertEqual([x[0] for x in _test_output], _expected_titles)
+            self.assertEqual(_test_output[2][1].iloc[0]['ASSET_CLASS'], 'US Equity')
+            self.assertEqual(_test_output[5][1].iloc[0]['YEAR'], 2030)
+            self.assertEqual(_test_output[6][1].iloc[0]['YTM'], 4.5)
+            self.assertEqual(list(_test_instance.timings.keys()),
+                             ['allocation_type', 'allocation_account', 'allocation_etf_by_account',
+                              'allocation_equity_stock', 'mature_calender', 'fixed_income_analytics',
+                              'cash_flow_ladder'])
+            self.assertTrue(all(_test_instance.summary_tool.data_context.is_loaded(x)
+                                for x in _test_instance.summary_tool.data_context.loaders))
+        # every shared input is loaded once per pipeline run, stock positions are taken from the positions frame
+        for _mock in mock_loaders:
+            self.assertEqual(_mock.call_count, 2)
+        self.assertEqual(mock_type.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
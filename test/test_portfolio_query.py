@@ -0,0 +1,158 @@
+"""
+This :module: contains Test Calls to :module: src/portfolio_query.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_portfolio_query
+
+
+"""
+
+import os
+import json
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from src.portfolio_query import PortfolioQuery
+from src.db_replica import DatabaseReplica
+from src.eq_SQLite_utility import SQLiteRequest
+from src.fixed_SQLite_utility import FixedSQLiteRequest
+
+
+class TestPortfolioQuery(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._eq_db_file = os.path.join(self._tmp_dir.name, 'equity.db')
+        self._fixed_db_file = os.path.join(self._tmp_dir.name, 'fixed_income.db')
+        self._other_investment_file = os.path.join(self._tmp_dir.name, 'others.json')
+        _eq_instance = SQLiteRequest(self._eq_db_file)
+        _eq_instance.create_database()
+        _eq_instance.create_table_transactions()
+        for _row in [('VOO', 'BUY', 20, 'TD'), ('VOO', 'BUY', 5, 'Fidelity'), ('BLV', 'BUY', 100, 'TD'),
+                     ('BLV', 'SELL', 50, 'TD')]:
+            _eq_instance.insert_into_table_transactions(_row[0], _row[1], '2018-12-31', 100.0, _row[2], 'etf',
+                                                        _row[3], _row[0])
+        _eq_instance.create_table_watch_list()
+        _eq_instance.sync_table_watch_list()
+        _eq_instance.create_table_holdings()
+        _eq_instance.sync_table_holdings()
+        _eq_instance.create_view_positions()
+        _conn = sqlite3.connect(self._eq_db_file)
+        _conn.execute("UPDATE watch_list SET PREV_CLOSE = CASE SYMBOL WHEN 'VOO' THEN 400.0 ELSE 100.0 END;")
+        _conn.commit()
+        _conn.close()
+        _fixed_instance = FixedSQLiteRequest(self._fixed_db_file)
+        _fixed_instance.create_database()
+        _fixed_instance.create_table_transactions_fixed()
+        _fixed_instance.insert_into_table_transactions_fixed('CD', 'TEST01', 'CD', 5, 1000.0, '2020-02-15',
+                                                             '2099-02-15', 5000.0, 'TD')
+        _fixed_instance.insert_into_table_transactions_fixed('CD', 'TEST02', 'CD', 2, 1000.0, '2000-01-15',
+                                                             '2001-01-15', 2000.0, 'TD')
+        with open(self._other_investment_file, 'w') as wf:
+            json.dump([{'SUFFIX': 'n/a', 'DESCRIPTION': 'Saving', 'MAJOR_TYPE': 'Cash Equivalent',
+                        'MINOR_TYPE': 'Saving', 'DOLLARS': 5000.0, 'ACCOUNT': 'CITI'},
+                       {'SUFFIX': 'VBTLX', 'DESCRIPTION': 'Bond Index', 'MAJOR_TYPE': 'FIXED_INCOME',
+                        'MINOR_TYPE': 'Mutual Fund', 'DOLLARS': 5000.0, 'ACCOUNT': 'Fidelity'}], wf)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_init(self):
+        """
+        TestCase for PortfolioQuery.__init__().
+        """
+        _test_instance = PortfolioQuery(self._eq_db_file, self._fixed_db_file, self._other_investment_file)
+        self.assertEqual(_test_instance.eq_db_file, self._eq_db_file)
+        self.assertRaises(IOError, PortfolioQuery, self._eq_db_file, None, self._other_investment_file)
+        _test_instance.fixed_db_file = os.path.join(self._tmp_dir.name, 'missing.db')
+        self.assertRaises(IOError, _test_instance.get_allocation_account)
+
+    def test_get_allocation_account(self):
+        """
+        TestCase for PortfolioQuery.get_allocation_account().
+        """
+        _test_instance = PortfolioQuery(self._eq_db_file, self._fixed_db_file, self._other_investment_file)
+        _test_output = _test_instance.get_allocation_account()
+        self.assertEqual(_test_output, [{'ACCOUNT': 'CITI', 'TOTAL_DOLLARS': 5000.0},
+                                        {'ACCOUNT': 'Fidelity', 'TOTAL_DOLLARS': 7000.0},
+                                        {'ACCOUNT': 'TD', 'TOTAL_DOLLARS': 18000.0}])
+        # one connection is shared by the queries of the instance until close()
+        _test_conn = _test_instance._conn
+        _test_instance.get_allocation_type()
+        self.assertIs(_test_instance._conn, _test_conn)
+        _test_instance.close()
+        self.assertIsNone(_test_instance._conn)
+        # prices are read from :table: materialized_positions when it exists
+        SQLiteRequest(self._eq_db_file).create_table_materialized_positions()
+        _conn = sqlite3.connect(self._eq_db_file)
+        _conn.execute("DROP VIEW positions;")
+        _conn.close()
+        self.assertEqual(_test_instance.get_allocation_account(), _test_output)
+        _test_instance.close()
+
+    def test_older_fixed_schema(self):
+        """
+        TestCase for PortfolioQuery on a fixed income database created before the generated day columns.
+        """
+        with PortfolioQuery(self._eq_db_file, self._fixed_db_file, self._other_investment_file) as _test_instance:
+            _test_output = _test_instance.get_allocation_account()
+        _conn = sqlite3.connect(self._fixed_db_file)
+        _conn.execute("DROP VIEW IF EXISTS positions;")
+        _conn.execute("CREATE TABLE older AS SELECT ID, NAME, SYMBOL, INVESTMENT_TYPE, UNITS, FACE_VALUE, "
+                      "TOTAL_DOLLARS, ADD_DATE, END_DATE, TOTAL_COST, APR, YTM, ACCOUNT FROM transactions;")
+        _conn.execute("DROP TABLE transactions;")
+        _conn.execute("ALTER TABLE older RENAME TO transactions;")
+        _conn.commit()
+        _conn.close()
+        with PortfolioQuery(self._eq_db_file, self._fixed_db_file, self._other_investment_file) as _test_instance:
+            self.assertEqual(_test_instance.get_allocation_account(), _test_output)
+        # the schema is left as it is
+        _conn = sqlite3.connect(self._fixed_db_file)
+        self.assertNotIn('END_DAY', [x[1] for x in _conn.execute("PRAGMA table_xinfo(transactions);")])
+        _conn.close()
+
+    def test_special_characters(self):
+        """
+        TestCase for PortfolioQuery with '#', '?' and '%' in the database paths.
+        """
+        _test_output = PortfolioQuery(self._eq_db_file, self._fixed_db_file,
+                                      self._other_investment_file).get_allocation_account()
+        _test_dir = os.path.join(self._tmp_dir.name, 'a#b?c%d')
+        os.makedirs(_test_dir)
+        for _file in [self._eq_db_file, self._fixed_db_file]:
+            shutil.copy(_file, _test_dir)
+        with PortfolioQuery(os.path.join(_test_dir, 'equity.db'), os.path.join(_test_dir, 'fixed_income.db'),
+                            self._other_investment_file) as _test_instance:
+            self.assertEqual(_test_instance.get_allocation_account(), _test_output)
+        self.assertEqual(sorted(os.listdir(_test_dir)), ['equity.db', 'fixed_income.db'])
+        self.assertNotIn('a', os.listdir(self._tmp_dir.name))
+
+    def test_get_allocation_type(self):
+        """
+        TestCase for PortfolioQuery.get_allocation_type(), reading from in-memory replicas.
+        """
+        with DatabaseReplica(self._eq_db_file) as _eq_replica, DatabaseReplica(self._fixed_db_file) as _fixed_replica:
+            _test_instance = PortfolioQuery(_eq_replica.uri, _fixed_replica.uri, self._other_investment_file)
+            _test_output = _test_instance.get_allocation_type()
+            # the attached replicas are not writable through the query connection
+            _test_conn = _test_instance._create_connection()
+            self.assertRaises(sqlite3.OperationalError, _test_conn.execute, "DELETE FROM eq.transactions;")
+            _test_conn.close()
+        self.assertEqual(sorted((x['SOURCE'], x['SYMBOL'] or '', x['MINOR_TYPE'], x['DOLLARS'])
+                                for x in _test_output),
+                         [('EQUITY', 'BLV', 'etf', 5000.0), ('EQUITY', 'VOO', 'etf', 10000.0),
+                          ('FIXED_INCOME', '', 'CD', 5000.0), ('OTHERS', 'VBTLX', 'Mutual Fund', 5000.0),
+                          ('OTHERS', 'n/a', 'Saving', 5000.0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+This :module: contains Test Calls to :module: src/report_exporter.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_report_exporter
+
+
+"""
+
+import os
+import tempfile
+import unittest
+import importlib.util
+import pandas as pd
+
+from src.report_exporter import ReportExporter
+
+
+class TestReportExporter(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._stem = os.path.join(self._tmp_dir.name, 'snapshot_20261019')
+        self.dict_reports = {
+            'allocation_account': pd.DataFrame(data={
+                'ACCOUNT': ['Fidelity', 'Vanguard'], 'TOTAL_DOLLARS': [3000, 1000.0], 'ALLOCATION': [75.0, 25.0],
+                'IS_TOTAL': [False, False]}),
+            'allocation_etf_by_account': {
+                'Fidelity': pd.DataFrame(data={'ASSET_CLASS': ['Large-Cap', 'TOTAL'],
+                                               'ASSET_CLASS_TOTAL_DOLLARS': [3000.0, 3000.0],
+                                               'SUBCLASS': ['Blend', ''],
+                                               'SUBCLASS_TOTAL_DOLLARS': [3000.0, float('nan')],
+                                               'IS_TOTAL': [False, True]}),
+                'Vanguard': pd.DataFrame(data={'ASSET_CLASS': ['TOTAL'], 'ASSET_CLASS_TOTAL_DOLLARS': [1000.0],
+                                               'SUBCLASS': [''], 'SUBCLASS_TOTAL_DOLLARS': [float('nan')],
+                                               'IS_TOTAL': [True]})}
+        }
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_to_frame(self):
+        """
+        TestCase for ReportExporter.to_frame().
+        """
+        _test_output = ReportExporter.to_frame(self.dict_reports['allocation_etf_by_account'])
+        self.assertEqual(list(_test_output.columns), ['ACCOUNT', 'ASSET_CLASS', 'ASSET_CLASS_TOTAL_DOLLARS',
+                                                      'SUBCLASS', 'SUBCLASS_TOTAL_DOLLARS', 'IS_TOTAL'])
+        self.assertEqual(list(_test_output['ACCOUNT']), ['Fidelity', 'Fidelity', 'Vanguard'])
+        self.assertEqual(_test_output['IS_TOTAL'].dtype, bool)
+        _test_output = ReportExporter.to_frame(self.dict_reports['allocation_account'])
+        self.assertEqual(_test_output['TOTAL_DOLLARS'].dtype, 'float64')
+
+    def test_export(self):
+        """
+        TestCase for ReportExporter.export() with json and csv.
+        """
+        _test_instance = ReportExporter()
+        _test_output = _test_instance.export(self._stem, self.dict_reports, ['json', 'csv'])
+        self.assertEqual(_test_output, [self._stem + '.jsonl', self._stem + '_allocation_account.csv',
+                                        self._stem + '_allocation_etf_by_account.csv'])
+        self.assertEqual(_test_output, _test_instance.output_files(self._stem, list(self.dict_reports.keys()),
+                                                                   ['json', 'csv']))
+        self.assertTrue(all(os.path.exists(x) for x in _test_output))
+        _df_json = pd.read_json(self._stem + '.jsonl', lines=True)
+        self.assertEqual(_df_json.shape[0], 5)
+        self.assertEqual(list(_df_json['REPORT'].unique()), ['allocation_account', 'allocation_etf_by_account'])
+        _df_csv = pd.read_csv(self._stem + '_allocation_account.csv')
+        self.assertEqual(_df_csv['TOTAL_DOLLARS'].tolist(), [3000.0, 1000.0])
+        self.assertFalse(any(x.endswith('.tmp') for x in os.listdir(self._tmp_dir.name)))
+        self.assertRaises(IOError, _test_instance.export, self._stem, self.dict_reports, ['xml'])
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_export_parquet(self):
+        """
+        TestCase for ReportExporter.export() with parquet.
+        """
+        ReportExporter().export(self._stem, self.dict_reports, ['parquet'])
+        _test_output = pd.read_parquet(self._stem + '_allocation_etf_by_account.parquet')
+        self.assertEqual(_test_output['IS_TOTAL'].tolist(), [False, True, True])
+        self.assertEqual(_test_output['SUBCLASS_TOTAL_DOLLARS'].dtype, 'float64')
+
+
+if __name__ == '__main__':
+    unittest.main()
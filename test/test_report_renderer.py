@@ -0,0 +1,136 @@
+"""
+This :module: contains Test Calls to :module: src/report_renderer.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_report_renderer
+
+
+"""
+
+import os
+import tempfile
+import unittest
+import pandas as pd
+
+from src.report_renderer import ReportRenderer, format_column
+
+
+class TestReportRenderer(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self.dict_allocation_type = {
+            'MAJOR_TYPE': ['EQUITY', 'EQUITY', 'FIXED_INCOME', 'TOTAL'],
+            'MAJOR_TOTAL_DOLLARS': [12000.0, 12000.0, 20000.0, 32000.0],
+            'MAJOR_ALLOCATION': [37.5, 37.5, 62.5, 100.0],
+            'MINOR_TYPE': ['Large-Cap', 'Individual Stock', 'CD', ''],
+            'MINOR_TOTAL_DOLLARS': [10000.0, 2000.0, 20000.0, float('nan')],
+            'MINOR_ALLOCATION': [31.25, 6.25, 62.5, float('nan')],
+            'IS_TOTAL': [False, False, False, True]
+        }
+
+    def test_format_column(self):
+        """
+        TestCase for format_column().
+        """
+        self.assertEqual(list(format_column([1234567.4, float('nan'), 0.0], '${:,.0f}')),
+                         ['$1,234,567', '', '$0'])
+        self.assertEqual(list(format_column([42.857, 100.0], '{:.1f}%')), ['42.9%', '100.0%'])
+
+    def test_format_frame(self):
+        """
+        TestCase for ReportRenderer.format_frame().
+        """
+        _test_output = ReportRenderer().format_frame(pd.DataFrame(data=self.dict_allocation_type))
+        self.assertEqual(list(_test_output.columns),
+                         ['MAJOR_TYPE', 'MAJOR_TOTAL_DOLLARS', 'MAJOR_ALLOCATION',
+                          'MINOR_TYPE', 'MINOR_TOTAL_DOLLARS', 'MINOR_ALLOCATION'])
+        self.assertEqual(list(_test_output.iloc[0]), ['EQUITY', '$12,000', '38%', 'Large-Cap', '$10,000', '31.25%'])
+        self.assertEqual(list(_test_output.iloc[1]), ['EQUITY', '', '', 'Individual Stock', '$2,000', '6.25%'])
+        self.assertEqual(list(_test_output.iloc[3]), ['TOTAL', '$32,000', '100%', '', '', ''])
+
+    def test_format_frame_mature_calender(self):
+        """
+        TestCase for ReportRenderer.format_frame() with integer and text columns.
+        """
+        _test_output = ReportRenderer().format_frame(pd.DataFrame(data={
+            'MATURE_DATE': ['2099-01'], 'TOTAL_DOLLARS': [1000.0], 'TOTAL_COUNT': [1], 'YIELD': [1.0],
+            'SYMBOL_REF': ['TEST01(Fidelity)'], 'IS_TOTAL': [False]}))
+        self.assertEqual(list(_test_output.iloc[0]), ['2099-01', '$1,000', '1', '1.00%', 'TEST01(Fidelity)'])
+
+    def test_to_html(self):
+        """
+        TestCase for ReportRenderer.to_html().
+        """
+        _dict_stock = {
+            'SYMBOL': ['MSFT', 'TOTAL'],
+            'DESCRIPTION': ['Microsoft <Corp> & Co', 'N/A'],
+            'DOLLARS': [3000.0, 3000.0],
+            'STOCK_ALLOCATION': [100.0, 100.0],
+            'IS_TOTAL': [False, True]
+        }
+        _test_output = ReportRenderer().to_html(pd.DataFrame(data=_dict_stock))
+        self.assertIn('<th align="center"; bgcolor="E0FFFF">SYMBOL</th>', _test_output)
+        self.assertIn('<td>Microsoft &lt;Corp&gt; &amp; Co</td>', _test_output)
+        self.assertIn('<td><strong>TOTAL</strong></td>', _test_output)
+        self.assertIn('<td><strong>$3,000</strong></td>', _test_output)
+        self.assertIn('<td>100.00%</td>', _test_output)
+        self.assertNotIn('IS_TOTAL', _test_output)
+
+    def test_iter_html(self):
+        """
+        TestCase for ReportRenderer.iter_html().
+        """
+        _df_report = pd.DataFrame(data=self.dict_allocation_type)
+        _test_instance = ReportRenderer(v_chunk_rows=3)
+        _test_output = list(_test_instance.iter_html(_df_report))
+        # table head, 2 row chunks, table tail
+        self.assertEqual(len(_test_output), 4)
+        self.assertEqual(_test_output[1].count('<tr>'), 3)
+        self.assertEqual(''.join(_test_output), ReportRenderer().to_html(_df_report))
+        self.assertIn('<td><strong>$32,000</strong></td>', _test_output[2])
+        # one row per chunk, the repeated EQUITY total is still blanked across the chunk boundary
+        _test_output = list(ReportRenderer(v_chunk_rows=1).iter_html(_df_report))
+        self.assertEqual(len(_test_output), 6)
+        self.assertEqual(_test_output[2].count('<td></td>'), 2)
+        self.assertEqual(''.join(_test_output), ReportRenderer().to_html(_df_report))
+
+    def test_write_snapshot(self):
+        """
+        TestCase for ReportRenderer.write_snapshot().
+        """
+        _df_report = pd.DataFrame(data=self.dict_allocation_type)
+        with tempfile.TemporaryDirectory() as _tmp_dir:
+            _out_filename = os.path.join(_tmp_dir, 'snapshot_20261019.html')
+            ReportRenderer().write_snapshot(_out_filename, 'Oct 19, 2026',
+                                            iter([('Allocation Report - Investment Type', _df_report),
+                                                  ('Allocation Report - A&B', _df_report)]))
+            with open(_out_filename, 'r') as rf:
+                _test_output = rf.read()
+            self.assertTrue(_test_output.startswith('<h1>Investment Portfolio Overview - Oct 19, 2026</h1>'))
+            self.assertIn('\n<h3>Allocation Report - Investment Type </h3>\n<table', _test_output)
+            self.assertIn('<h3>Allocation Report - A&amp;B </h3>', _test_output)
+            self.assertEqual(_test_output.count('</table>\n<br>'), 2)
+
+            def _failing_sections():
+                yield 'Allocation Report - Investment Type', _df_report
+                raise RuntimeError('report failed')
+            self.assertRaises(RuntimeError, ReportRenderer().write_snapshot, _out_filename, 'Oct 20, 2026',
+                              _failing_sections())
+            # the previous snapshot is kept and no temporary file is left behind
+            self.assertEqual(os.listdir(_tmp_dir), ['snapshot_20261019.html'])
+            with open(_out_filename, 'r') as rf:
+                self.assertIn('Oct 19, 2026', rf.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
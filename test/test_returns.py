@@ -0,0 +1,126 @@
+"""
+This :module: contains Test Calls to :module: src/returns.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_returns
+
+
+"""
+
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from src.returns import ReturnsCalculator, chain_link_returns, solve_irr, accrete_fixed_income
+
+
+class TestReturnsCalculator(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self.dict_eq_transactions = {
+            'ID': [1, 2],
+            'SYMBOL': ['AAPL', 'AAPL'],
+            'TYPE': ['BUY', 'SELL'],
+            'DATE': ['2020-01-01', '2020-01-03'],
+            'DOLLARS': [100.0, 120.0],
+            'UNITS': [10, 5],
+            'INVESTMENT_TYPE': ['stock', 'stock'],
+            'DESCRIPTION': ['Apple', 'Apple'],
+            'ACCOUNT': ['TD', 'TD'],
+            'TOTAL_DOLLARS': [1000.0, 600.0]
+        }
+        self.dict_fixed_transactions = {
+            'ID': [1], 'NAME': ['12-Month CD'], 'SYMBOL': ['XXXXXXXX2'], 'INVESTMENT_TYPE': ['CD'], 'UNITS': [1],
+            'FACE_VALUE': [1000.0], 'TOTAL_DOLLARS': [1000.0], 'ADD_DATE': ['2019-01-01'],
+            'END_DATE': ['2020-01-01'], 'TOTAL_COST': [1000.0], 'APR': [0.1], 'YTM': [0.0], 'ACCOUNT': ['Fidelity']
+        }
+        self.dict_prices = {
+            'SYMBOL': ['AAPL', 'AAPL'],
+            'DATE': ['2020-01-02', '2020-01-04'],
+            'CLOSE': [110.0, 100.0]
+        }
+
+    def test_chain_link_returns(self):
+        """
+        TestCase for chain_link_returns().
+        """
+        _values = np.array([[0.0, 100.0], [100.0, 110.0], [210.0, 99.0]])
+        _flows = np.array([[0.0, 0.0], [100.0, 0.0], [100.0, 0.0]])
+        _daily, _linked = chain_link_returns(_values, _flows)
+        np.testing.assert_allclose(_daily, [[0.0, 0.1], [0.1, -0.1]])
+        np.testing.assert_allclose(_linked, [0.1, -0.01])
+
+    def test_solve_irr(self):
+        """
+        TestCase for solve_irr().
+        """
+        _test_output = solve_irr(np.array([0, 0, 1, 1, 2]), np.array([0.0, 1.0, 0.0, 2.0, 0.0]),
+                                 np.array([-100.0, 110.0, -100.0, 121.0, -100.0]), 3)
+        np.testing.assert_allclose(_test_output[:2], [0.1, 0.1])
+        self.assertTrue(np.isnan(_test_output[2]))
+
+    def test_accrete_fixed_income(self):
+        """
+        TestCase for accrete_fixed_income(), positions are only valued while they are held.
+        """
+        _dates = np.arange(np.datetime64('2020-01-01'), np.datetime64('2020-01-06'))
+        _args = (_dates, np.array(['2019-12-30', '2020-01-02', '2020-01-03', '2019-01-01', '2020-01-10']),
+                 np.array(['2020-01-03', '2020-01-04', '2099-01-01', '2019-06-01', '2020-12-31']),
+                 np.array([100.0, 200.0, 50.0, 1000.0, 1000.0]), np.array([0.1, 0.0, 0.2, 0.1, 0.1]),
+                 np.array([0, 1, 0, 1, 1]), 2)
+        _growth = 1.1 ** (1 / 365.25)
+        _expected = np.array([[100.0 * _growth ** 2, 0.0], [100.0 * _growth ** 3, 200.0], [50.0, 200.0],
+                              [50.0 * 1.2 ** (1 / 365.25), 0.0], [50.0 * 1.2 ** (2 / 365.25), 0.0]])
+        for _chunk_cells in [1, 2, 4000000]:
+            np.testing.assert_allclose(accrete_fixed_income(*_args, v_chunk_cells=_chunk_cells), _expected)
+
+    @patch.object(ReturnsCalculator, "_get_fixed_transactions_data")
+    @patch.object(ReturnsCalculator, "_get_eq_transactions_data")
+    def test_get_cash_flows(self, mock_get_eq_transactions, mock_get_fixed_transactions):
+        """
+        TestCase for ReturnsCalculator.get_cash_flows().
+        """
+        mock_get_eq_transactions.return_value = pd.DataFrame(data=self.dict_eq_transactions)
+        mock_get_fixed_transactions.return_value = pd.DataFrame(data=self.dict_fixed_transactions)
+        _test_output = ReturnsCalculator().get_cash_flows('2020-01-05')
+        self.assertEqual(list(_test_output['ACCOUNT']), ['Fidelity', 'Fidelity', 'TD', 'TD'])
+        self.assertEqual(list(_test_output['DATE']), ['2019-01-01', '2020-01-01', '2020-01-01', '2020-01-03'])
+        np.testing.assert_allclose(_test_output['AMOUNT'], [1000.0, -1100.0, 1000.0, -600.0], rtol=1e-3)
+
+    @patch.object(ReturnsCalculator, "_get_price_history_data")
+    @patch.object(ReturnsCalculator, "_get_fixed_transactions_data")
+    @patch.object(ReturnsCalculator, "_get_eq_transactions_data")
+    def test_generate_returns_report(self, mock_get_eq_transactions, mock_get_fixed_transactions,
+                                     mock_get_prices):
+        """
+        TestCase for ReturnsCalculator.generate_returns_report().
+        """
+        mock_get_eq_transactions.return_value = pd.DataFrame(data=self.dict_eq_transactions)
+        mock_get_fixed_transactions.return_value = pd.DataFrame(
+            data={k: [] for k in self.dict_fixed_transactions})
+        mock_get_prices.return_value = pd.DataFrame(data=self.dict_prices)
+        _test_output = ReturnsCalculator().generate_returns_report('2020-01-01', '2020-01-04')
+        self.assertEqual(list(_test_output['ACCOUNT']), ['TD'])
+        self.assertEqual(_test_output['START_VALUE'][0], 0.0)
+        self.assertEqual(_test_output['END_VALUE'][0], 500.0)
+        self.assertEqual(_test_output['NET_CONTRIBUTIONS'][0], 400.0)
+        # 1000 -> 1100 -> (600 + 600) -> 500: 1.1 * (1200 / 1100) * (500 / 600) - 1
+        self.assertAlmostEqual(_test_output['TWR'][0], 0.0)
+        _growth = 1.0 + _test_output['IRR'][0]
+        self.assertAlmostEqual(-1000.0 * _growth ** (-1 / 365.25) + 600.0 * _growth ** (-3 / 365.25) +
+                               500.0 * _growth ** (-4 / 365.25), 0.0, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
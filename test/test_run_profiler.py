@@ -0,0 +1,98 @@
+"""
+This :module: contains Test Calls to :module: src/run_profiler.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_run_profiler
+
+
+"""
+
+import os
+import pstats
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.run_profiler import RUN_PROFILER, collapsed_stacks, profiled_stage
+
+
+def _busy_worker(v_size):
+    return sum(x * x for x in range(v_size))
+
+
+@profiled_stage()
+def _allocating_stage(v_size):
+    return [str(x) * 10 for x in range(v_size)]
+
+
+class TestRunProfiler(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        RUN_PROFILER.stop()
+        self._tmp_dir.cleanup()
+
+    def test_collapsed_stacks(self):
+        """
+        TestCase for collapsed_stacks(), the time of a shared callee is split across its callers.
+        """
+        _main, _a, _b, _leaf = ('m.py', 1, 'main'), ('m.py', 5, 'a'), ('m.py', 9, 'b'), ('~', 0, '<built-in sum>')
+        _test_stats = {
+            _main: (1, 1, 0.001, 0.010, {}),
+            _a: (1, 1, 0.001, 0.004, {_main: (1, 1, 0.001, 0.004)}),
+            _b: (1, 1, 0.001, 0.005, {_main: (1, 1, 0.001, 0.005)}),
+            _leaf: (2, 2, 0.007, 0.007, {_a: (1, 1, 0.003, 0.003), _b: (1, 1, 0.004, 0.004)})}
+        self.assertEqual(collapsed_stacks(_test_stats),
+                         ['m.py:main:1 1000', 'm.py:main:1;m.py:a:5 1000', 'm.py:main:1;m.py:a:5;<built-in_sum> 3000',
+                          'm.py:main:1;m.py:b:9 1000', 'm.py:main:1;m.py:b:9;<built-in_sum> 4000'])
+
+    def test_cpu(self):
+        """
+        TestCase for RunProfiler in cpu mode, worker threads are profiled too.
+        """
+        self.assertRaises(IOError, RUN_PROFILER.start, 'gpu', self._tmp_dir.name)
+        RUN_PROFILER.start('cpu', self._tmp_dir.name, 'overview')
+        self.assertRaises(IOError, RUN_PROFILER.start, 'cpu', self._tmp_dir.name)
+        with ThreadPoolExecutor(max_workers=2) as _executor:
+            self.assertEqual(list(_executor.map(_busy_worker, [1000, 2000])), [332833500, 2664667000])
+        _test_files = RUN_PROFILER.stop()
+        self.assertFalse(RUN_PROFILER.running)
+        self.assertEqual([os.path.splitext(x)[1] for x in _test_files], ['.pstats', '.txt', '.collapsed'])
+        self.assertTrue(os.path.basename(_test_files[0]).startswith('overview_'))
+        _test_stats = pstats.Stats(_test_files[0])
+        self.assertIn('_busy_worker', [x[2] for x in _test_stats.stats])
+        with open(_test_files[2], 'r') as rf:
+            self.assertTrue(any('_busy_worker' in x for x in rf.read().splitlines()))
+
+    def test_mem(self):
+        """
+        TestCase for RunProfiler in mem mode and profiled_stage().
+        """
+        self.assertEqual(len(_allocating_stage(10)), 10)
+        RUN_PROFILER.start('mem', self._tmp_dir.name, 'equity_update')
+        _test_kept = _allocating_stage(20000)
+        _allocating_stage(100)
+        with RUN_PROFILER.stage('empty'):
+            pass
+        _test_files = RUN_PROFILER.stop()
+        self.assertEqual(len(_test_files), 1)
+        with open(_test_files[0], 'r') as rf:
+            _test_report = rf.read()
+        self.assertIn('Stage _allocating_stage:', _test_report)
+        self.assertIn('over 2 call(s)', _test_report)
+        self.assertIn('test_run_profiler.py:', _test_report)
+        self.assertIn('Stage empty:', _test_report)
+        self.assertEqual(len(_test_kept), 20000)
+
+
+if __name__ == '__main__':
+    unittest.main()
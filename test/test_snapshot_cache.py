@@ -0,0 +1,123 @@
+"""
+This :module: contains Test Calls to :module: src/snapshot_cache.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_snapshot_cache
+
+
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from src.snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._eq_db_file = os.path.join(self._tmp_dir.name, 'equity.db')
+        self._fixed_db_file = os.path.join(self._tmp_dir.name, 'fixed_income.db')
+        self._others_file = os.path.join(self._tmp_dir.name, 'others.json')
+        self._output_file = os.path.join(self._tmp_dir.name, 'snapshot_20261019.html')
+        _conn = sqlite3.connect(self._eq_db_file)
+        _conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY, SYMBOL text, TYPE text, DATE text, "
+                      "DOLLARS real, UNITS real);")
+        _conn.execute("CREATE TABLE watch_list (SYMBOL text PRIMARY KEY, PREV_CLOSE real, LAST_UPDATED text);")
+        _conn.execute("INSERT INTO transactions VALUES (1, 'VOO', 'BUY', '2026-10-01', 350.0, 10);")
+        _conn.execute("INSERT INTO watch_list VALUES ('VOO', 351.0, '2026-10-18');")
+        _conn.commit()
+        _conn.close()
+        _conn = sqlite3.connect(self._fixed_db_file)
+        _conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY, NAME text, YTM real);")
+        _conn.execute("INSERT INTO transactions VALUES (1, 'US Treasury Notes', 0.025);")
+        _conn.commit()
+        _conn.close()
+        with open(self._others_file, 'w') as wf:
+            wf.write('[]')
+        self._test_instance = SnapshotCache(self._eq_db_file, self._fixed_db_file, self._others_file,
+                                            os.path.join(self._tmp_dir.name, 'fund_catalog.json'),
+                                            os.path.join(self._tmp_dir.name, 'snapshot_cache.json'))
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _execute(self, v_db_file, v_query):
+        _conn = sqlite3.connect(v_db_file)
+        _conn.execute(v_query)
+        _conn.commit()
+        _conn.close()
+
+    def test_compute_fingerprint(self):
+        """
+        TestCase for SnapshotCache.compute_fingerprint().
+        """
+        _fingerprint = self._test_instance.compute_fingerprint('20261019')
+        self.assertEqual(self._test_instance.compute_fingerprint('20261019'), _fingerprint)
+        self.assertNotEqual(self._test_instance.compute_fingerprint('20261020'), _fingerprint)
+        self.assertNotEqual(self._test_instance.compute_fingerprint('20261019', {'FORMATS': ['json']}), _fingerprint)
+        for _db_file, _query in [(self._eq_db_file, "INSERT INTO transactions VALUES (2, 'AAPL', 'BUY', "
+                                                    "'2026-10-02', 120.0, 5);"),
+                                 (self._eq_db_file, "UPDATE transactions SET UNITS = 6 WHERE ID = 2;"),
+                                 (self._eq_db_file, "UPDATE transactions SET DATE = '2026-10-03' WHERE ID = 2;"),
+                                 (self._eq_db_file, "UPDATE transactions SET TYPE = 'SELL' WHERE ID = 2;"),
+                                 (self._eq_db_file, "UPDATE watch_list SET LAST_UPDATED = '2026-10-19';"),
+                                 # a second price update on the same day
+                                 (self._eq_db_file, "UPDATE watch_list SET PREV_CLOSE = 352.0;"),
+                                 (self._fixed_db_file, "UPDATE transactions SET YTM = 0.03;")]:
+            self._execute(_db_file, _query)
+            _new_fingerprint = self._test_instance.compute_fingerprint('20261019')
+            self.assertNotEqual(_new_fingerprint, _fingerprint)
+            _fingerprint = _new_fingerprint
+        with open(self._others_file, 'w') as wf:
+            wf.write('[{"SYMBOL": "CASH"}]')
+        self.assertNotEqual(self._test_instance.compute_fingerprint('20261019'), _fingerprint)
+        # missing databases are not created
+        _test_instance = SnapshotCache(os.path.join(self._tmp_dir.name, 'missing.db'))
+        _test_instance.compute_fingerprint('20261019')
+        self.assertFalse(os.path.exists(os.path.join(self._tmp_dir.name, 'missing.db')))
+        # '#', '?' and '%' in the path are part of the database file name
+        _test_dir = os.path.join(self._tmp_dir.name, 'a#b?c%d')
+        os.makedirs(_test_dir)
+        _test_file = shutil.copy(self._eq_db_file, _test_dir)
+        _test_instance = SnapshotCache(_test_file, self._fixed_db_file, self._others_file,
+                                       self._test_instance.catalog_file)
+        _fingerprint = self._test_instance.compute_fingerprint('20261019')
+        self.assertEqual(_test_instance.compute_fingerprint('20261019'), _fingerprint)
+        self._execute(_test_file, "DELETE FROM transactions WHERE ID = 2;")
+        self.assertNotEqual(_test_instance.compute_fingerprint('20261019'), _fingerprint)
+        self.assertEqual(os.listdir(_test_dir), ['equity.db'])
+        self.assertNotIn('a', os.listdir(self._tmp_dir.name))
+
+    def test_is_fresh(self):
+        """
+        TestCase for SnapshotCache.is_fresh() and SnapshotCache.save().
+        """
+        _fingerprint = self._test_instance.compute_fingerprint('20261019')
+        self.assertFalse(self._test_instance.is_fresh(_fingerprint, self._output_file))
+        with open(self._output_file, 'w') as wf:
+            wf.write('<h1>Investment Portfolio Overview</h1>')
+        self.assertFalse(self._test_instance.is_fresh(_fingerprint, self._output_file))
+        self._test_instance.save(_fingerprint, self._output_file)
+        self.assertTrue(self._test_instance.is_fresh(_fingerprint, self._output_file))
+        self.assertTrue(self._test_instance.is_fresh(_fingerprint))
+        self.assertFalse(self._test_instance.is_fresh(_fingerprint, [self._output_file, self._others_file]))
+        self.assertFalse(self._test_instance.is_fresh('other', self._output_file))
+        os.utime(self._output_file, (0, 0))
+        self.assertFalse(self._test_instance.is_fresh(_fingerprint, self._output_file))
+        self.assertFalse(self._test_instance.is_fresh(_fingerprint))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+This :module: contains Test Calls to :module: src/snapshot_history.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_snapshot_history
+
+
+"""
+
+import os
+import tempfile
+import unittest
+import pandas as pd
+
+from src.snapshot_history import SnapshotHistory
+
+
+class TestSnapshotHistory(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._test_instance = SnapshotHistory(os.path.join(self._tmp_dir.name, 'history.db'))
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    @staticmethod
+    def _reports(v_equity_dollars):
+        _total = v_equity_dollars + 20000.0
+        return {
+            'allocation_type': pd.DataFrame(data={
+                'MAJOR_TYPE': ['EQUITY', 'EQUITY', 'FIXED_INCOME', 'TOTAL'],
+                'MAJOR_TOTAL_DOLLARS': [v_equity_dollars, v_equity_dollars, 20000.0, _total],
+                'MAJOR_ALLOCATION': [v_equity_dollars / _total * 100] * 2 + [20000.0 / _total * 100, 100.0],
+                'MINOR_TYPE': ['Large-Cap', 'Individual Stock', 'CD', ''],
+                'MINOR_TOTAL_DOLLARS': [v_equity_dollars - 2000.0, 2000.0, 20000.0, float('nan')],
+                'MINOR_ALLOCATION': [(v_equity_dollars - 2000.0) / _total * 100, 2000.0 / _total * 100,
+                                     20000.0 / _total * 100, float('nan')],
+                'IS_TOTAL': [False, False, False, True]}),
+            'allocation_account': pd.DataFrame(data={
+                'ACCOUNT': ['Fidelity'], 'TOTAL_DOLLARS': [_total], 'ALLOCATION': [100.0], 'IS_TOTAL': [False]}),
+            'allocation_etf_by_account': {'Fidelity': pd.DataFrame(data={
+                'ASSET_CLASS': ['Large-Cap', 'Fixed Income', 'TOTAL'],
+                'ASSET_CLASS_TOTAL_DOLLARS': [v_equity_dollars - 2000.0, 20000.0, _total - 2000.0],
+                'ASSET_CLASS_ALLOCATION': [0.0, 0.0, 100.0],
+                'SUBCLASS': ['Blend', 'CD', ''],
+                'SUBCLASS_TOTAL_DOLLARS': [v_equity_dollars - 2000.0, 20000.0, float('nan')],
+                'SUBCLASS_ALLOCATION': [0.0, 0.0, float('nan')],
+                'IS_TOTAL': [False, False, True]})}
+        }
+
+    def test_record(self):
+        """
+        TestCase for SnapshotHistory.record() and SnapshotHistory.get_snapshot().
+        """
+        _df_positions = pd.DataFrame(data={
+            'ACCOUNT': ['Fidelity', 'Vanguard'], 'SYMBOL': ['VOO', 'VOO'], 'INVESTMENT_TYPE': ['etf', 'etf'],
+            'UNITS': [30, 20], 'PRICE': [400.0, 400.0], 'MKT_VALUE': [12000.0, 8000.0]})
+        self.assertTrue(self._test_instance.record('2026-10-19', self._reports(12000.0), _df_positions))
+        # re-running the same date replaces its partition
+        self._test_instance.record('2026-10-19', self._reports(20000.0), _df_positions)
+        _test_output = self._test_instance.get_snapshot('2026-10-19', 'MAJOR_TYPE')
+        self.assertEqual(_test_output['KEY'].tolist(), ['EQUITY', 'FIXED_INCOME'])
+        self.assertEqual(_test_output['DOLLARS'].tolist(), [20000.0, 20000.0])
+        self.assertEqual(_test_output['ALLOCATION'].tolist(), [50.0, 50.0])
+        _test_output = self._test_instance.get_snapshot('2026-10-19', 'PORTFOLIO')
+        self.assertEqual(_test_output.values.tolist(), [['TOTAL', 40000.0, 100.0]])
+        _test_output = self._test_instance.get_snapshot('2026-10-19', 'ASSET_CLASS')
+        self.assertEqual(_test_output.values.tolist(), [['Fixed Income', 20000.0, 52.63157894736842],
+                                                        ['Large-Cap', 18000.0, 47.368421052631575]])
+        self.assertRaises(IOError, self._test_instance.get_snapshot, '2026-10-19', 'SECTOR')
+
+    def test_get_time_series(self):
+        """
+        TestCase for SnapshotHistory.get_time_series() and SnapshotHistory.get_position_series().
+        """
+        for _date, _dollars in [('2024-01-31', 10000.0), ('2025-01-31', 20000.0), ('2026-01-31', 30000.0)]:
+            self._test_instance.record(_date, self._reports(_dollars), pd.DataFrame(data={
+                'ACCOUNT': ['Fidelity', 'Vanguard'], 'SYMBOL': ['VOO', 'VOO'], 'INVESTMENT_TYPE': ['etf', 'etf'],
+                'UNITS': [10, 1], 'PRICE': [_dollars / 10] * 2, 'MKT_VALUE': [_dollars, _dollars / 10]}))
+        _test_output = self._test_instance.get_time_series('MAJOR_TYPE', 'EQUITY', '2025-01-01')
+        self.assertEqual(_test_output['SNAPSHOT_DATE'].tolist(), ['2025-01-31', '2026-01-31'])
+        self.assertEqual(_test_output['ALLOCATION'].tolist(), [50.0, 60.0])
+        _test_output = self._test_instance.get_time_series('ACCOUNT', 'Fidelity')
+        self.assertEqual(_test_output['DOLLARS'].tolist(), [30000.0, 40000.0, 50000.0])
+        _test_output = self._test_instance.get_position_series('VOO')
+        self.assertEqual(_test_output['UNITS'].tolist(), [11.0, 11.0, 11.0])
+        self.assertEqual(_test_output['MKT_VALUE'].tolist(), [11000.0, 22000.0, 33000.0])
+        _test_output = self._test_instance.get_position_series('VOO', 'Vanguard', v_end_date='2025-12-31')
+        self.assertEqual(_test_output['MKT_VALUE'].tolist(), [1000.0, 2000.0])
+        self.assertRaises(IOError, self._test_instance.get_time_series, 'SECTOR', 'Technology')
+
+
+if __name__ == '__main__':
+    unittest.main()
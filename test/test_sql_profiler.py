@@ -0,0 +1,114 @@
+"""
+This :module: contains Test Calls to :module: src/sql_profiler.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_sql_profiler
+
+
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.sql_profiler import SQL_PROFILER, ProfiledConnection, normalize_statement, full_scans
+from src.eq_SQLite_utility import SQLiteRequest
+
+
+class TestSQLProfiler(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._db_file = os.path.join(self._tmp_dir.name, 'equity.db')
+        SQL_PROFILER.reset()
+        SQL_PROFILER.enable(None)
+
+    def tearDown(self):
+        SQL_PROFILER.disable()
+        SQL_PROFILER.reset()
+        self._tmp_dir.cleanup()
+
+    def test_normalize_statement(self):
+        """
+        TestCase for normalize_statement().
+        """
+        self.assertEqual(normalize_statement("SELECT * FROM watch_list\n  WHERE SYMBOL = 'VOO' AND PE > 12.5;"),
+                         "SELECT * FROM watch_list WHERE SYMBOL = ? AND PE > ?;")
+        self.assertEqual(normalize_statement("SELECT idx_2 FROM t WHERE A = 'it''s';"),
+                         "SELECT idx_2 FROM t WHERE A = ?;")
+
+    def test_full_scans(self):
+        """
+        TestCase for full_scans().
+        """
+        self.assertEqual(full_scans(['SCAN transactions', 'SEARCH t2 USING INDEX idx (SYMBOL=?)',
+                                     'SCAN TABLE watch_list', 'SCAN t1 USING COVERING INDEX idx_x',
+                                     'SCAN CONSTANT ROW', 'SCAN (subquery-1)', 'SCAN transactions']),
+                         ['transactions', 'watch_list'])
+
+    def test_profile_sqlite_request(self):
+        """
+        TestCase for SQLProfiler on the statements of SQLiteRequest.
+        """
+        _test_instance = SQLiteRequest(self._db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        for _account in ['TD', 'Fidelity', 'TD']:
+            _test_instance.insert_into_table_transactions('AAPL', 'BUY', '2018-12-31', 200.0, 10, 'stock', _account,
+                                                          'Apple Inc')
+        _test_conn = _test_instance._create_connection()
+        self.assertTrue(isinstance(_test_conn, ProfiledConnection))
+        _test_conn.close()
+        self.assertEqual(len(_test_instance.get_table_transactions()), 3)
+        self.assertEqual(len(_test_instance.get_transactions(v_account='TD', v_columns=['SYMBOL'])), 2)
+        self.assertEqual(len(_test_instance.get_transactions(v_account='Fidelity', v_columns=['SYMBOL'])), 1)
+        _test_summary = {x['STATEMENT']: x for x in SQL_PROFILER.summary()}
+        _test_full = _test_summary['SELECT ID, SYMBOL, TYPE, DATE, DOLLARS, UNITS, INVESTMENT_TYPE, DESCRIPTION, '
+                                   'ACCOUNT, TOTAL_DOLLARS FROM transactions;']
+        self.assertEqual((_test_full['COUNT'], _test_full['ROWS'], _test_full['FULL_SCANS']),
+                         (1, 3, ['transactions']))
+        _test_filtered = _test_summary['SELECT SYMBOL FROM transactions WHERE ACCOUNT = ?;']
+        self.assertEqual((_test_filtered['COUNT'], _test_filtered['ROWS'], _test_filtered['FULL_SCANS']),
+                         (2, 3, []))
+        self.assertIn('idx_transactions_account', _test_filtered['PLAN'][0])
+        self.assertTrue(_test_filtered['P50_MS'] <= _test_filtered['P99_MS'] <= _test_filtered['MAX_MS'])
+        _test_file = SQL_PROFILER.dump(os.path.join(self._tmp_dir.name, 'sql_profile.txt'))
+        with open(_test_file, 'r') as rf:
+            _test_report = rf.read()
+        self.assertIn('FULL SCAN: transactions', _test_report)
+        # a disabled profiler opens plain connections
+        SQL_PROFILER.disable()
+        _test_conn = _test_instance._create_connection()
+        self.assertEqual(type(_test_conn), sqlite3.Connection)
+        _test_conn.close()
+
+    def test_profile_executemany(self):
+        """
+        TestCase for SQLProfiler on executemany(), the plan is explained with the first parameter row.
+        """
+        _test_conn = sqlite3.connect(self._db_file, factory=ProfiledConnection)
+        _test_conn.execute("CREATE TABLE transactions (ID integer PRIMARY KEY, SYMBOL text, TOTAL_GAIN real);")
+        _test_conn.executemany("INSERT INTO transactions (SYMBOL) VALUES (?);", [('VOO',), ('AAPL',), ('BND',)])
+        _test_conn.executemany("UPDATE transactions SET TOTAL_GAIN = ? WHERE ID = ?;",
+                               ((x * 10.0, x) for x in range(1, 4)))
+        _test_conn.executemany("DELETE FROM transactions WHERE SYMBOL = ?;", iter([('BND',)]))
+        self.assertEqual(_test_conn.execute("SELECT ID, TOTAL_GAIN FROM transactions;").fetchall(),
+                         [(1, 10.0), (2, 20.0)])
+        _test_conn.close()
+        _test_summary = {x['STATEMENT']: x for x in SQL_PROFILER.summary()}
+        _test_update = _test_summary['UPDATE transactions SET TOTAL_GAIN = ? WHERE ID = ?;']
+        self.assertIn('INTEGER PRIMARY KEY', _test_update['PLAN'][0])
+        self.assertEqual(_test_update['FULL_SCANS'], [])
+        self.assertEqual(_test_summary['DELETE FROM transactions WHERE SYMBOL = ?;']['FULL_SCANS'], ['transactions'])
+
+
+if __name__ == '__main__':
+    unittest.main()
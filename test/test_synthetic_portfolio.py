@@ -0,0 +1,94 @@
+"""
+This :module: contains Test Calls to :module: src/synthetic_portfolio.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_synthetic_portfolio
+
+
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+
+from src.synthetic_portfolio import SyntheticPortfolio, parse_scale
+
+
+class TestSyntheticPortfolio(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_parse_scale(self):
+        """
+        TestCase for parse_scale().
+        """
+        self.assertEqual(parse_scale('tiny')['TRANSACTIONS'], 500)
+        self.assertEqual(list(parse_scale('large, transactions=1000').values()), [10000, 1000, 200, 50000, 1000])
+        self.assertEqual(parse_scale('symbols=5')['SYMBOLS'], 5)
+        self.assertEqual(parse_scale({'accounts': 3})['ACCOUNTS'], 3)
+        self.assertRaises(IOError, parse_scale, 'huge')
+        self.assertRaises(IOError, parse_scale, 'tiny,trades=5')
+        self.assertRaises(IOError, parse_scale, 'tiny,symbols=0')
+        self.assertRaises(IOError, parse_scale, None)
+
+    def test_iter_transactions(self):
+        """
+        TestCase for SyntheticPortfolio.iter_transactions(), rows are deterministic and holdings never negative.
+        """
+        _test_instance = SyntheticPortfolio('tiny', v_seed=7)
+        _test_rows = list(_test_instance.iter_transactions())
+        self.assertEqual(_test_rows, list(SyntheticPortfolio('tiny', v_seed=7).iter_transactions()))
+        self.assertNotEqual(_test_rows, list(SyntheticPortfolio('tiny', v_seed=8).iter_transactions()))
+        self.assertEqual(len(_test_rows), 500)
+        self.assertEqual([x[2] for x in _test_rows], sorted(x[2] for x in _test_rows))
+        self.assertEqual(len(set(x[0] for x in _test_rows)), 20)
+        self.assertEqual(set(x[7] for x in _test_rows), set(_test_instance.accounts()))
+        _test_held = {}
+        for _row in _test_rows:
+            _test_held[(_row[7], _row[0])] = _test_held.get((_row[7], _row[0]), 0) + \
+                (_row[4] if _row[1] == 'BUY' else -_row[4])
+            self.assertTrue(_test_held[(_row[7], _row[0])] >= 0)
+        self.assertIn('SELL', [x[1] for x in _test_rows])
+        self.assertEqual(sum(1 for x in _test_instance.symbols() if x[1] == 'ETF'), 6)
+
+    def test_write(self):
+        """
+        TestCase for SyntheticPortfolio.write().
+        """
+        _test_dir = os.path.join(self._tmp_dir.name, 'databases')
+        _test_instance = SyntheticPortfolio('tiny,bonds=25')
+        self.assertEqual(list(_test_instance.write(_test_dir).items()),
+                         [('TRANSACTIONS', 500), ('BONDS', 25), ('OTHERS', 8)])
+        _test_conn = sqlite3.connect(os.path.join(_test_dir, 'equity.db'))
+        self.assertEqual(_test_conn.execute('SELECT COUNT(*) FROM transactions;').fetchone()[0], 500)
+        self.assertTrue(_test_conn.execute('SELECT COUNT(*) FROM cumulative_holdings;').fetchone()[0] > 0)
+        self.assertEqual(_test_conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name IN "
+                                            "('watch_list', 'tmp_holdings', 'materialized_positions', "
+                                            "'price_history', 'daily_valuation');").fetchone()[0], 5)
+        _test_conn.close()
+        _test_conn = sqlite3.connect(os.path.join(_test_dir, 'fixed_income.db'))
+        self.assertEqual(_test_conn.execute('SELECT COUNT(*) FROM positions;').fetchone()[0], 25)
+        self.assertEqual(_test_conn.execute("SELECT COUNT(*) FROM transactions WHERE INVESTMENT_TYPE = 'CD' "
+                                            "AND (APR = 0 OR YTM <> 0);").fetchone()[0], 0)
+        _test_conn.close()
+        with open(os.path.join(_test_dir, 'others.json'), 'r') as rf:
+            self.assertEqual(json.load(rf), _test_instance.others())
+        # existing files are never overwritten
+        self.assertRaises(IOError, _test_instance.write, _test_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
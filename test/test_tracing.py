@@ -0,0 +1,109 @@
+"""
+This :module: contains Test Calls to :module: src/tracing.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_tracing
+
+
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.tracing import TRACER, traced
+from src.eq_SQLite_utility import SQLiteRequest
+
+
+@traced()
+def _traced_function(v_value):
+    if v_value < 0:
+        raise IOError('negative')
+    return v_value * 2
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        TRACER.reset()
+        TRACER.enable(None)
+
+    def tearDown(self):
+        TRACER.disable()
+        TRACER.reset()
+        self._tmp_dir.cleanup()
+
+    def test_span(self):
+        """
+        TestCase for Tracer.span() and traced().
+        """
+        with TRACER.span('stage', SYMBOL='VOO') as _test_span:
+            self.assertEqual(TRACER.current(), _test_span)
+            self.assertEqual(_traced_function(2), 4)
+            self.assertEqual(_traced_function(3), 6)
+            with self.assertRaises(IOError):
+                _traced_function(-1)
+        self.assertIsNone(TRACER.current())
+        _test_records = TRACER.records()
+        self.assertEqual([(x['PATH'], x['DEPTH'], x['ERROR']) for x in _test_records],
+                         [('stage', 0, None), ('stage/_traced_function', 1, None),
+                          ('stage/_traced_function', 1, None), ('stage/_traced_function', 1, 'OSError')])
+        self.assertTrue(all(x['PARENT_ID'] == _test_records[0]['SPAN_ID'] for x in _test_records[1:]))
+        self.assertEqual(_test_records[0]['ATTRIBUTES'], {'SYMBOL': 'VOO'})
+        self.assertTrue(_test_records[0]['DURATION_MS'] >= sum(x['DURATION_MS'] for x in _test_records[1:]) - 0.01)
+        _test_summary = TRACER.summary()
+        self.assertEqual([(x['PATH'], x['COUNT'], x['ERRORS']) for x in _test_summary],
+                         [('stage', 1, 0), ('stage/_traced_function', 3, 1)])
+        self.assertIn('  _traced_function', TRACER.summary_tree())
+        # a disabled tracer records nothing
+        TRACER.disable()
+        with TRACER.span('ignored') as _test_span:
+            self.assertIsNone(_test_span)
+            self.assertEqual(_traced_function(1), 2)
+        self.assertEqual(len(TRACER.records()), 4)
+
+    def test_propagate(self):
+        """
+        TestCase for Tracer.propagate(), spans of worker threads are children of the submitting span.
+        """
+        _db_file = os.path.join(self._tmp_dir.name, 'equity.db')
+        _test_instance = SQLiteRequest(_db_file)
+        _test_instance.create_database()
+        _test_instance.create_table_transactions()
+        with ThreadPoolExecutor(max_workers=2) as _executor:
+            with TRACER.span('pipeline'):
+                _futures = [_executor.submit(TRACER.propagate(_test_instance.get_transactions), x)
+                            for x in ['TD', 'Fidelity']]
+                self.assertEqual([x.result() for x in _futures], [[], []])
+        self.assertEqual([(x['NAME'], x['COUNT']) for x in TRACER.summary()],
+                         [('pipeline', 1), ('SQLiteRequest.get_transactions', 2)])
+        self.assertEqual(TRACER.propagate(len), len)
+
+    def test_dump(self):
+        """
+        TestCase for Tracer.dump(), every run is appended to the same file.
+        """
+        _test_file = os.path.join(self._tmp_dir.name, 'trace.jsonl')
+        with TRACER.span('stage'):
+            _traced_function(1)
+        TRACER.dump(_test_file)
+        TRACER.dump(_test_file)
+        with open(_test_file, 'r') as rf:
+            _test_lines = [json.loads(x) for x in rf]
+        self.assertEqual([x['NAME'] for x in _test_lines], ['stage', '_traced_function'] * 2)
+        self.assertEqual(_test_lines[1]['PARENT_ID'], _test_lines[0]['SPAN_ID'])
+        self.assertEqual(_test_lines[0]['RUN_ID'], TRACER.run_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
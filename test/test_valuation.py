@@ -0,0 +1,129 @@
+"""
+This :module: contains Test Calls to :module: src/valuation.
+
+    Original Author: Mark D
+    Date created: 10/19/2026
+    Date Modified: 10/19/2026
+    Python Version: 3.7
+
+Note:
+    none
+
+Examples:
+    python -m unittest test.test_valuation
+
+
+"""
+
+import os
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from src.valuation import PortfolioValuation, build_units_matrix, build_price_matrix
+from src.eq_SQLite_utility import SQLiteRequest
+
+
+class TestPortfolioValuation(unittest.TestCase):
+    def setUp(self):
+        """
+        setup variables before each TestCase executed.
+        """
+        self.test_db_file = 'test/test_valuation.db'
+        self.dict_transactions = {
+            'ID': [1, 2, 3],
+            'SYMBOL': ['AAPL', 'VOO', 'AAPL'],
+            'TYPE': ['BUY', 'BUY', 'SELL'],
+            'DATE': ['2020-01-02', '2020-01-03', '2020-01-05'],
+            'UNITS': [10, 5, 4],
+            'INVESTMENT_TYPE': ['stock', 'etf', 'stock'],
+            'ACCOUNT': ['TD', 'Fidelity', 'TD']
+        }
+        self.dict_prices = {
+            'SYMBOL': ['AAPL', 'VOO', 'AAPL'],
+            'DATE': ['2019-12-31', '2020-01-03', '2020-01-04'],
+            'CLOSE': [90.0, 210.0, 110.0]
+        }
+
+    def tearDown(self):
+        """
+        drop test files after each TestCase finished.
+        """
+        if os.path.exists(self.test_db_file):
+            os.remove(self.test_db_file)
+
+    def test_build_units_matrix(self):
+        """
+        TestCase for build_units_matrix().
+        """
+        _dates = np.arange(np.datetime64('2020-01-02'), np.datetime64('2020-01-05'))
+        _test_output = build_units_matrix(_dates,
+                                          np.array(['2020-01-01', '2020-01-03', '2020-01-09'], dtype='datetime64[D]'),
+                                          np.array([0, 0, 1]), np.array([10.0, -4.0, 5.0]), 2)
+        self.assertEqual(_test_output.tolist(), [[10.0, 0.0], [6.0, 0.0], [6.0, 0.0]])
+
+    def test_build_price_matrix(self):
+        """
+        TestCase for build_price_matrix().
+        """
+        _dates = np.arange(np.datetime64('2020-01-02'), np.datetime64('2020-01-05'))
+        _test_output = build_price_matrix(_dates,
+                                          np.array(['2019-12-30', '2019-12-31', '2020-01-03'], dtype='datetime64[D]'),
+                                          np.array([0, 0, 0]), np.array([80.0, 90.0, 95.0]), 2)
+        self.assertEqual(_test_output[:, 0].tolist(), [90.0, 95.0, 95.0])
+        self.assertTrue(np.isnan(_test_output[:, 1]).all())
+
+    @patch.object(PortfolioValuation, "_get_price_history_data")
+    @patch.object(PortfolioValuation, "_get_transactions_data")
+    def test_compute_daily_values(self, mock_get_transactions, mock_get_prices):
+        """
+        TestCase for PortfolioValuation.compute_daily_values().
+        """
+        mock_get_transactions.return_value = pd.DataFrame(data=self.dict_transactions)
+        mock_get_prices.return_value = pd.DataFrame(data=self.dict_prices)
+        _test_instance = PortfolioValuation(self.test_db_file)
+        _test_output = _test_instance.compute_daily_values('2020-01-01', '2020-01-06')
+        self.assertEqual(list(_test_output.columns), ['DATE', 'ACCOUNT', 'ASSET_CLASS', 'MKT_VALUE'])
+        _td = _test_output[_test_output['ACCOUNT'] == 'TD']
+        self.assertEqual(list(_td['DATE']), ['2020-01-02', '2020-01-03', '2020-01-04', '2020-01-05', '2020-01-06'])
+        self.assertEqual(list(_td['MKT_VALUE']), [900.0, 900.0, 1100.0, 660.0, 660.0])
+        self.assertEqual(set(_td['ASSET_CLASS']), {'Individual Stock'})
+        _fidelity = _test_output[_test_output['ACCOUNT'] == 'Fidelity']
+        self.assertEqual(list(_fidelity['MKT_VALUE']), [1050.0] * 4)
+        self.assertEqual(set(_fidelity['ASSET_CLASS']), {'Large-Cap'})
+
+    def test_compute_group_values(self):
+        """
+        TestCase for PortfolioValuation.compute_group_values() with trade prices.
+        """
+        df_transactions = pd.DataFrame(data=self.dict_transactions)
+        df_transactions['DOLLARS'] = [100.0, 200.0, 150.0]
+        _test_dates = np.arange(np.datetime64('2020-01-02'), np.datetime64('2020-01-07'))
+        _test_instance = PortfolioValuation(self.test_db_file)
+        _test_values, _test_groups = _test_instance.compute_group_values(
+            df_transactions, pd.DataFrame(data=self.dict_prices), _test_dates, ('ACCOUNT',), v_trade_prices=True)
+        self.assertEqual(list(_test_groups['ACCOUNT']), ['TD', 'Fidelity'])
+        # the trades on 2020-01-02 and 2020-01-05 are newer than the last close
+        self.assertEqual(list(_test_values[:, 0]), [1000.0, 1000.0, 1100.0, 900.0, 900.0])
+        _test_values, _ = _test_instance.compute_group_values(
+            df_transactions, pd.DataFrame(data=self.dict_prices), _test_dates, ('ACCOUNT',))
+        self.assertEqual(list(_test_values[:, 0]), [900.0, 900.0, 1100.0, 660.0, 660.0])
+
+    def test_get_daily_values(self):
+        """
+        TestCase for PortfolioValuation.get_daily_values() incremental cache.
+        """
+        _db_instance = SQLiteRequest(self.test_db_file)
+        _db_instance.create_database()
+        _db_instance.create_table_transactions()
+        _db_instance.create_table_price_history()
+        _db_instance.insert_into_table_transactions('AAPL', 'BUY', '2020-01-02', 100.0, 10, 'stock', 'TD', 'Apple')
+        _db_instance.insert_into_table_price_history([('AAPL', '2020-01-02', 100.0)])
+        _test_instance = PortfolioValuation(self.test_db_file)
+        _test_output = _test_instance.get_daily_values(None, '2020-01-03')
+        self.assertEqual(list(_test_output['MKT_VALUE']), [1000.0, 1000.0])
+        _db_instance.insert_into_table_price_history([('AAPL', '2020-01-03', 110.0)])
+        _test_output = _test_instance.get_daily_values('2020-01-03', '2020-01-04')
+        self.assertEqual(list(_test_output['DATE']), ['2020-01-03', '2020-01-04'])
+        self.assertEqual(list(_test_output['MKT_VALUE']), [1100.0, 1100.0])